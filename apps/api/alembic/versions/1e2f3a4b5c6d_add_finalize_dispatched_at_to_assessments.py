@@ -0,0 +1,39 @@
+"""Add finalize_dispatched_at to assessments
+
+Revision ID: 1e2f3a4b5c6d
+Revises: 0d1e2f3a4b5c
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "1e2f3a4b5c6d"
+down_revision: Union[str, Sequence[str], None] = "0d1e2f3a4b5c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "assessments",
+        sa.Column("finalize_dispatched_at", sa.DateTime(), nullable=True),
+    )
+    # Classified assessments already went through the pipeline; the others
+    # are picked up by the dispatch_finalize_pipelines beat task
+    op.execute(
+        "UPDATE assessments "
+        "SET finalize_dispatched_at = COALESCE(validated_at, updated_at) "
+        "WHERE status = 'VALIDATED' AND final_compliance_status IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("assessments", "finalize_dispatched_at")
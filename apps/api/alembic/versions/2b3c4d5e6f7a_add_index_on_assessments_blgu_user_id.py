@@ -0,0 +1,34 @@
+"""Add index on assessments.blgu_user_id
+
+Revision ID: 2b3c4d5e6f7a
+Revises: 1a2b3c4d5e6f
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2b3c4d5e6f7a"
+down_revision: Union[str, Sequence[str], None] = "1a2b3c4d5e6f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ETag lookups for the BLGU read endpoints filter on blgu_user_id
+    op.create_index(
+        op.f("ix_assessments_blgu_user_id"),
+        "assessments",
+        ["blgu_user_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_assessments_blgu_user_id"), table_name="assessments")
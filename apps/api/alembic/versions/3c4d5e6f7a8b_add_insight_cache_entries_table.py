@@ -0,0 +1,76 @@
+"""Add insight_cache_entries table
+
+Revision ID: 3c4d5e6f7a8b
+Revises: 2b3c4d5e6f7a
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3c4d5e6f7a8b"
+down_revision: Union[str, Sequence[str], None] = "2b3c4d5e6f7a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "insight_cache_entries",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("model", sa.String(length=100), nullable=False),
+        sa.Column("response", sa.JSON(), nullable=False),
+        sa.Column("hit_count", sa.Integer(), nullable=False),
+        sa.Column("miss_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("last_accessed_at", sa.DateTime(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_insight_cache_entries_id"),
+        "insight_cache_entries",
+        ["id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_insight_cache_entries_cache_key"),
+        "insight_cache_entries",
+        ["cache_key"],
+        unique=True,
+    )
+    op.create_index(
+        op.f("ix_insight_cache_entries_last_accessed_at"),
+        "insight_cache_entries",
+        ["last_accessed_at"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_insight_cache_entries_expires_at"),
+        "insight_cache_entries",
+        ["expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_insight_cache_entries_expires_at"), table_name="insight_cache_entries"
+    )
+    op.drop_index(
+        op.f("ix_insight_cache_entries_last_accessed_at"),
+        table_name="insight_cache_entries",
+    )
+    op.drop_index(
+        op.f("ix_insight_cache_entries_cache_key"), table_name="insight_cache_entries"
+    )
+    op.drop_index(op.f("ix_insight_cache_entries_id"), table_name="insight_cache_entries")
+    op.drop_table("insight_cache_entries")
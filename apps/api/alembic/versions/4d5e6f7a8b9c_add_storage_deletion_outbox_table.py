@@ -0,0 +1,58 @@
+"""Add storage_deletion_outbox table
+
+Revision ID: 4d5e6f7a8b9c
+Revises: 3c4d5e6f7a8b
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4d5e6f7a8b9c"
+down_revision: Union[str, Sequence[str], None] = "3c4d5e6f7a8b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "storage_deletion_outbox",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("bucket", sa.String(length=100), nullable=False),
+        sa.Column("storage_path", sa.String(length=500), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_storage_deletion_outbox_id"),
+        "storage_deletion_outbox",
+        ["id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_storage_deletion_outbox_next_attempt_at"),
+        "storage_deletion_outbox",
+        ["next_attempt_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_storage_deletion_outbox_next_attempt_at"),
+        table_name="storage_deletion_outbox",
+    )
+    op.drop_index(
+        op.f("ix_storage_deletion_outbox_id"), table_name="storage_deletion_outbox"
+    )
+    op.drop_table("storage_deletion_outbox")
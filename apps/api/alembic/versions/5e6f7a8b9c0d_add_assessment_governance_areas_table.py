@@ -0,0 +1,67 @@
+"""Add assessment_governance_areas table and assessor queue index
+
+Revision ID: 5e6f7a8b9c0d
+Revises: 4d5e6f7a8b9c
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e6f7a8b9c0d"
+down_revision: Union[str, Sequence[str], None] = "4d5e6f7a8b9c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "assessment_governance_areas",
+        sa.Column("governance_area_id", sa.Integer(), nullable=False),
+        sa.Column("assessment_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["assessment_id"], ["assessments.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["governance_area_id"], ["governance_areas.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("governance_area_id", "assessment_id"),
+    )
+    op.create_index(
+        op.f("ix_assessment_governance_areas_assessment_id"),
+        "assessment_governance_areas",
+        ["assessment_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_assessments_status_submitted_at",
+        "assessments",
+        ["status", "submitted_at", "id"],
+        unique=False,
+    )
+
+    # Backfill from existing responses
+    op.execute(
+        """
+        INSERT INTO assessment_governance_areas (governance_area_id, assessment_id)
+        SELECT DISTINCT i.governance_area_id, ar.assessment_id
+        FROM assessment_responses ar
+        JOIN indicators i ON i.id = ar.indicator_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_assessments_status_submitted_at", table_name="assessments")
+    op.drop_index(
+        op.f("ix_assessment_governance_areas_assessment_id"),
+        table_name="assessment_governance_areas",
+    )
+    op.drop_table("assessment_governance_areas")
@@ -0,0 +1,68 @@
+"""Add notification_outbox table
+
+Revision ID: 6f7a8b9c0d1e
+Revises: 5e6f7a8b9c0d
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6f7a8b9c0d1e"
+down_revision: Union[str, Sequence[str], None] = "5e6f7a8b9c0d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "notification_outbox",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(length=50), nullable=False),
+        sa.Column("assessment_id", sa.Integer(), nullable=False),
+        sa.Column("recipient_email", sa.String(length=255), nullable=False),
+        sa.Column("recipient_name", sa.String(length=255), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["assessment_id"], ["assessments.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_notification_outbox_id"), "notification_outbox", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_notification_outbox_recipient_email"),
+        "notification_outbox",
+        ["recipient_email"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_notification_outbox_next_attempt_at"),
+        "notification_outbox",
+        ["next_attempt_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        op.f("ix_notification_outbox_next_attempt_at"),
+        table_name="notification_outbox",
+    )
+    op.drop_index(
+        op.f("ix_notification_outbox_recipient_email"),
+        table_name="notification_outbox",
+    )
+    op.drop_index(op.f("ix_notification_outbox_id"), table_name="notification_outbox")
+    op.drop_table("notification_outbox")
@@ -0,0 +1,41 @@
+"""Add insight_cache_stats table
+
+Revision ID: 8b9c0d1e2f3a
+Revises: 7a8b9c0d1e2f
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8b9c0d1e2f3a"
+down_revision: Union[str, Sequence[str], None] = "7a8b9c0d1e2f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    insight_cache_stats = op.create_table(
+        "insight_cache_stats",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("hits", sa.BigInteger(), nullable=False),
+        sa.Column("misses", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    # Carry over the counters of the entries still stored
+    op.execute(
+        "INSERT INTO insight_cache_stats (id, hits, misses) "
+        "SELECT 1, COALESCE(SUM(hit_count), 0), COALESCE(SUM(miss_count), 0) "
+        "FROM insight_cache_entries"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("insight_cache_stats")
@@ -0,0 +1,35 @@
+"""Add newest-first assessor queue index
+
+Revision ID: 9c0d1e2f3a4b
+Revises: 8b9c0d1e2f3a
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c0d1e2f3a4b"
+down_revision: Union[str, Sequence[str], None] = "8b9c0d1e2f3a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A backward scan of the ASC index yields NULLS FIRST, not the queue order
+    op.create_index(
+        "ix_assessments_status_submitted_at_desc",
+        "assessments",
+        ["status", sa.text("submitted_at DESC NULLS LAST"), sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_assessments_status_submitted_at_desc", table_name="assessments")
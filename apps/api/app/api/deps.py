@@ -1,16 +1,20 @@
 # 🔐 FastAPI Dependencies
 # Reusable dependency injection functions for authentication, database sessions, etc.
 
-from typing import Generator, Optional
+from typing import AsyncGenerator, Generator, Optional
 
+from app.core.executor import run_blocking
+from app.core.principal_cache import load_principal_user, load_principal_user_async
 from app.core.security import verify_token
+from app.db.base import get_async_db as get_async_db_session
 from app.db.base import get_db as get_db_session
 from app.db.base import get_supabase, get_supabase_admin
 from app.db.enums import UserRole
 from app.db.models.user import User
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 from supabase import Client
 
 # Security scheme for JWT tokens
@@ -25,6 +29,57 @@ def get_db() -> Generator[Session, None, None]:
     yield from get_db_session()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async database session dependency.
+    Use in `async def` routes whose services take an AsyncSession.
+    """
+    async for db in get_async_db_session():
+        yield db
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _token_subject(credentials: HTTPAuthorizationCredentials) -> str:
+    """
+    Verify a bearer token and return its subject (the user ID).
+
+    Raises:
+        HTTPException: 401 if the token is invalid or has no subject
+    """
+    try:
+        payload = verify_token(credentials.credentials)
+        user_id: Optional[str] = payload.get("sub")
+    except Exception:
+        raise _credentials_exception()
+    if user_id is None:
+        raise _credentials_exception()
+    return user_id
+
+
+def _require_active(user: User) -> User:
+    if not getattr(user, "is_active"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
+        )
+    return user
+
+
+def _require_admin(user: User) -> User:
+    if user.role not in [UserRole.SUPERADMIN, UserRole.MLGOO_DILG]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions. Admin access required.",
+        )
+    return user
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
@@ -42,25 +97,13 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
+    user_id = _token_subject(credentials)
 
-    try:
-        # Verify and decode the JWT token
-        payload = verify_token(credentials.credentials)
-        user_id: Optional[str] = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except Exception:
-        raise credentials_exception
-
-    # Get user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    # Get user from the principal cache, falling back to the database (on the
+    # blocking executor: a cache miss queries the sync session)
+    user = await run_blocking(load_principal_user, db, user_id)
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     return user
 
@@ -80,11 +123,7 @@ async def get_current_active_user(
     Raises:
         HTTPException: If user is inactive
     """
-    if not getattr(current_user, "is_active"):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
-        )
-    return current_user
+    return _require_active(current_user)
 
 
 async def get_current_admin_user(
@@ -104,12 +143,60 @@ async def get_current_admin_user(
     Raises:
         HTTPException: If user doesn't have admin privileges
     """
-    if current_user.role not in [UserRole.SUPERADMIN, UserRole.MLGOO_DILG]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not enough permissions. Admin access required.",
-        )
-    return current_user
+    return _require_admin(current_user)
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """
+    Get the current authenticated user on the request's AsyncSession.
+
+    For routes that take `get_async_db`: the user is loaded on the same
+    AsyncSession, so authentication doesn't check out a sync connection.
+
+    Args:
+        credentials: JWT token from Authorization header
+        db: Async database session
+
+    Returns:
+        User: Current authenticated user
+
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    user_id = _token_subject(credentials)
+
+    user = await load_principal_user_async(db, user_id)
+    if user is None:
+        raise _credentials_exception()
+
+    return user
+
+
+async def get_current_active_user_async(
+    current_user: User = Depends(get_current_user_async),
+) -> User:
+    """
+    Async-session variant of `get_current_active_user`.
+
+    Raises:
+        HTTPException: If user is inactive
+    """
+    return _require_active(current_user)
+
+
+async def get_current_admin_user_async(
+    current_user: User = Depends(get_current_active_user_async),
+) -> User:
+    """
+    Async-session variant of `get_current_admin_user`.
+
+    Raises:
+        HTTPException: If user doesn't have admin privileges
+    """
+    return _require_admin(current_user)
 
 
 def get_supabase_client() -> Client:
@@ -137,45 +224,32 @@ async def get_current_area_assessor_user(
     db: Session = Depends(get_db),
 ) -> User:
     """
-    Get the current authenticated Area Assessor user with governance area loaded.
+    Get the current authenticated Area Assessor user.
 
     - Requires role to be AREA_ASSESSOR
-    - Ensures an assigned governance_area exists
-    - Returns the user with governance_area eagerly loaded
+    - Ensures an assigned governance area exists
+    - Checks the cached principal's columns, so no extra query is needed;
+      `governance_area` loads on first access
 
     Raises:
         HTTPException: 403 if role is not AREA_ASSESSOR or governance area missing
     """
-    user_with_area = (
-        db.query(User)
-        .options(joinedload(User.governance_area))
-        .filter(User.id == current_user.id)
-        .first()
-    )
-
-    if not user_with_area:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-
     if (
-        getattr(user_with_area, "role", None) is None
-        or user_with_area.role != UserRole.AREA_ASSESSOR
+        getattr(current_user, "role", None) is None
+        or current_user.role != UserRole.AREA_ASSESSOR
     ):
          raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions. Area Assessor access required.",
         )
 
-    if user_with_area.governance_area is None:
+    if current_user.governance_area_id is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Assessor must be assigned to a governance area.",
         )
 
-    return user_with_area
+    return current_user
 
 
 async def get_current_area_assessor_user_http(
@@ -205,8 +279,8 @@ async def get_current_area_assessor_user_http(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Load user
-    user = db.query(User).filter(User.id == user_id).first()
+    # Load user (from the principal cache when possible)
+    user = await run_blocking(load_principal_user, db, user_id)
     if user is None or not getattr(user, "is_active", False):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -222,16 +296,11 @@ async def get_current_area_assessor_user_http(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user_with_area = (
-        db.query(User).options(joinedload(User.governance_area)).filter(User.id == user.id).first()
-    )
-    if user_with_area is None or user_with_area.governance_area is None:
+    if user.governance_area_id is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return user_with_area
-
-    return user_with_area
+    return user
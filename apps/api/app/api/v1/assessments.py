@@ -1,9 +1,13 @@
 # 📋 Assessments API Routes
 # Endpoints for assessment management and assessment data
 
-from typing import Any, Dict, List
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional
 
 from app.api import deps
+from app.core.etag import not_modified_response, set_etag_headers
+from app.core.executor import run_blocking
+from app.core.responses import JSONArrayStreamingResponse, ORJSONResponse
 from app.db.enums import AssessmentStatus, UserRole
 from app.db.models.user import User
 from app.schemas.assessment import (
@@ -13,11 +17,21 @@ from app.schemas.assessment import (
     AssessmentResponseCreate,
     AssessmentResponseUpdate,
     AssessmentSubmissionValidation,
+    InsightBatchRequest,
+    MOVBulkCreate,
     MOVCreate,
 )
-from app.db.models.assessment import MOV as MOVModel
 from app.services.assessment_service import assessment_service
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from app.services.insight_cache_service import insight_cache_service
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from sqlalchemy.orm import Session
 
 router = APIRouter()
@@ -48,10 +62,83 @@ async def get_current_blgu_user(
     return current_user
 
 
+@dataclass(frozen=True, slots=True)
+class BLGUContext:
+    """The current BLGU user and their assessment, resolved once per request."""
+
+    user: User
+    barangay_id: Optional[int]
+    assessment_id: Optional[int]
+    assessment_status: Optional[AssessmentStatus]
+
+
+@dataclass(frozen=True, slots=True)
+class OwnedResponse:
+    """An assessment response verified to belong to the current BLGU user."""
+
+    response_id: int
+    assessment_id: int
+    assessment_status: AssessmentStatus
+
+
+async def get_blgu_context(
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(get_current_blgu_user),
+) -> BLGUContext:
+    """
+    Resolve the BLGU user's barangay and assessment for this request.
+
+    The user comes from the principal cache and the assessment from one
+    id/status lookup; FastAPI caches the result for every dependency of the
+    request that asks for it.
+    """
+    assessment = await run_blocking(
+        assessment_service.get_blgu_assessment_ref, db, current_user.id
+    )
+    return BLGUContext(
+        user=current_user,
+        barangay_id=current_user.barangay_id,
+        assessment_id=assessment.id if assessment else None,
+        assessment_status=assessment.status if assessment else None,
+    )
+
+
+async def get_owned_response(
+    response_id: int,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(get_current_blgu_user),
+) -> OwnedResponse:
+    """
+    Check with one join query that a response belongs to the current user.
+
+    Raises:
+        HTTPException: 404 if the response does not exist, 403 if it belongs
+            to another user's assessment
+    """
+    owner = await run_blocking(assessment_service.get_response_owner, db, response_id)
+    if owner is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Assessment response not found",
+        )
+    if owner.blgu_user_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied. Response does not belong to your assessment",
+        )
+    return OwnedResponse(
+        response_id=owner.response_id,
+        assessment_id=owner.assessment_id,
+        assessment_status=owner.assessment_status,
+    )
+
+
 @router.get(
     "/dashboard", response_model=AssessmentDashboardResponse, tags=["assessments"]
 )
 async def get_assessment_dashboard(
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(get_current_blgu_user),
 ):
@@ -67,10 +154,25 @@ async def get_assessment_dashboard(
 
     This endpoint automatically creates an assessment if one doesn't exist
     for the BLGU user.
+
+    Supports conditional requests: send the last `ETag` in `If-None-Match`
+    to get a 304 without the body while the assessment is unchanged.
     """
+    blgu_user_id = getattr(current_user, "id")
+    # Computed before the body is built, so a concurrent write can only make
+    # the ETag older than the body (forcing a refetch), never newer
+    etag = await run_blocking(
+        assessment_service.get_assessment_etag,
+        db, "dashboard", blgu_user_id=blgu_user_id
+    )
+    not_modified = not_modified_response(request, etag)
+    if not_modified:
+        return not_modified
+
     try:
-        dashboard_data = assessment_service.get_assessment_dashboard_data(
-            db, getattr(current_user, "id")
+        dashboard_data = await run_blocking(
+            assessment_service.get_assessment_dashboard_data,
+            db, blgu_user_id
         )
 
         if not dashboard_data:
@@ -79,6 +181,13 @@ async def get_assessment_dashboard(
                 detail="Failed to retrieve dashboard data",
             )
 
+        if etag is None:
+            # The assessment was created by this request
+            etag = await run_blocking(
+                assessment_service.get_assessment_etag,
+                db, "dashboard", blgu_user_id=blgu_user_id
+            )
+        set_etag_headers(response, etag)
         return dashboard_data
 
     except Exception as e:
@@ -90,6 +199,7 @@ async def get_assessment_dashboard(
 
 @router.get("/my-assessment", response_model=Dict[str, Any], tags=["assessments"])
 async def get_my_assessment(
+    request: Request,
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(get_current_blgu_user),
 ):
@@ -106,10 +216,23 @@ async def get_my_assessment(
 
     This endpoint automatically creates an assessment if one doesn't exist
     for the BLGU user.
+
+    Supports conditional requests: send the last `ETag` in `If-None-Match`
+    to get a 304 without the body while the assessment is unchanged.
     """
+    blgu_user_id = getattr(current_user, "id")
+    etag = await run_blocking(
+        assessment_service.get_assessment_etag,
+        db, "my-assessment", blgu_user_id=blgu_user_id
+    )
+    not_modified = not_modified_response(request, etag)
+    if not_modified:
+        return not_modified
+
     try:
-        assessment_data = assessment_service.get_assessment_for_blgu_with_full_data(
-            db, getattr(current_user, "id")
+        assessment_data = await run_blocking(
+            assessment_service.get_assessment_for_blgu_with_full_data,
+            db, blgu_user_id
         )
 
         if not assessment_data:
@@ -118,7 +241,16 @@ async def get_my_assessment(
                 detail="Failed to retrieve assessment data",
             )
 
-        return assessment_data
+        if etag is None:
+            # The assessment was created by this request
+            etag = await run_blocking(
+                assessment_service.get_assessment_etag,
+                db, "my-assessment", blgu_user_id=blgu_user_id
+            )
+        # Returned directly so the large tree skips response_model encoding
+        full_response = ORJSONResponse(assessment_data)
+        set_etag_headers(full_response, etag)
+        return full_response
 
     except Exception as e:
         raise HTTPException(
@@ -127,13 +259,121 @@ async def get_my_assessment(
         ) from e
 
 
+@router.get(
+    "/my-assessment/areas", response_model=Dict[str, Any], tags=["assessments"]
+)
+async def get_my_assessment_area_index(
+    request: Request,
+    response: Response,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(get_current_blgu_user),
+):
+    """
+    Get the governance area index for the logged-in BLGU user's assessment.
+
+    Returns a lightweight list of governance areas with per-area counts
+    (total indicators, responses, completed, requiring rework) and no form
+    schemas, MOVs or comments. Use it for the initial page load and fetch
+    each area's subtree on demand from `/my-assessment/areas/{id}`.
+
+    Supports conditional requests via `ETag` / `If-None-Match`.
+    """
+    blgu_user_id = getattr(current_user, "id")
+    etag = await run_blocking(
+        assessment_service.get_assessment_etag,
+        db, "my-assessment-areas", blgu_user_id=blgu_user_id
+    )
+    not_modified = not_modified_response(request, etag)
+    if not_modified:
+        return not_modified
+
+    try:
+        area_index = await run_blocking(
+            assessment_service.get_governance_area_index_for_blgu,
+            db, blgu_user_id
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving governance area index: {str(e)}",
+        ) from e
+
+    if etag is None:
+        # The assessment was created by this request
+        etag = await run_blocking(
+            assessment_service.get_assessment_etag,
+            db, "my-assessment-areas", blgu_user_id=blgu_user_id
+        )
+    set_etag_headers(response, etag)
+    return area_index
+
+
+@router.get(
+    "/my-assessment/areas/{governance_area_id}",
+    response_model=Dict[str, Any],
+    tags=["assessments"],
+)
+async def get_my_assessment_area(
+    governance_area_id: int,
+    request: Request,
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(get_current_blgu_user),
+):
+    """
+    Get one governance area of the logged-in BLGU user's assessment.
+
+    Returns the same area structure as `/my-assessment` (indicators with
+    form schemas, nested children, responses, MOVs and feedback comments),
+    but only for the requested governance area.
+
+    Supports conditional requests via `ETag` / `If-None-Match`.
+    """
+    blgu_user_id = getattr(current_user, "id")
+    variant = f"my-assessment-area:{governance_area_id}"
+    etag = await run_blocking(
+        assessment_service.get_assessment_etag,
+        db, variant, blgu_user_id=blgu_user_id
+    )
+    not_modified = not_modified_response(request, etag)
+    if not_modified:
+        return not_modified
+
+    try:
+        area_data = await run_blocking(
+            assessment_service.get_governance_area_for_blgu,
+            db, blgu_user_id, governance_area_id
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error retrieving governance area: {str(e)}",
+        ) from e
+
+    if area_data is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Governance area not found",
+        )
+
+    if etag is None:
+        # The assessment was created by this request
+        etag = await run_blocking(
+            assessment_service.get_assessment_etag,
+            db, variant, blgu_user_id=blgu_user_id
+        )
+    # Returned directly so the subtree skips response_model encoding
+    area_response = ORJSONResponse(area_data)
+    set_etag_headers(area_response, etag)
+    return area_response
+
+
 @router.get(
     "/responses/{response_id}", response_model=AssessmentResponse, tags=["assessments"]
 )
 async def get_assessment_response(
     response_id: int,
     db: Session = Depends(deps.get_db),
-    current_user: User = Depends(get_current_blgu_user),
+    owned: OwnedResponse = Depends(get_owned_response),
 ):
     """
     Get a specific assessment response by ID.
@@ -144,7 +384,10 @@ async def get_assessment_response(
     - MOVs (Means of Verification)
     - Feedback comments
     """
-    response = assessment_service.get_assessment_response(db, response_id)
+    # Ownership is verified by get_owned_response
+    response = await run_blocking(
+        assessment_service.get_assessment_response, db, owned.response_id
+    )
 
     if not response:
         raise HTTPException(
@@ -152,16 +395,6 @@ async def get_assessment_response(
             detail="Assessment response not found",
         )
 
-    # Verify that the response belongs to the current user's assessment
-    assessment = assessment_service.get_assessment_for_blgu(
-        db, getattr(current_user, "id")
-    )
-    if assessment is None or response.assessment_id != assessment.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied. Response does not belong to your assessment",
-        )
-
     return response
 
 
@@ -172,7 +405,7 @@ async def update_assessment_response(
     response_id: int,
     response_update: AssessmentResponseUpdate,
     db: Session = Depends(deps.get_db),
-    current_user: User = Depends(get_current_blgu_user),
+    owned: OwnedResponse = Depends(get_owned_response),
 ):
     """
     Update an assessment response with validation.
@@ -186,36 +419,19 @@ async def update_assessment_response(
     - Response data is validated against the indicator's form schema
     - Completion status is automatically updated based on response data
     """
-    # First verify the response belongs to the current user
-    response = assessment_service.get_assessment_response(db, response_id)
-    if not response:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Assessment response not found",
-        )
-
-    # Verify ownership
-    assessment = assessment_service.get_assessment_for_blgu(
-        db, getattr(current_user, "id")
-    )
-    if assessment is None or response.assessment_id != assessment.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied. Response does not belong to your assessment",
-        )
-
-    # Check if assessment is in a state that allows updates
-    if assessment.status not in [
-        assessment.status.DRAFT,
-        assessment.status.NEEDS_REWORK,
+    # Ownership is verified by get_owned_response; check the assessment allows updates
+    if owned.assessment_status not in [
+        AssessmentStatus.DRAFT,
+        AssessmentStatus.NEEDS_REWORK,
     ]:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Cannot update response. Assessment status is {assessment.status.value}",
+            detail=f"Cannot update response. Assessment status is {owned.assessment_status.value}",
         )
 
     try:
-        updated_response = assessment_service.update_assessment_response(
+        updated_response = await run_blocking(
+            assessment_service.update_assessment_response,
             db, response_id, response_update
         )
 
@@ -240,7 +456,7 @@ async def update_assessment_response(
 async def create_assessment_response(
     response_create: AssessmentResponseCreate,
     db: Session = Depends(deps.get_db),
-    current_user: User = Depends(get_current_blgu_user),
+    context: BLGUContext = Depends(get_blgu_context),
 ):
     """
     Create a new assessment response.
@@ -249,24 +465,23 @@ async def create_assessment_response(
     The response data is validated against the indicator's form schema.
     """
     # Verify the assessment belongs to the current user
-    assessment = assessment_service.get_assessment_for_blgu(
-        db, getattr(current_user, "id")
-    )
-    if not assessment:
+    if context.assessment_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Assessment not found for current user",
         )
 
     # Verify the response is for the user's assessment
-    if response_create.assessment_id != assessment.id:
+    if response_create.assessment_id != context.assessment_id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Cannot create response for different assessment",
         )
 
     try:
-        return assessment_service.create_assessment_response(db, response_create)
+        return await run_blocking(
+            assessment_service.create_assessment_response, db, response_create
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -281,7 +496,7 @@ async def create_assessment_response(
 )
 async def submit_assessment(
     db: Session = Depends(deps.get_db),
-    current_user: User = Depends(get_current_blgu_user),
+    context: BLGUContext = Depends(get_blgu_context),
 ):
     """
     Submit the assessment for review.
@@ -293,17 +508,16 @@ async def submit_assessment(
 
     Returns validation results with any errors or warnings.
     """
-    assessment = assessment_service.get_assessment_for_blgu(
-        db, getattr(current_user, "id")
-    )
-    if not assessment:
+    if context.assessment_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Assessment not found for current user",
         )
 
     try:
-        validation_result = assessment_service.submit_assessment(db, assessment.id)
+        validation_result = await run_blocking(
+            assessment_service.submit_assessment, db, context.assessment_id
+        )
         if not getattr(validation_result, "is_valid", False):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -330,7 +544,7 @@ async def submit_assessment(
 async def submit_assessment_by_id(
     assessment_id: int,
     db: Session = Depends(deps.get_db),
-    current_user: User = Depends(get_current_blgu_user),
+    context: BLGUContext = Depends(get_blgu_context),
 ):
     """
     Submit a specific assessment for review by ID.
@@ -339,17 +553,16 @@ async def submit_assessment_by_id(
     preliminary compliance check (no "YES" answers without MOVs), and updates
     the status to "Submitted for Review" if valid.
     """
-    assessment = assessment_service.get_assessment_for_blgu(
-        db, getattr(current_user, "id")
-    )
-    if not assessment or assessment.id != assessment_id:
+    if context.assessment_id is None or context.assessment_id != assessment_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Assessment not found for current user",
         )
 
     try:
-        validation_result = assessment_service.submit_assessment(db, assessment_id)
+        validation_result = await run_blocking(
+            assessment_service.submit_assessment, db, assessment_id
+        )
         if not getattr(validation_result, "is_valid", False):
             # Return 400 with a concise detail message for failed indicators per PRD
             raise HTTPException(
@@ -372,7 +585,7 @@ async def upload_mov(
     response_id: int,
     mov_create: MOVCreate,
     db: Session = Depends(deps.get_db),
-    current_user: User = Depends(get_current_blgu_user),
+    owned: OwnedResponse = Depends(get_owned_response),
 ):
     """
     Upload a MOV (Means of Verification) file for an assessment response.
@@ -381,23 +594,7 @@ async def upload_mov(
     upload to Supabase Storage should be handled by the frontend before
     calling this endpoint.
     """
-    # Verify the response belongs to the current user
-    response = assessment_service.get_assessment_response(db, response_id)
-    if not response:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Assessment response not found",
-        )
-
-    assessment = assessment_service.get_assessment_for_blgu(
-        db, getattr(current_user, "id")
-    )
-    if assessment is None or response.assessment_id != assessment.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Access denied. Response does not belong to your assessment",
-        )
-
+    # Ownership is verified by get_owned_response
     # Verify the MOV is for the correct response
     if mov_create.response_id != response_id:
         raise HTTPException(
@@ -406,7 +603,7 @@ async def upload_mov(
         )
 
     try:
-        return assessment_service.create_mov(db, mov_create)
+        return await run_blocking(assessment_service.create_mov, db, mov_create)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -414,6 +611,47 @@ async def upload_mov(
         ) from e
 
 
+@router.post(
+    "/movs/bulk",
+    response_model=List[MOV],
+    status_code=status.HTTP_201_CREATED,
+    tags=["assessments"],
+)
+async def upload_movs_bulk(
+    bulk_create: MOVBulkCreate,
+    db: Session = Depends(deps.get_db),
+    context: BLGUContext = Depends(get_blgu_context),
+):
+    """
+    Register many uploaded MOV files at once.
+
+    Accepts MOVs for any responses of the current user's assessment. All
+    records are created in one transaction, with completion recomputed once
+    per affected response. The files themselves should already be uploaded
+    to Supabase Storage by the frontend.
+    """
+    if context.assessment_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Assessment not found for current user",
+        )
+
+    try:
+        return await run_blocking(
+            assessment_service.create_movs_bulk, db, context.assessment_id, bulk_create
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Access denied. {str(e)}",
+        ) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error creating MOVs: {str(e)}",
+        ) from e
+
+
 @router.delete("/movs/{mov_id}", response_model=Dict[str, str], tags=["assessments"])
 async def delete_mov(
     mov_id: int,
@@ -426,32 +664,26 @@ async def delete_mov(
     Removes the MOV record from the database. The actual file deletion
     from Supabase Storage should be handled separately.
     """
-    # First get the MOV to verify ownership
-    mov = db.query(MOVModel).filter(MOVModel.id == mov_id).first()
-    if mov is None:
+    # Verify MOV -> response -> assessment ownership with one join query
+    owner = await run_blocking(assessment_service.get_mov_owner, db, mov_id)
+    if owner is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="MOV not found"
         )
-
-    # Verify the MOV belongs to the current user's assessment
-    response = assessment_service.get_assessment_response(db, mov.response_id)
-    if not response:
+    if owner.response_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Assessment response not found",
         )
 
-    assessment = assessment_service.get_assessment_for_blgu(
-        db, getattr(current_user, "id")
-    )
-    if assessment is None or response.assessment_id != assessment.id:
+    if owner.blgu_user_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied. MOV does not belong to your assessment",
         )
 
     try:
-        success = assessment_service.delete_mov(db, mov_id)
+        success = await run_blocking(assessment_service.delete_mov, db, mov_id)
         if not success:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="MOV not found"
@@ -496,10 +728,24 @@ async def get_current_admin_user(
     return current_user
 
 
+def _stream_validated_assessments(
+    db: Session, assessment_status: AssessmentStatus
+) -> Iterator[Dict[str, Any]]:
+    """Iterate the validated assessments on a session owned by the stream."""
+    # The request session is closed once the endpoint returns, before the
+    # body is streamed, so the cursor gets a session of its own
+    with Session(bind=db.get_bind()) as stream_db:
+        yield from assessment_service.iter_validated_assessments(
+            stream_db, status=assessment_status
+        )
+
+
 @router.get("/list", response_model=List[Dict[str, Any]], tags=["assessments"])
 async def get_all_validated_assessments(
-    status: AssessmentStatus = Query(
-        AssessmentStatus.VALIDATED, description="Filter by assessment status"
+    assessment_status: AssessmentStatus = Query(
+        AssessmentStatus.VALIDATED,
+        alias="status",
+        description="Filter by assessment status",
     ),
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(get_current_admin_user),
@@ -509,9 +755,12 @@ async def get_all_validated_assessments(
 
     Returns a list of all validated assessments with their compliance status,
     area results, and barangay information. Used for MLGOO reports dashboard.
+    The JSON array is streamed in chunks instead of encoded as one string;
+    the first chunk is fetched before responding, so a failing query still
+    answers 500, while a later failure aborts the transfer.
 
     Args:
-        status: Filter by assessment status (defaults to VALIDATED)
+        assessment_status: Filter by assessment status (defaults to VALIDATED)
         db: Database session
         current_user: Current admin/MLGOO user
 
@@ -519,10 +768,10 @@ async def get_all_validated_assessments(
         List of assessment dictionaries with compliance data
     """
     try:
-        assessments = assessment_service.get_all_validated_assessments(
-            db, status=status
+        return await run_blocking(
+            JSONArrayStreamingResponse.prefetched,
+            _stream_validated_assessments(db, assessment_status),
         )
-        return assessments
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -530,6 +779,67 @@ async def get_all_validated_assessments(
         ) from e
 
 
+@router.get(
+    "/insights/cache-stats", response_model=Dict[str, Any], tags=["assessments"]
+)
+async def get_insight_cache_stats(
+    db: Session = Depends(deps.get_db),
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    Get usage statistics of the shared AI insight cache.
+
+    Reports the stored entries with their hits, misses and hit ratio, so the
+    savings in Gemini calls can be monitored.
+
+    Args:
+        db: Database session
+        current_user: Current admin/MLGOO user
+
+    Returns:
+        dict: Cache entries, capacity, TTL, hits, misses and hit ratio
+    """
+    return await run_blocking(insight_cache_service.get_stats, db)
+
+
+@router.post(
+    "/insights/generate-batch",
+    response_model=Dict[str, Any],
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["assessments"],
+)
+async def generate_insights_batch(
+    request_body: InsightBatchRequest,
+    current_user: User = Depends(get_current_admin_user),
+):
+    """
+    Generate AI-powered insights for many validated assessments at once.
+
+    Dispatches one background Celery task that builds all prompts in a single
+    DB pass, calls Gemini with bounded concurrency and stores the results in
+    bulk. Assessments that are not validated or already have insights are
+    skipped.
+
+    Args:
+        request_body: IDs of the assessments
+        current_user: Current admin/MLGOO user
+
+    Returns:
+        dict: Task dispatch confirmation
+    """
+    from app.workers.intelligence_worker import generate_insights_batch_task
+
+    assessment_ids = list(dict.fromkeys(request_body.assessment_ids))
+    task = generate_insights_batch_task.delay(assessment_ids)
+
+    return {
+        "message": "AI insight batch generation started",
+        "assessment_count": len(assessment_ids),
+        "task_id": task.id,
+        "status": "processing",
+    }
+
+
 @router.post(
     "/{id}/generate-insights",
     response_model=Dict[str, Any],
@@ -1,20 +1,29 @@
 # 🧭 Assessor API Routes
 # Endpoints for assessor-specific functionality (secure queue, validation actions)
 
-from typing import List
+from typing import List, Optional
 
 from app.api import deps
+from app.core.etag import not_modified_response, set_etag_headers
+from app.core.executor import run_blocking
+from app.db.enums import AssessmentStatus
 from app.db.models.user import User
 from app.schemas import (
     AssessmentDetailsResponse,
     AssessorQueueItem,
     MOVCreate,
     MOVUploadResponse,
+    ValidationBatchRequest,
+    ValidationBatchResponse,
     ValidationRequest,
     ValidationResponse,
 )
-from app.services import assessor_service, intelligence_service
-from fastapi import APIRouter, Depends
+from app.services import assessment_service, assessor_service, intelligence_service
+from app.services.assessor_service import (
+    DETAIL_OPTIONAL_FIELDS,
+    QUEUE_MAX_LIMIT,
+)
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 
 router = APIRouter()
@@ -22,15 +31,48 @@ router = APIRouter()
 
 @router.get("/queue", response_model=List[AssessorQueueItem], tags=["assessor"])
 async def get_assessor_queue(
+    response: Response,
+    status: Optional[List[AssessmentStatus]] = Query(
+        None, description="Only include these statuses (repeatable)"
+    ),
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        le=QUEUE_MAX_LIMIT,
+        description="Page size; omit to get the whole queue in one response",
+    ),
+    cursor: Optional[str] = Query(
+        None, description="X-Next-Cursor header of the previous page"
+    ),
+    order: str = Query("desc", pattern="^(asc|desc)$"),
     db: Session = Depends(deps.get_db),
     current_assessor: User = Depends(deps.get_current_area_assessor_user),
 ):
     """
     Get the assessor's secure submissions queue.
 
-    Returns a list of submissions filtered by the assessor's governance area.
+    Returns the submissions in the assessor's governance area, sorted by
+    submission date. Without `limit` the whole queue is returned, as before
+    pagination existed. With `limit`, one page is returned and, when more
+    submissions remain, the `X-Next-Cursor` response header holds the cursor
+    for the next page.
     """
-    return assessor_service.get_assessor_queue(db=db, assessor=current_assessor)
+    try:
+        page = await run_blocking(
+            assessor_service.get_assessor_queue,
+            db=db,
+            assessor=current_assessor,
+            statuses=status,
+            limit=limit,
+            cursor=cursor,
+            descending=order == "desc",
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if page["next_cursor"]:
+        response.headers["X-Next-Cursor"] = page["next_cursor"]
+    return page["items"]
 
 
 @router.post(
@@ -50,7 +92,8 @@ async def validate_assessment_response(
     Accepts validation status (Pass/Fail/Conditional), public comment, and internal note.
     Saves both comments to the feedback_comments table with appropriate flags.
     """
-    result = assessor_service.validate_assessment_response(
+    result = await run_blocking(
+        assessor_service.validate_assessment_response,
         db=db,
         response_id=response_id,
         assessor=current_assessor,
@@ -62,6 +105,38 @@ async def validate_assessment_response(
     return ValidationResponse(**result)
 
 
+@router.post(
+    "/assessment-responses/validate-batch",
+    response_model=ValidationBatchResponse,
+    tags=["assessor"],
+)
+async def validate_assessment_responses(
+    batch: ValidationBatchRequest,
+    db: Session = Depends(deps.get_db),
+    current_assessor: User = Depends(deps.get_current_area_assessor_user),
+):
+    """
+    Validate many responses of one assessment in one request.
+
+    Every response must belong to the same assessment and to the assessor's
+    governance area. Statuses and comments are saved in a single transaction:
+    either the whole batch is applied or none of it.
+    """
+    try:
+        result = await run_blocking(
+            assessor_service.validate_assessment_responses,
+            db=db,
+            assessor=current_assessor,
+            items=batch.items,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+
+    return ValidationBatchResponse(**result)
+
+
 @router.post(
     "/assessment-responses/{response_id}/movs",
     response_model=MOVUploadResponse,
@@ -91,7 +166,8 @@ async def upload_mov_for_assessor(
             mov_id=None,
         )
 
-    result = assessor_service.create_mov_for_assessor(
+    result = await run_blocking(
+        assessor_service.create_mov_for_assessor,
         db=db, mov_create=mov_data, assessor=current_assessor
     )
 
@@ -105,6 +181,16 @@ async def upload_mov_for_assessor(
 )
 async def get_assessment_details(
     assessment_id: int,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = Query(
+        None,
+        description=(
+            "Comma-separated optional response fields to include: "
+            + ", ".join(DETAIL_OPTIONAL_FIELDS)
+            + " (default: all)"
+        ),
+    ),
     db: Session = Depends(deps.get_db),
     current_assessor: User = Depends(deps.get_current_area_assessor_user),
 ):
@@ -114,18 +200,54 @@ async def get_assessment_details(
     Returns full assessment details including:
     - Assessment metadata and status
     - BLGU user information and barangay details
-    - All responses with indicators and technical notes
+    - The responses in the assessor's governance area, with indicators and
+      technical notes
     - MOVs (Means of Verification) for each response
     - Feedback comments from assessors
 
     The assessor must have permission to view assessments in their
     governance area. Technical notes are included for each indicator
-    to provide guidance during the review process.
+    to provide guidance during the review process. List views can pass
+    e.g. `fields=movs` to skip the response data and form schemas.
+
+    Supports conditional requests: send the last `ETag` in `If-None-Match`
+    to get a 304 without the body while the assessment is unchanged.
     """
-    result = assessor_service.get_assessment_details_for_assessor(
-        db=db, assessment_id=assessment_id, assessor=current_assessor
+    selected = (
+        None
+        if fields is None
+        else {field.strip() for field in fields.split(",") if field.strip()}
     )
 
+    # Scoped to the assessor's area and the selected fields, since both
+    # change the representation
+    variant = f"assessor-details:{current_assessor.governance_area_id}"
+    if selected is not None:
+        variant += ":" + ",".join(sorted(selected))
+    etag = await run_blocking(
+        assessment_service.get_assessment_etag,
+        db,
+        variant,
+        assessment_id=assessment_id,
+    )
+    not_modified = not_modified_response(request, etag)
+    if not_modified:
+        return not_modified
+
+    try:
+        result = await run_blocking(
+            assessor_service.get_assessment_details_for_assessor,
+            db=db,
+            assessment_id=assessment_id,
+            assessor=current_assessor,
+            fields=selected,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # Only successful details are cacheable; errors are always re-evaluated
+    if result.get("success"):
+        set_etag_headers(response, etag)
     return AssessmentDetailsResponse(**result)
 
 
@@ -148,7 +270,8 @@ async def send_assessment_for_rework(
     The assessor must have permission to review assessments in their governance area.
     """
     try:
-        result = assessor_service.send_assessment_for_rework(
+        result = await run_blocking(
+            assessor_service.send_assessment_for_rework,
             db=db, assessment_id=assessment_id, assessor=current_assessor
         )
         return result
@@ -178,10 +301,16 @@ async def finalize_assessment(
     from further edits by either the BLGU or the Assessor. This action can only be
     performed if all assessment responses have been reviewed (have a validation status).
 
+    Classification and the BLGU notification run in the background afterwards;
+    poll `/assessments/{assessment_id}/finalize-status` for their progress.
+    The `classification_result` and `notification_result` keys are deprecated
+    and always null.
+
     The assessor must have permission to review assessments in their governance area.
     """
     try:
-        result = assessor_service.finalize_assessment(
+        result = await run_blocking(
+            assessor_service.finalize_assessment,
             db=db, assessment_id=assessment_id, assessor=current_assessor
         )
         return result
@@ -195,6 +324,31 @@ async def finalize_assessment(
         raise HTTPException(status_code=403, detail=str(e))
 
 
+@router.get(
+    "/assessments/{assessment_id}/finalize-status",
+    tags=["assessor"],
+)
+async def get_finalize_status(
+    assessment_id: int,
+    db: Session = Depends(deps.get_db),
+    current_assessor: User = Depends(deps.get_current_area_assessor_user),
+):
+    """
+    Poll the background work started by finalizing an assessment.
+
+    Reports the state of each step of the classify -> notify (-> insights)
+    pipeline, plus the final compliance status once classification is done.
+    The overall `pipeline.state` is not_queued (the broker was unreachable;
+    a beat task queues it later), queued, running, completed or failed.
+    """
+    try:
+        return await run_blocking(
+            assessor_service.get_finalize_status, db=db, assessment_id=assessment_id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.post(
     "/assessments/{assessment_id}/classify",
     tags=["assessor"],
@@ -214,7 +368,8 @@ async def classify_assessment(
     The assessor must have permission to review assessments in their governance area.
     """
     try:
-        result = intelligence_service.classify_assessment(
+        result = await run_blocking(
+            intelligence_service.classify_assessment,
             db=db, assessment_id=assessment_id
         )
         return result
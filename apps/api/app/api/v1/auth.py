@@ -5,10 +5,17 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_active_user
-from app.core.security import verify_password, create_access_token, get_password_hash
+from app.core.executor import run_blocking
+from app.core.security import (
+    create_access_token,
+    get_password_hash_async,
+    verify_and_update_password_async,
+    verify_password_async,
+)
 from app.db.models.user import User
 from app.schemas.token import LoginRequest, AuthToken, ChangePasswordRequest
 from app.schemas.system import ApiResponse
+from app.services.user_service import user_service
 
 router = APIRouter()
 
@@ -24,17 +31,29 @@ async def login(login_data: LoginRequest, db: Session = Depends(get_db)):
     3. Generates a secure JWT token
     4. Returns token with expiration info
     """
-    # Find user by email
-    user = db.query(User).filter(User.email == login_data.email).first()
+    # Find user by email (off the event loop, like every sync DB call here)
+    user = await run_blocking(user_service.get_user_by_email, db, login_data.email)
 
-    # Check if user exists and password is correct
-    if not user or not verify_password(login_data.password, user.hashed_password):
+    # Check if user exists and password is correct (bcrypt runs in a process pool)
+    password_ok, new_hash = (
+        await verify_and_update_password_async(
+            login_data.password, user.hashed_password
+        )
+        if user
+        else (False, None)
+    )
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Transparently upgrade hashes made with a different BCRYPT_ROUNDS
+    if new_hash:
+        user.hashed_password = new_hash
+        await run_blocking(db.commit)
+
     # Check if user account is active
     if not user.is_active:
         raise HTTPException(
@@ -72,21 +91,26 @@ async def change_password(
     3. Sets must_change_password to False
     4. Returns success message
     """
+    # The hash isn't in the cached principal, so reading it may query
+    hashed_password = await run_blocking(getattr, current_user, "hashed_password")
+
     # Verify current password
-    if not verify_password(
-        password_data.current_password, current_user.hashed_password
+    if not await verify_password_async(
+        password_data.current_password, hashed_password
     ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Incorrect current password"
         )
 
     # Update password and reset must_change_password flag
-    current_user.hashed_password = get_password_hash(password_data.new_password)
+    current_user.hashed_password = await get_password_hash_async(
+        password_data.new_password
+    )
     current_user.must_change_password = False
 
     # Save changes to database
-    db.commit()
-    db.refresh(current_user)
+    await run_blocking(db.commit)
+    await run_blocking(db.refresh, current_user)
 
     return ApiResponse(message="Password changed successfully")
 
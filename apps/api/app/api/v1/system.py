@@ -4,6 +4,7 @@
 from fastapi import APIRouter
 from datetime import datetime
 
+from app.core.executor import get_executor_stats
 from app.schemas.system import ApiResponse, HealthCheck
 from app.db.base import (
     check_all_connections,
@@ -76,6 +77,17 @@ async def database_status():
     }
 
 
+@router.get("/executor-status", tags=["system"])
+async def executor_status():
+    """
+    Saturation gauges of the threadpool running blocking service calls.
+
+    A growing `queue_depth` or `avg_wait_ms` means requests are waiting for a
+    free thread (and therefore a database connection).
+    """
+    return {"timestamp": datetime.now(), "blocking_executor": get_executor_stats()}
+
+
 @router.get("/hello", response_model=ApiResponse, tags=["system"])
 async def hello():
     """Simple hello endpoint for testing connectivity."""
@@ -15,6 +15,7 @@ from app.schemas.user import (
 )
 from app.services.user_service import user_service
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 router = APIRouter()
@@ -51,8 +52,8 @@ async def update_current_user(
 
 @router.get("/", response_model=UserListResponse, tags=["users"])
 async def get_users(
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_admin_user),
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: User = Depends(deps.get_current_admin_user_async),
     page: int = Query(1, ge=1, description="Page number"),
     size: int = Query(10, ge=1, le=100, description="Page size"),
     search: Optional[str] = Query(None, description="Search in name and email"),
@@ -65,7 +66,7 @@ async def get_users(
     Requires admin privileges (System Admin role).
     """
     skip = (page - 1) * size
-    users, total = user_service.get_users(
+    users, total = await user_service.get_users(
         db, skip=skip, limit=size, search=search, role=role, is_active=is_active
     )
 
@@ -196,12 +197,12 @@ async def reset_user_password(
 
 @router.get("/stats/dashboard", response_model=dict, tags=["users"])
 async def get_user_stats(
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_admin_user),
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: User = Depends(deps.get_current_admin_user_async),
 ):
     """
     Get user statistics for admin dashboard.
 
     Requires admin privileges (System Admin role).
     """
-    return user_service.get_user_stats(db)
+    return await user_service.get_user_stats(db)
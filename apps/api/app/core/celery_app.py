@@ -13,6 +13,8 @@ celery_app = Celery(
         "app.workers.notifications",
         "app.workers.sglgb_classifier",
         "app.workers.intelligence_worker",
+        "app.workers.storage_outbox",
+        "app.workers.finalize_pipeline",
     ],
 )
 
@@ -35,6 +37,27 @@ celery_app.conf.task_routes = {
     "app.workers.notifications.*": {"queue": "notifications"},
     "app.workers.sglgb_classifier.*": {"queue": "classification"},
     "app.workers.intelligence.*": {"queue": "intelligence"},
+    "app.workers.storage_outbox.*": {"queue": "storage"},
+    "app.workers.finalize_pipeline.*": {"queue": "classification"},
+    # Tasks registered under short names
+    "notifications.*": {"queue": "notifications"},
+    "intelligence.*": {"queue": "intelligence"},
+}
+
+# Periodic tasks (run `celery -A app.core.celery_app beat`)
+celery_app.conf.beat_schedule = {
+    "drain-storage-outbox": {
+        "task": "app.workers.storage_outbox.drain_storage_outbox_task",
+        "schedule": settings.STORAGE_OUTBOX_DRAIN_INTERVAL_SECONDS,
+    },
+    "flush-notifications": {
+        "task": "notifications.flush_notifications",
+        "schedule": settings.NOTIFICATION_FLUSH_INTERVAL_SECONDS,
+    },
+    "dispatch-finalize-pipelines": {
+        "task": "app.workers.finalize_pipeline.dispatch_finalize_pipelines_task",
+        "schedule": settings.FINALIZE_DISPATCH_INTERVAL_SECONDS,
+    },
 }
 
 if __name__ == "__main__":
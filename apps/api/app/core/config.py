@@ -4,7 +4,7 @@
 import secrets
 from typing import List, Optional
 
-from pydantic import ConfigDict, ValidationInfo, field_validator
+from pydantic import ConfigDict, Field, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings
 
 
@@ -27,6 +27,19 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 8  # 8 days
 
+    # bcrypt cost factor; existing hashes are rehashed on the next login when it changes
+    BCRYPT_ROUNDS: int = 12
+    # Processes hashing/verifying passwords off the event loop
+    # (default: min(4, CPU count); 0 runs them on the blocking-call threadpool)
+    PASSWORD_HASH_WORKERS: Optional[int] = None
+
+    # Authenticated-user cache: "redis" (shared), "memory" (per process) or "none".
+    # Unset uses Redis when REDIS_URL is set and memory otherwise; with "memory",
+    # other workers see user changes only after the TTL.
+    PRINCIPAL_CACHE_BACKEND: Optional[str] = None
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10_000
+
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = [
         "http://localhost:3000",
@@ -73,6 +86,36 @@ class Settings(BaseSettings):
 
         return None
 
+    # SQLAlchemy connection pool (also sizes the blocking-call threadpool)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    # Threads for sync service calls from async routes (default: pool size + overflow)
+    BLOCKING_POOL_SIZE: Optional[int] = None
+
+    # Async driver URL for AsyncSession routes (derived from DATABASE_URL when unset)
+    ASYNC_DATABASE_URL: Optional[str] = Field(default=None, validate_default=True)
+
+    @field_validator("ASYNC_DATABASE_URL", mode="before")
+    @classmethod
+    def assemble_async_db_url(cls, v, info: ValidationInfo):
+        """Derive the asyncpg URL from DATABASE_URL."""
+        if isinstance(v, str) and v:
+            return v
+
+        database_url = info.data.get("DATABASE_URL") if info.data else None
+        if not database_url:
+            return None
+
+        scheme, _, rest = database_url.partition("://")
+        if scheme in ("postgres", "postgresql", "postgresql+psycopg2"):
+            # asyncpg takes SSL through connect_args, not the sslmode parameter
+            base, _, query = rest.partition("?")
+            params = [p for p in query.split("&") if p and not p.startswith("sslmode=")]
+            return f"postgresql+asyncpg://{base}" + (
+                "?" + "&".join(params) if params else ""
+            )
+        return None
+
     # Connection Requirements
     REQUIRE_ALL_CONNECTIONS: bool = (
         True  # If False, server can start with at least one working connection
@@ -86,6 +129,20 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: Optional[str] = None
     EMAILS_FROM_EMAIL: Optional[str] = None
     EMAILS_FROM_NAME: Optional[str] = None
+    # Backend: "smtp" (logs instead while SMTP_HOST is unset), "log" or "fake"
+    EMAIL_BACKEND: str = "smtp"
+    SMTP_POOL_SIZE: int = 2  # Persistent connections per worker process
+    SMTP_TIMEOUT_SECONDS: float = 10.0
+
+    # Notifications are queued in the notification_outbox table and flushed as
+    # one digest per recipient every NOTIFICATION_FLUSH_INTERVAL_SECONDS
+    NOTIFICATION_FLUSH_INTERVAL_SECONDS: float = 60.0
+    NOTIFICATION_BATCH_SIZE: int = 500  # Recipients claimed per flush round
+    # Claimed events are hidden from other workers while their digests are sent
+    NOTIFICATION_CLAIM_SECONDS: float = 600.0
+    NOTIFICATION_MAX_ATTEMPTS: int = 8
+    NOTIFICATION_RETRY_BASE_SECONDS: float = 60.0  # Doubles after every failure
+    NOTIFICATION_RETRY_MAX_SECONDS: float = 3600.0
 
     # File Upload
     MAX_FILE_SIZE: int = 100 * 1024 * 1024  # 100MB
@@ -98,11 +155,62 @@ class Settings(BaseSettings):
 
     # Gemini AI Configuration
     GEMINI_API_KEY: Optional[str] = None
+    GEMINI_MODEL: str = "gemini-2.5-flash"
+    # REST endpoint used by batch generation (point at app.devtools.gemini_stub offline)
+    GEMINI_API_BASE_URL: str = "https://generativelanguage.googleapis.com"
+    GEMINI_REQUEST_TIMEOUT_SECONDS: float = 120.0
+    GEMINI_BATCH_CONCURRENCY: int = 8
+    # Output cap of every call; the rate limiter reserves it per request
+    GEMINI_MAX_OUTPUT_TOKENS: int = 8192
+
+    # Gemini quota shared by all workers (token buckets; 0 disables a limit).
+    # Backend: "redis" (shared), "memory" (per process) or "none".
+    GEMINI_REQUESTS_PER_MINUTE: int = 60
+    GEMINI_TOKENS_PER_MINUTE: int = 1_000_000
+    GEMINI_RATE_LIMIT_BACKEND: str = "redis"
+    GEMINI_RATE_LIMIT_MAX_WAIT_SECONDS: float = 300.0
+    REDIS_URL: Optional[str] = None  # Defaults to CELERY_BROKER_URL
+
+    # Shared insight cache (keyed by prompt hash): TTL and LRU capacity
+    INSIGHT_CACHE_TTL_HOURS: int = 24 * 30
+    INSIGHT_CACHE_MAX_ENTRIES: int = 5000
+
+    # File storage deletions go through an outbox drained by a Celery worker.
+    # Backend: "supabase" or "fake" (in-memory, for tests and local runs).
+    STORAGE_BACKEND: str = "supabase"
+    STORAGE_OUTBOX_BATCH_SIZE: int = 100  # Paths per storage remove() call
+    # Claimed deletions are hidden from other workers while storage is called
+    STORAGE_OUTBOX_CLAIM_SECONDS: float = 600.0
+    STORAGE_OUTBOX_MAX_ATTEMPTS: int = 8
+    STORAGE_OUTBOX_RETRY_BASE_SECONDS: float = 30.0  # Doubles after every failure
+    STORAGE_OUTBOX_RETRY_MAX_SECONDS: float = 3600.0
+    STORAGE_OUTBOX_DRAIN_INTERVAL_SECONDS: float = 30.0
+
+    # Finalizing an assessment queues classify -> notify (-> AI insights)
+    FINALIZE_GENERATE_INSIGHTS: bool = False
+    # Pipelines the request could not queue (broker down) are queued by beat
+    # once they are older than the grace period
+    FINALIZE_DISPATCH_INTERVAL_SECONDS: float = 60.0
+    FINALIZE_DISPATCH_GRACE_SECONDS: float = 60.0
 
     # Environment
     ENVIRONMENT: str = "development"
     DEBUG: bool = True
 
+    # Run dev data safeguards (governance area / sample indicator seeding) inside
+    # BLGU read endpoints. Defaults to off in production, where the safeguards run
+    # once at startup or via `python manage.py ensure-data` and reads stay read-only.
+    READ_PATH_SAFEGUARDS: Optional[bool] = Field(default=None, validate_default=True)
+
+    @field_validator("READ_PATH_SAFEGUARDS", mode="before")
+    @classmethod
+    def default_read_path_safeguards(cls, v, info: ValidationInfo):
+        """Enable read-path safeguards everywhere except production by default."""
+        if v is not None and v != "":
+            return v
+        environment = info.data.get("ENVIRONMENT", "development") if info.data else ""
+        return environment != "production"
+
     # First Superuser
     FIRST_SUPERUSER: str = "admin@vantage.com"
     FIRST_SUPERUSER_PASSWORD: str = "changethis"
@@ -0,0 +1,74 @@
+# 🏷️ ETag Helpers
+# Building and matching HTTP entity tags for conditional GET requests
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from the values that identify a representation.
+
+    Args:
+        *parts: Values whose change must produce a new ETag
+
+    Returns:
+        Quoted ETag string suitable for the `ETag` header
+    """
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    return f'"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """
+    Check an `If-None-Match` header against the current ETag.
+
+    Uses the weak comparison required for `If-None-Match` (RFC 9110), so a
+    `W/` prefix added by a proxy still matches.
+
+    Args:
+        if_none_match: Raw `If-None-Match` header value, if any
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's cached copy is current
+    """
+    if not if_none_match or not etag:
+        return False
+
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    if "*" in candidates:
+        return True
+
+    def opaque(tag: str) -> str:
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return opaque(etag) in {opaque(tag) for tag in candidates}
+
+
+def not_modified_response(request: Request, etag: Optional[str]) -> Optional[Response]:
+    """
+    Return a 304 response if the client's cached copy matches `etag`.
+
+    Args:
+        request: Incoming request carrying the `If-None-Match` header
+        etag: Current ETag of the resource, or None if it has none yet
+
+    Returns:
+        304 Response to send as-is, or None if the full body is needed
+    """
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": "private, no-cache"},
+        )
+    return None
+
+
+def set_etag_headers(response: Response, etag: Optional[str]) -> None:
+    """Attach the ETag and revalidation headers to a full response."""
+    if etag:
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = "private, no-cache"
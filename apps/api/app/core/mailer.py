@@ -0,0 +1,198 @@
+# ✉️ Mail Delivery
+# Outgoing email over pooled, persistent SMTP connections (or a log/fake backend)
+
+import logging
+import queue
+import smtplib
+import threading
+from email.message import EmailMessage
+from typing import List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class MailError(Exception):
+    """Raised when a message cannot be delivered."""
+
+
+class SMTPMailer:
+    """
+    SMTP delivery that keeps connections open between messages.
+
+    Up to `pool_size` connections are opened lazily and reused by every
+    send(), so a flush of many digests costs one handshake (and login) per
+    connection instead of one per message. A connection the server dropped
+    while idle is replaced transparently.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        from_address: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = True,
+        pool_size: int = 2,
+        timeout: float = 10.0,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.from_address = from_address
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self.connections_opened = 0
+        self._idle: "queue.LifoQueue[smtplib.SMTP]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+
+    def _connect(self) -> smtplib.SMTP:
+        connection = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.use_tls:
+            connection.starttls()
+        if self.username:
+            connection.login(self.username, self.password or "")
+        self.connections_opened += 1
+        return connection
+
+    def send(self, message: EmailMessage) -> None:
+        """
+        Send one message on a pooled connection.
+
+        Args:
+            message: Message with To and Subject set (From defaults to the mailer's)
+
+        Raises:
+            MailError: If the message cannot be delivered
+        """
+        if "From" not in message:
+            message["From"] = self.from_address
+
+        with self._slots:
+            try:
+                connection = self._idle.get_nowait()
+                reused = True
+            except queue.Empty:
+                connection, reused = None, False
+
+            try:
+                if connection is None:
+                    connection = self._connect()
+                try:
+                    connection.send_message(message)
+                except smtplib.SMTPServerDisconnected:
+                    if not reused:
+                        raise
+                    # Dropped while idle in the pool: reconnect once
+                    self._discard(connection)
+                    connection = None
+                    connection = self._connect()
+                    connection.send_message(message)
+            except (smtplib.SMTPException, OSError) as e:
+                self._discard(connection)
+                raise MailError(f"SMTP delivery failed: {e}") from e
+
+            self._idle.put(connection)
+
+    def _discard(self, connection: Optional[smtplib.SMTP]) -> None:
+        if connection is None:
+            return
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        """Close every idle connection (QUIT, best effort)."""
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                connection.quit()
+            except Exception:
+                self._discard(connection)
+
+
+class LogMailer:
+    """Logs messages instead of sending them (no SMTP_HOST configured)."""
+
+    def send(self, message: EmailMessage) -> None:
+        logger.info(
+            "EMAIL to %s: %s\n%s",
+            message["To"],
+            message["Subject"],
+            message.get_content(),
+        )
+
+    def close(self) -> None:
+        pass
+
+
+class FakeMailer:
+    """
+    In-memory mailer for tests and local runs.
+
+    Records every message, and can be told to fail the next N sends.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.messages: List[EmailMessage] = []
+        self.fail_next = 0
+
+    def send(self, message: EmailMessage) -> None:
+        with self._lock:
+            if self.fail_next > 0:
+                self.fail_next -= 1
+                raise MailError("Fake mailer failure")
+            self.messages.append(message)
+
+    def close(self) -> None:
+        pass
+
+
+def build_mailer():
+    """
+    Build the mailer selected by EMAIL_BACKEND.
+
+    "smtp" falls back to logging while SMTP_HOST is not configured.
+    """
+    if settings.EMAIL_BACKEND == "fake":
+        return FakeMailer()
+    if settings.EMAIL_BACKEND == "log" or not settings.SMTP_HOST:
+        return LogMailer()
+
+    from_address = (
+        settings.EMAILS_FROM_EMAIL or settings.SMTP_USER or "noreply@localhost"
+    )
+    if settings.EMAILS_FROM_NAME:
+        from_address = f"{settings.EMAILS_FROM_NAME} <{from_address}>"
+    return SMTPMailer(
+        host=settings.SMTP_HOST,
+        port=settings.SMTP_PORT or (587 if settings.SMTP_TLS else 25),
+        from_address=from_address,
+        username=settings.SMTP_USER,
+        password=settings.SMTP_PASSWORD,
+        use_tls=settings.SMTP_TLS,
+        pool_size=settings.SMTP_POOL_SIZE,
+        timeout=settings.SMTP_TIMEOUT_SECONDS,
+    )
+
+
+_mailer = None
+_mailer_lock = threading.Lock()
+
+
+def get_mailer():
+    """Return the process-wide mailer, building it on first use."""
+    global _mailer
+    if _mailer is None:
+        with _mailer_lock:
+            if _mailer is None:
+                _mailer = build_mailer()
+    return _mailer
@@ -0,0 +1,320 @@
+# 🪪 Principal Cache
+# Short-TTL cache of authenticated users, so most requests skip the users query
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+from app.core.executor import run_blocking
+from app.db.enums import UserRole
+from app.db.models.user import User
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+logger = logging.getLogger(__name__)
+
+# User columns kept in the cache. Everything else (password hash, timestamps)
+# is loaded from the database only if a request actually reads it.
+PRINCIPAL_COLUMNS = (
+    "id",
+    "email",
+    "name",
+    "phone_number",
+    "role",
+    "governance_area_id",
+    "barangay_id",
+    "must_change_password",
+    "is_active",
+    "is_superuser",
+)
+
+Principal = Dict[str, Any]
+
+
+def principal_from_user(user: User) -> Principal:
+    """Snapshot the cached columns of a user as a JSON-serializable dict."""
+    principal = {column: getattr(user, column) for column in PRINCIPAL_COLUMNS}
+    principal["role"] = user.role.value if user.role is not None else None
+    return principal
+
+
+def _detached_user(principal: Principal) -> User:
+    """Build a detached User (persistent identity, no session) from a principal."""
+    values = dict(principal)
+    values["role"] = UserRole(values["role"]) if values["role"] else None
+    user = User(**values)
+    make_transient_to_detached(user)
+    return user
+
+
+def user_from_principal(db: Session, principal: Principal) -> User:
+    """
+    Rebuild a session-attached User from a cached principal without a query.
+
+    The instance behaves like a loaded row: changes are flushed on commit, and
+    columns not in the cache are loaded on first access.
+    """
+    return db.merge(_detached_user(principal), load=False)
+
+
+class InMemoryPrincipalBackend:
+    """Process-local LRU with per-entry expiry."""
+
+    def __init__(
+        self, max_entries: int, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, Principal]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Principal]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return principal
+
+    def set(self, key: str, principal: Principal, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl_seconds, principal)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisPrincipalBackend:
+    """Redis storage shared by every worker, so invalidations reach all of them."""
+
+    def __init__(self, client, prefix: str = "principal:") -> None:
+        self._client = client
+        self._prefix = prefix
+
+    def get(self, key: str) -> Optional[Principal]:
+        raw = self._client.get(self._prefix + key)
+        return json.loads(raw) if raw else None
+
+    def set(self, key: str, principal: Principal, ttl_seconds: float) -> None:
+        self._client.set(
+            self._prefix + key, json.dumps(principal), px=int(ttl_seconds * 1000)
+        )
+
+    def delete(self, key: str) -> None:
+        self._client.delete(self._prefix + key)
+
+    def clear(self) -> None:
+        keys = list(self._client.scan_iter(match=self._prefix + "*"))
+        if keys:
+            self._client.delete(*keys)
+
+
+class PrincipalCache:
+    """
+    Cache of authenticated principals keyed by user ID.
+
+    Entries live for at most `ttl_seconds` and are invalidated when a
+    transaction that updated or deleted the user commits. Backend errors are
+    logged and treated as misses, so authentication falls back to the database.
+    """
+
+    def __init__(self, backend, ttl_seconds: float) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+    def get(self, user_id: Any) -> Optional[Principal]:
+        try:
+            return self.backend.get(str(user_id))
+        except Exception as e:
+            logger.warning("Principal cache unavailable: %s", e)
+            return None
+
+    def set(self, user_id: Any, principal: Principal) -> None:
+        try:
+            self.backend.set(str(user_id), principal, self.ttl_seconds)
+        except Exception as e:
+            logger.warning("Principal cache unavailable: %s", e)
+
+    def invalidate(self, user_id: Any) -> None:
+        try:
+            self.backend.delete(str(user_id))
+        except Exception as e:
+            logger.warning("Principal cache invalidation failed: %s", e)
+
+    def clear(self) -> None:
+        try:
+            self.backend.clear()
+        except Exception as e:
+            logger.warning("Principal cache invalidation failed: %s", e)
+
+
+def build_principal_cache() -> Optional[PrincipalCache]:
+    """
+    Build the principal cache from settings.
+
+    Without an explicit PRINCIPAL_CACHE_BACKEND the cache lives in Redis when
+    REDIS_URL is set, so invalidations reach every worker.
+
+    Returns:
+        PrincipalCache, or None if PRINCIPAL_CACHE_BACKEND is "none"
+    """
+    backend_name = settings.PRINCIPAL_CACHE_BACKEND or (
+        "redis" if settings.REDIS_URL else "memory"
+    )
+    if backend_name == "none":
+        return None
+
+    if backend_name == "redis":
+        import redis
+
+        client = redis.Redis.from_url(
+            settings.REDIS_URL or settings.CELERY_BROKER_URL,
+            socket_connect_timeout=1,
+            socket_timeout=1,
+        )
+        backend = RedisPrincipalBackend(client)
+    else:
+        backend = InMemoryPrincipalBackend(settings.PRINCIPAL_CACHE_MAX_ENTRIES)
+
+    return PrincipalCache(backend, settings.PRINCIPAL_CACHE_TTL_SECONDS)
+
+
+_principal_cache: Optional[PrincipalCache] = None
+_principal_cache_lock = threading.Lock()
+_principal_cache_built = False
+
+
+def get_principal_cache() -> Optional[PrincipalCache]:
+    """Return the process-wide principal cache, building it on first use."""
+    global _principal_cache, _principal_cache_built
+    if not _principal_cache_built:
+        with _principal_cache_lock:
+            if not _principal_cache_built:
+                _principal_cache = build_principal_cache()
+                _principal_cache_built = True
+    return _principal_cache
+
+
+def load_principal_user(db: Session, user_id: Any) -> Optional[User]:
+    """
+    Load the user behind a token, from the cache when possible.
+
+    Args:
+        db: Database session of the request
+        user_id: User ID from the token's subject
+
+    Returns:
+        Session-attached User, or None if it does not exist
+    """
+    cache = get_principal_cache()
+    principal = cache.get(user_id) if cache else None
+    if principal is not None:
+        return user_from_principal(db, principal)
+
+    user = db.query(User).filter(User.id == user_id).first()
+    if user is not None and cache:
+        cache.set(user_id, principal_from_user(user))
+    return user
+
+
+async def load_principal_user_async(db: AsyncSession, user_id: Any) -> Optional[User]:
+    """
+    Load the user behind a token onto an AsyncSession, from the cache when possible.
+
+    Cache backend calls run on the blocking executor (the Redis client is
+    synchronous). Columns outside the cache can't lazy load on an
+    AsyncSession, so routes using this only read the principal columns.
+
+    Args:
+        db: Async database session of the request
+        user_id: User ID from the token's subject
+
+    Returns:
+        Session-attached User, or None if it does not exist
+    """
+    try:
+        user_id = int(user_id)
+    except (TypeError, ValueError):
+        return None
+
+    cache = get_principal_cache()
+    principal = await run_blocking(cache.get, user_id) if cache else None
+    if principal is not None:
+        return await db.merge(_detached_user(principal), load=False)
+
+    user = await db.scalar(select(User).where(User.id == user_id))
+    if user is not None and cache:
+        await run_blocking(cache.set, user_id, principal_from_user(user))
+    return user
+
+
+# Session info keys: IDs of users written in the transaction, and whether a
+# bulk statement wrote users (IDs unknown)
+_WRITTEN_USERS_KEY = "principal_cache_written_users"
+_BULK_USER_WRITE_KEY = "principal_cache_bulk_user_write"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_users(session: Session, flush_context: Any) -> None:
+    """Remember users updated or deleted by this transaction."""
+    # dirty/deleted still reflect the pre-flush state inside after_flush
+    for obj in (*session.dirty, *session.deleted):
+        if isinstance(obj, User) and obj.id is not None:
+            session.info.setdefault(_WRITTEN_USERS_KEY, set()).add(obj.id)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_user_writes(orm_execute_state: Any) -> None:
+    """Catch bulk UPDATE/DELETE statements against the users table."""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if getattr(table, "name", None) == User.__tablename__:
+        orm_execute_state.session.info[_BULK_USER_WRITE_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    """
+    Drop the principals of users written by the committed transaction.
+
+    Runs for every session (API routes, startup seeding, manage.py), so no
+    write path can leave a stale principal behind.
+    """
+    user_ids = session.info.pop(_WRITTEN_USERS_KEY, set())
+    bulk_write = session.info.pop(_BULK_USER_WRITE_KEY, False)
+    if not (user_ids or bulk_write):
+        return
+
+    cache = get_principal_cache()
+    if cache is None:
+        return
+    if bulk_write:
+        cache.clear()
+        return
+    for user_id in user_ids:
+        cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_users(session: Session) -> None:
+    """Rolled back writes leave the cached principals valid."""
+    session.info.pop(_WRITTEN_USERS_KEY, None)
+    session.info.pop(_BULK_USER_WRITE_KEY, None)
@@ -0,0 +1,279 @@
+# 🚦 Rate Limiter
+# Token-bucket rate limiting shared across API processes and Celery workers
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used to estimate prompt size before a call
+CHARS_PER_TOKEN = 4
+
+
+class RateLimitTimeout(Exception):
+    """Raised when capacity does not free up within the allowed wait."""
+
+
+@dataclass(frozen=True, slots=True)
+class Bucket:
+    """A token bucket: refills to `capacity` over `period_seconds`."""
+
+    key: str
+    capacity: float
+    period_seconds: float = 60.0
+
+    @property
+    def refill_per_second(self) -> float:
+        return self.capacity / self.period_seconds
+
+
+class InMemoryBucketBackend:
+    """
+    Process-local bucket storage.
+
+    Used in tests and single-process deployments; buckets are not shared with
+    other workers.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state: Dict[str, Tuple[float, float]] = {}
+
+    def try_acquire(self, requests: Sequence[Tuple[Bucket, float]]) -> float:
+        """
+        Take `amount` tokens from every bucket, or from none of them.
+
+        Args:
+            requests: (bucket, amount) pairs
+
+        Returns:
+            0 if the tokens were taken, otherwise seconds until they would be
+        """
+        with self._lock:
+            now = self._clock()
+            levels = []
+            wait = 0.0
+            for bucket, amount in requests:
+                tokens, updated_at = self._state.get(bucket.key, (bucket.capacity, now))
+                tokens = min(
+                    bucket.capacity,
+                    tokens + max(0.0, now - updated_at) * bucket.refill_per_second,
+                )
+                levels.append(tokens)
+                if tokens < amount:
+                    wait = max(wait, (amount - tokens) / bucket.refill_per_second)
+
+            if wait > 0:
+                return wait
+
+            for (bucket, amount), tokens in zip(requests, levels):
+                self._state[bucket.key] = (tokens - amount, now)
+            return 0.0
+
+
+# Atomically refill and take tokens from every bucket in KEYS, or from none.
+# ARGV holds capacity, refill rate and amount per key. Redis TIME keeps every
+# worker on the same clock. Returns the wait in seconds as a string.
+_ACQUIRE_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local wait = 0
+local levels = {}
+for i, key in ipairs(KEYS) do
+    local base = (i - 1) * 3
+    local capacity = tonumber(ARGV[base + 1])
+    local rate = tonumber(ARGV[base + 2])
+    local amount = tonumber(ARGV[base + 3])
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+    levels[i] = tokens
+    if tokens < amount then
+        wait = math.max(wait, (amount - tokens) / rate)
+    end
+end
+if wait > 0 then
+    return tostring(wait)
+end
+for i, key in ipairs(KEYS) do
+    local base = (i - 1) * 3
+    local capacity = tonumber(ARGV[base + 1])
+    local rate = tonumber(ARGV[base + 2])
+    local amount = tonumber(ARGV[base + 3])
+    redis.call('HSET', key, 'tokens', tostring(levels[i] - amount), 'ts', tostring(now))
+    redis.call('PEXPIRE', key, math.ceil(capacity / rate * 1000) + 1000)
+end
+return '0'
+"""
+
+
+class RedisBucketBackend:
+    """
+    Redis bucket storage shared by every process using the same Redis.
+
+    The refill-and-take step runs as one Lua script, so concurrent workers
+    never overdraw a bucket.
+    """
+
+    def __init__(self, client) -> None:
+        self._client = client
+        self._script = client.register_script(_ACQUIRE_SCRIPT)
+
+    def try_acquire(self, requests: Sequence[Tuple[Bucket, float]]) -> float:
+        """
+        Take `amount` tokens from every bucket, or from none of them.
+
+        Args:
+            requests: (bucket, amount) pairs
+
+        Returns:
+            0 if the tokens were taken, otherwise seconds until they would be
+        """
+        args: list = []
+        for bucket, amount in requests:
+            args.extend([bucket.capacity, bucket.refill_per_second, amount])
+        result = self._script(keys=[bucket.key for bucket, _ in requests], args=args)
+        return float(result)
+
+
+class RateLimiter:
+    """
+    Requests-per-minute plus tokens-per-minute limiter for one upstream API.
+
+    `acquire` blocks until both buckets have capacity, instead of letting the
+    call fail upstream and retrying blindly.
+    """
+
+    def __init__(
+        self,
+        backend,
+        name: str,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_wait_seconds: float = 300.0,
+        sleep: Callable[[float], None] = time.sleep,
+        fail_open: bool = True,
+    ) -> None:
+        self.backend = backend
+        self.requests_bucket = (
+            Bucket(f"ratelimit:{name}:rpm", requests_per_minute)
+            if requests_per_minute > 0
+            else None
+        )
+        self.tokens_bucket = (
+            Bucket(f"ratelimit:{name}:tpm", tokens_per_minute)
+            if tokens_per_minute > 0
+            else None
+        )
+        self.max_wait_seconds = max_wait_seconds
+        self._sleep = sleep
+        self.fail_open = fail_open
+
+    def acquire(self, tokens: int = 0) -> float:
+        """
+        Wait for capacity for one request consuming `tokens` tokens.
+
+        Args:
+            tokens: Estimated tokens of the request (capped at the TPM capacity)
+
+        Returns:
+            Total seconds spent waiting
+
+        Raises:
+            RateLimitTimeout: If capacity is not available within max_wait_seconds
+        """
+        requests = []
+        if self.requests_bucket:
+            requests.append((self.requests_bucket, 1))
+        if self.tokens_bucket:
+            requests.append(
+                (self.tokens_bucket, min(tokens, self.tokens_bucket.capacity))
+            )
+        if not requests:
+            return 0.0
+
+        waited = 0.0
+        while True:
+            try:
+                wait = self.backend.try_acquire(requests)
+            except Exception as e:
+                if not self.fail_open:
+                    raise
+                # Limiter storage unavailable: let the upstream quota decide
+                logger.warning("Rate limiter unavailable, not limiting: %s", e)
+                return waited
+
+            if wait <= 0:
+                return waited
+            if waited + wait > self.max_wait_seconds:
+                raise RateLimitTimeout(
+                    f"Rate limit: no capacity within {self.max_wait_seconds:.0f}s"
+                )
+            self._sleep(wait)
+            waited += wait
+
+
+def estimate_tokens(prompt: str, output_tokens: Optional[int] = None) -> int:
+    """
+    Estimate the tokens a call will consume (prompt plus reserved output).
+
+    The output reservation defaults to GEMINI_MAX_OUTPUT_TOKENS, the cap the
+    calls are made with, so the estimate never undercounts a full response.
+    """
+    if output_tokens is None:
+        output_tokens = settings.GEMINI_MAX_OUTPUT_TOKENS
+    return math.ceil(len(prompt) / CHARS_PER_TOKEN) + output_tokens
+
+
+def build_gemini_rate_limiter() -> Optional[RateLimiter]:
+    """
+    Build the Gemini limiter from settings.
+
+    Returns:
+        RateLimiter, or None if GEMINI_RATE_LIMIT_BACKEND is "none"
+    """
+    backend_name = settings.GEMINI_RATE_LIMIT_BACKEND
+    if backend_name == "none":
+        return None
+
+    if backend_name == "memory":
+        backend = InMemoryBucketBackend()
+    else:
+        import redis
+
+        client = redis.Redis.from_url(
+            settings.REDIS_URL or settings.CELERY_BROKER_URL,
+            socket_connect_timeout=1,
+            socket_timeout=1,
+        )
+        backend = RedisBucketBackend(client)
+
+    return RateLimiter(
+        backend,
+        name="gemini",
+        requests_per_minute=settings.GEMINI_REQUESTS_PER_MINUTE,
+        tokens_per_minute=settings.GEMINI_TOKENS_PER_MINUTE,
+        max_wait_seconds=settings.GEMINI_RATE_LIMIT_MAX_WAIT_SECONDS,
+    )
+
+
+_gemini_rate_limiter: Optional[RateLimiter] = None
+_gemini_rate_limiter_lock = threading.Lock()
+
+
+def get_gemini_rate_limiter() -> Optional[RateLimiter]:
+    """Return the process-wide Gemini limiter, building it on first use."""
+    global _gemini_rate_limiter
+    if _gemini_rate_limiter is None:
+        with _gemini_rate_limiter_lock:
+            if _gemini_rate_limiter is None:
+                _gemini_rate_limiter = build_gemini_rate_limiter()
+    return _gemini_rate_limiter
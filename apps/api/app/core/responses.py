@@ -0,0 +1,140 @@
+# ⚡ JSON Responses
+# orjson-backed response classes used across the API
+
+import itertools
+import logging
+from decimal import Decimal
+from typing import Any, Iterable, Iterator
+
+import orjson
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Allow int keys (e.g. indicator_id lookups) in serialized dicts
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# Items encoded per chunk when streaming JSON arrays
+DEFAULT_STREAM_CHUNK_SIZE = 200
+
+
+def _default(obj: Any) -> Any:
+    """Serialize the few types orjson does not handle natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Encode content to JSON bytes with orjson.
+
+    datetime, date, UUID, Enum and dataclass values are encoded natively
+    (datetimes as RFC 3339, matching `datetime.isoformat()`), so services
+    can return them as-is instead of pre-formatting strings.
+
+    Args:
+        content: JSON-compatible Python data
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    Default response class of the API.
+
+    Endpoints returning large dict trees can return an instance directly to
+    skip FastAPI's `response_model` validation/encoding pass as well.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _iter_json_array(items: Iterable[Any], chunk_size: int) -> Iterator[bytes]:
+    """Yield a JSON array a chunk of encoded items at a time."""
+    yield b"["
+    chunk: list[bytes] = []
+    first = True
+    for item in items:
+        chunk.append(dumps(item))
+        if len(chunk) >= chunk_size:
+            yield (b"" if first else b",") + b",".join(chunk)
+            first = False
+            chunk = []
+    if chunk:
+        yield (b"" if first else b",") + b",".join(chunk)
+    yield b"]"
+
+
+def _abort_on_error(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """
+    Log an error raised after the response has started and re-raise it.
+
+    The status line is already sent by then, so the error propagates to the
+    server, which drops the connection without ending the body: clients see
+    an incomplete transfer instead of a well-formed response.
+    """
+    try:
+        yield from chunks
+    except Exception:
+        logger.exception("JSON array stream failed after the response started")
+        raise
+
+
+class JSONArrayStreamingResponse(StreamingResponse):
+    """
+    Stream a (possibly lazy) iterable of items as one JSON array.
+
+    Items are encoded in chunks as they are consumed, so the whole payload is
+    never materialized as a single string.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[Any],
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        _chunks: Iterator[bytes] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        kwargs.setdefault("media_type", "application/json")
+        chunks = _chunks if _chunks is not None else _iter_json_array(items, chunk_size)
+        super().__init__(_abort_on_error(chunks), **kwargs)
+
+    @classmethod
+    def prefetched(
+        cls,
+        items: Iterable[Any],
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+        **kwargs: Any,
+    ) -> "JSONArrayStreamingResponse":
+        """
+        Build the response after encoding its first chunk.
+
+        Consuming the first chunk runs the query behind a lazy iterable, so a
+        failing query raises here, where the endpoint can still answer with an
+        error status, instead of after a 200 has been sent. This blocks, so
+        call it through `run_blocking`.
+
+        Args:
+            items: Items to stream
+            chunk_size: Items encoded per chunk
+            **kwargs: Passed on to `StreamingResponse`
+
+        Returns:
+            The streaming response
+        """
+        chunks = _iter_json_array(items, chunk_size)
+        # The opening bracket and the first chunk (or the closing bracket)
+        head = [next(chunks), next(chunks)]
+        return cls(
+            items, chunk_size, _chunks=itertools.chain(head, chunks), **kwargs
+        )
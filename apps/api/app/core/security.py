@@ -1,15 +1,25 @@
 # 🔐 Security Functions
 # Password hashing, JWT token creation/verification, and security utilities
 
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
-from typing import Optional, Union
+from typing import Any, Callable, Optional, Tuple, TypeVar, Union
 
 from app.core.config import settings
 from jose import JWTError, jwt  # type: ignore
 from passlib.context import CryptContext  # type: ignore
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+T = TypeVar("T")
+
+# Password hashing context (hashes with other rounds are flagged for rehash)
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
 
 
 def create_access_token(
@@ -84,14 +94,26 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: True if password matches, False otherwise
     """
-    # Bcrypt has a maximum password length of 72 bytes
-    # Truncate to 72 bytes if password is too long
-    if isinstance(plain_password, str):
-        plain_password_bytes = plain_password.encode("utf-8")
-        if len(plain_password_bytes) > 72:
-            plain_password = plain_password_bytes[:72].decode("utf-8", errors="ignore")
+    return pwd_context.verify(_bcrypt_input(plain_password), hashed_password)
 
-    return pwd_context.verify(plain_password, hashed_password)
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if its hash uses outdated settings.
+
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password from database
+
+    Returns:
+        (matches, new_hash): new_hash is set when the stored hash should be
+        replaced, e.g. after BCRYPT_ROUNDS changed
+    """
+    return pwd_context.verify_and_update(
+        _bcrypt_input(plain_password), hashed_password
+    )
 
 
 def get_password_hash(password: str) -> str:
@@ -104,14 +126,92 @@ def get_password_hash(password: str) -> str:
     Returns:
         str: Hashed password
     """
-    # Bcrypt has a maximum password length of 72 bytes
-    # Truncate to 72 bytes if password is too long
+    return pwd_context.hash(_bcrypt_input(password))
+
+
+def _bcrypt_input(password: str) -> str:
+    """Truncate a password to bcrypt's maximum length of 72 bytes."""
     if isinstance(password, str):
         password_bytes = password.encode("utf-8")
         if len(password_bytes) > 72:
             password = password_bytes[:72].decode("utf-8", errors="ignore")
+    return password
+
+
+# Process pool for bcrypt: each hash/verify burns 100-300 ms of CPU, which
+# would otherwise stall the event loop (or the GIL) for every other request
+_hash_pool: Optional[ProcessPoolExecutor] = None
+_hash_pool_lock = threading.Lock()
+
+
+def get_password_hash_pool() -> Optional[ProcessPoolExecutor]:
+    """
+    Return the password hashing process pool, starting it on first use.
+
+    Returns:
+        ProcessPoolExecutor, or None if PASSWORD_HASH_WORKERS is 0
+    """
+    global _hash_pool
+    workers = settings.PASSWORD_HASH_WORKERS
+    if workers is None:
+        workers = min(4, os.cpu_count() or 1)
+    if workers <= 0:
+        return None
+
+    if _hash_pool is None:
+        with _hash_pool_lock:
+            if _hash_pool is None:
+                _hash_pool = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+    return _hash_pool
+
+
+def shutdown_password_hash_pool() -> None:
+    """Stop the password hashing processes (called on application shutdown)."""
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is not None:
+            _hash_pool.shutdown(wait=False, cancel_futures=True)
+            _hash_pool = None
+
+
+async def _run_password_hashing(func: Callable[..., T], *args: Any) -> T:
+    """Run a bcrypt function in the process pool (or the threadpool fallback)."""
+    global _hash_pool
+    pool = get_password_hash_pool()
+    if pool is not None:
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+        except BrokenProcessPool:
+            # A worker died; start a fresh pool on the next call
+            with _hash_pool_lock:
+                if _hash_pool is pool:
+                    _hash_pool = None
+
+    from app.core.executor import run_blocking
+
+    return await run_blocking(func, *args)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """`verify_password` off the event loop."""
+    return await _run_password_hashing(verify_password, plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """`verify_and_update_password` off the event loop."""
+    return await _run_password_hashing(
+        verify_and_update_password, plain_password, hashed_password
+    )
+
 
-    return pwd_context.hash(password)
+async def get_password_hash_async(password: str) -> str:
+    """`get_password_hash` off the event loop."""
+    return await _run_password_hashing(get_password_hash, password)
 
 
 def verify_password_reset_token(token: str) -> Optional[str]:
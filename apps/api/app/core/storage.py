@@ -0,0 +1,96 @@
+# 🗂️ File Storage Backends
+# Object storage used for MOV files (Supabase in production, in-memory fake locally)
+
+import threading
+from typing import Dict, List, Sequence, Set, Tuple
+
+from app.core.config import settings
+
+
+class StorageError(Exception):
+    """Raised when the storage backend fails to remove objects."""
+
+
+class SupabaseStorageBackend:
+    """Supabase Storage through the service-role client."""
+
+    def __init__(self, client=None) -> None:
+        self._client = client
+
+    def remove(self, bucket: str, paths: Sequence[str]) -> None:
+        """
+        Remove many objects from a bucket in one request.
+
+        Missing objects are not an error, so retrying a partially applied
+        removal is safe.
+
+        Args:
+            bucket: Bucket name
+            paths: Object paths within the bucket
+
+        Raises:
+            StorageError: If the request fails
+        """
+        client = self._client
+        if client is None:
+            from app.db.base import get_supabase_admin
+
+            client = get_supabase_admin()
+
+        try:
+            result = client.storage.from_(bucket).remove(list(paths))
+        except Exception as e:
+            raise StorageError(f"Supabase file delete error: {e}") from e
+        if isinstance(result, dict) and result.get("error"):
+            raise StorageError(f"Supabase file delete error: {result['error']}")
+
+
+class FakeStorageBackend:
+    """
+    In-memory storage for tests and local runs without Supabase.
+
+    Records every remove() call, and can be told to fail the next N calls.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.objects: Dict[str, Set[str]] = {}
+        self.calls: List[Tuple[str, List[str]]] = []
+        self.fail_next = 0
+
+    def put(self, bucket: str, path: str) -> None:
+        with self._lock:
+            self.objects.setdefault(bucket, set()).add(path)
+
+    def exists(self, bucket: str, path: str) -> bool:
+        with self._lock:
+            return path in self.objects.get(bucket, set())
+
+    def remove(self, bucket: str, paths: Sequence[str]) -> None:
+        with self._lock:
+            self.calls.append((bucket, list(paths)))
+            if self.fail_next > 0:
+                self.fail_next -= 1
+                raise StorageError("Fake storage failure")
+            self.objects.get(bucket, set()).difference_update(paths)
+
+
+def build_storage_backend():
+    """Build the backend selected by STORAGE_BACKEND."""
+    if settings.STORAGE_BACKEND == "fake":
+        return FakeStorageBackend()
+    return SupabaseStorageBackend()
+
+
+_storage_backend = None
+_storage_backend_lock = threading.Lock()
+
+
+def get_storage_backend():
+    """Return the process-wide storage backend, building it on first use."""
+    global _storage_backend
+    if _storage_backend is None:
+        with _storage_backend_lock:
+            if _storage_backend is None:
+                _storage_backend = build_storage_backend()
+    return _storage_backend
@@ -2,10 +2,16 @@
 # Supabase client, SQLAlchemy engine, session management, and base models
 
 import logging
-from typing import Any, Dict, Generator
+from typing import Any, AsyncGenerator, Dict, Generator
 
 from app.core.config import settings
 from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 from supabase import Client, create_client
 
@@ -50,8 +56,8 @@ if settings.DATABASE_URL:
         # Connection pool settings optimized for Supabase
         pool_pre_ping=True,
         pool_recycle=300,
-        pool_size=10,
-        max_overflow=20,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
         # Supabase specific connection parameters
         connect_args={
             "options": "-c timezone=utc",
@@ -62,6 +68,40 @@ if settings.DATABASE_URL:
     # Create session factory
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for `async def` routes, so DB round trips don't block the event loop
+async_engine: AsyncEngine | None = None
+AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
+
+try:
+    if settings.ASYNC_DATABASE_URL:
+        is_asyncpg = settings.ASYNC_DATABASE_URL.startswith("postgresql+asyncpg")
+        async_engine = create_async_engine(
+            settings.ASYNC_DATABASE_URL,
+            pool_pre_ping=True,
+            pool_recycle=300,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            connect_args={
+                "server_settings": {"timezone": "utc"},
+                "ssl": "require",
+                # The Supabase pooler (transaction mode) cannot keep prepared statements
+                "statement_cache_size": 0,
+            }
+            if is_asyncpg
+            else {},
+        )
+
+        # expire_on_commit=False: attributes stay readable after commit without
+        # an implicit (and, in async code, forbidden) lazy refresh
+        AsyncSessionLocal = async_sessionmaker(
+            async_engine, autoflush=False, expire_on_commit=False
+        )
+except Exception as e:
+    # Routes on the sync Session keep working without the async driver
+    logger.error(f"Failed to initialize async database engine: {str(e)}")
+    async_engine = None
+    AsyncSessionLocal = None
+
 # Base class for SQLAlchemy models
 Base = declarative_base()
 
@@ -86,6 +126,23 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async database session generator for AsyncSession operations.
+    Creates a new session for each request and ensures it's properly closed.
+
+    Yields:
+        AsyncSession: SQLAlchemy async database session
+    """
+    if not AsyncSessionLocal:
+        raise RuntimeError(
+            "Async database not configured. Please set DATABASE_URL or ASYNC_DATABASE_URL."
+        )
+
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def get_supabase() -> Client:
     """
     Get Supabase client for real-time operations, auth, and storage.
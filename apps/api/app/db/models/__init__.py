@@ -3,9 +3,18 @@
 
 # Import Base for migrations and table creation
 from ..base import Base
-from .assessment import MOV, Assessment, AssessmentResponse, FeedbackComment
+from .assessment import (
+    MOV,
+    Assessment,
+    AssessmentGovernanceArea,
+    AssessmentResponse,
+    FeedbackComment,
+)
 from .barangay import Barangay
-from .governance_area import GovernanceArea, Indicator
+from .governance_area import CatalogueVersion, GovernanceArea, Indicator
+from .insight_cache import InsightCacheEntry, InsightCacheStats
+from .notification_outbox import NotificationEvent
+from .storage_outbox import StorageDeletion
 from .user import User
 
 __all__ = [
@@ -14,8 +23,14 @@ __all__ = [
     "Barangay",
     "GovernanceArea",
     "Indicator",
+    "CatalogueVersion",
     "Assessment",
     "AssessmentResponse",
     "MOV",
     "FeedbackComment",
+    "AssessmentGovernanceArea",
+    "InsightCacheEntry",
+    "InsightCacheStats",
+    "StorageDeletion",
+    "NotificationEvent",
 ]
@@ -5,7 +5,18 @@ from datetime import datetime
 
 from app.db.base import Base
 from app.db.enums import AssessmentStatus, ComplianceStatus, MOVStatus, ValidationStatus
-from sqlalchemy import JSON, Boolean, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -18,6 +29,18 @@ class Assessment(Base):
     """
 
     __tablename__ = "assessments"
+    __table_args__ = (
+        # Keyset pagination of the assessor queue (status filter, submitted_at order)
+        Index("ix_assessments_status_submitted_at", "status", "submitted_at", "id"),
+        # Same for the default newest-first order (PostgreSQL can't serve
+        # DESC NULLS LAST from a backward scan of the ASC index)
+        Index(
+            "ix_assessments_status_submitted_at_desc",
+            "status",
+            text("submitted_at DESC NULLS LAST"),
+            text("id DESC"),
+        ).ddl_if(dialect="postgresql"),
+    )
 
     # Primary key
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
@@ -40,8 +63,17 @@ class Assessment(Base):
     area_results: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     ai_recommendations: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
+    # Steps of the post-finalize pipeline, as queued at finalization
+    finalize_steps: Mapped[list | None] = mapped_column(JSON, nullable=True)
+    # When the pipeline was handed to the broker (None until it is queued)
+    finalize_dispatched_at: Mapped[datetime | None] = mapped_column(
+        DateTime, nullable=True
+    )
+
     # Foreign key to BLGU user
-    blgu_user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    blgu_user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id"), nullable=False, index=True
+    )
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -191,3 +223,23 @@ class FeedbackComment(Base):
     # Relationships
     response = relationship("AssessmentResponse", back_populates="feedback_comments")
     assessor = relationship("User", back_populates="feedback_comments")
+
+
+class AssessmentGovernanceArea(Base):
+    """
+    AssessmentGovernanceArea table model for database storage.
+
+    Links an assessment to every governance area its responses touch, so the
+    assessor queue does not scan responses and indicators. Rows are derived
+    data: they are kept in sync on flush by the assessment service and can be
+    rebuilt with `python manage.py rebuild-queue-links`.
+    """
+
+    __tablename__ = "assessment_governance_areas"
+
+    governance_area_id: Mapped[int] = mapped_column(
+        ForeignKey("governance_areas.id", ondelete="CASCADE"), primary_key=True
+    )
+    assessment_id: Mapped[int] = mapped_column(
+        ForeignKey("assessments.id", ondelete="CASCADE"), primary_key=True, index=True
+    )
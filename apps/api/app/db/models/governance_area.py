@@ -3,7 +3,7 @@
 
 from app.db.base import Base
 from app.db.enums import AreaType
-from sqlalchemy import JSON, Column, Enum, ForeignKey, String
+from sqlalchemy import JSON, BigInteger, Column, Enum, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional
 
@@ -75,3 +75,18 @@ class Indicator(Base):
         back_populates="parent",
         cascade="all, delete-orphan",
     )
+
+
+class CatalogueVersion(Base):
+    """
+    Single-row counter of indicator catalogue changes.
+
+    Bumped in the same transaction as every write to `governance_areas` or
+    `indicators`, so all API and worker processes agree on the catalogue
+    version their cached indicator trees and ETags are built from.
+    """
+
+    __tablename__ = "catalogue_version"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
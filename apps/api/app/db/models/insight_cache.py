@@ -0,0 +1,61 @@
+# 🧠 Insight Cache Database Model
+# SQLAlchemy model for the shared, content-addressed AI insight cache
+
+from datetime import datetime
+
+from app.db.base import Base
+from sqlalchemy import JSON, BigInteger, DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class InsightCacheEntry(Base):
+    """
+    InsightCacheEntry table model for database storage.
+
+    Stores one parsed Gemini response per normalized prompt + model, so
+    assessments producing the same prompt share a single API call. Entries
+    expire after a TTL and the least recently used ones are evicted first.
+    """
+
+    __tablename__ = "insight_cache_entries"
+
+    # Primary key
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+
+    # sha256 of the model name and normalized prompt
+    cache_key: Mapped[str] = mapped_column(
+        String(64), nullable=False, unique=True, index=True
+    )
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+
+    # Parsed response: summary, recommendations, capacity_development_needs
+    response: Mapped[dict] = mapped_column(JSON, nullable=False)
+
+    # Usage counters for hit ratio reporting
+    hit_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    miss_count: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+
+    # Timestamps (last_accessed_at drives LRU eviction, expires_at the TTL)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
+    last_accessed_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow, index=True
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+
+
+class InsightCacheStats(Base):
+    """
+    Single-row lookup counters of the insight cache.
+
+    Every lookup counts here, so misses that never reach `put` (failed or
+    skipped generations) and lookups of since-evicted entries still show up
+    in the reported hit ratio.
+    """
+
+    __tablename__ = "insight_cache_stats"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    hits: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    misses: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
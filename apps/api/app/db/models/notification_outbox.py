@@ -0,0 +1,48 @@
+# 📬 Notification Outbox Database Model
+# SQLAlchemy model for notifications queued with the changes that caused them
+
+from datetime import datetime
+from typing import Optional
+
+from app.db.base import Base
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class NotificationEvent(Base):
+    """
+    NotificationEvent table model for database storage.
+
+    One pending notification for a recipient (e.g. "assessment needs rework").
+    Rows are written in the transaction that changes the assessment; the
+    notification worker periodically sends all pending events of a recipient
+    as one digest email and then deletes them.
+    """
+
+    __tablename__ = "notification_outbox"
+
+    # Primary key
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+
+    # What happened, to which assessment
+    kind: Mapped[str] = mapped_column(String(50), nullable=False)
+    assessment_id: Mapped[int] = mapped_column(
+        ForeignKey("assessments.id", ondelete="CASCADE"), nullable=False
+    )
+
+    # Recipient, captured when the event is queued
+    recipient_email: Mapped[str] = mapped_column(
+        String(255), nullable=False, index=True
+    )
+    recipient_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+
+    # Retry state (rows at NOTIFICATION_MAX_ATTEMPTS are kept for inspection)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow, index=True
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
@@ -0,0 +1,39 @@
+# 📤 Storage Deletion Outbox Database Model
+# SQLAlchemy model for file deletions committed with the rows that owned the files
+
+from datetime import datetime
+from typing import Optional
+
+from app.db.base import Base
+from sqlalchemy import DateTime, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+
+class StorageDeletion(Base):
+    """
+    StorageDeletion table model for database storage.
+
+    One pending object removal. Rows are written in the same transaction that
+    deletes the owning record (e.g. a MOV) and removed by the outbox worker
+    once the storage backend confirms the deletion.
+    """
+
+    __tablename__ = "storage_deletion_outbox"
+
+    # Primary key
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+
+    # Object location
+    bucket: Mapped[str] = mapped_column(String(100), nullable=False)
+    storage_path: Mapped[str] = mapped_column(String(500), nullable=False)
+
+    # Retry state (rows at STORAGE_OUTBOX_MAX_ATTEMPTS are kept for inspection)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow, index=True
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow
+    )
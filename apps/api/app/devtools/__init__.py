@@ -0,0 +1,2 @@
+# 🧰 Developer Tools
+# Local stand-ins for external services, used in tests and offline benchmarks
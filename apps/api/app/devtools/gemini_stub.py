@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+🤖 Gemini Stub Server
+Local HTTP stand-in for the Gemini `generateContent` REST API
+
+Returns well-formed insight JSON for any prompt after a configurable latency,
+so batch insight generation can be tested and benchmarked offline.
+
+Usage:
+    python -m app.devtools.gemini_stub --port 8765 --latency 0.5
+
+    # Then point the API at it
+    GEMINI_API_BASE_URL=http://127.0.0.1:8765 GEMINI_API_KEY=stub \\
+        python manage.py generate-insights --concurrency 16
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+
+_GENERATE_PATH = re.compile(r"^/v1beta/models/(?P<model>[^/:]+):generateContent$")
+
+
+def stub_insights(prompt: str) -> Dict[str, Any]:
+    """Deterministic insights for a prompt (same prompt, same answer)."""
+    digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8]
+    return {
+        "summary": f"Stub analysis {digest} of the assessment results.",
+        "recommendations": [f"Address the failed indicators ({digest})"],
+        "capacity_development_needs": ["Training on SGLGB documentation"],
+    }
+
+
+class GeminiStubServer:
+    """
+    Threaded HTTP server mimicking `POST /v1beta/models/{model}:generateContent`.
+
+    Counts requests and the peak number of concurrent requests, which tests use
+    to check bounded concurrency. Every `fail_every`-th request gets a 429.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        fail_every: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.fail_every = fail_every
+        self.request_count = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "GeminiStubServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def __enter__(self) -> "GeminiStubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _make_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                match = _GENERATE_PATH.match(self.path.split("?")[0])
+                if match is None:
+                    self._send(404, {"error": {"code": 404, "status": "NOT_FOUND"}})
+                    return
+                if not (self.headers.get("x-goog-api-key") or "key=" in self.path):
+                    self._send(
+                        403, {"error": {"code": 403, "status": "PERMISSION_DENIED"}}
+                    )
+                    return
+
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                prompt = "".join(
+                    part.get("text", "")
+                    for content in body.get("contents", [])
+                    for part in content.get("parts", [])
+                )
+
+                with server._lock:
+                    server.request_count += 1
+                    count = server.request_count
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    if server.latency:
+                        time.sleep(server.latency)
+                    if server.fail_every and count % server.fail_every == 0:
+                        self._send(
+                            429,
+                            {
+                                "error": {
+                                    "code": 429,
+                                    "message": "Resource has been exhausted (e.g. check quota).",
+                                    "status": "RESOURCE_EXHAUSTED",
+                                }
+                            },
+                        )
+                        return
+
+                    text = json.dumps(stub_insights(prompt))
+                    prompt_tokens = len(prompt) // 4
+                    output_tokens = len(text) // 4
+                    self._send(
+                        200,
+                        {
+                            "candidates": [
+                                {
+                                    "content": {"role": "model", "parts": [{"text": text}]},
+                                    "finishReason": "STOP",
+                                    "index": 0,
+                                }
+                            ],
+                            "usageMetadata": {
+                                "promptTokenCount": prompt_tokens,
+                                "candidatesTokenCount": output_tokens,
+                                "totalTokenCount": prompt_tokens + output_tokens,
+                            },
+                            "modelVersion": match.group("model"),
+                        },
+                    )
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+            def _send(self, status: int, payload: Dict[str, Any]) -> None:
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                # Keep test and benchmark output quiet
+                pass
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local Gemini API stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--latency", type=float, default=0.5, help="Seconds per response"
+    )
+    parser.add_argument(
+        "--fail-every", type=int, default=0, help="Answer every Nth request with 429"
+    )
+    args = parser.parse_args()
+
+    server = GeminiStubServer(args.host, args.port, args.latency, args.fail_every)
+    print(f"Gemini stub listening on {server.url} (latency {args.latency}s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
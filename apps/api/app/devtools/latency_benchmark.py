@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+⏱️ Latency Benchmark
+Fire concurrent requests at an API endpoint and report latency percentiles
+
+Used to compare an endpoint before and after moving it to the async session
+layer: a route doing sync DB I/O inside `async def` stalls every other request
+on the event loop, which shows up as a p99 far above p50.
+
+Usage:
+    python -m app.devtools.latency_benchmark \\
+        http://127.0.0.1:8000/api/v1/users/stats/dashboard \\
+        --token "$ADMIN_TOKEN" --requests 500 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import math
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies: List[float], elapsed: float, errors: int) -> Dict[str, float]:
+    """
+    Summarize request latencies.
+
+    Args:
+        latencies: Per-request latency in seconds
+        elapsed: Wall time of the whole run in seconds
+        errors: Number of failed requests
+
+    Returns:
+        Request count, errors, throughput and p50/p95/p99/max in milliseconds
+    """
+    ordered = sorted(latencies)
+    return {
+        "requests": len(latencies) + errors,
+        "errors": errors,
+        "requests_per_second": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 1),
+        "p95_ms": round(percentile(ordered, 95) * 1000, 1),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 1),
+        "max_ms": round(ordered[-1] * 1000, 1) if ordered else 0.0,
+    }
+
+
+async def run_benchmark(
+    url: str,
+    requests: int,
+    concurrency: int,
+    token: Optional[str] = None,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+    method: str = "GET",
+    json_body: Optional[Any] = None,
+) -> Dict[str, float]:
+    """
+    Send `requests` requests to `url` with at most `concurrency` in flight.
+
+    Args:
+        url: Endpoint to call
+        requests: Total number of requests
+        concurrency: Maximum concurrent requests
+        token: Optional bearer token
+        transport: Optional httpx transport (e.g. ASGITransport for in-process runs)
+        method: HTTP method
+        json_body: Optional JSON body sent with every request
+
+    Returns:
+        Summary from `summarize`
+    """
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async with httpx.AsyncClient(
+        headers=headers,
+        timeout=60,
+        transport=transport,
+        limits=httpx.Limits(max_connections=concurrency),
+    ) as client:
+
+        async def one() -> None:
+            nonlocal errors
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await client.request(method, url, json=json_body)
+                    response.raise_for_status()
+                except httpx.HTTPError:
+                    errors += 1
+                    return
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    return summarize(latencies, elapsed, errors)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="API latency benchmark")
+    parser.add_argument("url")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--token", default=None, help="Bearer token")
+    args = parser.parse_args()
+
+    summary = asyncio.run(
+        run_benchmark(args.url, args.requests, args.concurrency, args.token)
+    )
+    for key, value in summary.items():
+        print(f"{key:>20}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+🔑 Login Throughput Benchmark
+Fire concurrent logins at the API and report throughput and latency percentiles
+
+Each login costs one bcrypt verification. With hashing on the event loop,
+logins are served one at a time and every other request waits behind them;
+with the hashing process pool, throughput scales with PASSWORD_HASH_WORKERS.
+Compare runs with PASSWORD_HASH_WORKERS=0 and the default, or across
+BCRYPT_ROUNDS values.
+
+Usage:
+    python -m app.devtools.login_benchmark http://127.0.0.1:8000 \\
+        --email admin@vantage.com --password changethis \\
+        --requests 200 --concurrency 20
+"""
+
+import argparse
+import asyncio
+from typing import Dict, Optional
+
+import httpx
+from app.devtools.latency_benchmark import run_benchmark
+
+
+async def run_login_benchmark(
+    base_url: str,
+    email: str,
+    password: str,
+    requests: int,
+    concurrency: int,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> Dict[str, float]:
+    """
+    Log in `requests` times with at most `concurrency` logins in flight.
+
+    Args:
+        base_url: API root (without /api/v1)
+        email: Account email
+        password: Account password
+        requests: Total number of logins
+        concurrency: Maximum concurrent logins
+        transport: Optional httpx transport (e.g. ASGITransport for in-process runs)
+
+    Returns:
+        Summary from `latency_benchmark.summarize` (failed logins count as errors)
+    """
+    return await run_benchmark(
+        f"{base_url.rstrip('/')}/api/v1/auth/login",
+        requests,
+        concurrency,
+        transport=transport,
+        method="POST",
+        json_body={"email": email, "password": password},
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Login throughput benchmark")
+    parser.add_argument("base_url")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    summary = asyncio.run(
+        run_login_benchmark(
+            args.base_url, args.email, args.password, args.requests, args.concurrency
+        )
+    )
+    for key, value in summary.items():
+        print(f"{key:>20}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+📮 SMTP Sink
+Local SMTP server that accepts every message and keeps it in memory
+
+Lets the notification digests be sent over real SMTP in tests and local
+runs, and counts client connections so connection reuse can be checked.
+
+Usage:
+    python -m app.devtools.smtp_sink --port 1025
+
+    # Then point the API and workers at it
+    SMTP_HOST=127.0.0.1 SMTP_PORT=1025 SMTP_TLS=false \\
+        celery -A app.core.celery_app worker --queues=notifications
+"""
+
+import argparse
+import socket
+import threading
+import time
+from email import message_from_bytes, policy
+from email.message import EmailMessage
+from typing import Any, List, Set, Tuple
+
+from aiosmtpd.controller import Controller  # type: ignore
+
+
+def _free_port(host: str) -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+class SMTPSink:
+    """
+    aiosmtpd server running in a background thread.
+
+    Stores every accepted message as an EmailMessage and remembers the peer
+    address of each client connection that delivered one.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.host = host
+        self.port = port or _free_port(host)
+        self.messages: List[EmailMessage] = []
+        self._peers: Set[Tuple[str, int]] = set()
+        self._lock = threading.Lock()
+        self._controller = Controller(self, hostname=host, port=self.port)
+
+    @property
+    def connection_count(self) -> int:
+        """Number of distinct client connections that delivered mail."""
+        with self._lock:
+            return len(self._peers)
+
+    async def handle_DATA(self, server: Any, session: Any, envelope: Any) -> str:
+        message = message_from_bytes(envelope.content, policy=policy.default)
+        with self._lock:
+            self.messages.append(message)
+            self._peers.add(tuple(session.peer[:2]))
+        return "250 Message accepted for delivery"
+
+    def start(self) -> "SMTPSink":
+        self._controller.start()
+        return self
+
+    def stop(self) -> None:
+        self._controller.stop()
+
+    def __enter__(self) -> "SMTPSink":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local SMTP sink")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=1025)
+    args = parser.parse_args()
+
+    sink = SMTPSink(args.host, args.port).start()
+    print(f"SMTP sink listening on {sink.host}:{sink.port}")
+    seen = 0
+    try:
+        while True:
+            time.sleep(1)
+            for message in sink.messages[seen:]:
+                print(f"--- To: {message['To']} | {message['Subject']}")
+                print(message.get_content())
+            seen = len(sink.messages)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sink.stop()
+
+
+if __name__ == "__main__":
+    main()
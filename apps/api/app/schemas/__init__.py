@@ -34,6 +34,9 @@ from .assessor import (
     AssessmentDetailsResponse,
     AssessorQueueItem,
     MOVUploadResponse,
+    ValidationBatchItem,
+    ValidationBatchRequest,
+    ValidationBatchResponse,
     ValidationRequest,
     ValidationResponse,
 )
@@ -87,5 +90,8 @@ __all__ = [
     "AssessmentDetailsResponse",
     "ValidationRequest",
     "ValidationResponse",
+    "ValidationBatchItem",
+    "ValidationBatchRequest",
+    "ValidationBatchResponse",
     "MOVUploadResponse",
 ]
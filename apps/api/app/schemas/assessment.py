@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from app.db.enums import AssessmentStatus, ComplianceStatus, MOVStatus
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 # ============================================================================
 # Indicator Schemas
@@ -153,6 +153,12 @@ class MOVCreate(BaseModel):
     response_id: int
 
 
+class MOVBulkCreate(BaseModel):
+    """Schema for registering many MOVs of one assessment in one request."""
+
+    movs: List[MOVCreate] = Field(min_length=1, max_length=500)
+
+
 class MOVUpdate(BaseModel):
     """Schema for updating MOV information."""
 
@@ -377,6 +383,17 @@ class AssessmentDashboardResponse(BaseModel):
     upcoming_deadlines: List[Dict[str, Any]] = []  # Any upcoming deadlines
 
 
+# ============================================================================
+# Intelligence Schemas
+# ============================================================================
+
+
+class InsightBatchRequest(BaseModel):
+    """Schema for requesting AI insights for many assessments at once."""
+
+    assessment_ids: List[int] = Field(min_length=1, max_length=1000)
+
+
 # ============================================================================
 # Update forward references for nested models
 # ============================================================================
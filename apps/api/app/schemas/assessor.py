@@ -2,9 +2,10 @@
 # Pydantic models for assessor-related API responses/requests
 
 from datetime import datetime
+from typing import List
 
 from app.db.enums import ValidationStatus
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class AssessorQueueItem(BaseModel):
@@ -35,6 +36,28 @@ class ValidationResponse(BaseModel):
     validation_status: ValidationStatus
 
 
+class ValidationBatchItem(ValidationRequest):
+    """One response's validation within a batch."""
+
+    response_id: int
+
+
+class ValidationBatchRequest(BaseModel):
+    """Request schema for validating many responses of one assessment."""
+
+    items: List[ValidationBatchItem] = Field(min_length=1, max_length=500)
+
+
+class ValidationBatchResponse(BaseModel):
+    """Response schema for the batch validation endpoint."""
+
+    success: bool
+    message: str
+    assessment_id: int
+    validated_count: int
+    comments_created: int
+
+
 class MOVUploadResponse(BaseModel):
     """Response schema for MOV upload endpoint."""
 
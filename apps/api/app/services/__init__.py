@@ -1,18 +1,30 @@
 # 🔧 Services Package
 # Business logic layer services
 
+# Registers the session hooks that drop cached principals when users change
+from app.core import principal_cache  # noqa: F401
+
 from .assessment_service import AssessmentService, assessment_service
 from .assessor_service import AssessorService, assessor_service
+from .insight_cache_service import InsightCacheService, insight_cache_service
 from .intelligence_service import IntelligenceService, intelligence_service
+from .notification_service import NotificationService, notification_service
 from .startup_service import StartupService, startup_service
+from .storage_outbox_service import StorageOutboxService, storage_outbox_service
 
 __all__ = [
     "assessment_service",
     "AssessmentService",
     "assessor_service",
     "AssessorService",
+    "insight_cache_service",
+    "InsightCacheService",
     "intelligence_service",
     "IntelligenceService",
+    "notification_service",
+    "NotificationService",
     "startup_service",
     "StartupService",
+    "storage_outbox_service",
+    "StorageOutboxService",
 ]
@@ -2,12 +2,15 @@
 # Business logic for assessment management operations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
+from app.core.config import settings
+from app.core.etag import make_etag
 from app.db.enums import AssessmentStatus, MOVStatus
 from app.db.models import (
     MOV,
     Assessment,
+    AssessmentGovernanceArea,
     AssessmentResponse,
     FeedbackComment,
     GovernanceArea,
@@ -23,18 +26,40 @@ from app.schemas.assessment import (
     FeedbackCommentCreate,
     FormSchemaValidation,
     GovernanceAreaProgress,
+    MOVBulkCreate,
     MOVCreate,
     ProgressSummary,
 )
+from app.services.indicator_tree_cache import (
+    GovernanceAreaNode,
+    IndicatorNode,
+    catalogue_version_column,
+    indicator_tree_cache,
+)
+from app.services.storage_outbox_service import storage_outbox_service
 from fastapi import HTTPException, status  # type: ignore[reportMissingImports]
-from sqlalchemy import and_, func  # type: ignore[reportMissingImports]
-from sqlalchemy.orm import Session, joinedload  # type: ignore[reportMissingImports]
+from sqlalchemy import (  # type: ignore[reportMissingImports]
+    and_,
+    case,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+    update,
+)
+from sqlalchemy.orm import (  # type: ignore[reportMissingImports]
+    Session,
+    joinedload,
+    selectinload,
+)
 
 
 class AssessmentService:
     """Service class for assessment management operations."""
 
     # ----- Serialization helpers -----
+    # Serializers accept ORM objects or column rows with the same attribute names
     def _serialize_response_obj(self, response: Optional[AssessmentResponse]) -> Optional[Dict[str, Any]]:
         if response is None:
             return None
@@ -45,8 +70,8 @@ class AssessmentService:
             "requires_rework": response.requires_rework,
             "assessment_id": response.assessment_id,
             "indicator_id": response.indicator_id,
-            "created_at": response.created_at.isoformat() if response.created_at else None,
-            "updated_at": response.updated_at.isoformat() if response.updated_at else None,
+            "created_at": response.created_at,
+            "updated_at": response.updated_at,
         }
 
     def _serialize_mov_list(self, movs: Optional[List[MOV]]) -> List[Dict[str, Any]]:
@@ -60,13 +85,164 @@ class AssessmentService:
                 "file_size": mov.file_size,
                 "content_type": mov.content_type,
                 "storage_path": mov.storage_path,
-                "status": mov.status.value if hasattr(mov.status, "value") else mov.status,
+                "status": mov.status,
                 "response_id": mov.response_id,
-                "uploaded_at": mov.uploaded_at.isoformat() if mov.uploaded_at else None,
+                "uploaded_at": mov.uploaded_at,
             }
             for mov in movs
         ]
 
+    # ----- Bulk loaders (plain rows, no identity map) -----
+    def load_response_graph(
+        self,
+        db: Session,
+        assessment_id: int,
+        governance_area_id: Optional[int] = None,
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Load an assessment's responses with their MOVs and feedback comments.
+
+        Issues three flat SELECTs (responses, MOVs, comments) instead of one
+        joinedload whose rows multiply responses x MOVs x comments, and builds
+        plain dicts from column tuples instead of identity-mapped ORM objects.
+
+        Args:
+            db: Database session
+            assessment_id: ID of the assessment
+            governance_area_id: Only load responses to indicators in this area
+
+        Returns:
+            Dictionary keyed by indicator_id with "response" (serialized like
+            `_serialize_response_obj`), "movs" and "feedback_comments" entries
+        """
+        # Every batch is scoped by the same response filter
+        response_filter = [AssessmentResponse.assessment_id == assessment_id]
+        if governance_area_id is not None:
+            response_filter.append(
+                AssessmentResponse.indicator_id.in_(
+                    select(Indicator.id).where(
+                        Indicator.governance_area_id == governance_area_id
+                    )
+                )
+            )
+
+        response_rows = db.execute(
+            select(
+                AssessmentResponse.id,
+                AssessmentResponse.response_data,
+                AssessmentResponse.is_completed,
+                AssessmentResponse.requires_rework,
+                AssessmentResponse.assessment_id,
+                AssessmentResponse.indicator_id,
+                AssessmentResponse.created_at,
+                AssessmentResponse.updated_at,
+            ).where(*response_filter)
+        ).all()
+
+        graph: Dict[int, Dict[str, Any]] = {}
+        by_response_id: Dict[int, Dict[str, Any]] = {}
+        for row in response_rows:
+            entry = {
+                "response": self._serialize_response_obj(row),
+                "movs": [],
+                "feedback_comments": [],
+            }
+            graph[row.indicator_id] = entry
+            by_response_id[row.id] = entry
+
+        if not graph:
+            return graph
+
+        # MOV -> response is many-to-one, so joining to filter by assessment
+        # does not multiply rows
+        mov_rows = db.execute(
+            select(
+                MOV.id,
+                MOV.filename,
+                MOV.original_filename,
+                MOV.file_size,
+                MOV.content_type,
+                MOV.storage_path,
+                MOV.status,
+                MOV.response_id,
+                MOV.uploaded_at,
+            )
+            .join(AssessmentResponse, MOV.response_id == AssessmentResponse.id)
+            .where(*response_filter)
+            .order_by(MOV.id)
+        ).all()
+        for mov in self._serialize_mov_list(mov_rows):
+            by_response_id[mov["response_id"]]["movs"].append(mov)
+
+        comment_rows = db.execute(
+            select(
+                FeedbackComment.id,
+                FeedbackComment.comment,
+                FeedbackComment.comment_type,
+                FeedbackComment.is_internal_note,
+                FeedbackComment.response_id,
+                FeedbackComment.assessor_id,
+                FeedbackComment.created_at,
+            )
+            .join(
+                AssessmentResponse,
+                FeedbackComment.response_id == AssessmentResponse.id,
+            )
+            .where(*response_filter)
+            .order_by(FeedbackComment.id)
+        ).all()
+        for c in comment_rows:
+            by_response_id[c.response_id]["feedback_comments"].append(
+                {
+                    "id": c.id,
+                    "comment": c.comment,
+                    "comment_type": c.comment_type,
+                    "is_internal_note": c.is_internal_note,
+                    "response_id": c.response_id,
+                    "assessor_id": c.assessor_id,
+                    "created_at": c.created_at,
+                }
+            )
+
+        return graph
+
+    def load_response_summaries(self, db: Session, assessment_id: int) -> List[Any]:
+        """
+        Load per-response flags and MOV/comment counts in a single query.
+
+        Counts come from correlated subqueries, so each response yields exactly
+        one row regardless of how many MOVs or comments it has.
+
+        Args:
+            db: Database session
+            assessment_id: ID of the assessment
+
+        Returns:
+            List of rows with indicator_id, is_completed, requires_rework,
+            mov_count and comment_count
+        """
+        mov_count = (
+            select(func.count(MOV.id))
+            .where(MOV.response_id == AssessmentResponse.id)
+            .correlate(AssessmentResponse)
+            .scalar_subquery()
+        )
+        comment_count = (
+            select(func.count(FeedbackComment.id))
+            .where(FeedbackComment.response_id == AssessmentResponse.id)
+            .correlate(AssessmentResponse)
+            .scalar_subquery()
+        )
+        return db.execute(
+            select(
+                AssessmentResponse.indicator_id,
+                AssessmentResponse.is_completed,
+                AssessmentResponse.requires_rework,
+                mov_count.label("mov_count"),
+                comment_count.label("comment_count"),
+            ).where(AssessmentResponse.assessment_id == assessment_id)
+        ).all()
+
     def get_assessment_for_blgu(
         self, db: Session, blgu_user_id: int
     ) -> Optional[Assessment]:
@@ -84,6 +260,113 @@ class AssessmentService:
             db.query(Assessment).filter(Assessment.blgu_user_id == blgu_user_id).first()
         )
 
+    def get_blgu_assessment_ref(self, db: Session, blgu_user_id: int) -> Optional[Any]:
+        """
+        Get the id and status of a BLGU user's assessment without loading it.
+
+        Args:
+            db: Database session
+            blgu_user_id: ID of the BLGU user
+
+        Returns:
+            Row with `id` and `status`, or None if the user has no assessment
+        """
+        return db.execute(
+            select(Assessment.id, Assessment.status)
+            .where(Assessment.blgu_user_id == blgu_user_id)
+            .limit(1)
+        ).first()
+
+    def get_response_owner(self, db: Session, response_id: int) -> Optional[Any]:
+        """
+        Resolve who owns an assessment response with one join query.
+
+        Args:
+            db: Database session
+            response_id: ID of the assessment response
+
+        Returns:
+            Row with `response_id`, `assessment_id`, `blgu_user_id` and
+            `assessment_status`, or None if the response does not exist
+        """
+        return db.execute(
+            select(
+                AssessmentResponse.id.label("response_id"),
+                Assessment.id.label("assessment_id"),
+                Assessment.blgu_user_id,
+                Assessment.status.label("assessment_status"),
+            )
+            .join(Assessment, AssessmentResponse.assessment_id == Assessment.id)
+            .where(AssessmentResponse.id == response_id)
+        ).first()
+
+    def get_mov_owner(self, db: Session, mov_id: int) -> Optional[Any]:
+        """
+        Resolve who owns a MOV with one join query (MOV -> response -> assessment).
+
+        Args:
+            db: Database session
+            mov_id: ID of the MOV
+
+        Returns:
+            Row with `mov_id`, `response_id`, `assessment_id`, `blgu_user_id`
+            and `assessment_status` (None for a MOV without a response), or
+            None if the MOV does not exist
+        """
+        return db.execute(
+            select(
+                MOV.id.label("mov_id"),
+                AssessmentResponse.id.label("response_id"),
+                Assessment.id.label("assessment_id"),
+                Assessment.blgu_user_id,
+                Assessment.status.label("assessment_status"),
+            )
+            .outerjoin(AssessmentResponse, MOV.response_id == AssessmentResponse.id)
+            .outerjoin(Assessment, AssessmentResponse.assessment_id == Assessment.id)
+            .where(MOV.id == mov_id)
+        ).first()
+
+    def get_assessment_etag(
+        self,
+        db: Session,
+        variant: str,
+        assessment_id: Optional[int] = None,
+        blgu_user_id: Optional[int] = None,
+    ) -> Optional[str]:
+        """
+        Compute the ETag of an assessment representation from one indexed lookup.
+
+        The ETag covers the assessment id, its `updated_at` (touched on every
+        response, MOV and feedback write, see `touch_assessments`) and the
+        indicator catalogue version. Nothing from the response graph is loaded.
+
+        Args:
+            db: Database session
+            variant: Name of the representation (e.g. "dashboard"), so that
+                different endpoints never share an ETag
+            assessment_id: Look the assessment up by primary key
+            blgu_user_id: Look the assessment up by its BLGU user instead
+
+        Returns:
+            Quoted ETag string, or None if the assessment does not exist yet
+        """
+        query = select(
+            Assessment.id,
+            Assessment.updated_at,
+            catalogue_version_column().label("catalogue_version"),
+        )
+        if assessment_id is not None:
+            query = query.where(Assessment.id == assessment_id)
+        else:
+            query = query.where(Assessment.blgu_user_id == blgu_user_id)
+
+        row = db.execute(query.limit(1)).first()
+        if row is None:
+            return None
+
+        updated_at = row.updated_at.isoformat() if row.updated_at else None
+        return make_etag(variant, row.id, updated_at, row.catalogue_version or 0)
+
     def get_assessment_with_responses(
         self, db: Session, assessment_id: int
     ) -> Optional[Assessment]:
@@ -119,6 +402,10 @@ class AssessmentService:
         Get complete assessment data for BLGU user including all governance areas,
         indicators, and responses.
 
+        With `READ_PATH_SAFEGUARDS` disabled (production default) this is a
+        read-only path: one SELECT for the assessment and one batch for its
+        responses, with the indicator catalogue served from `indicator_tree_cache`.
+
         Args:
             db: Database session
             blgu_user_id: ID of the BLGU user
@@ -126,15 +413,134 @@ class AssessmentService:
         Returns:
             Dictionary with assessment and governance areas data
         """
+        assessment = self._get_or_create_blgu_assessment(db, blgu_user_id)
+
+        # Responses with MOVs and comments as plain dicts, keyed by indicator_id
+        response_lookup = self.load_response_graph(db, assessment.id)
+
+        # Indicator catalogue skeleton, shared across requests until reseeded
+        indicator_tree = indicator_tree_cache.get_tree(db)
+
+        return {
+            "assessment": self._serialize_assessment_summary(assessment),
+            "governance_areas": [
+                self._serialize_governance_area(area, response_lookup)
+                for area in indicator_tree.areas
+            ],
+        }
+
+    def get_governance_area_for_blgu(
+        self, db: Session, blgu_user_id: int, governance_area_id: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get one governance area's indicator subtree with this BLGU's responses.
+
+        Only responses, MOVs and comments of indicators in the area are loaded
+        (filtered in SQL by `Indicator.governance_area_id`), so opening a single
+        area costs a fraction of `get_assessment_for_blgu_with_full_data`.
+
+        Args:
+            db: Database session
+            blgu_user_id: ID of the BLGU user
+            governance_area_id: ID of the governance area to load
+
+        Returns:
+            Dictionary with assessment and governance area data, or None if the
+            governance area does not exist
+        """
+        assessment = self._get_or_create_blgu_assessment(db, blgu_user_id)
+
+        indicator_tree = indicator_tree_cache.get_tree(db)
+        area = next(
+            (a for a in indicator_tree.areas if a.id == governance_area_id), None
+        )
+        if area is None:
+            return None
+
+        response_lookup = self.load_response_graph(
+            db, assessment.id, governance_area_id=governance_area_id
+        )
+
+        return {
+            "assessment": self._serialize_assessment_summary(assessment),
+            "governance_area": self._serialize_governance_area(area, response_lookup),
+        }
+
+    def get_governance_area_index_for_blgu(
+        self, db: Session, blgu_user_id: int
+    ) -> Dict[str, Any]:
+        """
+        Get the list of governance areas with per-area progress counts.
+
+        Meant for the initial page load: no form schemas, MOVs or comments are
+        included, and the counts come from one grouped query.
+
+        Args:
+            db: Database session
+            blgu_user_id: ID of the BLGU user
+
+        Returns:
+            Dictionary with assessment data and one summary per governance area
+        """
+        assessment = self._get_or_create_blgu_assessment(db, blgu_user_id)
+        indicator_tree = indicator_tree_cache.get_tree(db)
+
+        counts_by_area = {
+            row.governance_area_id: row
+            for row in db.execute(
+                select(
+                    Indicator.governance_area_id,
+                    func.count(AssessmentResponse.id).label("responses"),
+                    func.count(case((AssessmentResponse.is_completed, 1))).label(
+                        "completed"
+                    ),
+                    func.count(case((AssessmentResponse.requires_rework, 1))).label(
+                        "requires_rework"
+                    ),
+                )
+                .join(Indicator, AssessmentResponse.indicator_id == Indicator.id)
+                .where(AssessmentResponse.assessment_id == assessment.id)
+                .group_by(Indicator.governance_area_id)
+            )
+        }
+
+        def count_nodes(nodes: tuple) -> int:
+            return sum(1 + count_nodes(node.children) for node in nodes)
+
+        areas = []
+        for area in indicator_tree.areas:
+            counts = counts_by_area.get(area.id)
+            areas.append(
+                {
+                    "id": area.id,
+                    "name": area.name,
+                    "area_type": area.area_type,
+                    "total_indicators": count_nodes(area.indicators),
+                    "responses": counts.responses if counts else 0,
+                    "completed_indicators": counts.completed if counts else 0,
+                    "requires_rework_count": counts.requires_rework if counts else 0,
+                }
+            )
+
+        return {
+            "assessment": self._serialize_assessment_summary(assessment),
+            "governance_areas": areas,
+        }
+
+    def _get_or_create_blgu_assessment(
+        self, db: Session, blgu_user_id: int
+    ) -> Assessment:
+        """Get the BLGU user's assessment for the read endpoints, bootstrapping it once."""
         try:
+            if settings.READ_PATH_SAFEGUARDS:
+                # Dev mode: self-heal missing areas/indicators on every read
+                self._ensure_catalogue_exists(db)
+
             # Get assessment
-            assessment = (
-                db.query(Assessment)
-                .filter(Assessment.blgu_user_id == blgu_user_id)
-                .first()
-            )
+            assessment = self.get_assessment_for_blgu(db, blgu_user_id)
 
-            # Create if not exists
+            # Create if not exists. This is a one-time bootstrap for users created
+            # after the last safeguard run; steady-state reads never write.
             if assessment is None:
                 assessment = Assessment(
                     blgu_user_id=blgu_user_id,
@@ -146,151 +552,152 @@ class AssessmentService:
                 db.commit()
                 db.refresh(assessment)
 
-            # Ensure governance areas exist (dev safeguard)
-            self._ensure_governance_areas_exist(db)
+        except Exception as e:
+            print(f"Error in _get_or_create_blgu_assessment: {e}")
+            raise
 
-            # Get all governance areas
-            governance_areas = db.query(GovernanceArea).all()
+        return assessment
 
-            # If no indicators exist, create some sample indicators for development
-            areas_with_no_indicators = (
-                db.query(GovernanceArea).outerjoin(Indicator).group_by(GovernanceArea.id).having(func.count(Indicator.id) == 0).all()
-            )
-            if areas_with_no_indicators:
-                self._create_sample_indicators(db)
+    def _serialize_assessment_summary(self, assessment: Assessment) -> Dict[str, Any]:
+        """Convert the assessment header fields to a dictionary for JSON serialization."""
+        return {
+            "id": assessment.id,
+            "status": assessment.status.value,
+            "blgu_user_id": assessment.blgu_user_id,
+            "created_at": assessment.created_at,
+            "updated_at": assessment.updated_at,
+            "submitted_at": assessment.submitted_at,
+            "validated_at": assessment.validated_at,
+        }
 
-        except Exception as e:
-            print(f"Error in get_assessment_for_blgu_with_full_data: {e}")
-            raise
+    def _serialize_governance_area(
+        self, area: GovernanceAreaNode, response_lookup: Dict[int, Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Merge an assessment's response graph into a cached governance area subtree.
 
-        # Get all responses for this assessment
-        responses = (
-            db.query(AssessmentResponse)
-            .options(
-                joinedload(AssessmentResponse.indicator),
-                joinedload(AssessmentResponse.movs),
-                joinedload(AssessmentResponse.feedback_comments),
-            )
-            .filter(AssessmentResponse.assessment_id == assessment.id)
-            .all()
-        )
+        Args:
+            area: Cached governance area node from `indicator_tree_cache`
+            response_lookup: Output of `load_response_graph`, keyed by indicator_id
 
-        # Create response lookup
-        response_lookup = {r.indicator_id: r for r in responses}
+        Returns:
+            Dictionary with the area and its top-level indicators, nested children
+        """
 
-        # Fetch all indicators once to avoid N+1 and build a tree by area
-        all_indicators = db.query(Indicator).all()
-        indicators_by_area: Dict[int, list[Indicator]] = {}
-        for ind in all_indicators:
-            indicators_by_area.setdefault(ind.governance_area_id, []).append(ind)
-
-        # Pre-build adjacency lists for indicators for O(n) tree assembly
-        children_by_parent: Dict[int | None, list[Indicator]] = {}
-        for ind in all_indicators:
-            children_by_parent.setdefault(getattr(ind, "parent_id", None), []).append(ind)
-
-        def serialize_indicator_node(ind: Indicator) -> Dict[str, Any]:
-            """Serialize an indicator and attach nested children without triggering lazy loads."""
-            response = response_lookup.get(ind.id)
-            node = {
+        def serialize_indicator_node(ind: IndicatorNode) -> Dict[str, Any]:
+            """Merge this assessment's response data into a cached indicator node."""
+            entry = response_lookup.get(ind.id)
+            return {
                 "id": ind.id,
                 "name": ind.name,
                 "description": ind.description,
                 "form_schema": ind.form_schema,
-                "response": self._serialize_response_obj(response),
-                "movs": self._serialize_mov_list(response.movs) if response else [],
-                "feedback_comments": [
-                    {
-                        "id": c.id,
-                        "comment": c.comment,
-                        "comment_type": c.comment_type,
-                        "is_internal_note": c.is_internal_note,
-                        "response_id": c.response_id,
-                        "assessor_id": c.assessor_id,
-                        "created_at": c.created_at.isoformat() if c.created_at else None,
-                    }
-                    for c in (response.feedback_comments if response else [])
-                ],
-                "children": [],
+                "response": entry["response"] if entry else None,
+                "movs": entry["movs"] if entry else [],
+                "feedback_comments": entry["feedback_comments"] if entry else [],
+                "children": [serialize_indicator_node(child) for child in ind.children],
             }
-            # Recurse over children using pre-built adjacency lists
-            for child in children_by_parent.get(ind.id, []):
-                node["children"].append(serialize_indicator_node(child))
-            return node
 
-        # Build governance areas with top-level indicators and nested children
-        governance_areas_data = []
-        for area in governance_areas:
-            area_data = {
-                "id": area.id,
-                "name": area.name,
-                "area_type": area.area_type.value,
-                "indicators": [],
-            }
+        area_data = {
+            "id": area.id,
+            "name": area.name,
+            "area_type": area.area_type,
+            "indicators": [],
+        }
 
-            # Add only top-level indicators for this area, with nested children
-            top_level_nodes: list[Dict[str, Any]] = []
-            top_level_inds = [
-                ind for ind in indicators_by_area.get(area.id, []) if getattr(ind, "parent_id", None) is None
-            ]
-            
-            # For area 1, only use the first indicator as the parent for synthetic children
-            if area.id == 1:
-                # Only take the first indicator for area 1 to use as parent
-                top_level_inds = top_level_inds[:1]
-            
-            for ind in top_level_inds:
-                top_level_nodes.append(serialize_indicator_node(ind))
-
-            # Option B (dev/demo): inject synthetic children for Area 1 using existing helper
-            # This enables nested rendering even without DB hierarchy
-            if area.id == 1 and len(top_level_inds) >= 1 and len(top_level_nodes) >= 1:
-                base_ind = top_level_inds[0]
-                base_resp = response_lookup.get(base_ind.id)
-                try:
-                    fi_subs = self._build_fi_mock_subindicators(base_ind, base_resp)
-                    # Override parent display title to match spec (1.1 Compliance ...)
-                    top_level_nodes[0]["name"] = (
-                        "BFDP Board Compliance"
-                    )
-                    # Provide explicit code so frontend doesn't derive from DB id (e.g., 1.119)
-                    top_level_nodes[0]["code"] = "1.1"
-                    # Override the description to match the parent role
-                    top_level_nodes[0]["description"] = (
-                        "Compliance with the Barangay Full Disclosure Policy (BFDP) Board requirements"
-                    )
-                    # Clear MOVs from parent since children will show them
-                    top_level_nodes[0]["movs"] = []
-                    # Clear existing children and add synthetic ones
-                    top_level_nodes[0]["children"] = fi_subs
-                except Exception:
-                    # Fail-safe: ignore mock injection errors in prod paths
-                    pass
+        # Add only top-level indicators for this area, with nested children
+        top_level_nodes: list[Dict[str, Any]] = []
+        top_level_inds = list(area.indicators)
+
+        # For area 1, only use the first indicator as the parent for synthetic children
+        if area.id == 1:
+            # Only take the first indicator for area 1 to use as parent
+            top_level_inds = top_level_inds[:1]
+
+        for ind in top_level_inds:
+            top_level_nodes.append(serialize_indicator_node(ind))
+
+        # Option B (dev/demo): inject synthetic children for Area 1 using existing helper
+        # This enables nested rendering even without DB hierarchy
+        if area.id == 1 and len(top_level_inds) >= 1 and len(top_level_nodes) >= 1:
+            base_ind = top_level_inds[0]
+            base_entry = response_lookup.get(base_ind.id)
+            try:
+                fi_subs = self._build_fi_mock_subindicators(base_ind, base_entry)
+                # Override parent display title to match spec (1.1 Compliance ...)
+                top_level_nodes[0]["name"] = (
+                    "BFDP Board Compliance"
+                )
+                # Provide explicit code so frontend doesn't derive from DB id (e.g., 1.119)
+                top_level_nodes[0]["code"] = "1.1"
+                # Override the description to match the parent role
+                top_level_nodes[0]["description"] = (
+                    "Compliance with the Barangay Full Disclosure Policy (BFDP) Board requirements"
+                )
+                # Clear MOVs from parent since children will show them
+                top_level_nodes[0]["movs"] = []
+                # Clear existing children and add synthetic ones
+                top_level_nodes[0]["children"] = fi_subs
+            except Exception:
+                # Fail-safe: ignore mock injection errors in prod paths
+                pass
+
+        area_data["indicators"].extend(top_level_nodes)
+        return area_data
+
+    def run_data_safeguards(self, db: Session) -> Dict[str, int]:
+        """
+        Ensure the data the BLGU assessment form depends on exists.
 
-            area_data["indicators"].extend(top_level_nodes)
+        - Creates any missing SGLGB governance areas
+        - Creates sample indicators if any area has none (dev use)
+        - Creates a DRAFT assessment for every BLGU user that lacks one
 
-            governance_areas_data.append(area_data)
+        Runs once at startup and via `python manage.py ensure-data`. With
+        `READ_PATH_SAFEGUARDS` enabled, the area/indicator checks also run on
+        every BLGU read.
 
-        # Convert SQLAlchemy models to dictionaries for JSON serialization
-        assessment_dict = {
-            "id": assessment.id,
-            "status": assessment.status.value,
-            "blgu_user_id": assessment.blgu_user_id,
-            "created_at": assessment.created_at.isoformat(),
-            "updated_at": assessment.updated_at.isoformat(),
-            "submitted_at": assessment.submitted_at.isoformat()
-            if assessment.submitted_at
-            else None,
-            "validated_at": assessment.validated_at.isoformat()
-            if assessment.validated_at
-            else None,
-        }
+        Args:
+            db: Database session
+
+        Returns:
+            Dictionary with counts of created records
+        """
+        from app.db.enums import UserRole
+        from app.db.models.user import User
+
+        areas_without_indicators = self._ensure_catalogue_exists(db)
+
+        # Every BLGU user gets a DRAFT assessment up front so reads never create one
+        users_without_assessment = (
+            db.query(User.id)
+            .outerjoin(Assessment, Assessment.blgu_user_id == User.id)
+            .filter(User.role == UserRole.BLGU_USER, Assessment.id.is_(None))
+            .all()
+        )
+        for (user_id,) in users_without_assessment:
+            db.add(Assessment(blgu_user_id=user_id, status=AssessmentStatus.DRAFT))
+        if users_without_assessment:
+            db.commit()
 
         return {
-            "assessment": assessment_dict,
-            "governance_areas": governance_areas_data,
+            "areas_without_indicators": areas_without_indicators,
+            "assessments_created": len(users_without_assessment),
         }
 
+    def _ensure_catalogue_exists(self, db: Session) -> int:
+        """Ensure governance areas exist and seed sample indicators for empty areas (dev use)."""
+        self._ensure_governance_areas_exist(db)
+
+        # If no indicators exist, create some sample indicators for development
+        areas_with_no_indicators = (
+            db.query(GovernanceArea).outerjoin(Indicator).group_by(GovernanceArea.id).having(func.count(Indicator.id) == 0).all()
+        )
+        if areas_with_no_indicators:
+            self._create_sample_indicators(db)
+
+        return len(areas_with_no_indicators)
+
     def _ensure_governance_areas_exist(self, db: Session) -> None:
         """Ensure the 6 governance areas exist. Creates them if missing (dev use)."""
         from app.db.models.governance_area import GovernanceArea
@@ -327,21 +734,22 @@ class AssessmentService:
                 db.delete(ga)
             db.commit()
 
-    def _build_fi_mock_subindicators(self, base_indicator, base_response) -> List[Dict[str, Any]]:
+    def _build_fi_mock_subindicators(self, base_indicator, base_entry) -> List[Dict[str, Any]]:
         """
         Build 4 mock sub-indicators for Area 1 (for frontend testing only).
         These reuse the REAL assessment response (if any) of the base indicator
         so the frontend can POST MOVs using a valid response_id.
+
+        `base_entry` is the base indicator's entry from `load_response_graph`.
         """
         subs: List[Dict[str, Any]] = []
 
         # Determine an id that the frontend can use for MOV upload. Prefer the
         # real response id; if none exists yet, fall back to the base indicator id
         # (upload will 404 until a real response is created by the client elsewhere).
-        safe_id = base_response.id if base_response else base_indicator.id
-        safe_movs = base_response.movs if base_response else []
-        serialized_response = self._serialize_response_obj(base_response)
-        serialized_movs = self._serialize_mov_list(safe_movs)
+        serialized_response = base_entry["response"] if base_entry else None
+        serialized_movs = base_entry["movs"] if base_entry else []
+        safe_id = serialized_response["id"] if serialized_response else base_indicator.id
 
         # 1.1.1 – Posted documents (child indicator under 1.1 Compliance)
         subs.append(
@@ -646,6 +1054,9 @@ class AssessmentService:
             db_response.is_completed = False
 
         db.add(db_response)
+        db.flush()
+        sync_assessment_area_links(db, [response_create.assessment_id])
+        touch_assessments(db, [response_create.assessment_id])
         db.commit()
         db.refresh(db_response)
         return db_response
@@ -690,6 +1101,7 @@ class AssessmentService:
                 db_response.indicator.form_schema, response_update.response_data, db_response.movs
             )
 
+        touch_assessments(db, [db_response.assessment_id])
         db.commit()
         db.refresh(db_response)
         return db_response
@@ -1016,12 +1428,7 @@ class AssessmentService:
                 db.add(db_response)
                 
                 # Touch the parent assessment's updated_at to bust frontend cache
-                if db_response.assessment_id:
-                    from datetime import datetime, timezone
-                    db_assessment = db.query(Assessment).filter(Assessment.id == db_response.assessment_id).first()
-                    if db_assessment:
-                        db_assessment.updated_at = datetime.now(timezone.utc)
-                        db.add(db_assessment)
+                touch_assessments(db, [db_response.assessment_id])
         
         try:
             db.commit()
@@ -1034,13 +1441,85 @@ class AssessmentService:
         db.refresh(db_mov)
         return db_mov
 
-    def delete_mov(self, db: Session, mov_id: int) -> bool:
+    def create_movs_bulk(
+        self, db: Session, assessment_id: int, bulk_create: MOVBulkCreate
+    ) -> List[MOV]:
         """
-        Atomically delete a MOV record and its corresponding storage file.
-        Also recalculates parent AssessmentResponse's completion status.
+        Register many MOVs across the responses of one assessment.
+
+        The MOVs are inserted with one INSERT ... RETURNING, completion is
+        recomputed once per affected response, and the assessment's
+        updated_at is touched once, all in one commit. The returned MOVs are
+        detached from the session, fully loaded from the RETURNING rows.
+
+        Args:
+            db: Database session
+            assessment_id: Assessment the MOVs' responses must belong to
+            bulk_create: MOVs to create
+
+        Returns:
+            Created MOV objects, in request order
+
+        Raises:
+            ValueError: If a response does not belong to the assessment
         """
-        from app.db.base import supabase_admin
+        response_ids = {mov.response_id for mov in bulk_create.movs}
+        owned_ids = set(
+            db.scalars(
+                select(AssessmentResponse.id).where(
+                    AssessmentResponse.id.in_(response_ids),
+                    AssessmentResponse.assessment_id == assessment_id,
+                )
+            )
+        )
+        foreign_ids = sorted(response_ids - owned_ids)
+        if foreign_ids:
+            raise ValueError(
+                f"Responses {foreign_ids} do not belong to assessment {assessment_id}"
+            )
 
+        try:
+            db_movs = db.scalars(
+                insert(MOV).returning(MOV, sort_by_parameter_order=True),
+                [
+                    {**mov.model_dump(), "status": MOVStatus.UPLOADED}
+                    for mov in bulk_create.movs
+                ],
+            ).all()
+            # RETURNING loaded every column; detached, they survive the commit
+            # without one refresh SELECT per MOV when the response is serialized
+            for db_mov in db_movs:
+                db.expunge(db_mov)
+
+            # Recompute completion once per affected response
+            responses = db.scalars(
+                select(AssessmentResponse)
+                .options(
+                    selectinload(AssessmentResponse.movs),
+                    joinedload(AssessmentResponse.indicator),
+                )
+                .where(AssessmentResponse.id.in_(owned_ids))
+                .execution_options(populate_existing=True)
+            ).unique()
+            for db_response in responses:
+                self.recompute_response_completion(db_response)
+
+            # Touch the parent assessment's updated_at to bust frontend cache
+            touch_assessments(db, [assessment_id])
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return db_movs
+
+    def delete_mov(self, db: Session, mov_id: int) -> bool:
+        """
+        Delete a MOV record and queue its storage file for deletion.
+
+        The MOV row, the parent response's completion recompute and the storage
+        outbox entry commit together; the outbox worker removes the file later,
+        so a slow storage API never holds the request or its DB connection.
+        """
         db_mov = db.query(MOV).filter(MOV.id == mov_id).first()
         if not db_mov:
             return False
@@ -1051,25 +1530,9 @@ class AssessmentService:
             .filter(AssessmentResponse.id == db_mov.response_id)
             .first()
         )
-        if not db_response:
-            # Possible data corruption, but MOV is useless, so delete just the file and MOV.
-            db_response = None
-        storage_path = db_mov.storage_path
-        # Step 1: Synchronously delete storage file. Fail if deletion fails.
-        if not supabase_admin:
-            raise RuntimeError("Supabase admin client not configured")
-        try:
-            storage_res = supabase_admin.storage.from_('movs').remove([storage_path])
-            # The supabase-py client raises on HTTP/storage network error, but check for errors in resp too
-            if isinstance(storage_res, dict) and storage_res.get('error'):
-                raise Exception(f"Supabase file delete error: {storage_res['error']}")
-        except Exception as e:
-            raise HTTPException(
-                status.HTTP_500_INTERNAL_SERVER_ERROR,
-                f"Failed to delete MOV file from storage: {str(e)}",
-            )
-        # Step 2: Delete MOV and update parent completion inside transaction
+        # Delete MOV, queue the file and update parent completion in one transaction
         try:
+            storage_outbox_service.enqueue(db, "movs", [db_mov.storage_path])
             db.delete(db_mov)
             if db_response is not None:
                 # Remove the NOW deleted MOV from in-memory .movs list before recompute
@@ -1080,12 +1543,7 @@ class AssessmentService:
                 db.add(db_response)
                 
                 # Touch the parent assessment's updated_at to bust frontend cache
-                if db_response.assessment_id:
-                    from datetime import datetime, timezone
-                    db_assessment = db.query(Assessment).filter(Assessment.id == db_response.assessment_id).first()
-                    if db_assessment:
-                        db_assessment.updated_at = datetime.now(timezone.utc)
-                        db.add(db_assessment)
+                touch_assessments(db, [db_response.assessment_id])
             db.commit()
         except Exception as e:
             db.rollback()
@@ -1116,6 +1574,7 @@ class AssessmentService:
         )
 
         db.add(db_comment)
+        touch_assessments(db, response_ids=[comment_create.response_id])
         db.commit()
         db.refresh(db_comment)
         return db_comment
@@ -1182,9 +1641,9 @@ class AssessmentService:
                 "status": assessment.status.value
                 if hasattr(assessment.status, "value")
                 else str(assessment.status),
-                "created_at": assessment.created_at.isoformat(),
-                "updated_at": assessment.updated_at.isoformat(),
-                "submitted_at": assessment.submitted_at.isoformat()
+                "created_at": assessment.created_at,
+                "updated_at": assessment.updated_at,
+                "submitted_at": assessment.submitted_at
                 if assessment.submitted_at
                 else None,
             },
@@ -1490,9 +1949,9 @@ class AssessmentService:
                 "status": assessment.status.value
                 if hasattr(assessment.status, "value")
                 else str(assessment.status),
-                "created_at": assessment.created_at.isoformat(),
-                "updated_at": assessment.updated_at.isoformat(),
-                "submitted_at": assessment.submitted_at.isoformat()
+                "created_at": assessment.created_at,
+                "updated_at": assessment.updated_at,
+                "submitted_at": assessment.submitted_at
                 if assessment.submitted_at
                 else None,
             }
@@ -1508,8 +1967,8 @@ class AssessmentService:
                 "is_active": getattr(user, "is_active", True),
                 "is_superuser": getattr(user, "is_superuser", False),
                 "must_change_password": getattr(user, "must_change_password", True),
-                "created_at": user.created_at.isoformat(),
-                "updated_at": user.updated_at.isoformat(),
+                "created_at": user.created_at,
+                "updated_at": user.updated_at,
             },
             "barangay": barangay_info,
             "assessment": assessment_info,
@@ -1542,8 +2001,8 @@ class AssessmentService:
             "assessment_year": current_year,
             "fiscal_year_start": 1,  # January
             "fiscal_year_end": 12,  # December
-            "assessment_period_start": datetime(current_year, 1, 1).isoformat(),
-            "assessment_period_end": datetime(current_year, 12, 31).isoformat(),
+            "assessment_period_start": datetime(current_year, 1, 1),
+            "assessment_period_end": datetime(current_year, 12, 31),
             "deadline_extensions": [],  # TODO: Implement deadline extension system
             "configuration_source": "default",  # Could be "database" or "config_file"
         }
@@ -1584,8 +2043,8 @@ class AssessmentService:
                     "id": comment.id,
                     "comment": comment.comment,
                     "comment_type": comment.comment_type,
-                    "created_at": comment.created_at.isoformat(),
-                    "updated_at": comment.created_at.isoformat(),  # Using created_at as updated_at for now
+                    "created_at": comment.created_at,
+                    "updated_at": comment.created_at,  # Using created_at as updated_at for now
                     "assessor": {
                         "id": getattr(comment.assessor, "id"),
                         "name": f"{getattr(comment.assessor, 'first_name', '')} {getattr(comment.assessor, 'last_name', '')}".strip(),
@@ -1690,7 +2149,7 @@ class AssessmentService:
                     "comment": comment.comment,
                     "comment_type": comment.comment_type,
                     "timestamps": {
-                        "created_at": created_at.isoformat(),
+                        "created_at": created_at,
                         "created_at_human": self._format_human_timestamp(created_at),
                         "created_at_relative": self._format_relative_timestamp(
                             created_at
@@ -1849,17 +2308,8 @@ class AssessmentService:
             .all()
         )
 
-        # Get all responses for this assessment
-        responses = (
-            db.query(AssessmentResponse)
-            .options(
-                joinedload(AssessmentResponse.indicator),
-                joinedload(AssessmentResponse.movs),
-                joinedload(AssessmentResponse.feedback_comments),
-            )
-            .filter(AssessmentResponse.assessment_id == assessment.id)
-            .all()
-        )
+        # One row per response with MOV/comment counts (no ORM graph needed)
+        responses = self.load_response_summaries(db, assessment.id)
 
         # Create response lookup by indicator_id
         response_lookup = {r.indicator_id: r for r in responses}
@@ -1880,11 +2330,11 @@ class AssessmentService:
 
         # Count responses with feedback
         responses_with_feedback = sum(
-            1 for response in responses if len(response.feedback_comments) > 0
+            1 for response in responses if response.comment_count > 0
         )
 
         # Count responses with MOVs
-        responses_with_movs = sum(1 for response in responses if len(response.movs) > 0)
+        responses_with_movs = sum(1 for response in responses if response.mov_count > 0)
 
         # Build governance area progress
         governance_area_progress = []
@@ -2028,59 +2478,151 @@ class AssessmentService:
         Returns:
             List of dictionaries with assessment details including compliance status
         """
+        return list(self.iter_validated_assessments(db, status=status))
+
+    def iter_validated_assessments(
+        self,
+        db: Session,
+        status: Optional[AssessmentStatus] = None,
+        batch_size: int = 200,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily build the assessment dictionaries of `get_all_validated_assessments`.
+
+        The rows are plain column tuples fetched `batch_size` at a time from
+        one query (a server-side cursor where the driver supports it), so the
+        session must stay open until the iterator is exhausted or closed.
+
+        Args:
+            db: Database session
+            status: Optional filter by assessment status (defaults to VALIDATED)
+            batch_size: Rows fetched from the cursor at a time
+
+        Returns:
+            Iterator of dictionaries with assessment details
+        """
+        from app.db.models.barangay import Barangay
         from app.db.models.user import User
 
-        # Query assessments with related user and barangay data
-        query = (
-            db.query(Assessment)
+        # Filter by status if provided
+        filter_status = status or AssessmentStatus.VALIDATED
+
+        result = db.execute(
+            select(
+                Assessment.id,
+                Assessment.status,
+                Assessment.final_compliance_status,
+                Assessment.area_results,
+                Assessment.ai_recommendations,
+                Assessment.validated_at,
+                Assessment.updated_at,
+                User.name.label("blgu_user_name"),
+                Barangay.name.label("barangay_name"),
+            )
             .join(User, Assessment.blgu_user_id == User.id)
-            .options(joinedload(Assessment.blgu_user).joinedload(User.barangay))
+            .outerjoin(Barangay, User.barangay_id == Barangay.id)
+            .where(Assessment.status == filter_status)
+            # Order by updated_at descending
+            .order_by(Assessment.updated_at.desc())
+            .execution_options(yield_per=batch_size)
         )
 
-        # Filter by status if provided
-        filter_status = status or AssessmentStatus.VALIDATED
-        query = query.filter(Assessment.status == filter_status)
-
-        # Order by updated_at descending
-        query = query.order_by(Assessment.updated_at.desc())
-
-        assessments = query.all()
-
-        # Build response list
-        assessment_list = []
-        for assessment in assessments:
-            # Get barangay name from relationship
-            barangay_name = "Unknown"
-            if assessment.blgu_user:
-                if (
-                    hasattr(assessment.blgu_user, "barangay")
-                    and assessment.blgu_user.barangay
-                ):
-                    barangay_name = assessment.blgu_user.barangay.name
-
-            assessment_list.append(
-                {
-                    "id": assessment.id,
-                    "status": assessment.status.value if assessment.status else None,
-                    "final_compliance_status": assessment.final_compliance_status.value
-                    if assessment.final_compliance_status
-                    else None,
-                    "area_results": assessment.area_results,
-                    "ai_recommendations": assessment.ai_recommendations,
-                    "barangay_name": barangay_name,
-                    "blgu_user_name": assessment.blgu_user.name
-                    if assessment.blgu_user
-                    else "Unknown",
-                    "validated_at": assessment.validated_at.isoformat()
-                    if assessment.validated_at
-                    else None,
-                    "updated_at": assessment.updated_at.isoformat()
-                    if assessment.updated_at
-                    else None,
-                }
+        for row in result:
+            yield {
+                "id": row.id,
+                "status": row.status,
+                "final_compliance_status": row.final_compliance_status,
+                "area_results": row.area_results,
+                "ai_recommendations": row.ai_recommendations,
+                "barangay_name": row.barangay_name or "Unknown",
+                "blgu_user_name": row.blgu_user_name or "Unknown",
+                "validated_at": row.validated_at,
+                "updated_at": row.updated_at,
+            }
+
+
+# 🔔 Assessment version tracking
+
+
+def touch_assessments(
+    db: Session,
+    assessment_ids: Iterable[Optional[int]] = (),
+    response_ids: Iterable[Optional[int]] = (),
+) -> None:
+    """
+    Move `Assessment.updated_at` forward after a write below an assessment.
+
+    The ETags of the assessment read endpoints are derived from
+    `Assessment.updated_at`, so every write path that changes responses, MOVs
+    or feedback comments calls this in the same transaction.
+
+    Args:
+        db: Database session
+        assessment_ids: Assessments that changed
+        response_ids: Responses whose assessments changed
+    """
+    assessment_ids = {i for i in assessment_ids if i is not None}
+    response_ids = {i for i in response_ids if i is not None}
+    if not assessment_ids and not response_ids:
+        return
+
+    conditions = []
+    if assessment_ids:
+        conditions.append(Assessment.id.in_(assessment_ids))
+    if response_ids:
+        conditions.append(
+            Assessment.id.in_(
+                select(AssessmentResponse.assessment_id).where(
+                    AssessmentResponse.id.in_(response_ids)
+                )
             )
+        )
 
-        return assessment_list
+    db.execute(
+        update(Assessment)
+        .where(or_(*conditions))
+        .values(updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+
+
+# 🧭 Assessor queue links
+
+
+def sync_assessment_area_links(
+    connection: Any, assessment_ids: Optional[Iterable[int]] = None
+) -> None:
+    """
+    Recompute the assessment-to-governance-area links from the responses.
+
+    The assessor queue and details endpoints filter on these links, so every
+    write path that adds or removes responses calls this in the same
+    transaction, after flushing them. Raw SQL, bulk statements and indicator
+    moves between areas are not tracked; repair the links afterwards with
+    `assessor_service.rebuild_queue_links`.
+
+    Args:
+        connection: Connection or session to execute on
+        assessment_ids: Assessments to recompute (None rebuilds every link)
+    """
+    links = AssessmentGovernanceArea.__table__
+    source = (
+        select(Indicator.governance_area_id, AssessmentResponse.assessment_id)
+        .join(Indicator, Indicator.id == AssessmentResponse.indicator_id)
+        .distinct()
+    )
+    clear = delete(links)
+    if assessment_ids is not None:
+        assessment_ids = list(assessment_ids)
+        if not assessment_ids:
+            return
+        source = source.where(AssessmentResponse.assessment_id.in_(assessment_ids))
+        clear = clear.where(links.c.assessment_id.in_(assessment_ids))
+
+    connection.execute(clear)
+    connection.execute(
+        insert(links).from_select(["governance_area_id", "assessment_id"], source)
+    )
 
 
 # Create service instance
@@ -1,67 +1,220 @@
 # 🛠️ Assessor Service
 # Business logic for assessor features
 
-from typing import List
+import base64
+import json
+import logging
+import operator
+from datetime import datetime
+from typing import Any, Collection, Dict, List, Optional, Sequence, Tuple
 
 from app.db.enums import AssessmentStatus, ValidationStatus
 from app.db.models.assessment import (
     MOV,
     Assessment,
+    AssessmentGovernanceArea,
     AssessmentResponse,
     FeedbackComment,
 )
+from app.db.models.barangay import Barangay
 from app.db.models.governance_area import Indicator
 from app.db.models.user import User
 from app.schemas.assessment import MOVCreate
-from sqlalchemy.orm import Session, joinedload
+from app.schemas.assessor import ValidationBatchItem
+from app.services.assessment_service import (
+    sync_assessment_area_links,
+    touch_assessments,
+)
+from app.services.notification_service import REWORK, notification_service
+from sqlalchemy import func, insert, select, tuple_, update
+from sqlalchemy.orm import (
+    Session,
+    contains_eager,
+    defer,
+    joinedload,
+    selectinload,
+)
+
+logger = logging.getLogger(__name__)
+
+# Statuses an assessor works on; drafts never appear in the queue
+QUEUE_STATUSES = (
+    AssessmentStatus.SUBMITTED_FOR_REVIEW,
+    AssessmentStatus.NEEDS_REWORK,
+    AssessmentStatus.VALIDATED,
+)
+QUEUE_MAX_LIMIT = 500
+
+# Response fields the assessor details loader can leave out (e.g. list views)
+DETAIL_OPTIONAL_FIELDS = ("response_data", "form_schema", "movs", "feedback_comments")
+
+
+def encode_queue_cursor(
+    submitted_at: Optional[datetime], assessment_id: int, descending: bool
+) -> str:
+    """Encode the position after a queue row as an opaque cursor."""
+    payload = [
+        submitted_at.isoformat() if submitted_at else None,
+        assessment_id,
+        "desc" if descending else "asc",
+    ]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_queue_cursor(
+    cursor: str, descending: bool
+) -> Tuple[Optional[datetime], int]:
+    """
+    Decode a queue cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for the other order
+    """
+    try:
+        raw_submitted_at, assessment_id, order = json.loads(
+            base64.urlsafe_b64decode(cursor.encode())
+        )
+        submitted_at = (
+            datetime.fromisoformat(raw_submitted_at) if raw_submitted_at else None
+        )
+        assessment_id = int(assessment_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid queue cursor") from e
+    if order != ("desc" if descending else "asc"):
+        raise ValueError("Queue cursor was issued for the other sort order")
+    return submitted_at, assessment_id
+
 
 
 class AssessorService:
-    def get_assessor_queue(self, db: Session, assessor: User) -> List[dict]:
+    def get_assessor_queue(
+        self,
+        db: Session,
+        assessor: User,
+        statuses: Optional[Sequence[AssessmentStatus]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        descending: bool = True,
+    ) -> Dict[str, Any]:
         """
-        Return submissions filtered by the assessor's governance area.
+        Return one page of submissions in the assessor's governance area.
+
+        Reads the maintained assessment-to-governance-area links instead of
+        scanning responses, and pages by (submitted_at, id) instead of OFFSET.
+        Dated submissions are read with a row-value seek ordered like the
+        (status, submitted_at, id) indexes; unsubmitted ones (NULL date, always
+        last) are read by a second seek on id only once the dated rows run
+        out. The status filter still reads one index range per status.
+
+        Args:
+            db: Database session
+            assessor: Area assessor whose governance area scopes the queue
+            statuses: Statuses to include (default: every queue status)
+            limit: Maximum number of items on the page (None returns the
+                whole queue without a cursor)
+            cursor: `next_cursor` of the previous page, or None for the first
+            descending: Newest submissions first (unsubmitted ones always last)
 
-        Includes barangay name, submission date, status, and last updated.
+        Returns:
+            Dict with `items` (barangay name, submission date, status and last
+            updated per assessment) and `next_cursor` (None on the last page)
+
+        Raises:
+            ValueError: If a status is not a queue status or the cursor is invalid
         """
-        # Fetch assessments whose BLGU user belongs to barangays in the
-        # same governance area as the assessor via indicator governance area linkage.
-        # Simplified initial implementation: show assessments in Submitted/Needs Rework/Validated.
-        assessments = (
-            db.query(Assessment)
-            .join(AssessmentResponse, AssessmentResponse.assessment_id == Assessment.id)
-            .join(Indicator, Indicator.id == AssessmentResponse.indicator_id)
-            .options(joinedload(Assessment.blgu_user).joinedload(User.barangay))
-            .filter(
-                Indicator.governance_area_id == assessor.governance_area_id,
-                Assessment.status.in_(
-                    [
-                        AssessmentStatus.SUBMITTED_FOR_REVIEW,
-                        AssessmentStatus.NEEDS_REWORK,
-                        AssessmentStatus.VALIDATED,
-                    ]
-                ),
+        statuses = list(statuses or QUEUE_STATUSES)
+        invalid = [s.value for s in statuses if s not in QUEUE_STATUSES]
+        if invalid:
+            raise ValueError(f"Statuses not in the assessor queue: {invalid}")
+
+        submitted_at = Assessment.submitted_at
+        base = (
+            select(
+                Assessment.id,
+                Assessment.status,
+                Assessment.submitted_at,
+                Assessment.updated_at,
+                Barangay.name.label("barangay_name"),
+            )
+            .join(
+                AssessmentGovernanceArea,
+                AssessmentGovernanceArea.assessment_id == Assessment.id,
+            )
+            .join(User, User.id == Assessment.blgu_user_id)
+            .outerjoin(Barangay, Barangay.id == User.barangay_id)
+            .where(
+                AssessmentGovernanceArea.governance_area_id
+                == assessor.governance_area_id,
+                Assessment.status.in_(statuses),
             )
-            .distinct(Assessment.id)
-            .order_by(Assessment.id, Assessment.updated_at.desc())
-            .all()
         )
 
-        items = []
-        for a in assessments:
-            barangay_name = getattr(getattr(a.blgu_user, "barangay", None), "name", "-")
-            items.append(
-                {
-                    "assessment_id": a.id,
-                    "barangay_name": barangay_name,
-                    "submission_date": a.submitted_at,
-                    "status": a.status.value
-                    if hasattr(a.status, "value")
-                    else str(a.status),
-                    "updated_at": a.updated_at,
-                }
-            )
+        after_submitted_at, after_id = None, None
+        if cursor is not None:
+            after_submitted_at, after_id = decode_queue_cursor(cursor, descending)
+        seek = operator.lt if descending else operator.gt
+        # One extra row tells whether another page follows
+        fetch = None if limit is None else limit + 1
+
+        rows = []
+        if cursor is None or after_submitted_at is not None:
+            dated = base.where(submitted_at.is_not(None))
+            if cursor is not None:
+                dated = dated.where(
+                    seek(
+                        tuple_(submitted_at, Assessment.id),
+                        tuple_(after_submitted_at, after_id),
+                    )
+                )
+            if descending:
+                order = (submitted_at.desc().nulls_last(), Assessment.id.desc())
+            else:
+                order = (submitted_at.asc().nulls_last(), Assessment.id.asc())
+            rows = db.execute(dated.order_by(*order).limit(fetch)).all()
+
+        if fetch is None or len(rows) < fetch:
+            # NULL submission dates sort last, in id order
+            undated = base.where(submitted_at.is_(None))
+            if cursor is not None and after_submitted_at is None:
+                undated = undated.where(seek(Assessment.id, after_id))
+            id_order = Assessment.id.desc() if descending else Assessment.id.asc()
+            remaining = None if fetch is None else fetch - len(rows)
+            rows += db.execute(undated.order_by(id_order).limit(remaining)).all()
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_queue_cursor(last.submitted_at, last.id, descending)
+
+        items = [
+            {
+                "assessment_id": row.id,
+                "barangay_name": row.barangay_name or "-",
+                "submission_date": row.submitted_at,
+                "status": row.status.value,
+                "updated_at": row.updated_at,
+            }
+            for row in rows
+        ]
+        return {"items": items, "next_cursor": next_cursor}
 
-        return items
+    def rebuild_queue_links(
+        self, db: Session, assessment_ids: Optional[List[int]] = None
+    ) -> None:
+        """
+        Recompute the assessor queue links from the responses and commit.
+
+        The response write paths keep the links in step; this repairs them
+        after writes that bypass those paths (raw SQL, bulk statements,
+        restores) and after indicators are moved to another area.
+
+        Args:
+            db: Database session
+            assessment_ids: Assessments to recompute (None rebuilds all)
+        """
+        sync_assessment_area_links(db, assessment_ids)
+        db.commit()
 
     def validate_assessment_response(
         self,
@@ -103,7 +256,6 @@ class AssessorService:
 
         # Update the validation status
         response.validation_status = validation_status
-        db.commit()
 
         # Save public comment if provided
         if public_comment:
@@ -127,6 +279,7 @@ class AssessorService:
             )
             db.add(internal_feedback)
 
+        touch_assessments(db, [response.assessment_id])
         db.commit()
 
         return {
@@ -136,6 +289,109 @@ class AssessorService:
             "validation_status": validation_status,
         }
 
+    def validate_assessment_responses(
+        self, db: Session, assessor: User, items: Sequence[ValidationBatchItem]
+    ) -> dict:
+        """
+        Validate many responses of one assessment in a single transaction.
+
+        Ownership is checked with one query, then the statuses are written with
+        one bulk UPDATE and the comments with one bulk INSERT.
+
+        Args:
+            db: Database session
+            assessor: The assessor performing the validation
+            items: Validation status and optional comments per response
+
+        Returns:
+            dict: Success status, assessment ID and number of rows written
+
+        Raises:
+            ValueError: If a response is missing or repeated, or the responses
+                span more than one assessment
+            PermissionError: If a response is outside the assessor's governance area
+        """
+        response_ids = [item.response_id for item in items]
+        if len(set(response_ids)) != len(response_ids):
+            raise ValueError("Each response may appear only once in a batch")
+
+        rows = db.execute(
+            select(
+                AssessmentResponse.id,
+                AssessmentResponse.assessment_id,
+                Indicator.governance_area_id,
+            )
+            .join(Indicator, Indicator.id == AssessmentResponse.indicator_id)
+            .where(AssessmentResponse.id.in_(response_ids))
+        ).all()
+
+        missing = set(response_ids) - {row.id for row in rows}
+        if missing:
+            raise ValueError(f"Assessment responses not found: {sorted(missing)}")
+        assessment_ids = {row.assessment_id for row in rows}
+        if len(assessment_ids) != 1:
+            raise ValueError("All responses in a batch must belong to one assessment")
+        foreign = sorted(
+            row.id
+            for row in rows
+            if row.governance_area_id != assessor.governance_area_id
+        )
+        if foreign:
+            raise PermissionError(
+                f"Responses outside your governance area: {foreign}"
+            )
+        (assessment_id,) = assessment_ids
+
+        now = datetime.utcnow()
+        comments = []
+        for item in items:
+            if item.public_comment:
+                comments.append(
+                    {
+                        "comment": item.public_comment,
+                        "comment_type": "validation",
+                        "response_id": item.response_id,
+                        "assessor_id": assessor.id,
+                        "is_internal_note": False,
+                        "created_at": now,
+                    }
+                )
+            if item.internal_note:
+                comments.append(
+                    {
+                        "comment": item.internal_note,
+                        "comment_type": "internal_note",
+                        "response_id": item.response_id,
+                        "assessor_id": assessor.id,
+                        "is_internal_note": True,
+                        "created_at": now,
+                    }
+                )
+
+        db.execute(
+            update(AssessmentResponse),
+            [
+                {
+                    "id": item.response_id,
+                    "validation_status": item.validation_status,
+                    "updated_at": now,
+                }
+                for item in items
+            ],
+        )
+        if comments:
+            db.execute(insert(FeedbackComment), comments)
+        touch_assessments(db, [assessment_id])
+        db.commit()
+
+        return {
+            "success": True,
+            "message": "Assessment responses validated successfully",
+            "assessment_id": assessment_id,
+            "validated_count": len(items),
+            "comments_created": len(comments),
+        }
+
     def create_mov_for_assessor(
         self, db: Session, mov_create: MOVCreate, assessor: User
     ) -> dict:
@@ -192,6 +448,7 @@ class AssessorService:
         )
 
         db.add(db_mov)
+        touch_assessments(db, [response.assessment_id])
         db.commit()
         db.refresh(db_mov)
 
@@ -202,90 +459,123 @@ class AssessorService:
         }
 
     def get_assessment_details_for_assessor(
-        self, db: Session, assessment_id: int, assessor: User
+        self,
+        db: Session,
+        assessment_id: int,
+        assessor: User,
+        fields: Optional[Collection[str]] = None,
     ) -> dict:
         """
         Get detailed assessment data for assessor review.
 
-        Returns full assessment details including:
+        Returns assessment details including:
         - Assessment metadata and status
         - BLGU user information
-        - All responses with indicators
+        - The responses in the assessor's governance area, with indicators
         - MOVs for each response
-        - Feedback comments
+        - Feedback comments with their authors
         - Technical notes for each indicator
 
+        Responses are filtered by governance area in SQL. MOVs and comments
+        are fetched with one batched select each, so the number of queries
+        does not grow with the number of responses.
+
         Args:
             db: Database session
             assessment_id: ID of the assessment to retrieve
             assessor: The assessor requesting the data
+            fields: Optional response fields to include, from
+                DETAIL_OPTIONAL_FIELDS (None includes all of them)
 
         Returns:
             dict: Assessment details or error information
+
+        Raises:
+            ValueError: If `fields` names an unknown field
         """
-        # Get the assessment with all related data
-        assessment = (
-            db.query(Assessment)
-            .options(
-                joinedload(Assessment.blgu_user).joinedload(User.barangay),
-                joinedload(Assessment.responses)
-                .joinedload(AssessmentResponse.indicator)
-                .joinedload(Indicator.governance_area),
-                joinedload(Assessment.responses).joinedload(AssessmentResponse.movs),
-                joinedload(Assessment.responses).joinedload(
-                    AssessmentResponse.feedback_comments
-                ),
+        fields = set(DETAIL_OPTIONAL_FIELDS if fields is None else fields)
+        unknown = fields - set(DETAIL_OPTIONAL_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown fields: {sorted(unknown)}")
+
+        area_id = assessor.governance_area_id
+        links = AssessmentGovernanceArea
+        row = db.execute(
+            select(
+                Assessment,
+                select(links.assessment_id)
+                .where(
+                    links.assessment_id == Assessment.id,
+                    links.governance_area_id == area_id,
+                )
+                .exists()
+                .label("in_area"),
+                select(links.assessment_id)
+                .where(links.assessment_id == Assessment.id)
+                .exists()
+                .label("has_responses"),
             )
-            .filter(Assessment.id == assessment_id)
-            .first()
-        )
+            .options(joinedload(Assessment.blgu_user).joinedload(User.barangay))
+            .where(Assessment.id == assessment_id)
+        ).first()
 
-        if not assessment:
+        if row is None:
             return {
                 "success": False,
                 "message": "Assessment not found",
                 "assessment_id": assessment_id,
             }
+        assessment = row.Assessment
 
-        # Verify the assessor has permission to view this assessment
-        # by checking if any of the assessment's indicators belong to the assessor's governance area
-        # If there are no responses, we need to check if the BLGU user's barangay is in the assessor's governance area
-        has_permission = False
-
-        if assessment.responses:
-            # Check if any response's indicator belongs to the assessor's governance area
-            for response in assessment.responses:
-                if response.indicator.governance_area_id == assessor.governance_area_id:
-                    has_permission = True
-                    break
-        else:
-            # For assessments with no responses, check if the BLGU user's barangay
-            # belongs to the assessor's governance area (this would require additional logic
-            # to map barangays to governance areas, but for now we'll allow access)
-            # This is a simplified approach - in a real system, you'd need proper mapping
-            has_permission = True  # Allow access to empty assessments for now
-
-        if not has_permission:
+        # Assessments with no responses yet cannot be mapped to an area, so
+        # they stay visible to every assessor
+        if row.has_responses and not row.in_area:
             return {
                 "success": False,
                 "message": "Access denied. You can only view assessments in your governance area",
                 "assessment_id": assessment_id,
             }
 
+        indicator = contains_eager(AssessmentResponse.indicator)
+        options = [indicator.joinedload(Indicator.governance_area)]
+        if "form_schema" not in fields:
+            options.append(indicator.defer(Indicator.form_schema))
+        if "response_data" not in fields:
+            options.append(defer(AssessmentResponse.response_data))
+        if "movs" in fields:
+            options.append(selectinload(AssessmentResponse.movs))
+        if "feedback_comments" in fields:
+            options.append(
+                selectinload(AssessmentResponse.feedback_comments).joinedload(
+                    FeedbackComment.assessor
+                )
+            )
+
+        responses = (
+            db.execute(
+                select(AssessmentResponse)
+                .join(AssessmentResponse.indicator)
+                .options(*options)
+                .where(
+                    AssessmentResponse.assessment_id == assessment_id,
+                    Indicator.governance_area_id == area_id,
+                )
+                .order_by(AssessmentResponse.id)
+            )
+            .scalars()
+            .all()
+        )
+
         # Build the response data
         assessment_data = {
             "success": True,
             "assessment": {
                 "id": assessment.id,
                 "status": assessment.status.value,
-                "created_at": assessment.created_at.isoformat(),
-                "updated_at": assessment.updated_at.isoformat(),
-                "submitted_at": assessment.submitted_at.isoformat()
-                if assessment.submitted_at
-                else None,
-                "validated_at": assessment.validated_at.isoformat()
-                if assessment.validated_at
-                else None,
+                "created_at": assessment.created_at,
+                "updated_at": assessment.updated_at,
+                "submitted_at": assessment.submitted_at,
+                "validated_at": assessment.validated_at,
                 "blgu_user": {
                     "id": assessment.blgu_user.id,
                     "name": assessment.blgu_user.name,
@@ -302,7 +592,8 @@ class AssessorService:
         }
 
         # Process each response with its related data
-        for response in assessment.responses:
+        for response in responses:
+            indicator = response.indicator
             response_data = {
                 "id": response.id,
                 "is_completed": response.is_completed,
@@ -310,24 +601,28 @@ class AssessorService:
                 "validation_status": response.validation_status.value
                 if response.validation_status
                 else None,
-                "response_data": response.response_data,
-                "created_at": response.created_at.isoformat(),
-                "updated_at": response.updated_at.isoformat(),
+                "created_at": response.created_at,
+                "updated_at": response.updated_at,
                 "indicator": {
-                    "id": response.indicator.id,
-                    "name": response.indicator.name,
-                    "description": response.indicator.description,
-                    "form_schema": response.indicator.form_schema,
+                    "id": indicator.id,
+                    "name": indicator.name,
+                    "description": indicator.description,
                     "governance_area": {
-                        "id": response.indicator.governance_area.id,
-                        "name": response.indicator.governance_area.name,
-                        "area_type": response.indicator.governance_area.area_type.value,
+                        "id": indicator.governance_area.id,
+                        "name": indicator.governance_area.name,
+                        "area_type": indicator.governance_area.area_type.value,
                     },
                     # Technical notes - for now using description, but this could be a separate field
-                    "technical_notes": response.indicator.description
+                    "technical_notes": indicator.description
                     or "No technical notes available",
                 },
-                "movs": [
+            }
+            if "response_data" in fields:
+                response_data["response_data"] = response.response_data
+            if "form_schema" in fields:
+                response_data["indicator"]["form_schema"] = indicator.form_schema
+            if "movs" in fields:
+                response_data["movs"] = [
                     {
                         "id": mov.id,
                         "filename": mov.filename,
@@ -336,17 +631,18 @@ class AssessorService:
                         "content_type": mov.content_type,
                         "storage_path": mov.storage_path,
                         "status": mov.status.value,
-                        "uploaded_at": mov.uploaded_at.isoformat(),
+                        "uploaded_at": mov.uploaded_at,
                     }
                     for mov in response.movs
-                ],
-                "feedback_comments": [
+                ]
+            if "feedback_comments" in fields:
+                response_data["feedback_comments"] = [
                     {
                         "id": comment.id,
                         "comment": comment.comment,
                         "comment_type": comment.comment_type,
                         "is_internal_note": comment.is_internal_note,
-                        "created_at": comment.created_at.isoformat(),
+                        "created_at": comment.created_at,
                         "assessor": {
                             "id": comment.assessor.id,
                             "name": comment.assessor.name,
@@ -356,8 +652,7 @@ class AssessorService:
                         else None,
                     }
                     for comment in response.feedback_comments
-                ],
-            }
+                ]
             assessment_data["assessment"]["responses"].append(response_data)
 
         return assessment_data
@@ -380,61 +675,66 @@ class AssessorService:
             ValueError: If assessment not found or rework not allowed
             PermissionError: If assessor doesn't have permission
         """
-        # Get the assessment
-        assessment = (
-            db.query(Assessment)
-            .options(joinedload(Assessment.blgu_user).joinedload(User.barangay))
-            .filter(Assessment.id == assessment_id)
-            .first()
-        )
+        # Check assessor permission (assessor must be assigned to the governance area)
+        # For now, we'll allow any assessor to send for rework
+        # In a more sophisticated system, we'd check specific permissions
 
-        if not assessment:
-            raise ValueError(f"Assessment {assessment_id} not found")
+        # Rework is allowed once (rework_count must be 0) and never after
+        # finalization; checking it in the UPDATE itself also stops two
+        # concurrent requests from both passing
+        now = datetime.utcnow()
+        sent = db.execute(
+            update(Assessment)
+            .where(
+                Assessment.id == assessment_id,
+                Assessment.rework_count == 0,
+                Assessment.status != AssessmentStatus.VALIDATED,
+            )
+            .values(
+                status=AssessmentStatus.NEEDS_REWORK, rework_count=1, updated_at=now
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
 
-        # Check if rework is allowed (rework_count must be 0)
-        if assessment.rework_count != 0:
+        if not sent:
+            db.rollback()
+            current_status = db.scalar(
+                select(Assessment.status).where(Assessment.id == assessment_id)
+            )
+            if current_status is None:
+                raise ValueError(f"Assessment {assessment_id} not found")
+            if current_status == AssessmentStatus.VALIDATED:
+                raise ValueError(
+                    "Assessment has been finalized. Cannot send for rework."
+                )
             raise ValueError(
                 "Assessment has already been sent for rework. Cannot send again."
             )
 
-        # Check assessor permission (assessor must be assigned to the governance area)
-        # For now, we'll allow any assessor to send for rework
-        # In a more sophisticated system, we'd check specific permissions
-
-        # Update assessment status and rework count
-        assessment.status = AssessmentStatus.NEEDS_REWORK
-        assessment.rework_count = 1
-        # Note: updated_at is automatically handled by SQLAlchemy's onupdate
-
         # Mark all responses as requiring rework
-        for response in assessment.responses:
-            response.requires_rework = True
+        db.execute(
+            update(AssessmentResponse)
+            .where(AssessmentResponse.assessment_id == assessment_id)
+            .values(requires_rework=True, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
 
+        # Queue the BLGU notification in the same transaction; the
+        # notification worker emails it with the recipient's next digest
+        notification_service.enqueue(db, assessment_id, REWORK)
         db.commit()
-        db.refresh(assessment)
 
-        # Trigger notification asynchronously using Celery
-        try:
-            from app.workers.notifications import send_rework_notification
-
-            # Queue the notification task to run in the background
-            task = send_rework_notification.delay(assessment_id)
-            notification_result = {
-                "success": True,
-                "message": "Rework notification queued successfully",
-                "task_id": task.id,
-            }
-        except Exception as e:
-            # Log the error but don't fail the rework operation
-            print(f"Failed to queue notification: {e}")
-            notification_result = {"success": False, "error": str(e)}
+        notification_result = {
+            "success": True,
+            "message": "Rework notification queued for the next digest",
+        }
 
         return {
             "success": True,
             "message": "Assessment sent for rework successfully",
             "assessment_id": assessment_id,
-            "new_status": assessment.status.value,
-            "rework_count": assessment.rework_count,
+            "new_status": AssessmentStatus.NEEDS_REWORK.value,
+            "rework_count": 1,
             "notification_result": notification_result,
         }
 
@@ -444,6 +744,10 @@ class AssessorService:
         """
         Finalize assessment validation, permanently locking it.
 
+        Only the status change happens in the request. Classification, the
+        BLGU notification and (optionally) AI insights run afterwards as a
+        Celery chain; see `get_finalize_status` for its progress.
+
         Args:
             db: Database session
             assessment_id: ID of the assessment to finalize
@@ -456,88 +760,132 @@ class AssessorService:
             ValueError: If assessment not found or cannot be finalized
             PermissionError: If assessor doesn't have permission
         """
-        # Get the assessment
-        assessment = (
-            db.query(Assessment)
-            .options(joinedload(Assessment.blgu_user).joinedload(User.barangay))
-            .filter(Assessment.id == assessment_id)
-            .first()
-        )
+        # Status and number of unreviewed responses in one aggregate
+        row = db.execute(
+            select(
+                Assessment.status,
+                func.count(AssessmentResponse.id).filter(
+                    AssessmentResponse.validation_status.is_(None)
+                ),
+            )
+            .outerjoin(
+                AssessmentResponse, AssessmentResponse.assessment_id == Assessment.id
+            )
+            .where(Assessment.id == assessment_id)
+            .group_by(Assessment.id)
+        ).first()
 
-        if not assessment:
+        if row is None:
             raise ValueError(f"Assessment {assessment_id} not found")
+        current_status, unreviewed = row
 
         # Check if assessment can be finalized
-        if assessment.status == AssessmentStatus.VALIDATED:
+        if current_status == AssessmentStatus.VALIDATED:
             raise ValueError("Assessment is already finalized")
 
-        if assessment.status == AssessmentStatus.DRAFT:
+        if current_status == AssessmentStatus.DRAFT:
             raise ValueError("Cannot finalize a draft assessment")
 
         # Check that all responses have been reviewed (have validation status)
-        unreviewed_responses = [
-            response
-            for response in assessment.responses
-            if response.validation_status is None
-        ]
-
-        if unreviewed_responses:
+        if unreviewed:
             raise ValueError(
-                f"Cannot finalize assessment. {len(unreviewed_responses)} responses have not been reviewed."
+                f"Cannot finalize assessment. {unreviewed} responses have not been reviewed."
             )
 
-        # Update assessment status
-        assessment.status = AssessmentStatus.VALIDATED
-        assessment.validated_at = (
-            db.query(Assessment)
-            .filter(Assessment.id == assessment_id)
-            .first()
-            .updated_at
+        from app.workers.finalize_pipeline import (
+            enqueue_finalize_pipeline,
+            mark_finalize_pipeline_dispatched,
+            pipeline_steps,
         )
-        # Note: updated_at is automatically handled by SQLAlchemy's onupdate
 
-        db.commit()
-        db.refresh(assessment)
-
-        # Run classification algorithm synchronously
-        # This must complete in <5 seconds to ensure real-time user experience
-        from app.services.intelligence_service import intelligence_service
-
-        try:
-            classification_result = intelligence_service.classify_assessment(
-                db, assessment_id
+        # The status guard makes a concurrent finalize lose cleanly. The
+        # pipeline steps are recorded so their status is reported for the
+        # same steps even if FINALIZE_GENERATE_INSIGHTS changes later.
+        validated_at = datetime.utcnow()
+        steps = pipeline_steps()
+        finalized = db.execute(
+            update(Assessment)
+            .where(Assessment.id == assessment_id, Assessment.status == current_status)
+            .values(
+                status=AssessmentStatus.VALIDATED,
+                validated_at=validated_at,
+                updated_at=validated_at,
+                finalize_steps=steps,
             )
-        except Exception as e:
-            # Log the error but don't fail the finalization operation
-            print(f"Failed to run classification: {e}")
-            classification_result = {"success": False, "error": str(e)}
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if not finalized:
+            db.rollback()
+            raise ValueError("Assessment is already finalized")
+        db.commit()
 
-        # Trigger notification asynchronously using Celery
+        # Queue classification, notification and insights off the request.
+        # The steps committed above act as the outbox record: if the broker
+        # is down, the dispatch_finalize_pipelines beat task queues them later.
         try:
-            from app.workers.notifications import send_validation_complete_notification
-
-            # Queue the notification task to run in the background
-            task = send_validation_complete_notification.delay(assessment_id)
-            notification_result = {
-                "success": True,
-                "message": "Validation complete notification queued successfully",
-                "task_id": task.id,
-            }
+            task_ids = enqueue_finalize_pipeline(assessment_id, steps)
         except Exception as e:
-            # Log the error but don't fail the finalization operation
-            print(f"Failed to queue notification: {e}")
-            notification_result = {"success": False, "error": str(e)}
+            logger.exception(
+                "Failed to queue finalize pipeline for assessment %s", assessment_id
+            )
+            pipeline = {"queued": False, "error": str(e)}
+        else:
+            mark_finalize_pipeline_dispatched(db, assessment_id)
+            pipeline = {"queued": True, "steps": task_ids}
 
         return {
             "success": True,
             "message": "Assessment finalized successfully",
             "assessment_id": assessment_id,
-            "new_status": assessment.status.value,
-            "validated_at": assessment.validated_at.isoformat()
-            if assessment.validated_at
+            "new_status": AssessmentStatus.VALIDATED.value,
+            "validated_at": validated_at,
+            # Deprecated: classification and the notification now run in the
+            # pipeline, so these are always null; read finalize-status instead
+            "classification_result": None,
+            "notification_result": None,
+            "pipeline": pipeline,
+        }
+
+    def get_finalize_status(self, db: Session, assessment_id: int) -> dict:
+        """
+        Report the progress of the post-finalize pipeline of an assessment.
+
+        Args:
+            db: Database session
+            assessment_id: ID of the finalized assessment
+
+        Returns:
+            dict: Assessment status, classification result so far and the
+            state of every pipeline step
+
+        Raises:
+            ValueError: If the assessment is not found or not finalized
+        """
+        row = db.execute(
+            select(
+                Assessment.status,
+                Assessment.final_compliance_status,
+                Assessment.finalize_steps,
+                Assessment.finalize_dispatched_at,
+            ).where(Assessment.id == assessment_id)
+        ).first()
+        if row is None:
+            raise ValueError(f"Assessment {assessment_id} not found")
+        if row.status != AssessmentStatus.VALIDATED:
+            raise ValueError("Assessment has not been finalized")
+
+        from app.workers.finalize_pipeline import get_finalize_pipeline_status
+
+        return {
+            "assessment_id": assessment_id,
+            "final_compliance_status": row.final_compliance_status.value
+            if row.final_compliance_status
             else None,
-            "classification_result": classification_result,
-            "notification_result": notification_result,
+            "pipeline": get_finalize_pipeline_status(
+                assessment_id,
+                row.finalize_steps,
+                dispatched=row.finalize_dispatched_at is not None,
+            ),
         }
 
 
@@ -0,0 +1,132 @@
+# 🤖 Gemini Client
+# Async REST client for the Gemini generateContent API, used for batch calls
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, TypeVar
+
+import httpx
+from app.core.config import settings
+
+K = TypeVar("K", bound=Hashable)
+
+
+class GeminiClientError(Exception):
+    """Raised when the Gemini API rejects a request or returns no text."""
+
+
+class AsyncGeminiClient:
+    """
+    Minimal async client for `models/{model}:generateContent`.
+
+    Talks to `GEMINI_API_BASE_URL`, so it can be pointed at the local stub in
+    `app.devtools.gemini_stub` for offline tests and benchmarks. Use as an
+    async context manager; connections are pooled across calls.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        generation_config: Mapping[str, Any],
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        max_connections: int = 10,
+    ) -> None:
+        self.api_key = api_key
+        self.model = model
+        self.generation_config = {
+            "temperature": generation_config.get("temperature"),
+            "maxOutputTokens": generation_config.get("max_output_tokens"),
+        }
+        self._client = httpx.AsyncClient(
+            base_url=base_url or settings.GEMINI_API_BASE_URL,
+            timeout=timeout or settings.GEMINI_REQUEST_TIMEOUT_SECONDS,
+            limits=httpx.Limits(max_connections=max_connections),
+        )
+
+    async def __aenter__(self) -> "AsyncGeminiClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self._client.aclose()
+
+    async def generate(self, prompt: str) -> str:
+        """
+        Generate content for one prompt.
+
+        Args:
+            prompt: Prompt text
+
+        Returns:
+            Text of the first candidate
+
+        Raises:
+            GeminiClientError: On HTTP errors or an empty response
+        """
+        try:
+            response = await self._client.post(
+                f"/v1beta/models/{self.model}:generateContent",
+                headers={"x-goog-api-key": self.api_key},
+                json={
+                    "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+                    "generationConfig": self.generation_config,
+                },
+            )
+        except httpx.HTTPError as e:
+            raise GeminiClientError(
+                f"Network error connecting to Gemini API: {e}"
+            ) from e
+
+        if response.status_code == 429:
+            raise GeminiClientError(
+                "Gemini API quota exceeded or rate limit hit. Please try again later."
+            )
+        if response.status_code >= 400:
+            raise GeminiClientError(
+                f"Gemini API call failed with status {response.status_code}: "
+                f"{response.text[:200]}"
+            )
+
+        try:
+            parts = response.json()["candidates"][0]["content"]["parts"]
+            text = "".join(part.get("text", "") for part in parts)
+        except (ValueError, KeyError, IndexError, TypeError) as e:
+            raise GeminiClientError(
+                "Gemini API returned empty or invalid response"
+            ) from e
+        if not text:
+            raise GeminiClientError("Gemini API returned empty or invalid response")
+        return text
+
+    async def generate_many(
+        self,
+        prompts: Mapping[K, str],
+        concurrency: int,
+        before_call: Optional[Callable[[str], Awaitable[None]]] = None,
+        parse: Optional[Callable[[str], Any]] = None,
+    ) -> Dict[K, Any]:
+        """
+        Generate content for many prompts with at most `concurrency` in flight.
+
+        Args:
+            prompts: Prompts keyed by caller-defined IDs
+            concurrency: Maximum concurrent requests
+            before_call: Awaited before each request (e.g. rate limiting)
+            parse: Applied to each response text
+
+        Returns:
+            Result per key: the (parsed) text, or the exception it raised
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run(prompt: str) -> Any:
+            async with semaphore:
+                if before_call is not None:
+                    await before_call(prompt)
+                text = await self.generate(prompt)
+            return parse(text) if parse else text
+
+        results = await asyncio.gather(
+            *(run(prompt) for prompt in prompts.values()), return_exceptions=True
+        )
+        return dict(zip(prompts, results))
@@ -0,0 +1,229 @@
+# 🌳 Indicator Tree Cache
+# Process-wide, versioned cache of the governance-area/indicator catalogue
+
+import copy
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from app.db.models.governance_area import CatalogueVersion, GovernanceArea, Indicator
+from sqlalchemy import event, insert, select, update  # type: ignore[reportMissingImports]
+from sqlalchemy.orm import Session  # type: ignore[reportMissingImports]
+
+# Tables whose writes invalidate the cached catalogue
+CATALOGUE_TABLES = {"governance_areas", "indicators"}
+
+# Session.info key used to remember that a transaction already bumped the version
+_CATALOGUE_BUMPED_KEY = "indicator_catalogue_bumped"
+
+# The catalogue_version table holds a single row
+_VERSION_ROW_ID = 1
+
+
+@dataclass(frozen=True, slots=True)
+class IndicatorNode:
+    """Immutable, detached snapshot of an indicator and its nested children."""
+
+    id: int
+    name: str
+    description: Optional[str]
+    form_schema: Dict[str, Any]
+    governance_area_id: int
+    parent_id: Optional[int]
+    children: tuple["IndicatorNode", ...]
+
+
+@dataclass(frozen=True, slots=True)
+class GovernanceAreaNode:
+    """Immutable snapshot of a governance area with its top-level indicators."""
+
+    id: int
+    name: str
+    area_type: str
+    indicators: tuple[IndicatorNode, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class IndicatorTree:
+    """The whole indicator catalogue as built for a single catalogue version."""
+
+    version: int
+    areas: tuple[GovernanceAreaNode, ...]
+
+
+def catalogue_version_column() -> Any:
+    """
+    Scalar subquery reading the shared catalogue version.
+
+    Lets callers fetch the version in the same round trip as other columns.
+    """
+    return (
+        select(CatalogueVersion.version)
+        .where(CatalogueVersion.id == _VERSION_ROW_ID)
+        .scalar_subquery()
+    )
+
+
+class IndicatorTreeCache:
+    """
+    Cache of the indicator catalogue shared by every request in the process.
+
+    The catalogue only changes when an admin reseeds it, so the tree is built
+    once per catalogue version and reused. The version lives in the
+    `catalogue_version` row and is bumped inside every transaction that writes
+    to `governance_areas` or `indicators` (see the session listeners below),
+    so a reseed from manage.py, a worker or another API process invalidates
+    the trees cached by every process. Checking it costs one primary-key read.
+
+    Cached nodes are shared between requests and must be treated as read-only;
+    callers merge per-assessment data into new dicts instead of mutating them.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tree: Optional[IndicatorTree] = None
+
+    def clear(self) -> None:
+        """Drop the cached tree (the next get_tree() rebuilds it)."""
+        with self._lock:
+            self._tree = None
+
+    def get_version(self, db: Session) -> int:
+        """
+        Read the shared catalogue version.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Current catalogue version (0 before the first catalogue write)
+        """
+        return db.scalar(select(catalogue_version_column())) or 0
+
+    def get_tree(self, db: Session) -> IndicatorTree:
+        """
+        Return the cached tree for the current version, building it on a miss.
+
+        Args:
+            db: Database session used to read the version and, on a miss,
+                to build the tree
+
+        Returns:
+            IndicatorTree for the current catalogue version
+        """
+        version = self.get_version(db)
+        tree = self._tree
+        if tree is not None and tree.version == version:
+            return tree
+
+        tree = self._build_tree(db, version)
+        with self._lock:
+            # Never replace a tree built for a newer version
+            if self._tree is None or self._tree.version <= version:
+                self._tree = tree
+        return tree
+
+    def _build_tree(self, db: Session, version: int) -> IndicatorTree:
+        """Load all areas and indicators in two queries and assemble the tree."""
+        areas = db.query(GovernanceArea).order_by(GovernanceArea.id).all()
+        indicators = db.query(Indicator).order_by(Indicator.id).all()
+
+        # Pre-build adjacency lists for O(n) tree assembly
+        children_by_parent: Dict[Optional[int], List[Indicator]] = {}
+        for ind in indicators:
+            children_by_parent.setdefault(ind.parent_id, []).append(ind)
+
+        def build_node(ind: Indicator) -> IndicatorNode:
+            return IndicatorNode(
+                id=ind.id,
+                name=ind.name,
+                description=ind.description,
+                form_schema=copy.deepcopy(ind.form_schema) if ind.form_schema else {},
+                governance_area_id=ind.governance_area_id,
+                parent_id=ind.parent_id,
+                children=tuple(
+                    build_node(child) for child in children_by_parent.get(ind.id, [])
+                ),
+            )
+
+        top_level_by_area: Dict[int, List[IndicatorNode]] = {}
+        for ind in children_by_parent.get(None, []):
+            top_level_by_area.setdefault(ind.governance_area_id, []).append(
+                build_node(ind)
+            )
+
+        area_nodes = tuple(
+            GovernanceAreaNode(
+                id=area.id,
+                name=area.name,
+                area_type=area.area_type.value
+                if hasattr(area.area_type, "value")
+                else str(area.area_type),
+                indicators=tuple(top_level_by_area.get(area.id, [])),
+            )
+            for area in areas
+        )
+
+        return IndicatorTree(version=version, areas=area_nodes)
+
+
+# 🔔 Catalogue write tracking
+
+
+def bump_catalogue_version(session: Session) -> None:
+    """
+    Bump the shared catalogue version in the session's transaction.
+
+    Runs once per transaction; the bump commits or rolls back together with
+    the catalogue write that caused it.
+    """
+    if session.info.get(_CATALOGUE_BUMPED_KEY):
+        return
+    session.info[_CATALOGUE_BUMPED_KEY] = True
+
+    # Core statements on the session connection: no ORM events, no autoflush
+    connection = session.connection()
+    table = CatalogueVersion.__table__
+    bumped = connection.execute(
+        update(table)
+        .where(table.c.id == _VERSION_ROW_ID)
+        .values(version=table.c.version + 1)
+    ).rowcount
+    if not bumped:
+        # The migration seeds the row; databases built with create_all lack it
+        connection.execute(insert(table).values(id=_VERSION_ROW_ID, version=1))
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_on_catalogue_flush(session: Session, flush_context: Any) -> None:
+    """Bump the version when this transaction flushes catalogue rows."""
+    # new/dirty/deleted still reflect the pre-flush state inside after_flush
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, (GovernanceArea, Indicator)):
+            bump_catalogue_version(session)
+            return
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bump_on_catalogue_bulk_write(orm_execute_state: Any) -> None:
+    """Catch bulk INSERT/UPDATE/DELETE statements against catalogue tables."""
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if getattr(table, "name", None) in CATALOGUE_TABLES:
+        bump_catalogue_version(orm_execute_state.session)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _reset_catalogue_bump(session: Session) -> None:
+    """Let the next transaction bump the version again."""
+    session.info.pop(_CATALOGUE_BUMPED_KEY, None)
+
+
+# Create a single instance to be used across the application
+indicator_tree_cache = IndicatorTreeCache()
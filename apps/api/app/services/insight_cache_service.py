@@ -0,0 +1,333 @@
+# 🧠 Insight Cache Service
+# Shared, content-addressed cache of Gemini insights keyed by a normalized hash
+
+import hashlib
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, Hashable, Iterable, Mapping, Optional, Tuple, TypeVar
+
+from app.core.config import settings
+from app.db.models.insight_cache import InsightCacheEntry, InsightCacheStats
+from sqlalchemy import bindparam, delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+K = TypeVar("K", bound=Hashable)
+
+# Single row of `insight_cache_stats`
+_STATS_ROW_ID = 1
+
+
+def normalize_cache_text(text: str) -> str:
+    """Collapse whitespace and case so cosmetic differences share a cache entry."""
+    return " ".join(text.split()).casefold()
+
+
+def make_cache_key(content: str, model: str) -> str:
+    """
+    Build the content address of a request.
+
+    The content is what the response depends on, not the full prompt: see
+    `intelligence_service.insight_cache_content`, which leaves out barangay
+    name, year and IDs.
+
+    Args:
+        content: Cache content of the request
+        model: Model name (different models never share entries)
+
+    Returns:
+        Hex sha256 of the model name and normalized content
+    """
+    payload = f"{model}\n{normalize_cache_text(content)}".encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()
+
+
+class InsightCacheService:
+    """
+    Database-backed insight cache shared by every API process and worker.
+
+    Entries expire `INSIGHT_CACHE_TTL_HOURS` after being generated, and once the
+    table grows past `INSIGHT_CACHE_MAX_ENTRIES` the least recently used entries
+    are evicted. Each entry counts its hits and the misses that (re)generated it;
+    every lookup is also counted in `insight_cache_stats` for the hit ratio.
+    Lookups record their bookkeeping in their own short transaction, so they
+    never commit the caller's session.
+    """
+
+    def get(self, db: Session, content: str, model: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response, recording the hit or miss.
+
+        Args:
+            db: Database session
+            content: Cache content of the request (see `make_cache_key`)
+            model: Model name
+
+        Returns:
+            Cached response, or None on a miss or expired entry
+        """
+        now = datetime.utcnow()
+        cache_key = make_cache_key(content, model)
+
+        entry = db.execute(
+            select(InsightCacheEntry.id, InsightCacheEntry.response).where(
+                InsightCacheEntry.cache_key == cache_key,
+                InsightCacheEntry.expires_at > now,
+            )
+        ).first()
+
+        if entry is None:
+            self._record_lookups(db, {}, 1, now)
+            return None
+        self._record_lookups(db, {entry.id: 1}, 0, now)
+        return entry.response
+
+    def put(
+        self, db: Session, content: str, model: str, response: Dict[str, Any]
+    ) -> None:
+        """
+        Store a freshly generated response and apply the eviction policy.
+
+        An expired entry for the same content is refreshed in place, keeping its
+        counters. If another worker stored the same content concurrently, the
+        first write wins.
+
+        Args:
+            db: Database session
+            content: Cache content of the request (see `make_cache_key`)
+            model: Model name
+            response: Parsed model response
+        """
+        now = datetime.utcnow()
+        self._store(db, make_cache_key(content, model), model, response, now)
+        self.evict(db, now)
+        db.commit()
+
+    def get_many(
+        self, db: Session, contents: Mapping[K, str], model: str
+    ) -> Dict[K, Dict[str, Any]]:
+        """
+        Look up many requests with one SELECT, recording hits and misses.
+
+        Args:
+            db: Database session
+            contents: Cache contents keyed by caller-defined IDs
+            model: Model name
+
+        Returns:
+            Cached responses for the keys that hit; misses are left out
+        """
+        if not contents:
+            return {}
+
+        now = datetime.utcnow()
+        keys = {
+            item: make_cache_key(content, model) for item, content in contents.items()
+        }
+        entries = {
+            row.cache_key: row
+            for row in db.execute(
+                select(
+                    InsightCacheEntry.id,
+                    InsightCacheEntry.cache_key,
+                    InsightCacheEntry.response,
+                ).where(
+                    InsightCacheEntry.cache_key.in_(set(keys.values())),
+                    InsightCacheEntry.expires_at > now,
+                )
+            )
+        }
+
+        hits: Dict[K, Dict[str, Any]] = {}
+        hits_per_entry: Counter[int] = Counter()
+        for item, cache_key in keys.items():
+            entry = entries.get(cache_key)
+            if entry is not None:
+                hits[item] = entry.response
+                hits_per_entry[entry.id] += 1
+
+        self._record_lookups(db, hits_per_entry, len(keys) - len(hits), now)
+        return hits
+
+    def put_many(
+        self,
+        db: Session,
+        items: Iterable[Tuple[str, Dict[str, Any]]],
+        model: str,
+    ) -> None:
+        """
+        Store many (content, response) pairs, evicting and committing once.
+
+        Args:
+            db: Database session
+            items: (cache content, parsed response) pairs
+            model: Model name
+        """
+        now = datetime.utcnow()
+        for content, response in items:
+            self._store(db, make_cache_key(content, model), model, response, now)
+        self.evict(db, now)
+        db.commit()
+
+    def _record_lookups(
+        self,
+        db: Session,
+        hits_per_entry: Mapping[int, int],
+        misses: int,
+        now: datetime,
+    ) -> None:
+        """
+        Count lookups in a separate short transaction.
+
+        Runs on its own connection from the session's engine, so the caller's
+        transaction is neither committed nor left holding locks on the counter
+        row while it waits on Gemini.
+        """
+        hits = sum(hits_per_entry.values())
+        if not hits and not misses:
+            return
+
+        entries = InsightCacheEntry.__table__
+        stats = InsightCacheStats.__table__
+        with db.get_bind().begin() as connection:
+            if hits_per_entry:
+                connection.execute(
+                    update(entries)
+                    .where(entries.c.id == bindparam("entry_id"))
+                    .values(
+                        hit_count=entries.c.hit_count + bindparam("hits"),
+                        last_accessed_at=now,
+                    ),
+                    [
+                        {"entry_id": entry_id, "hits": count}
+                        for entry_id, count in hits_per_entry.items()
+                    ],
+                )
+
+            counted = connection.execute(
+                update(stats)
+                .where(stats.c.id == _STATS_ROW_ID)
+                .values(hits=stats.c.hits + hits, misses=stats.c.misses + misses)
+            ).rowcount
+            if not counted:
+                # The migration seeds the row; databases built with create_all lack it
+                connection.execute(
+                    insert(stats).values(id=_STATS_ROW_ID, hits=hits, misses=misses)
+                )
+
+    def _store(
+        self,
+        db: Session,
+        cache_key: str,
+        model: str,
+        response: Dict[str, Any],
+        now: datetime,
+    ) -> None:
+        """Insert or refresh one entry (the caller evicts and commits)."""
+        expires_at = now + timedelta(hours=settings.INSIGHT_CACHE_TTL_HOURS)
+
+        refreshed = db.execute(
+            update(InsightCacheEntry)
+            .where(InsightCacheEntry.cache_key == cache_key)
+            .values(
+                response=response,
+                miss_count=InsightCacheEntry.miss_count + 1,
+                last_accessed_at=now,
+                expires_at=expires_at,
+            )
+        ).rowcount
+
+        if not refreshed:
+            try:
+                with db.begin_nested():
+                    db.add(
+                        InsightCacheEntry(
+                            cache_key=cache_key,
+                            model=model,
+                            response=response,
+                            hit_count=0,
+                            miss_count=1,
+                            created_at=now,
+                            last_accessed_at=now,
+                            expires_at=expires_at,
+                        )
+                    )
+            except IntegrityError:
+                # Stored concurrently by another worker
+                pass
+
+    def evict(self, db: Session, now: Optional[datetime] = None) -> int:
+        """
+        Delete expired entries, then the least recently used ones over capacity.
+
+        Args:
+            db: Database session (the caller commits)
+            now: Reference time for expiry (defaults to the current UTC time)
+
+        Returns:
+            Number of evicted entries
+        """
+        now = now or datetime.utcnow()
+        evicted = db.execute(
+            delete(InsightCacheEntry).where(InsightCacheEntry.expires_at <= now)
+        ).rowcount
+
+        overflow = (
+            db.scalar(select(func.count(InsightCacheEntry.id)))
+            - settings.INSIGHT_CACHE_MAX_ENTRIES
+        )
+        if overflow > 0:
+            lru_ids = (
+                select(InsightCacheEntry.id)
+                .order_by(
+                    InsightCacheEntry.last_accessed_at, InsightCacheEntry.id
+                )
+                .limit(overflow)
+                .scalar_subquery()
+            )
+            evicted += db.execute(
+                delete(InsightCacheEntry).where(InsightCacheEntry.id.in_(lru_ids))
+            ).rowcount
+
+        return evicted
+
+    def get_stats(self, db: Session) -> Dict[str, Any]:
+        """
+        Summarize cache usage: stored entries and every lookup so far.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Entry count, hits, misses and hit ratio (None before any lookups)
+        """
+        row = db.execute(
+            select(
+                select(func.count(InsightCacheEntry.id))
+                .scalar_subquery()
+                .label("entries"),
+                select(InsightCacheStats.hits)
+                .where(InsightCacheStats.id == _STATS_ROW_ID)
+                .scalar_subquery()
+                .label("hits"),
+                select(InsightCacheStats.misses)
+                .where(InsightCacheStats.id == _STATS_ROW_ID)
+                .scalar_subquery()
+                .label("misses"),
+            )
+        ).one()
+
+        hits = row.hits or 0
+        misses = row.misses or 0
+        lookups = hits + misses
+        return {
+            "entries": row.entries,
+            "max_entries": settings.INSIGHT_CACHE_MAX_ENTRIES,
+            "ttl_hours": settings.INSIGHT_CACHE_TTL_HOURS,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / lookups, 4) if lookups else None,
+        }
+
+
+insight_cache_service = InsightCacheService()
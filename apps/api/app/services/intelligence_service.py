@@ -1,16 +1,32 @@
 # 🧠 Intelligence Service
 # Business logic for SGLGB compliance classification and AI-powered insights
 
+import asyncio
 import json
-from datetime import UTC, datetime
-from typing import Any
+import time
+from datetime import datetime
+from typing import Any, Iterable, Sequence
 
 import google.generativeai as genai
 from app.core.config import settings
-from app.db.enums import ComplianceStatus, ValidationStatus
-from app.db.models.assessment import Assessment, AssessmentResponse
+from app.core.rate_limiter import (
+    RateLimitTimeout,
+    estimate_tokens,
+    get_gemini_rate_limiter,
+)
+from app.db.enums import AssessmentStatus, ComplianceStatus, ValidationStatus
+from app.db.models.assessment import Assessment, AssessmentResponse, FeedbackComment
+from app.db.models.barangay import Barangay
 from app.db.models.governance_area import GovernanceArea, Indicator
-from sqlalchemy.orm import Session, joinedload
+from app.db.models.user import User
+from app.services.gemini_client import AsyncGeminiClient
+from app.services.insight_cache_service import (
+    insight_cache_service,
+    make_cache_key,
+    normalize_cache_text,
+)
+from sqlalchemy import and_, distinct, func, or_, select, update
+from sqlalchemy.orm import Session, aliased
 
 # Core governance areas (must all pass for compliance)
 CORE_AREAS = [
@@ -26,6 +42,137 @@ ESSENTIAL_AREAS = [
     "Environmental Management",
 ]
 
+ALL_AREAS = CORE_AREAS + ESSENTIAL_AREAS
+
+# Generation settings shared by every Gemini call
+GENERATION_CONFIG = {
+    "temperature": 0.7,
+    "max_output_tokens": settings.GEMINI_MAX_OUTPUT_TOKENS,
+}
+
+
+def reduce_area_compliance(
+    rows: Iterable[Any], area_names: Sequence[str]
+) -> dict[str, bool]:
+    """
+    Reduce per-area indicator/pass counts to pass/fail per area name.
+
+    Args:
+        rows: Rows with `name`, `indicator_count` and `passed_count`, ordered by
+            area id (the first area wins if a name is duplicated)
+        area_names: Area names to report on; missing areas fail
+
+    Returns:
+        Dictionary mapping each area name to True (passed) or False
+    """
+    results = {name: False for name in area_names}
+    seen: set[str] = set()
+    for row in rows:
+        if row.name in seen or row.name not in results:
+            continue
+        seen.add(row.name)
+        # No indicators = failed area
+        results[row.name] = 0 < row.indicator_count == row.passed_count
+    return results
+
+
+def format_area_results(area_compliance: dict[str, bool]) -> dict[str, str]:
+    """Map area pass/fail flags to the 'Passed'/'Failed' strings stored on assessments."""
+    return {
+        name: "Passed" if passed else "Failed"
+        for name, passed in area_compliance.items()
+    }
+
+
+def parse_insights_response(response_text: str) -> dict[str, Any]:
+    """
+    Extract and validate the insights JSON from a Gemini response text.
+
+    Args:
+        response_text: Raw model output, optionally wrapped in a markdown code block
+
+    Returns:
+        Dictionary with 'summary', 'recommendations' and 'capacity_development_needs'
+
+    Raises:
+        json.JSONDecodeError: If the text does not contain valid JSON
+        ValueError: If required keys are missing
+    """
+    # The response might be wrapped in markdown code blocks
+    if "```json" in response_text:
+        # Extract JSON from code block
+        start = response_text.find("```json") + 7
+        end = response_text.find("```", start)
+        json_str = response_text[start:end].strip()
+    elif "```" in response_text:
+        # Extract JSON from code block (without json tag)
+        start = response_text.find("```") + 3
+        end = response_text.find("```", start)
+        json_str = response_text[start:end].strip()
+    else:
+        # Assume the entire response is JSON
+        json_str = response_text.strip()
+
+    parsed_response = json.loads(json_str)
+
+    # Validate the response structure
+    required_keys = ["summary", "recommendations", "capacity_development_needs"]
+    if not all(key in parsed_response for key in required_keys):
+        raise ValueError(
+            f"Gemini API response missing required keys. Got: {list(parsed_response.keys())}"
+        )
+
+    return parsed_response
+
+
+def insight_cache_content(context: dict[str, Any]) -> str:
+    """
+    Canonical content the insights of a prompt context are cached under.
+
+    Holds the sorted failed indicators with their normalized assessor feedback.
+    Barangay name, assessment year, compliance status and comment authors stay
+    in the prompt but out of the cache content, so assessments failing the
+    same indicators with the same feedback share one cached response.
+
+    Args:
+        context: Entry of `IntelligenceService.load_prompt_contexts`
+
+    Returns:
+        JSON text to hash with `make_cache_key`
+    """
+    indicators = sorted(
+        [
+            indicator["governance_area"] or "",
+            indicator["indicator_name"] or "",
+            indicator["description"] or "",
+            sorted(
+                normalize_cache_text(comment["comment"])
+                for comment in indicator["assessor_comments"]
+            ),
+        ]
+        for indicator in context["failed_indicators"]
+    )
+    return json.dumps(indicators, ensure_ascii=False)
+
+
+def apply_three_plus_one_rule(area_compliance: dict[str, bool]) -> ComplianceStatus:
+    """
+    Apply the SGLGB "3+1" rule to per-area results.
+
+    Args:
+        area_compliance: Pass/fail flag per area name
+
+    Returns:
+        PASSED if all Core areas and at least one Essential area passed
+    """
+    all_core_passed = all(area_compliance.get(name, False) for name in CORE_AREAS)
+    at_least_one_essential_passed = any(
+        area_compliance.get(name, False) for name in ESSENTIAL_AREAS
+    )
+    if all_core_passed and at_least_one_essential_passed:
+        return ComplianceStatus.PASSED
+    return ComplianceStatus.FAILED
+
 
 class IntelligenceService:
     def get_validated_responses_by_area(
@@ -64,6 +211,52 @@ class IntelligenceService:
 
         return area_responses
 
+    def get_area_compliance(
+        self,
+        db: Session,
+        assessment_id: int,
+        area_names: Sequence[str] | None = None,
+    ) -> dict[str, bool]:
+        """
+        Determine pass/fail for several governance areas with one grouped query.
+
+        An area passes if it has at least one indicator and ALL of its indicators
+        have a response for this assessment with validation_status = 'Pass'.
+        Unknown areas and areas without indicators fail.
+
+        Args:
+            db: Database session
+            assessment_id: ID of the assessment
+            area_names: Areas to evaluate (defaults to all six SGLGB areas)
+
+        Returns:
+            Dictionary mapping each requested area name to True (passed) or False
+        """
+        names = list(area_names) if area_names is not None else ALL_AREAS
+
+        passed_response = and_(
+            AssessmentResponse.indicator_id == Indicator.id,
+            AssessmentResponse.assessment_id == assessment_id,
+            AssessmentResponse.validation_status == ValidationStatus.PASS,
+        )
+        rows = db.execute(
+            select(
+                GovernanceArea.id,
+                GovernanceArea.name,
+                func.count(distinct(Indicator.id)).label("indicator_count"),
+                func.count(distinct(AssessmentResponse.indicator_id)).label(
+                    "passed_count"
+                ),
+            )
+            .outerjoin(Indicator, Indicator.governance_area_id == GovernanceArea.id)
+            .outerjoin(AssessmentResponse, passed_response)
+            .where(GovernanceArea.name.in_(names))
+            .group_by(GovernanceArea.id, GovernanceArea.name)
+            .order_by(GovernanceArea.id)
+        ).all()
+
+        return reduce_area_compliance(rows, names)
+
     def determine_area_compliance(
         self, db: Session, assessment_id: int, area_name: str
     ) -> bool:
@@ -81,34 +274,7 @@ class IntelligenceService:
         Returns:
             True if all indicators in the area passed, False otherwise
         """
-        # Get all indicators for this governance area
-        area = db.query(GovernanceArea).filter(GovernanceArea.name == area_name).first()
-        if not area:
-            return False
-
-        indicators = (
-            db.query(Indicator).filter(Indicator.governance_area_id == area.id).all()
-        )
-
-        if not indicators:
-            return False  # No indicators = failed area
-
-        # Check all responses for this assessment and area
-        for indicator in indicators:
-            response = (
-                db.query(AssessmentResponse)
-                .filter(
-                    AssessmentResponse.assessment_id == assessment_id,
-                    AssessmentResponse.indicator_id == indicator.id,
-                )
-                .first()
-            )
-
-            # If no response exists, or if validation status is not PASS, the area fails
-            if not response or response.validation_status != ValidationStatus.PASS:
-                return False
-
-        return True
+        return self.get_area_compliance(db, assessment_id, [area_name])[area_name]
 
     def get_all_area_results(self, db: Session, assessment_id: int) -> dict[str, str]:
         """
@@ -123,18 +289,7 @@ class IntelligenceService:
         Returns:
             Dictionary mapping area name to status
         """
-        area_results: dict[str, str] = {}
-
-        # Check all six areas
-        all_areas = CORE_AREAS + ESSENTIAL_AREAS
-
-        for area_name in all_areas:
-            if self.determine_area_compliance(db, assessment_id, area_name):
-                area_results[area_name] = "Passed"
-            else:
-                area_results[area_name] = "Failed"
-
-        return area_results
+        return format_area_results(self.get_area_compliance(db, assessment_id))
 
     def check_core_areas_compliance(self, db: Session, assessment_id: int) -> bool:
         """
@@ -149,10 +304,7 @@ class IntelligenceService:
         Returns:
             True if all Core areas passed, False otherwise
         """
-        for area_name in CORE_AREAS:
-            if not self.determine_area_compliance(db, assessment_id, area_name):
-                return False
-        return True
+        return all(self.get_area_compliance(db, assessment_id, CORE_AREAS).values())
 
     def check_essential_areas_compliance(self, db: Session, assessment_id: int) -> bool:
         """
@@ -167,10 +319,9 @@ class IntelligenceService:
         Returns:
             True if at least one Essential area passed, False otherwise
         """
-        for area_name in ESSENTIAL_AREAS:
-            if self.determine_area_compliance(db, assessment_id, area_name):
-                return True
-        return False
+        return any(
+            self.get_area_compliance(db, assessment_id, ESSENTIAL_AREAS).values()
+        )
 
     def determine_compliance_status(
         self, db: Session, assessment_id: int
@@ -193,26 +344,14 @@ class IntelligenceService:
         Returns:
             ComplianceStatus.PASSED or ComplianceStatus.FAILED
         """
-        # Check Core areas compliance
-        all_core_passed = self.check_core_areas_compliance(db, assessment_id)
-
-        # Check Essential areas compliance
-        at_least_one_essential_passed = self.check_essential_areas_compliance(
-            db, assessment_id
-        )
-
-        # Apply "3+1" rule
-        if all_core_passed and at_least_one_essential_passed:
-            return ComplianceStatus.PASSED
-        else:
-            return ComplianceStatus.FAILED
+        return apply_three_plus_one_rule(self.get_area_compliance(db, assessment_id))
 
     def classify_assessment(self, db: Session, assessment_id: int) -> dict[str, Any]:
         """
         Run the complete classification algorithm and store results.
 
         This method:
-        1. Calculates area-level compliance (all indicators must pass)
+        1. Calculates area-level compliance (all indicators must pass) in one query
         2. Applies the "3+1" rule to determine overall compliance status
         3. Stores results in the database
 
@@ -231,16 +370,17 @@ class IntelligenceService:
         if not assessment:
             raise ValueError(f"Assessment {assessment_id} not found")
 
-        # Get area-level results
-        area_results = self.get_all_area_results(db, assessment_id)
+        # Evaluate every area once, then derive both results from it
+        area_compliance = self.get_area_compliance(db, assessment_id)
+        area_results = format_area_results(area_compliance)
 
         # Determine overall compliance status using "3+1" rule
-        compliance_status = self.determine_compliance_status(db, assessment_id)
+        compliance_status = apply_three_plus_one_rule(area_compliance)
 
         # Store results in database
         assessment.final_compliance_status = compliance_status
         assessment.area_results = area_results
-        assessment.updated_at = datetime.now(UTC)
+        assessment.updated_at = datetime.utcnow()
 
         db.commit()
         db.refresh(assessment)
@@ -252,6 +392,158 @@ class IntelligenceService:
             "area_results": area_results,
         }
 
+    def reclassify_assessments(
+        self,
+        db: Session,
+        status: AssessmentStatus | None = AssessmentStatus.VALIDATED,
+        assessment_ids: Sequence[int] | None = None,
+        dry_run: bool = False,
+        batch_size: int = 1000,
+    ) -> dict[str, Any]:
+        """
+        Re-run the classification for a whole set of assessments at once.
+
+        Used after CORE_AREAS/ESSENTIAL_AREAS or indicator assignments change.
+        Passing responses are read with one streaming query (`yield_per`),
+        area results and the "3+1" status are computed in memory, and only
+        assessments whose results changed are written back with one bulk UPDATE.
+
+        Args:
+            db: Database session
+            status: Only reclassify assessments with this status (None for all)
+            assessment_ids: Only reclassify these assessments
+            dry_run: Compute and report the diff without writing anything
+            batch_size: Rows fetched per round trip while streaming responses
+
+        Returns:
+            Report with counts, throughput and the list of changes
+        """
+        started = time.perf_counter()
+
+        # Area catalogue: the first area per name wins, as in get_area_compliance
+        area_name_by_id: dict[int, str] = {}
+        for area_id, area_name in db.execute(
+            select(GovernanceArea.id, GovernanceArea.name)
+            .where(GovernanceArea.name.in_(ALL_AREAS))
+            .order_by(GovernanceArea.id)
+        ):
+            if area_name not in area_name_by_id.values():
+                area_name_by_id[area_id] = area_name
+
+        indicator_area: dict[int, str] = {}
+        indicator_count = {name: 0 for name in ALL_AREAS}
+        for indicator_id, area_id in db.execute(
+            select(Indicator.id, Indicator.governance_area_id).where(
+                Indicator.governance_area_id.in_(list(area_name_by_id))
+            )
+        ):
+            area_name = area_name_by_id[area_id]
+            indicator_area[indicator_id] = area_name
+            indicator_count[area_name] += 1
+
+        # Target assessments with their current results
+        target_filter = []
+        if status is not None:
+            target_filter.append(Assessment.status == status)
+        if assessment_ids is not None:
+            target_filter.append(Assessment.id.in_(list(assessment_ids)))
+
+        current = {
+            row.id: row
+            for row in db.execute(
+                select(
+                    Assessment.id,
+                    Assessment.final_compliance_status,
+                    Assessment.area_results,
+                ).where(*target_filter)
+            )
+        }
+
+        # One streaming pass over every passing response of the target set
+        passed: dict[int, dict[str, set[int]]] = {
+            assessment_id: {} for assessment_id in current
+        }
+        responses_scanned = 0
+        if current and indicator_area:
+            response_rows = db.execute(
+                select(AssessmentResponse.assessment_id, AssessmentResponse.indicator_id)
+                .join(Assessment, AssessmentResponse.assessment_id == Assessment.id)
+                .where(
+                    AssessmentResponse.validation_status == ValidationStatus.PASS,
+                    *target_filter,
+                )
+                .execution_options(yield_per=batch_size)
+            )
+            for assessment_id, indicator_id in response_rows:
+                responses_scanned += 1
+                area_name = indicator_area.get(indicator_id)
+                if area_name is not None and assessment_id in passed:
+                    passed[assessment_id].setdefault(area_name, set()).add(
+                        indicator_id
+                    )
+
+        # Reduce in memory and diff against the stored results
+        changes: list[dict[str, Any]] = []
+        updates: list[dict[str, Any]] = []
+        now = datetime.utcnow()
+        for assessment_id, row in current.items():
+            area_compliance = {
+                name: 0 < indicator_count[name]
+                == len(passed[assessment_id].get(name, ()))
+                for name in ALL_AREAS
+            }
+            area_results = format_area_results(area_compliance)
+            compliance_status = apply_three_plus_one_rule(area_compliance)
+
+            if (
+                row.final_compliance_status == compliance_status
+                and row.area_results == area_results
+            ):
+                continue
+
+            old_results = row.area_results or {}
+            changes.append(
+                {
+                    "assessment_id": assessment_id,
+                    "old_status": row.final_compliance_status.value
+                    if row.final_compliance_status
+                    else None,
+                    "new_status": compliance_status.value,
+                    "changed_areas": {
+                        name: [old_results.get(name), result]
+                        for name, result in area_results.items()
+                        if old_results.get(name) != result
+                    },
+                }
+            )
+            updates.append(
+                {
+                    "id": assessment_id,
+                    "final_compliance_status": compliance_status,
+                    "area_results": area_results,
+                    "updated_at": now,
+                }
+            )
+
+        if updates and not dry_run:
+            # ORM bulk UPDATE by primary key: one executemany for all changes
+            db.execute(update(Assessment), updates)
+            db.commit()
+
+        elapsed = time.perf_counter() - started
+        return {
+            "dry_run": dry_run,
+            "assessments_scanned": len(current),
+            "responses_scanned": responses_scanned,
+            "changed": len(changes),
+            "unchanged": len(current) - len(changes),
+            "elapsed_seconds": round(elapsed, 3),
+            "assessments_per_second": round(len(current) / elapsed, 1)
+            if elapsed > 0
+            else None,
+            "changes": changes,
+        }
+
     def build_gemini_prompt(self, db: Session, assessment_id: int) -> str:
         """
         Build a structured prompt for Gemini API from failed indicators.
@@ -272,67 +564,185 @@ class IntelligenceService:
         Raises:
             ValueError: If assessment not found
         """
-        # Get assessment with all relationships
-        from app.db.models.user import User
-
-        assessment = (
-            db.query(Assessment)
-            .options(
-                joinedload(Assessment.blgu_user).joinedload(User.barangay),
-                joinedload(Assessment.responses)
-                .joinedload(AssessmentResponse.indicator)
-                .joinedload(Indicator.governance_area),
-                joinedload(Assessment.responses).joinedload(
-                    AssessmentResponse.feedback_comments
-                ),
-            )
-            .filter(Assessment.id == assessment_id)
-            .first()
-        )
+        return self.build_gemini_request(db, assessment_id)[0]
 
-        if not assessment:
+    def build_gemini_request(
+        self, db: Session, assessment_id: int
+    ) -> tuple[str, str]:
+        """
+        Build the prompt of an assessment and the content its insights are cached under.
+
+        Args:
+            db: Database session
+            assessment_id: ID of the assessment
+
+        Returns:
+            (prompt, cache content); see `insight_cache_content`
+
+        Raises:
+            ValueError: If assessment not found
+        """
+        requests = self.build_gemini_requests(db, [assessment_id])
+        if assessment_id not in requests:
             raise ValueError(f"Assessment {assessment_id} not found")
+        return requests[assessment_id]
 
-        # Get barangay name
-        barangay_name = "Unknown"
-        if assessment.blgu_user and assessment.blgu_user.barangay:
-            barangay_name = assessment.blgu_user.barangay.name
-
-        # Get assessment year
-        assessment_year = "2024"  # Default
-        if assessment.validated_at:
-            assessment_year = str(assessment.validated_at.year)
-
-        # Get failed indicators with feedback
-        failed_indicators = []
-        for response in assessment.responses:
-            if response.validation_status != ValidationStatus.PASS:
-                indicator = response.indicator
-                governance_area = indicator.governance_area
-
-                # Get assessor comments
-                comments = []
-                for comment in response.feedback_comments:
-                    comments.append(
-                        f"{comment.assessor.name if comment.assessor else 'Assessor'}: {comment.comment}"
-                    )
+    def build_gemini_prompts(
+        self, db: Session, assessment_ids: Sequence[int]
+    ) -> dict[int, str]:
+        """
+        Build Gemini prompts for many assessments with one projection query.
+
+        Args:
+            db: Database session
+            assessment_ids: IDs of the assessments
+
+        Returns:
+            Dictionary mapping assessment ID to prompt; unknown IDs are left out
+        """
+        return {
+            assessment_id: prompt
+            for assessment_id, (prompt, _) in self.build_gemini_requests(
+                db, assessment_ids
+            ).items()
+        }
+
+    def build_gemini_requests(
+        self, db: Session, assessment_ids: Sequence[int]
+    ) -> dict[int, tuple[str, str]]:
+        """
+        Build prompts and cache contents for many assessments with one query.
+
+        Args:
+            db: Database session
+            assessment_ids: IDs of the assessments
+
+        Returns:
+            Dictionary mapping assessment ID to (prompt, cache content);
+            unknown IDs are left out
+        """
+        return {
+            assessment_id: (
+                self._format_gemini_prompt(context),
+                insight_cache_content(context),
+            )
+            for assessment_id, context in self.load_prompt_contexts(
+                db, assessment_ids
+            ).items()
+        }
+
+    def load_prompt_contexts(
+        self, db: Session, assessment_ids: Sequence[int]
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Load what the Gemini prompt needs for many assessments in one query.
+
+        Selects only the text columns used by the prompt: the assessment header
+        with its barangay, and every non-passing response with its indicator,
+        governance area and feedback comments (with the comment author's name).
+        No ORM objects are loaded, so
+        there are no lazy loads per comment. Indicators are ordered by
+        governance area and name, so the same failures always render in the
+        same order regardless of the order responses were created in.
+
+        Args:
+            db: Database session
+            assessment_ids: IDs of the assessments
+
+        Returns:
+            Dictionary mapping assessment ID to barangay_name, assessment_year,
+            compliance_status and failed_indicators; unknown IDs are left out
+        """
+        blgu_user = aliased(User)
+        assessor = aliased(User)
+        failed_response = and_(
+            AssessmentResponse.assessment_id == Assessment.id,
+            or_(
+                AssessmentResponse.validation_status.is_(None),
+                AssessmentResponse.validation_status != ValidationStatus.PASS,
+            ),
+        )
+
+        rows = db.execute(
+            select(
+                Assessment.id.label("assessment_id"),
+                Assessment.validated_at,
+                Assessment.final_compliance_status,
+                Barangay.name.label("barangay_name"),
+                AssessmentResponse.id.label("response_id"),
+                Indicator.name.label("indicator_name"),
+                Indicator.description,
+                GovernanceArea.name.label("governance_area"),
+                GovernanceArea.area_type,
+                FeedbackComment.id.label("comment_id"),
+                FeedbackComment.comment,
+                assessor.name.label("assessor_name"),
+            )
+            .select_from(Assessment)
+            .outerjoin(blgu_user, Assessment.blgu_user_id == blgu_user.id)
+            .outerjoin(Barangay, blgu_user.barangay_id == Barangay.id)
+            .outerjoin(AssessmentResponse, failed_response)
+            .outerjoin(Indicator, AssessmentResponse.indicator_id == Indicator.id)
+            .outerjoin(GovernanceArea, Indicator.governance_area_id == GovernanceArea.id)
+            .outerjoin(FeedbackComment, FeedbackComment.response_id == AssessmentResponse.id)
+            .outerjoin(assessor, FeedbackComment.assessor_id == assessor.id)
+            .where(Assessment.id.in_(list(assessment_ids)))
+            .order_by(
+                Assessment.id,
+                GovernanceArea.name,
+                Indicator.name,
+                AssessmentResponse.id,
+                FeedbackComment.id,
+            )
+        )
 
-                failed_indicators.append(
+        contexts: dict[int, dict[str, Any]] = {}
+        indicators_by_response: dict[int, dict[str, Any]] = {}
+        for row in rows:
+            context = contexts.get(row.assessment_id)
+            if context is None:
+                context = contexts[row.assessment_id] = {
+                    "barangay_name": row.barangay_name or "Unknown",
+                    # Default year when the assessment is not validated yet
+                    "assessment_year": str(row.validated_at.year)
+                    if row.validated_at
+                    else "2024",
+                    "compliance_status": row.final_compliance_status.value
+                    if row.final_compliance_status
+                    else "Not yet classified",
+                    "failed_indicators": [],
+                }
+
+            if row.response_id is None:
+                continue
+
+            indicator = indicators_by_response.get(row.response_id)
+            if indicator is None:
+                indicator = indicators_by_response[row.response_id] = {
+                    "indicator_name": row.indicator_name,
+                    "description": row.description,
+                    "governance_area": row.governance_area,
+                    "area_type": row.area_type.value,
+                    "assessor_comments": [],
+                }
+                context["failed_indicators"].append(indicator)
+
+            if row.comment_id is not None:
+                indicator["assessor_comments"].append(
                     {
-                        "indicator_name": indicator.name,
-                        "description": indicator.description,
-                        "governance_area": governance_area.name,
-                        "area_type": governance_area.area_type.value,
-                        "assessor_comments": comments,
+                        "assessor_name": row.assessor_name or "Assessor",
+                        "comment": row.comment,
                     }
                 )
 
-        # Get overall compliance status
-        compliance_status = (
-            assessment.final_compliance_status.value
-            if assessment.final_compliance_status
-            else "Not yet classified"
-        )
+        return contexts
+
+    def _format_gemini_prompt(self, context: dict[str, Any]) -> str:
+        """Render the Gemini prompt from a `load_prompt_contexts` entry."""
+        barangay_name = context["barangay_name"]
+        assessment_year = context["assessment_year"]
+        compliance_status = context["compliance_status"]
+        failed_indicators = context["failed_indicators"]
 
         # Build the prompt
         prompt = f"""You are an expert consultant analyzing SGLGB (Seal of Good Local Governance - Barangay) compliance assessment results.
@@ -355,7 +765,9 @@ FAILED INDICATORS:
             if indicator["assessor_comments"]:
                 prompt += "   - Assessor Feedback:\n"
                 for comment in indicator["assessor_comments"]:
-                    prompt += f"     • {comment}\n"
+                    prompt += (
+                        f"     • {comment['assessor_name']}: {comment['comment']}\n"
+                    )
 
         prompt += """
 
@@ -389,7 +801,10 @@ Focus on:
         Call Gemini API with the prompt and parse the JSON response.
 
         Builds the prompt from failed indicators, calls Gemini API,
-        and returns the structured JSON response.
+        and returns the structured JSON response. Responses are shared through
+        `insight_cache_service`, so failures and feedback already answered (for
+        this or any other assessment) are served from the cache without an API
+        call.
 
         Args:
             db: Database session
@@ -402,32 +817,43 @@ Focus on:
             ValueError: If assessment not found or API key not configured
             Exception: If API call fails or response parsing fails
         """
+        # Build the prompt
+        prompt, cache_content = self.build_gemini_request(db, assessment_id)
+        model_name = settings.GEMINI_MODEL
+
+        # Identical failures and feedback never hit Gemini twice
+        cached = insight_cache_service.get(db, cache_content, model_name)
+        if cached is not None:
+            return cached
+
         # Check if API key is configured
         if not settings.GEMINI_API_KEY:
             raise ValueError("GEMINI_API_KEY not configured in environment")
 
-        # Build the prompt
-        prompt = self.build_gemini_prompt(db, assessment_id)
+        # Wait for RPM/TPM capacity shared by all workers instead of failing upstream
+        rate_limiter = get_gemini_rate_limiter()
+        if rate_limiter is not None:
+            try:
+                rate_limiter.acquire(estimate_tokens(prompt))
+            except RateLimitTimeout as e:
+                raise Exception(
+                    "Gemini API rate limit: no capacity available. Please try again later."
+                ) from e
 
         # Configure Gemini
         genai.configure(api_key=settings.GEMINI_API_KEY)  # type: ignore
 
         # Initialize the model
-        # Using Gemini 2.5 Flash (latest stable as of Oct 2025)
+        # Defaults to Gemini 2.5 Flash (latest stable as of Oct 2025)
         # Supports up to 1M input tokens and 65K output tokens
-        model = genai.GenerativeModel("gemini-2.5-flash")  # type: ignore
+        model = genai.GenerativeModel(model_name)  # type: ignore
 
         try:
             # Call the API with generation configuration
             # Using type: ignore due to incomplete type stubs in google-generativeai
-            generation_config = {
-                "temperature": 0.7,
-                "max_output_tokens": 8192,
-            }
-
             response = model.generate_content(
                 prompt,
-                generation_config=generation_config,  # type: ignore
+                generation_config=GENERATION_CONFIG,  # type: ignore
             )
 
             # Parse the response text
@@ -435,34 +861,7 @@ Focus on:
                 raise Exception("Gemini API returned empty or invalid response")
 
             response_text = response.text
-
-            # Try to extract JSON from the response
-            # The response might be wrapped in markdown code blocks
-            if "```json" in response_text:
-                # Extract JSON from code block
-                start = response_text.find("```json") + 7
-                end = response_text.find("```", start)
-                json_str = response_text[start:end].strip()
-            elif "```" in response_text:
-                # Extract JSON from code block (without json tag)
-                start = response_text.find("```") + 3
-                end = response_text.find("```", start)
-                json_str = response_text[start:end].strip()
-            else:
-                # Assume the entire response is JSON
-                json_str = response_text.strip()
-
-            # Parse the JSON
-            parsed_response = json.loads(json_str)
-
-            # Validate the response structure
-            required_keys = ["summary", "recommendations", "capacity_development_needs"]
-            if not all(key in parsed_response for key in required_keys):
-                raise ValueError(
-                    f"Gemini API response missing required keys. Got: {list(parsed_response.keys())}"
-                )
-
-            return parsed_response
+            parsed_response = parse_insights_response(response_text)
 
         except json.JSONDecodeError as e:
             raise Exception(
@@ -493,6 +892,151 @@ Focus on:
             else:
                 raise Exception(f"Gemini API call failed: {str(e)}") from e
 
+        insight_cache_service.put(db, cache_content, model_name, parsed_response)
+        return parsed_response
+
+    def generate_insights_batch(
+        self,
+        db: Session,
+        assessment_ids: Sequence[int],
+        concurrency: int | None = None,
+    ) -> dict[str, Any]:
+        """
+        Generate AI insights for many validated assessments at once.
+
+        Prompts are built in one DB pass and checked against the shared insight
+        cache with one lookup. Uncached prompts go to Gemini once per cache key
+        through an async client with at most `concurrency` requests in flight (each waiting
+        on the shared rate limiter), and all results are written back with one
+        bulk UPDATE. Must be called from synchronous code (worker or CLI).
+
+        Args:
+            db: Database session
+            assessment_ids: IDs of the assessments
+            concurrency: Maximum concurrent Gemini requests
+                (defaults to GEMINI_BATCH_CONCURRENCY)
+
+        Returns:
+            Report with generated, cached, skipped and failed assessments
+
+        Raises:
+            ValueError: If Gemini calls are needed and no API key is configured
+        """
+        started = time.perf_counter()
+        requested = list(dict.fromkeys(assessment_ids))
+
+        found = {
+            row.id: row
+            for row in db.execute(
+                select(
+                    Assessment.id, Assessment.status, Assessment.ai_recommendations
+                ).where(Assessment.id.in_(requested))
+            )
+        }
+        skipped: dict[int, str] = {}
+        for assessment_id in requested:
+            row = found.get(assessment_id)
+            if row is None:
+                skipped[assessment_id] = "not found"
+            elif row.status != AssessmentStatus.VALIDATED:
+                skipped[assessment_id] = "not validated"
+            elif row.ai_recommendations:
+                skipped[assessment_id] = "already generated"
+
+        requests = self.build_gemini_requests(
+            db, [i for i in requested if i not in skipped]
+        )
+        model_name = settings.GEMINI_MODEL
+
+        insights = insight_cache_service.get_many(
+            db,
+            {
+                assessment_id: cache_content
+                for assessment_id, (_, cache_content) in requests.items()
+            },
+            model_name,
+        )
+        cached_count = len(insights)
+
+        # Assessments sharing a cache key are sent to Gemini once
+        pending: dict[str, str] = {}
+        contents: dict[str, str] = {}
+        ids_by_key: dict[str, list[int]] = {}
+        for assessment_id, (prompt, cache_content) in requests.items():
+            if assessment_id in insights:
+                continue
+            cache_key = make_cache_key(cache_content, model_name)
+            pending.setdefault(cache_key, prompt)
+            contents.setdefault(cache_key, cache_content)
+            ids_by_key.setdefault(cache_key, []).append(assessment_id)
+
+        failed: dict[int, str] = {}
+        if pending:
+            if not settings.GEMINI_API_KEY:
+                raise ValueError("GEMINI_API_KEY not configured in environment")
+
+            results = asyncio.run(
+                self._generate_many(
+                    pending, concurrency or settings.GEMINI_BATCH_CONCURRENCY
+                )
+            )
+            generated = []
+            for cache_key, result in results.items():
+                if isinstance(result, BaseException):
+                    for assessment_id in ids_by_key[cache_key]:
+                        failed[assessment_id] = str(result)
+                    continue
+                generated.append((contents[cache_key], result))
+                for assessment_id in ids_by_key[cache_key]:
+                    insights[assessment_id] = result
+            insight_cache_service.put_many(db, generated, model_name)
+
+        if insights:
+            now = datetime.utcnow()
+            db.execute(
+                update(Assessment),
+                [
+                    {"id": assessment_id, "ai_recommendations": result, "updated_at": now}
+                    for assessment_id, result in insights.items()
+                ],
+            )
+            db.commit()
+
+        elapsed = time.perf_counter() - started
+        return {
+            "requested": len(requested),
+            "generated": len(insights) - cached_count,
+            "cached": cached_count,
+            "gemini_calls": len(pending),
+            "skipped": skipped,
+            "failed": failed,
+            "elapsed_seconds": round(elapsed, 3),
+        }
+
+    async def _generate_many(
+        self, prompts: dict[str, str], concurrency: int
+    ) -> dict[str, Any]:
+        """Call Gemini for each prompt with bounded concurrency and rate limiting."""
+        rate_limiter = get_gemini_rate_limiter()
+
+        async def wait_for_capacity(prompt: str) -> None:
+            if rate_limiter is not None:
+                # The limiter blocks; keep the event loop free while it waits
+                await asyncio.to_thread(rate_limiter.acquire, estimate_tokens(prompt))
+
+        async with AsyncGeminiClient(
+            api_key=settings.GEMINI_API_KEY or "",
+            model=settings.GEMINI_MODEL,
+            generation_config=GENERATION_CONFIG,
+            max_connections=concurrency,
+        ) as client:
+            return await client.generate_many(
+                prompts,
+                concurrency,
+                before_call=wait_for_capacity,
+                parse=parse_insights_response,
+            )
+
     def get_insights_with_caching(
         self, db: Session, assessment_id: int
     ) -> dict[str, Any]:
@@ -530,7 +1074,7 @@ Focus on:
 
         # Store the recommendations in the database for future use
         assessment.ai_recommendations = insights
-        assessment.updated_at = datetime.now(UTC)
+        assessment.updated_at = datetime.utcnow()
         db.commit()
         db.refresh(assessment)
 
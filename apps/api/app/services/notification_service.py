@@ -0,0 +1,334 @@
+# 📬 Notification Service
+# Notification outbox: events queued with assessment changes, sent as digests
+
+import time
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from email.utils import formataddr
+from itertools import groupby
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.core.mailer import get_mailer
+from app.db.models.assessment import Assessment
+from app.db.models.barangay import Barangay
+from app.db.models.notification_outbox import NotificationEvent
+from app.db.models.user import User
+from sqlalchemy import (
+    and_,
+    bindparam,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.orm import Session, aliased
+
+REWORK = "rework"
+VALIDATION_COMPLETE = "validation_complete"
+NOTIFICATION_KINDS = (REWORK, VALIDATION_COMPLETE)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """
+    Delay before retrying a digest that failed `attempts` times.
+
+    Args:
+        attempts: Failed attempts so far (>= 1)
+
+    Returns:
+        Exponential backoff capped at NOTIFICATION_RETRY_MAX_SECONDS
+    """
+    seconds = settings.NOTIFICATION_RETRY_BASE_SECONDS * 2 ** max(0, attempts - 1)
+    return timedelta(seconds=min(seconds, settings.NOTIFICATION_RETRY_MAX_SECONDS))
+
+
+def _due(event: Any, now: datetime) -> Any:
+    """Condition for events (NotificationEvent or an alias) that are due at `now`."""
+    return and_(
+        event.next_attempt_at <= now,
+        event.attempts < settings.NOTIFICATION_MAX_ATTEMPTS,
+    )
+
+
+def render_event(event: Any) -> Tuple[str, str]:
+    """
+    Render one queued event as a subject line and a paragraph.
+
+    Args:
+        event: Row with kind, barangay_name and final_compliance_status
+
+    Returns:
+        (subject, text)
+    """
+    barangay = event.barangay_name or "your barangay"
+    if event.kind == REWORK:
+        return (
+            f"Assessment for {barangay} needs rework",
+            f"Your assessment for {barangay} needs rework. Please review the "
+            "assessor feedback and resubmit.",
+        )
+
+    text = (
+        f"Congratulations! Your assessment for {barangay} has been validated "
+        "and is now complete."
+    )
+    if event.final_compliance_status is not None:
+        text += f" Final SGLGB result: {event.final_compliance_status.value}."
+    return f"Assessment for {barangay} has been validated", text
+
+
+def render_digest(recipient_name: Optional[str], events: Sequence[Any]) -> Tuple[str, str]:
+    """
+    Render all pending events of one recipient as a single email.
+
+    Args:
+        recipient_name: Greeting name (may be None)
+        events: Queued event rows, oldest first
+
+    Returns:
+        (subject, body)
+    """
+    rendered = [render_event(event) for event in events]
+    greeting = f"Hello {recipient_name}," if recipient_name else "Hello,"
+
+    if len(rendered) == 1:
+        subject, text = rendered[0]
+        return f"VANTAGE: {subject}", f"{greeting}\n\n{text}\n"
+
+    items = "\n\n".join(f"- {text}" for _, text in rendered)
+    return (
+        f"VANTAGE: {len(rendered)} updates on your assessments",
+        f"{greeting}\n\nHere is what changed since our last message:\n\n{items}\n",
+    )
+
+
+class NotificationService:
+    """
+    Queues notifications in the same transaction as the change they report,
+    so requests never talk to a broker or mail server, and sends them as one
+    digest per recipient from the notification worker.
+    """
+
+    def enqueue(self, db: Session, assessment_id: int, kind: str) -> int:
+        """
+        Queue a notification to an assessment's BLGU user (the caller commits).
+
+        The recipient is resolved inside the INSERT, so this is one statement.
+
+        Args:
+            db: Database session
+            assessment_id: Assessment the notification is about
+            kind: One of NOTIFICATION_KINDS
+
+        Returns:
+            Number of queued events (0 if the assessment does not exist)
+
+        Raises:
+            ValueError: If the kind is unknown
+        """
+        if kind not in NOTIFICATION_KINDS:
+            raise ValueError(f"Unknown notification kind: {kind}")
+
+        now = datetime.utcnow()
+        recipient = (
+            select(
+                literal(kind),
+                Assessment.id,
+                User.email,
+                User.name,
+                literal(0),
+                literal(now),
+                literal(now),
+            )
+            .join(User, User.id == Assessment.blgu_user_id)
+            .where(Assessment.id == assessment_id)
+        )
+        result = db.execute(
+            insert(NotificationEvent.__table__).from_select(
+                [
+                    "kind",
+                    "assessment_id",
+                    "recipient_email",
+                    "recipient_name",
+                    "attempts",
+                    "next_attempt_at",
+                    "created_at",
+                ],
+                recipient,
+            )
+        )
+        return result.rowcount
+
+    def flush(
+        self,
+        db: Session,
+        mailer=None,
+        batch_size: Optional[int] = None,
+        max_batches: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Send every due event, one digest email per recipient.
+
+        Each batch claims whole recipients: a worker locks the oldest due
+        event of a recipient with SKIP LOCKED (on PostgreSQL) and then takes
+        all of that recipient's due events, so a recipient never gets two
+        digests from concurrent workers. The claim is committed (the events
+        are pushed NOTIFICATION_CLAIM_SECONDS into the future) before the mail
+        server is contacted, so no row locks are held during SMTP sends and
+        events of a crashed worker are retried once the claim expires. All
+        digests of a flush go through the mailer's persistent connections.
+        Sent events are deleted; failed ones are retried with exponential
+        backoff until they reach NOTIFICATION_MAX_ATTEMPTS.
+
+        Args:
+            db: Database session
+            mailer: Mailer (defaults to the configured one)
+            batch_size: Recipients per batch (defaults to NOTIFICATION_BATCH_SIZE)
+            max_batches: Optional limit on the number of batches
+
+        Returns:
+            Report with batches, digests_sent, events_sent, failed and elapsed_seconds
+        """
+        mailer = mailer or get_mailer()
+        batch_size = batch_size or settings.NOTIFICATION_BATCH_SIZE
+        started = time.perf_counter()
+        report = {"batches": 0, "digests_sent": 0, "events_sent": 0, "failed": 0}
+
+        earlier = aliased(NotificationEvent)
+        while max_batches is None or report["batches"] < max_batches:
+            now = datetime.utcnow()
+            # The oldest due event of a recipient stands for the recipient:
+            # whoever locks it owns all of the recipient's due events
+            recipients = db.scalars(
+                select(NotificationEvent.recipient_email)
+                .where(
+                    _due(NotificationEvent, now),
+                    ~exists().where(
+                        earlier.recipient_email == NotificationEvent.recipient_email,
+                        earlier.id < NotificationEvent.id,
+                        _due(earlier, now),
+                    ),
+                )
+                .order_by(NotificationEvent.id)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            ).all()
+            if not recipients:
+                break
+
+            rows = db.execute(
+                select(
+                    NotificationEvent.id,
+                    NotificationEvent.kind,
+                    NotificationEvent.recipient_email,
+                    NotificationEvent.recipient_name,
+                    NotificationEvent.attempts,
+                    Assessment.final_compliance_status,
+                    Barangay.name.label("barangay_name"),
+                )
+                .join(Assessment, Assessment.id == NotificationEvent.assessment_id)
+                .join(User, User.id == Assessment.blgu_user_id)
+                .outerjoin(Barangay, Barangay.id == User.barangay_id)
+                .where(
+                    _due(NotificationEvent, now),
+                    NotificationEvent.recipient_email.in_(recipients),
+                )
+                .order_by(NotificationEvent.recipient_email, NotificationEvent.id)
+                .with_for_update(of=NotificationEvent)
+            ).all()
+
+            # Commit the claim so the locks are released before the SMTP sends
+            table = NotificationEvent.__table__
+            db.execute(
+                update(table)
+                .where(table.c.id.in_([row.id for row in rows]))
+                .values(
+                    next_attempt_at=now
+                    + timedelta(seconds=settings.NOTIFICATION_CLAIM_SECONDS)
+                )
+            )
+            db.commit()
+
+            sent_ids: List[int] = []
+            failures: List[Dict[str, Any]] = []
+            for email, events in groupby(rows, key=lambda row: row.recipient_email):
+                events = list(events)
+                subject, body = render_digest(events[-1].recipient_name, events)
+                message = EmailMessage()
+                message["To"] = formataddr((events[-1].recipient_name or "", email))
+                message["Subject"] = subject
+                message.set_content(body)
+                try:
+                    mailer.send(message)
+                except Exception as e:
+                    error = str(e)[:1000]
+                    failures.extend(
+                        {
+                            "event_id": event.id,
+                            "attempts": event.attempts + 1,
+                            "last_error": error,
+                            "next_attempt_at": now + retry_delay(event.attempts + 1),
+                        }
+                        for event in events
+                    )
+                else:
+                    report["digests_sent"] += 1
+                    sent_ids.extend(event.id for event in events)
+
+            if sent_ids:
+                db.execute(
+                    delete(NotificationEvent).where(NotificationEvent.id.in_(sent_ids))
+                )
+            if failures:
+                db.execute(
+                    update(table)
+                    .where(table.c.id == bindparam("event_id"))
+                    .values(
+                        attempts=bindparam("attempts"),
+                        last_error=bindparam("last_error"),
+                        next_attempt_at=bindparam("next_attempt_at"),
+                    ),
+                    failures,
+                )
+            db.commit()
+
+            report["batches"] += 1
+            report["events_sent"] += len(sent_ids)
+            report["failed"] += len(failures)
+
+        report["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+        return report
+
+    def get_stats(self, db: Session) -> Dict[str, Any]:
+        """
+        Summarize the notification backlog.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Pending and dead (out of attempts) counts and the oldest pending event time
+        """
+        max_attempts = settings.NOTIFICATION_MAX_ATTEMPTS
+        pending = NotificationEvent.attempts < max_attempts
+        row = db.execute(
+            select(
+                func.count(NotificationEvent.id).filter(pending).label("pending"),
+                func.count(NotificationEvent.id)
+                .filter(NotificationEvent.attempts >= max_attempts)
+                .label("dead"),
+                func.min(NotificationEvent.created_at).filter(pending).label("oldest"),
+            )
+        ).one()
+        return {
+            "pending": row.pending,
+            "dead": row.dead,
+            "oldest_pending_at": row.oldest,
+        }
+
+
+notification_service = NotificationService()
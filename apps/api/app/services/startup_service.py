@@ -17,6 +17,7 @@ from app.db.base import (
 from app.db.enums import UserRole
 from app.db.models.barangay import Barangay
 from app.db.models.user import User
+from app.services.assessment_service import assessment_service
 from app.services.governance_area_service import governance_area_service
 from app.services.indicator_service import indicator_service
 from sqlalchemy.orm import Session  # type: ignore[reportMissingImports]
@@ -141,6 +142,11 @@ class StartupService:
             indicator_service.ensure_environmental_indicator(db)
             logger.info("  - Environmental indicator ensured.")
 
+            # Run BLGU read-path safeguards once here so reads can stay read-only
+            logger.info("  - Running assessment data safeguards...")
+            safeguard_result = assessment_service.run_data_safeguards(db)
+            logger.info(f"  - Assessment data safeguards complete: {safeguard_result}")
+
         except Exception as e:
             logger.warning(f"⚠️  Could not seed initial data: {str(e)}")
             db.rollback()
@@ -0,0 +1,206 @@
+# 📤 Storage Outbox Service
+# Transactional outbox for file storage deletions, drained in batches by a worker
+
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.core.config import settings
+from app.core.storage import get_storage_backend
+from app.db.models.storage_outbox import StorageDeletion
+from sqlalchemy import bindparam, delete, func, select, update
+from sqlalchemy.orm import Session
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """
+    Exponential backoff after the given number of failed attempts.
+
+    Args:
+        attempts: Failed attempts so far (>= 1)
+
+    Returns:
+        Delay before the next attempt, capped at STORAGE_OUTBOX_RETRY_MAX_SECONDS
+    """
+    seconds = settings.STORAGE_OUTBOX_RETRY_BASE_SECONDS * 2 ** max(0, attempts - 1)
+    return timedelta(seconds=min(seconds, settings.STORAGE_OUTBOX_RETRY_MAX_SECONDS))
+
+
+class StorageOutboxService:
+    """
+    Records storage deletions in the database transaction that removes the
+    owning rows, so a request never waits on (or fails because of) the storage
+    API. The outbox worker later removes the objects many paths per call.
+    """
+
+    def enqueue(self, db: Session, bucket: str, paths: Iterable[str]) -> int:
+        """
+        Add deletions to the outbox (the caller commits with its own changes).
+
+        Args:
+            db: Database session
+            bucket: Bucket name
+            paths: Object paths within the bucket
+
+        Returns:
+            Number of queued deletions
+        """
+        now = datetime.utcnow()
+        entries = [
+            StorageDeletion(
+                bucket=bucket,
+                storage_path=path,
+                attempts=0,
+                next_attempt_at=now,
+                created_at=now,
+            )
+            for path in paths
+            if path
+        ]
+        db.add_all(entries)
+        return len(entries)
+
+    def drain(
+        self,
+        db: Session,
+        backend=None,
+        batch_size: Optional[int] = None,
+        max_batches: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Remove due objects from storage in batches until the outbox is empty.
+
+        Each batch is claimed with SKIP LOCKED (on PostgreSQL), so several
+        workers can drain concurrently. The claim is committed (the rows'
+        next attempt pushed STORAGE_OUTBOX_CLAIM_SECONDS ahead) before the
+        storage calls, so no lock is held during them; rows of a crashed
+        worker are retried once the claim expires. Successful rows are
+        deleted; failed rows are retried with exponential backoff until they
+        reach STORAGE_OUTBOX_MAX_ATTEMPTS.
+
+        Args:
+            db: Database session
+            backend: Storage backend (defaults to the configured one)
+            batch_size: Paths per batch (defaults to STORAGE_OUTBOX_BATCH_SIZE)
+            max_batches: Optional limit on the number of batches
+
+        Returns:
+            Report with batches, storage_calls, removed, failed and elapsed_seconds
+        """
+        backend = backend or get_storage_backend()
+        batch_size = batch_size or settings.STORAGE_OUTBOX_BATCH_SIZE
+        started = time.perf_counter()
+        report = {"batches": 0, "storage_calls": 0, "removed": 0, "failed": 0}
+
+        while max_batches is None or report["batches"] < max_batches:
+            now = datetime.utcnow()
+            rows = db.execute(
+                select(
+                    StorageDeletion.id,
+                    StorageDeletion.bucket,
+                    StorageDeletion.storage_path,
+                    StorageDeletion.attempts,
+                )
+                .where(
+                    StorageDeletion.next_attempt_at <= now,
+                    StorageDeletion.attempts < settings.STORAGE_OUTBOX_MAX_ATTEMPTS,
+                )
+                .order_by(StorageDeletion.id)
+                .limit(batch_size)
+                .with_for_update(skip_locked=True)
+            ).all()
+            if not rows:
+                break
+
+            # Commit the claim so the locks are released before the storage calls
+            table = StorageDeletion.__table__
+            db.execute(
+                update(table)
+                .where(table.c.id.in_([row.id for row in rows]))
+                .values(
+                    next_attempt_at=now
+                    + timedelta(seconds=settings.STORAGE_OUTBOX_CLAIM_SECONDS)
+                )
+            )
+            db.commit()
+
+            by_bucket: Dict[str, List[Any]] = defaultdict(list)
+            for row in rows:
+                by_bucket[row.bucket].append(row)
+
+            removed_ids: List[int] = []
+            failures: List[Dict[str, Any]] = []
+            for bucket, bucket_rows in by_bucket.items():
+                report["storage_calls"] += 1
+                try:
+                    backend.remove(
+                        bucket, sorted({row.storage_path for row in bucket_rows})
+                    )
+                except Exception as e:
+                    error = str(e)[:1000]
+                    failures.extend(
+                        {
+                            "entry_id": row.id,
+                            "attempts": row.attempts + 1,
+                            "last_error": error,
+                            "next_attempt_at": now + retry_delay(row.attempts + 1),
+                        }
+                        for row in bucket_rows
+                    )
+                else:
+                    removed_ids.extend(row.id for row in bucket_rows)
+
+            if removed_ids:
+                db.execute(
+                    delete(StorageDeletion).where(StorageDeletion.id.in_(removed_ids))
+                )
+            if failures:
+                db.execute(
+                    update(table)
+                    .where(table.c.id == bindparam("entry_id"))
+                    .values(
+                        attempts=bindparam("attempts"),
+                        last_error=bindparam("last_error"),
+                        next_attempt_at=bindparam("next_attempt_at"),
+                    ),
+                    failures,
+                )
+            db.commit()
+
+            report["batches"] += 1
+            report["removed"] += len(removed_ids)
+            report["failed"] += len(failures)
+
+        report["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+        return report
+
+    def get_stats(self, db: Session) -> Dict[str, Any]:
+        """
+        Summarize the outbox backlog.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Pending and dead (out of attempts) counts and the oldest pending entry time
+        """
+        max_attempts = settings.STORAGE_OUTBOX_MAX_ATTEMPTS
+        pending = StorageDeletion.attempts < max_attempts
+        row = db.execute(
+            select(
+                func.count(StorageDeletion.id).filter(pending).label("pending"),
+                func.count(StorageDeletion.id)
+                .filter(StorageDeletion.attempts >= max_attempts)
+                .label("dead"),
+                func.min(StorageDeletion.created_at).filter(pending).label("oldest"),
+            )
+        ).one()
+        return {
+            "pending": row.pending,
+            "dead": row.dead,
+            "oldest_pending_at": row.oldest,
+        }
+
+
+storage_outbox_service = StorageOutboxService()
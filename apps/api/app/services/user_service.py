@@ -8,7 +8,8 @@ from app.db.enums import UserRole
 from app.db.models.user import User
 from app.schemas.user import UserAdminCreate, UserAdminUpdate, UserCreate, UserUpdate
 from fastapi import HTTPException, status
-from sqlalchemy import func
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 
@@ -23,9 +24,9 @@ class UserService:
         """Get a user by their email address."""
         return db.query(User).filter(User.email == email).first()
 
-    def get_users(
+    async def get_users(
         self,
-        db: Session,
+        db: AsyncSession,
         skip: int = 0,
         limit: int = 100,
         search: Optional[str] = None,
@@ -38,27 +39,29 @@ class UserService:
         Returns:
             tuple: (users, total_count)
         """
-        query = db.query(User)
+        filters = []
 
         # Apply filters
         if search:
-            query = query.filter(
+            filters.append(
                 (User.name.ilike(f"%{search}%")) | (User.email.ilike(f"%{search}%"))
             )
 
         if role:
-            query = query.filter(User.role == role)
+            filters.append(User.role == role)
 
         if is_active is not None:
-            query = query.filter(User.is_active == is_active)
+            filters.append(User.is_active == is_active)
 
         # Get total count before pagination
-        total = query.count()
+        total = await db.scalar(select(func.count(User.id)).where(*filters))
 
         # Apply pagination
-        users = query.offset(skip).limit(limit).all()
+        users = await db.scalars(
+            select(User).where(*filters).order_by(User.id).offset(skip).limit(limit)
+        )
 
-        return users, total
+        return list(users), total or 0
 
     def create_user(self, db: Session, user_create: UserCreate) -> User:
         """Create a new user (regular user creation)."""
@@ -229,24 +232,33 @@ class UserService:
         db.refresh(db_user)
         return db_user
 
-    def get_user_stats(self, db: Session) -> dict:
+    async def get_user_stats(self, db: AsyncSession) -> dict:
         """Get user statistics for admin dashboard."""
-        total_users = db.query(User).count()
-        active_users = db.query(User).filter(User.is_active).count()
-        inactive_users = total_users - active_users
-        users_need_password_change = (
-            db.query(User).filter(User.must_change_password, User.is_active).count()
-        )
+        # Users by role, with the active / password-change counts in the same pass
+        role_stats = (
+            await db.execute(
+                select(
+                    User.role,
+                    func.count(User.id).label("total"),
+                    func.count(case((User.is_active, 1))).label("active"),
+                    func.count(
+                        case((and_(User.must_change_password, User.is_active), 1))
+                    ).label("need_password_change"),
+                ).group_by(User.role)
+            )
+        ).all()
 
-        # Users by role
-        role_stats = db.query(User.role, func.count(User.id)).group_by(User.role).all()  # type: ignore
+        total_users = sum(row.total for row in role_stats)
+        active_users = sum(row.active for row in role_stats)
 
         return {
             "total_users": total_users,
             "active_users": active_users,
-            "inactive_users": inactive_users,
-            "users_need_password_change": users_need_password_change,
-            "users_by_role": {role: count for role, count in role_stats},
+            "inactive_users": total_users - active_users,
+            "users_need_password_change": sum(
+                row.need_password_change for row in role_stats
+            ),
+            "users_by_role": {row.role: row.total for row in role_stats},
         }
 
 
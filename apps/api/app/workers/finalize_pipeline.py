@@ -0,0 +1,281 @@
+# 🏁 Finalize Pipeline
+# Celery chain run after an assessment is finalized: classify -> notify -> insights
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.core.celery_app import celery_app
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.db.enums import AssessmentStatus
+from app.db.models.assessment import Assessment
+from app.workers.intelligence_worker import generate_insights_task
+from app.workers.notifications import send_validation_complete_notification
+from app.workers.sglgb_classifier import classify_assessment_task
+from celery import chain  # type: ignore
+from celery.result import AsyncResult  # type: ignore
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import Session
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Celery states that end a step without running the ones after it
+FAILED_STATES = {"FAILURE", "REVOKED"}
+
+
+def pipeline_steps() -> List[str]:
+    """Names of the pipeline steps to queue now, in execution order."""
+    steps = ["classify", "notify"]
+    if settings.FINALIZE_GENERATE_INSIGHTS:
+        steps.append("insights")
+    return steps
+
+
+def step_task_id(assessment_id: int, step: str) -> str:
+    """
+    Task ID of a pipeline step.
+
+    Finalization happens once per assessment (a validated assessment cannot be
+    sent for rework), so the IDs are derived from the assessment instead of
+    being stored: the status endpoint can rebuild them.
+    """
+    return f"finalize-{assessment_id}-{step}"
+
+
+def enqueue_finalize_pipeline(
+    assessment_id: int, steps: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """
+    Queue the post-finalize chain for an assessment.
+
+    Classification runs on the "classification" queue, the notification on
+    "notifications" and insight generation (FINALIZE_GENERATE_INSIGHTS) on
+    "intelligence". A failed step stops the steps after it.
+
+    Args:
+        assessment_id: ID of the finalized assessment
+        steps: Steps to queue (defaults to `pipeline_steps()`); the caller
+            stores them so the status can be reported for the same steps
+
+    Returns:
+        dict: Task IDs per step
+    """
+    signatures = {
+        "classify": classify_assessment_task.si(assessment_id),
+        "notify": send_validation_complete_notification.si(assessment_id),
+        "insights": generate_insights_task.si(assessment_id),
+    }
+    steps = list(steps or pipeline_steps())
+    chain(
+        *(
+            signatures[step].set(task_id=step_task_id(assessment_id, step))
+            for step in steps
+        )
+    ).apply_async()
+
+    logger.info("Queued finalize pipeline for assessment %s", assessment_id)
+    return {step: step_task_id(assessment_id, step) for step in steps}
+
+
+def mark_finalize_pipeline_dispatched(db: Session, assessment_id: int) -> None:
+    """
+    Record that an assessment's pipeline reached the broker (commits).
+
+    Args:
+        db: Database session
+        assessment_id: ID of the finalized assessment
+    """
+    db.execute(
+        update(Assessment)
+        .where(Assessment.id == assessment_id)
+        # Bookkeeping only: keep updated_at (and the assessment's ETag) as is
+        .values(
+            finalize_dispatched_at=datetime.utcnow(),
+            updated_at=Assessment.updated_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+
+def dispatch_pending_finalize_pipelines(
+    db: Session, batch_size: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Queue the pipelines of finalized assessments that never reached the broker.
+
+    The finalize request commits the status change with its steps and then
+    queues the chain; if the broker was unreachable, the assessment stays
+    undispatched. Assessments older than FINALIZE_DISPATCH_GRACE_SECONDS (so
+    a request still queueing its own pipeline is left alone) are claimed with
+    SKIP LOCKED, queued and marked dispatched. Dispatch stops at the first
+    broker error; the rest are retried by the next run.
+
+    Args:
+        db: Database session
+        batch_size: Optional limit on the assessments dispatched per run
+
+    Returns:
+        dict: Dispatched assessment IDs and the broker error (if any)
+    """
+    now = datetime.utcnow()
+    cutoff = now - timedelta(seconds=settings.FINALIZE_DISPATCH_GRACE_SECONDS)
+    rows = db.execute(
+        select(Assessment.id, Assessment.finalize_steps)
+        .where(
+            Assessment.status == AssessmentStatus.VALIDATED,
+            Assessment.finalize_dispatched_at.is_(None),
+            Assessment.validated_at <= cutoff,
+        )
+        .order_by(Assessment.validated_at, Assessment.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    ).all()
+
+    dispatched: List[Dict[str, Any]] = []
+    error = None
+    for row in rows:
+        # Assessments finalized before steps were recorded get today's steps
+        steps = row.finalize_steps or pipeline_steps()
+        try:
+            enqueue_finalize_pipeline(row.id, steps)
+        except Exception as e:
+            logger.exception("Failed to queue finalize pipeline for assessment %s", row.id)
+            error = str(e)
+            break
+        dispatched.append({"assessment_id": row.id, "steps": steps})
+
+    if dispatched:
+        table = Assessment.__table__
+        db.execute(
+            update(table)
+            .where(table.c.id == bindparam("assessment_id"))
+            .values(
+                finalize_steps=bindparam("steps"),
+                finalize_dispatched_at=now,
+                updated_at=table.c.updated_at,
+            ),
+            dispatched,
+        )
+    db.commit()
+
+    return {
+        "dispatched": [item["assessment_id"] for item in dispatched],
+        "error": error,
+    }
+
+
+def get_finalize_pipeline_status(
+    assessment_id: int,
+    steps: Optional[Sequence[str]] = None,
+    dispatched: bool = True,
+) -> Dict[str, Any]:
+    """
+    Report the progress of an assessment's finalize pipeline.
+
+    Reads the state of every step from the Celery result backend. A pipeline
+    that has not reached the broker yet reports `not_queued` without asking
+    the backend (unknown task IDs would read as PENDING).
+
+    Args:
+        assessment_id: ID of the finalized assessment
+        steps: Steps that were queued (recorded at finalization); pipelines
+            queued before steps were recorded fall back to `pipeline_steps()`
+        dispatched: Whether the pipeline was handed to the broker
+
+    Returns:
+        dict: Overall `state` (not_queued, queued, running, completed or
+        failed) and the state, task ID and error (if any) of every step
+    """
+    if not dispatched:
+        return {
+            "state": "not_queued",
+            "steps": [
+                {"name": step, "task_id": None, "state": "NOT_QUEUED", "error": None}
+                for step in steps or pipeline_steps()
+            ],
+        }
+
+    reports = []
+    for step in steps or pipeline_steps():
+        result = AsyncResult(step_task_id(assessment_id, step), app=celery_app)
+        state = result.state
+        reports.append(
+            {
+                "name": step,
+                "task_id": result.id,
+                "state": state,
+                "error": str(result.result) if state in FAILED_STATES else None,
+            }
+        )
+
+    states = [report["state"] for report in reports]
+    if any(state in FAILED_STATES for state in states):
+        overall = "failed"
+    elif all(state == "SUCCESS" for state in states):
+        overall = "completed"
+    elif all(state == "PENDING" for state in states):
+        overall = "queued"
+    else:
+        overall = "running"
+
+    return {"state": overall, "steps": reports}
+
+
+def _dispatch_finalize_pipelines_logic(
+    batch_size: int | None = None, db: Session | None = None
+) -> Dict[str, Any]:
+    """
+    Core logic for dispatching pending finalize pipelines (separated for easier testing).
+
+    Args:
+        batch_size: Optional limit on the assessments dispatched per run
+        db: Optional database session (for testing)
+
+    Returns:
+        dict: Dispatch report
+    """
+    needs_cleanup = False
+    if db is None:
+        db = SessionLocal()
+        needs_cleanup = True
+
+    try:
+        report = dispatch_pending_finalize_pipelines(db, batch_size=batch_size)
+        if report["dispatched"]:
+            logger.info(
+                "Queued %s pending finalize pipelines", len(report["dispatched"])
+            )
+        return {"success": report["error"] is None, **report}
+
+    except Exception as e:
+        db.rollback()
+        error_msg = str(e)
+        logger.error("Error dispatching finalize pipelines: %s", error_msg)
+        return {"success": False, "error": error_msg}
+
+    finally:
+        if needs_cleanup:
+            db.close()
+
+
+@celery_app.task(
+    bind=True, name="app.workers.finalize_pipeline.dispatch_finalize_pipelines_task"
+)
+def dispatch_finalize_pipelines_task(
+    self: Any, batch_size: int | None = None
+) -> Dict[str, Any]:
+    """
+    Queue finalize pipelines that the finalize request could not queue.
+
+    Scheduled every FINALIZE_DISPATCH_INTERVAL_SECONDS by Celery beat.
+
+    Args:
+        batch_size: Optional limit on the assessments dispatched per run
+
+    Returns:
+        dict: Dispatch report
+    """
+    return _dispatch_finalize_pipelines_logic(batch_size)
@@ -2,7 +2,7 @@
 # Background tasks for AI-powered insights generation using Gemini API
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from app.core.celery_app import celery_app
 from app.db.base import SessionLocal
@@ -165,3 +165,70 @@ def generate_insights_task(self: Any, assessment_id: int) -> Dict[str, Any]:
         )
 
     return result
+
+
+def _generate_insights_batch_logic(
+    assessment_ids: List[int],
+    concurrency: int | None = None,
+    db: Session | None = None,
+) -> Dict[str, Any]:
+    """
+    Core logic for batch insight generation (separated for easier testing).
+
+    Args:
+        assessment_ids: IDs of the assessments
+        concurrency: Maximum concurrent Gemini requests
+        db: Optional database session (for testing)
+
+    Returns:
+        dict: Batch report from intelligence_service
+    """
+    needs_cleanup = False
+    if db is None:
+        db = SessionLocal()
+        needs_cleanup = True
+
+    try:
+        logger.info("Generating AI insights for %s assessments", len(assessment_ids))
+        report = intelligence_service.generate_insights_batch(
+            db, assessment_ids, concurrency=concurrency
+        )
+        logger.info(
+            "Batch insights: %s generated, %s cached, %s failed in %ss",
+            report["generated"],
+            report["cached"],
+            len(report["failed"]),
+            report["elapsed_seconds"],
+        )
+        return {"success": True, **report}
+
+    except Exception as e:
+        db.rollback()
+        error_msg = str(e)
+        logger.error("Error generating batch insights: %s", error_msg)
+        return {"success": False, "error": error_msg}
+
+    finally:
+        if needs_cleanup:
+            db.close()
+
+
+@celery_app.task(bind=True, name="intelligence.generate_insights_batch_task")
+def generate_insights_batch_task(
+    self: Any, assessment_ids: List[int], concurrency: int | None = None
+) -> Dict[str, Any]:
+    """
+    Generate AI insights for many validated assessments in one task.
+
+    Prompts are built in one DB pass, Gemini calls run concurrently (bounded
+    and rate limited) and results are committed in bulk. Assessments whose
+    call failed are reported in `failed` and can be resubmitted.
+
+    Args:
+        assessment_ids: IDs of the assessments
+        concurrency: Maximum concurrent Gemini requests
+
+    Returns:
+        dict: Batch report
+    """
+    return _generate_insights_batch_logic(assessment_ids, concurrency)
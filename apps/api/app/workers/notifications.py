@@ -6,166 +6,181 @@ from typing import Any, Dict
 
 from app.core.celery_app import celery_app
 from app.db.base import SessionLocal
-from app.db.models import Assessment, User
+from app.services.notification_service import (
+    REWORK,
+    VALIDATION_COMPLETE,
+    notification_service,
+)
 from sqlalchemy.orm import Session
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
-@celery_app.task(bind=True, name="notifications.send_rework_notification")
-def send_rework_notification(self: Any, assessment_id: int) -> Dict[str, Any]:
+def _enqueue_notification_logic(
+    assessment_id: int, kind: str, db: Session | None = None
+) -> Dict[str, Any]:
     """
-    Send notification to BLGU user when assessment needs rework.
-
-    This is a Celery task that runs in the background to handle
-    rework notifications without blocking the main API thread.
+    Core logic for queueing a notification (separated for easier testing).
 
     Args:
-        assessment_id: ID of the assessment that needs rework
+        assessment_id: ID of the assessment the notification is about
+        kind: Notification kind (see notification_service.NOTIFICATION_KINDS)
+        db: Optional database session (for testing)
 
     Returns:
-        dict: Result of the notification process
+        dict: Result of the enqueue
     """
-    db: Session = SessionLocal()
+    needs_cleanup = False
+    if db is None:
+        db = SessionLocal()
+        needs_cleanup = True
 
     try:
-        # Get the assessment with BLGU user details
-        assessment = db.query(Assessment).filter(Assessment.id == assessment_id).first()
-
-        if not assessment:
+        queued = notification_service.enqueue(db, assessment_id, kind)
+        if not queued:
+            db.rollback()
             logger.error("Assessment %s not found", assessment_id)
             return {"success": False, "error": "Assessment not found"}
 
-        # Get BLGU user details
-        blgu_user = db.query(User).filter(User.id == assessment.blgu_user_id).first()
-
-        if not blgu_user:
-            logger.error(
-                "BLGU user %s not found for assessment %s",
-                assessment.blgu_user_id,
-                assessment_id,
-            )
-            return {"success": False, "error": "BLGU user not found"}
-
-        # Log the notification (for now, email integration will come later)
-        logger.info(
-            "REWORK NOTIFICATION: Assessment %s needs rework. BLGU User: %s (%s)",
-            assessment_id,
-            blgu_user.name,
-            blgu_user.email,
-        )
-
-        # TODO: In the future, this is where we would:
-        # 1. Send email notification to BLGU user
-        # 2. Send SMS notification if configured
-        # 3. Create in-app notification
-        # 4. Send webhook notification to external systems
-
-        # For now, we'll just log the notification details
-        notification_details = {
-            "assessment_id": assessment_id,
-            "blgu_user_name": blgu_user.name,
-            "blgu_user_email": blgu_user.email,
-            "barangay": blgu_user.barangay.name if blgu_user.barangay else "Unknown",
-            "assessment_status": assessment.status,
-            "rework_count": assessment.rework_count,
-            "message": f"Your assessment for {blgu_user.barangay.name if blgu_user.barangay else 'your barangay'} needs rework. Please review the assessor feedback and resubmit.",
-        }
-
-        logger.info("Notification details: %s", notification_details)
-
+        db.commit()
+        logger.info("Queued %s notification for assessment %s", kind, assessment_id)
         return {
             "success": True,
-            "message": "Rework notification sent successfully",
-            "notification_details": notification_details,
+            "message": f"{kind} notification queued for the next digest",
+            "assessment_id": assessment_id,
         }
 
     except Exception as e:
+        db.rollback()
         logger.error(
-            "Error sending rework notification for assessment %s: %s",
+            "Error queueing %s notification for assessment %s: %s",
+            kind,
             assessment_id,
             str(e),
         )
         return {"success": False, "error": str(e)}
 
     finally:
-        db.close()
+        if needs_cleanup:
+            db.close()
+
+
+@celery_app.task(bind=True, name="notifications.send_rework_notification")
+def send_rework_notification(self: Any, assessment_id: int) -> Dict[str, Any]:
+    """
+    Notify the BLGU user that an assessment needs rework.
+
+    The notification is added to the outbox and delivered by the next
+    flush_notifications_task run, together with anything else pending
+    for the same user. (Rework itself queues the event in its own
+    transaction; this task remains for callers outside a request.)
+
+    Args:
+        assessment_id: ID of the assessment that needs rework
+
+    Returns:
+        dict: Result of the enqueue
+    """
+    return _enqueue_notification_logic(assessment_id, REWORK)
 
 
-@celery_app.task(bind=True, name="notifications.send_validation_complete_notification")
+@celery_app.task(
+    bind=True,
+    name="notifications.send_validation_complete_notification",
+    max_retries=3,
+    default_retry_delay=10,
+)
 def send_validation_complete_notification(
     self: Any, assessment_id: int
 ) -> Dict[str, Any]:
     """
-    Send notification to BLGU user when assessment validation is complete.
+    Notify the BLGU user that an assessment's validation is complete.
 
-    This is a Celery task that runs in the background to handle
-    validation complete notifications without blocking the main API thread.
+    Runs as the "notify" step of the finalize pipeline, after classification,
+    so the digest can include the final SGLGB result. Errors are retried with
+    exponential backoff; once retries run out the task fails, which stops the
+    rest of the pipeline and shows as FAILURE in its status.
 
     Args:
         assessment_id: ID of the validated assessment
 
     Returns:
-        dict: Result of the notification process
+        dict: Result of the enqueue
     """
-    db: Session = SessionLocal()
+    result = _enqueue_notification_logic(assessment_id, VALIDATION_COMPLETE)
+    if result["success"]:
+        return result
 
-    try:
-        # Get the assessment with BLGU user details
-        assessment = db.query(Assessment).filter(Assessment.id == assessment_id).first()
+    if "not found" not in result["error"] and self.request.retries < self.max_retries:
+        raise self.retry(countdown=self.default_retry_delay * 2**self.request.retries)
+    raise RuntimeError(result["error"])
 
-        if not assessment:
-            logger.error("Assessment %s not found", assessment_id)
-            return {"success": False, "error": "Assessment not found"}
 
-        # Get BLGU user details
-        blgu_user = db.query(User).filter(User.id == assessment.blgu_user_id).first()
+def _flush_notifications_logic(
+    batch_size: int | None = None,
+    max_batches: int | None = None,
+    db: Session | None = None,
+    mailer=None,
+) -> Dict[str, Any]:
+    """
+    Core logic for flushing the notification outbox (separated for easier testing).
 
-        if not blgu_user:
-            logger.error(
-                "BLGU user %s not found for assessment %s",
-                assessment.blgu_user_id,
-                assessment_id,
-            )
-            return {"success": False, "error": "BLGU user not found"}
+    Args:
+        batch_size: Events per batch (defaults to NOTIFICATION_BATCH_SIZE)
+        max_batches: Optional limit on the number of batches
+        db: Optional database session (for testing)
+        mailer: Optional mailer (for testing)
 
-        # Log the notification
-        logger.info(
-            "VALIDATION COMPLETE NOTIFICATION: Assessment %s has been validated. BLGU User: %s (%s)",
-            assessment_id,
-            blgu_user.name,
-            blgu_user.email,
+    Returns:
+        dict: Flush report from notification_service
+    """
+    needs_cleanup = False
+    if db is None:
+        db = SessionLocal()
+        needs_cleanup = True
+
+    try:
+        report = notification_service.flush(
+            db, mailer=mailer, batch_size=batch_size, max_batches=max_batches
         )
+        if report["events_sent"] or report["failed"]:
+            logger.info(
+                "Notifications: sent %s events in %s digests, failed %s (%ss)",
+                report["events_sent"],
+                report["digests_sent"],
+                report["failed"],
+                report["elapsed_seconds"],
+            )
+        return {"success": True, **report}
 
-        # TODO: In the future, this is where we would send actual notifications
+    except Exception as e:
+        db.rollback()
+        error_msg = str(e)
+        logger.error("Error flushing notifications: %s", error_msg)
+        return {"success": False, "error": error_msg}
 
-        notification_details = {
-            "assessment_id": assessment_id,
-            "blgu_user_name": blgu_user.name,
-            "blgu_user_email": blgu_user.email,
-            "barangay": blgu_user.barangay.name if blgu_user.barangay else "Unknown",
-            "assessment_status": assessment.status,
-            "message": f"Congratulations! Your assessment for {blgu_user.barangay.name if blgu_user.barangay else 'your barangay'} has been validated and is now complete.",
-        }
+    finally:
+        if needs_cleanup:
+            db.close()
 
-        logger.info(
-            "Validation complete notification details: %s", notification_details
-        )
 
-        return {
-            "success": True,
-            "message": "Validation complete notification sent successfully",
-            "notification_details": notification_details,
-        }
+@celery_app.task(bind=True, name="notifications.flush_notifications")
+def flush_notifications_task(
+    self: Any, batch_size: int | None = None, max_batches: int | None = None
+) -> Dict[str, Any]:
+    """
+    Email every pending notification, one digest per recipient.
 
-    except Exception as e:
-        logger.error(
-            "Error sending validation complete notification for assessment %s: %s",
-            assessment_id,
-            str(e),
-        )
-        return {"success": False, "error": str(e)}
+    Scheduled every NOTIFICATION_FLUSH_INTERVAL_SECONDS by Celery beat. The
+    worker's mailer keeps its SMTP connections open between runs. Failed
+    digests stay in the outbox and are retried with exponential backoff.
 
-    finally:
-        db.close()
+    Args:
+        batch_size: Events per batch
+        max_batches: Optional limit on the number of batches
+
+    Returns:
+        dict: Flush report
+    """
+    return _flush_notifications_logic(batch_size=batch_size, max_batches=max_batches)
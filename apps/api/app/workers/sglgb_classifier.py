@@ -0,0 +1,163 @@
+# ⚖️ SGLGB Classifier Worker
+# Background tasks for (re)classifying assessments with the "3+1" rule
+
+import logging
+from typing import Any, Dict, List
+
+from app.core.celery_app import celery_app
+from app.db.base import SessionLocal
+from app.db.enums import AssessmentStatus
+from app.services.intelligence_service import intelligence_service
+from sqlalchemy.orm import Session
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def _reclassify_logic(
+    status: str | None = AssessmentStatus.VALIDATED.value,
+    assessment_ids: List[int] | None = None,
+    dry_run: bool = False,
+    batch_size: int = 1000,
+    db: Session | None = None,
+) -> Dict[str, Any]:
+    """
+    Core logic for bulk reclassification (separated for easier testing).
+
+    Args:
+        status: Assessment status value to reclassify (None for all statuses)
+        assessment_ids: Optional list of assessment IDs to restrict the run to
+        dry_run: Report the diff without writing
+        batch_size: Rows fetched per round trip while streaming responses
+        db: Optional database session (for testing)
+
+    Returns:
+        dict: Reclassification report from intelligence_service
+    """
+    needs_cleanup = False
+    if db is None:
+        db = SessionLocal()
+        needs_cleanup = True
+
+    try:
+        report = intelligence_service.reclassify_assessments(
+            db,
+            status=AssessmentStatus(status) if status else None,
+            assessment_ids=assessment_ids,
+            dry_run=dry_run,
+            batch_size=batch_size,
+        )
+        logger.info(
+            "Reclassified %s assessments (%s changed, dry_run=%s) in %ss",
+            report["assessments_scanned"],
+            report["changed"],
+            dry_run,
+            report["elapsed_seconds"],
+        )
+        return {"success": True, **report}
+
+    except Exception as e:
+        db.rollback()
+        error_msg = str(e)
+        logger.error("Error reclassifying assessments: %s", error_msg)
+        return {"success": False, "error": error_msg}
+
+    finally:
+        if needs_cleanup:
+            db.close()
+
+
+@celery_app.task(
+    bind=True,
+    name="app.workers.sglgb_classifier.reclassify_assessments_task",
+)
+def reclassify_assessments_task(
+    self: Any,
+    status: str | None = AssessmentStatus.VALIDATED.value,
+    assessment_ids: List[int] | None = None,
+    dry_run: bool = False,
+    batch_size: int = 1000,
+) -> Dict[str, Any]:
+    """
+    Reclassify a whole assessment cycle after the area rules or indicators change.
+
+    Routed to the "classification" queue. Only assessments whose area results
+    or final compliance status actually change are written.
+
+    Args:
+        status: Assessment status value to reclassify (None for all statuses)
+        assessment_ids: Optional list of assessment IDs to restrict the run to
+        dry_run: Report the diff without writing
+        batch_size: Rows fetched per round trip while streaming responses
+
+    Returns:
+        dict: Reclassification report
+    """
+    return _reclassify_logic(status, assessment_ids, dry_run, batch_size)
+
+
+def _classify_assessment_logic(
+    assessment_id: int, db: Session | None = None
+) -> Dict[str, Any]:
+    """
+    Core logic for classifying one assessment (separated for easier testing).
+
+    Args:
+        assessment_id: ID of the assessment to classify
+        db: Optional database session (for testing)
+
+    Returns:
+        dict: Classification result from intelligence_service
+    """
+    needs_cleanup = False
+    if db is None:
+        db = SessionLocal()
+        needs_cleanup = True
+
+    try:
+        result = intelligence_service.classify_assessment(db, assessment_id)
+        logger.info(
+            "Classified assessment %s as %s",
+            assessment_id,
+            result["final_compliance_status"],
+        )
+        return result
+
+    except Exception as e:
+        db.rollback()
+        error_msg = str(e)
+        logger.error("Error classifying assessment %s: %s", assessment_id, error_msg)
+        return {"success": False, "assessment_id": assessment_id, "error": error_msg}
+
+    finally:
+        if needs_cleanup:
+            db.close()
+
+
+@celery_app.task(
+    bind=True,
+    name="app.workers.sglgb_classifier.classify_assessment_task",
+    max_retries=3,
+    default_retry_delay=10,
+)
+def classify_assessment_task(self: Any, assessment_id: int) -> Dict[str, Any]:
+    """
+    Classify a finalized assessment; the first step of the finalize pipeline.
+
+    Routed to the "classification" queue. Errors are retried with exponential
+    backoff; once retries run out the task fails, which stops the rest of the
+    pipeline (notification and insights).
+
+    Args:
+        assessment_id: ID of the assessment to classify
+
+    Returns:
+        dict: Classification result
+    """
+    result = _classify_assessment_logic(assessment_id)
+    if result["success"]:
+        return result
+
+    if "not found" not in result["error"] and self.request.retries < self.max_retries:
+        raise self.retry(countdown=self.default_retry_delay * 2**self.request.retries)
+    raise RuntimeError(result["error"])
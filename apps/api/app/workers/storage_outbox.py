@@ -0,0 +1,82 @@
+# 📤 Storage Outbox Worker
+# Background task draining queued file storage deletions in batches
+
+import logging
+from typing import Any, Dict
+
+from app.core.celery_app import celery_app
+from app.db.base import SessionLocal
+from app.services.storage_outbox_service import storage_outbox_service
+from sqlalchemy.orm import Session
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def _drain_storage_outbox_logic(
+    batch_size: int | None = None,
+    max_batches: int | None = None,
+    db: Session | None = None,
+    backend=None,
+) -> Dict[str, Any]:
+    """
+    Core logic for draining the storage outbox (separated for easier testing).
+
+    Args:
+        batch_size: Paths per storage call (defaults to STORAGE_OUTBOX_BATCH_SIZE)
+        max_batches: Optional limit on the number of batches
+        db: Optional database session (for testing)
+        backend: Optional storage backend (for testing)
+
+    Returns:
+        dict: Drain report from storage_outbox_service
+    """
+    needs_cleanup = False
+    if db is None:
+        db = SessionLocal()
+        needs_cleanup = True
+
+    try:
+        report = storage_outbox_service.drain(
+            db, backend=backend, batch_size=batch_size, max_batches=max_batches
+        )
+        if report["removed"] or report["failed"]:
+            logger.info(
+                "Storage outbox: removed %s, failed %s in %s calls (%ss)",
+                report["removed"],
+                report["failed"],
+                report["storage_calls"],
+                report["elapsed_seconds"],
+            )
+        return {"success": True, **report}
+
+    except Exception as e:
+        db.rollback()
+        error_msg = str(e)
+        logger.error("Error draining storage outbox: %s", error_msg)
+        return {"success": False, "error": error_msg}
+
+    finally:
+        if needs_cleanup:
+            db.close()
+
+
+@celery_app.task(bind=True, name="app.workers.storage_outbox.drain_storage_outbox_task")
+def drain_storage_outbox_task(
+    self: Any, batch_size: int | None = None, max_batches: int | None = None
+) -> Dict[str, Any]:
+    """
+    Remove queued files from storage, many paths per request.
+
+    Scheduled every STORAGE_OUTBOX_DRAIN_INTERVAL_SECONDS by Celery beat.
+    Failed deletions stay in the outbox and are retried with exponential
+    backoff by later runs.
+
+    Args:
+        batch_size: Paths per storage call
+        max_batches: Optional limit on the number of batches
+
+    Returns:
+        dict: Drain report
+    """
+    return _drain_storage_outbox_logic(batch_size, max_batches)
@@ -8,6 +8,8 @@ from app.api.v1 import api_router as api_router_v1
 
 # Import from our restructured modules
 from app.core.config import settings
+from app.core.responses import ORJSONResponse
+from app.core.security import shutdown_password_hash_pool
 from app.services.startup_service import startup_service
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -37,6 +39,7 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
+    shutdown_password_hash_pool()
     startup_service.log_shutdown()
 
 
@@ -48,6 +51,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS middleware using settings
@@ -57,6 +61,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+🛠️ Admin Commands
+Operational commands for the VANTAGE API that should not run inside requests
+
+Usage:
+    # Ensure governance areas, sample indicators and BLGU draft assessments exist
+    python manage.py ensure-data
+
+    # Recompute area results and final compliance of all validated assessments
+    python manage.py reclassify --dry-run
+    python manage.py reclassify --assessment-id 12 --assessment-id 15
+    python manage.py reclassify --enqueue
+
+    # Generate AI insights for validated assessments without insights
+    python manage.py generate-insights --concurrency 8
+
+    # Rebuild the assessor queue's assessment-to-governance-area links
+    python manage.py rebuild-queue-links
+"""
+
+import argparse
+import os
+import sys
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def ensure_data(args: argparse.Namespace) -> int:
+    """Run the BLGU read-path data safeguards once."""
+    from app.db.base import SessionLocal
+    from app.services.assessment_service import assessment_service
+
+    if SessionLocal is None:
+        print("Database not configured. Please set DATABASE_URL.")
+        return 1
+
+    db = SessionLocal()
+    try:
+        result = assessment_service.run_data_safeguards(db)
+        print(f"Data safeguards complete: {result}")
+        return 0
+    finally:
+        db.close()
+
+
+def reclassify(args: argparse.Namespace) -> int:
+    """Reclassify assessments in bulk, inline or on the Celery worker."""
+    status = None if args.status == "all" else args.status
+
+    if args.enqueue:
+        from app.workers.sglgb_classifier import reclassify_assessments_task
+
+        task = reclassify_assessments_task.delay(
+            status, args.assessment_ids, args.dry_run, args.batch_size
+        )
+        print(f"Reclassification queued: task {task.id}")
+        return 0
+
+    from app.db.base import SessionLocal
+    from app.workers.sglgb_classifier import _reclassify_logic
+
+    if SessionLocal is None:
+        print("Database not configured. Please set DATABASE_URL.")
+        return 1
+
+    db = SessionLocal()
+    try:
+        result = _reclassify_logic(
+            status, args.assessment_ids, args.dry_run, args.batch_size, db=db
+        )
+    finally:
+        db.close()
+
+    if not result["success"]:
+        print(f"Reclassification failed: {result['error']}")
+        return 1
+
+    for change in result["changes"]:
+        areas = ", ".join(
+            f"{name}: {old} -> {new}"
+            for name, (old, new) in change["changed_areas"].items()
+        )
+        print(
+            f"  assessment {change['assessment_id']}: "
+            f"{change['old_status']} -> {change['new_status']}"
+            + (f" ({areas})" if areas else "")
+        )
+    print(
+        f"{'Dry run' if result['dry_run'] else 'Reclassification'} complete: "
+        f"{result['assessments_scanned']} scanned, {result['changed']} changed, "
+        f"{result['responses_scanned']} responses in {result['elapsed_seconds']}s "
+        f"({result['assessments_per_second']} assessments/s)"
+    )
+    return 0
+
+
+def generate_insights(args: argparse.Namespace) -> int:
+    """Generate AI insights in batch, inline or on the Celery worker."""
+    from app.db.base import SessionLocal
+
+    if SessionLocal is None:
+        print("Database not configured. Please set DATABASE_URL.")
+        return 1
+
+    db = SessionLocal()
+    try:
+        assessment_ids = args.assessment_ids
+        if not assessment_ids:
+            from app.db.enums import AssessmentStatus
+            from app.db.models import Assessment
+            from sqlalchemy import select
+
+            assessment_ids = list(
+                db.scalars(
+                    select(Assessment.id)
+                    .where(
+                        Assessment.status == AssessmentStatus.VALIDATED,
+                        Assessment.ai_recommendations.is_(None),
+                    )
+                    .order_by(Assessment.id)
+                )
+            )
+        if not assessment_ids:
+            print("No assessments need insights.")
+            return 0
+
+        if args.enqueue:
+            from app.workers.intelligence_worker import generate_insights_batch_task
+
+            task = generate_insights_batch_task.delay(assessment_ids, args.concurrency)
+            print(f"Insight batch queued: task {task.id}")
+            return 0
+
+        from app.workers.intelligence_worker import _generate_insights_batch_logic
+
+        result = _generate_insights_batch_logic(
+            assessment_ids, args.concurrency, db=db
+        )
+    finally:
+        db.close()
+
+    if not result["success"]:
+        print(f"Insight generation failed: {result['error']}")
+        return 1
+
+    for assessment_id, error in result["failed"].items():
+        print(f"  assessment {assessment_id} failed: {error}")
+    elapsed = result["elapsed_seconds"]
+    print(
+        f"Insights complete: {result['generated']} generated "
+        f"({result['gemini_calls']} Gemini calls), {result['cached']} cached, "
+        f"{len(result['skipped'])} skipped, {len(result['failed'])} failed "
+        f"in {elapsed}s"
+        + (f" ({result['gemini_calls'] / elapsed:.1f} calls/s)" if elapsed else "")
+    )
+    return 0
+
+
+def rebuild_queue_links(args: argparse.Namespace) -> int:
+    """Recompute the assessor queue links after writes that bypassed the ORM."""
+    from app.db.base import SessionLocal
+    from app.services.assessor_service import assessor_service
+
+    if SessionLocal is None:
+        print("Database not configured. Please set DATABASE_URL.")
+        return 1
+
+    db = SessionLocal()
+    try:
+        assessor_service.rebuild_queue_links(db, args.assessment_ids)
+        print("Assessor queue links rebuilt.")
+        return 0
+    finally:
+        db.close()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="VANTAGE API admin commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ensure_parser = subparsers.add_parser(
+        "ensure-data",
+        help="Ensure governance areas, sample indicators and BLGU assessments exist",
+    )
+    ensure_parser.set_defaults(func=ensure_data)
+
+    reclassify_parser = subparsers.add_parser(
+        "reclassify",
+        help="Recompute area results and compliance status for many assessments",
+    )
+    reclassify_parser.add_argument(
+        "--status",
+        default="Validated",
+        help='Assessment status to reclassify, or "all" (default: Validated)',
+    )
+    reclassify_parser.add_argument(
+        "--assessment-id",
+        dest="assessment_ids",
+        type=int,
+        action="append",
+        help="Restrict to this assessment (repeatable)",
+    )
+    reclassify_parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Print the diff without writing anything",
+    )
+    reclassify_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Responses fetched per round trip (default: 1000)",
+    )
+    reclassify_parser.add_argument(
+        "--enqueue",
+        action="store_true",
+        help="Run on the Celery classification queue instead of inline",
+    )
+    reclassify_parser.set_defaults(func=reclassify)
+
+    insights_parser = subparsers.add_parser(
+        "generate-insights",
+        help="Generate AI insights for many validated assessments",
+    )
+    insights_parser.add_argument(
+        "--assessment-id",
+        dest="assessment_ids",
+        type=int,
+        action="append",
+        help="Assessment to process (repeatable; default: all validated without insights)",
+    )
+    insights_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Maximum concurrent Gemini requests (default: GEMINI_BATCH_CONCURRENCY)",
+    )
+    insights_parser.add_argument(
+        "--enqueue",
+        action="store_true",
+        help="Run on a Celery worker instead of inline",
+    )
+    insights_parser.set_defaults(func=generate_insights)
+
+    links_parser = subparsers.add_parser(
+        "rebuild-queue-links",
+        help="Recompute the assessor queue's assessment-to-governance-area links",
+    )
+    links_parser.add_argument(
+        "--assessment-id",
+        dest="assessment_ids",
+        type=int,
+        action="append",
+        help="Restrict to this assessment (repeatable; default: all)",
+    )
+    links_parser.set_defaults(func=rebuild_queue_links)
+
+    return parser
+
+
+if __name__ == "__main__":
+    parsed = build_parser().parse_args()
+    sys.exit(parsed.func(parsed))
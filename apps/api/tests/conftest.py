@@ -10,9 +10,11 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import pytest
+from app.core.principal_cache import get_principal_cache
 from app.db.base import Base, get_db
 # Ensure all ORM models are registered on Base.metadata before creating tables
 from app.db import models  # noqa: F401
+from app.services.indicator_tree_cache import indicator_tree_cache
 from fastapi.testclient import TestClient
 from main import app
 from sqlalchemy import create_engine
@@ -76,6 +78,12 @@ def db_session(db_setup):
     for table in reversed(Base.metadata.sorted_tables):
         db.execute(table.delete())
     db.commit()
+    # User IDs are reused across tests, so cached principals would be stale
+    principal_cache = get_principal_cache()
+    if principal_cache:
+        principal_cache.clear()
+    # So are catalogue versions, which would match trees cached by earlier tests
+    indicator_tree_cache.clear()
 
     try:
         yield db
@@ -0,0 +1,175 @@
+# 🧪 Tests for ETag / If-None-Match support on assessment read endpoints
+
+from unittest.mock import patch
+
+import pytest
+from app.api import deps
+from app.api.v1.assessments import get_current_blgu_user
+from app.core.etag import etag_matches
+from app.db.enums import AreaType, AssessmentStatus, UserRole
+from app.db.models import (
+    Assessment,
+    AssessmentResponse,
+    GovernanceArea,
+    Indicator,
+    User,
+)
+from app.schemas.assessment import AssessmentResponseUpdate, FeedbackCommentCreate
+from app.services.assessment_service import assessment_service
+from app.services.indicator_tree_cache import bump_catalogue_version
+from fastapi.testclient import TestClient
+from main import app
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+@pytest.fixture
+def etag_context(db_session: Session):
+    """BLGU user with an assessment and one response, plus an assessor."""
+    area = GovernanceArea(id=2, name="Disaster Preparedness", area_type=AreaType.CORE)
+    db_session.add(area)
+    db_session.commit()
+
+    indicator = Indicator(
+        name="ETag Indicator",
+        form_schema={"type": "object"},
+        governance_area_id=area.id,
+    )
+    blgu = User(
+        email="etag-blgu@test.com",
+        name="ETag BLGU",
+        role=UserRole.BLGU_USER,
+        hashed_password="hashed",
+        is_active=True,
+    )
+    assessor = User(
+        email="etag-assessor@test.com",
+        name="ETag Assessor",
+        role=UserRole.AREA_ASSESSOR,
+        governance_area_id=area.id,
+        hashed_password="hashed",
+        is_active=True,
+    )
+    db_session.add_all([indicator, blgu, assessor])
+    db_session.commit()
+
+    assessment = Assessment(
+        blgu_user_id=blgu.id, status=AssessmentStatus.SUBMITTED_FOR_REVIEW
+    )
+    db_session.add(assessment)
+    db_session.commit()
+
+    response = AssessmentResponse(
+        assessment_id=assessment.id,
+        indicator_id=indicator.id,
+        response_data={"answer": "yes"},
+    )
+    db_session.add(response)
+    db_session.commit()
+
+    def _override_get_db():
+        yield db_session
+
+    app.dependency_overrides[deps.get_db] = _override_get_db
+    app.dependency_overrides[get_current_blgu_user] = lambda: blgu
+    app.dependency_overrides[deps.get_current_area_assessor_user] = lambda: assessor
+    # Dev safeguards reseed the catalogue on reads, which would move the ETag
+    with patch("app.services.assessment_service.settings.READ_PATH_SAFEGUARDS", False):
+        yield {
+            "client": TestClient(app),
+            "assessment": assessment,
+            "response": response,
+            "assessor": assessor,
+        }
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize(
+    "path", ["/api/v1/assessments/my-assessment", "/api/v1/assessments/dashboard"]
+)
+def test_blgu_endpoint_returns_304_until_assessment_changes(
+    etag_context, db_session: Session, path
+):
+    """A matching If-None-Match gets a 304 until a response is written."""
+    client = etag_context["client"]
+
+    first = client.get(path)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    cached = client.get(path, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+    assert cached.content == b""
+
+    assessment_service.update_assessment_response(
+        db_session,
+        etag_context["response"].id,
+        AssessmentResponseUpdate(response_data={"answer": "no"}),
+    )
+
+    changed = client.get(path, headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_not_modified_uses_a_single_lookup(etag_context, db_session: Session):
+    """The 304 path runs one SELECT and never loads the response graph."""
+    client = etag_context["client"]
+    etag = client.get("/api/v1/assessments/my-assessment").headers["etag"]
+
+    statements: list[str] = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", record_statement)
+    try:
+        cached = client.get(
+            "/api/v1/assessments/my-assessment", headers={"If-None-Match": etag}
+        )
+    finally:
+        event.remove(bind, "before_cursor_execute", record_statement)
+
+    assert cached.status_code == 304
+    assert len(statements) == 1
+    assert "assessment_responses" not in statements[0]
+
+
+def test_assessor_details_etag_tracks_feedback_and_catalogue(
+    etag_context, db_session: Session
+):
+    """Feedback writes and catalogue changes both invalidate the ETag."""
+    client = etag_context["client"]
+    path = f"/api/v1/assessor/assessments/{etag_context['assessment'].id}"
+
+    etag = client.get(path).headers["etag"]
+    assert client.get(path, headers={"If-None-Match": etag}).status_code == 304
+
+    assessment_service.create_feedback_comment(
+        db_session,
+        FeedbackCommentCreate(
+            comment="Please attach the signed ordinance",
+            response_id=etag_context["response"].id,
+            assessor_id=etag_context["assessor"].id,
+        ),
+    )
+    after_feedback = client.get(path, headers={"If-None-Match": etag})
+    assert after_feedback.status_code == 200
+    etag = after_feedback.headers["etag"]
+
+    bump_catalogue_version(db_session)
+    db_session.commit()
+    assert client.get(path, headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_etag_matching_rules():
+    """If-None-Match uses weak comparison and supports lists and '*'."""
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc"', '"abc"')
+    assert etag_matches('"x", "abc"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"x"', '"abc"')
+    assert not etag_matches(None, '"abc"')
+    assert not etag_matches('"abc"', None)
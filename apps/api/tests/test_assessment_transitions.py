@@ -0,0 +1,137 @@
+# 🧪 Tests for the set-based rework and finalize transitions
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from app.db.enums import AreaType, AssessmentStatus, UserRole, ValidationStatus
+from app.db.models import (
+    Assessment,
+    AssessmentResponse,
+    GovernanceArea,
+    Indicator,
+    User,
+)
+from app.services.assessor_service import assessor_service
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+RESPONSES = 25
+STALE = datetime(2020, 1, 1)
+
+
+@pytest.fixture
+def submitted(db_session: Session):
+    """A submitted assessment with many responses and a stale updated_at."""
+    area = GovernanceArea(id=2, name="Area A", area_type=AreaType.CORE)
+    db_session.add(area)
+    db_session.commit()
+
+    indicators = [
+        Indicator(name=f"Ind {i}", form_schema={}, governance_area_id=area.id)
+        for i in range(RESPONSES)
+    ]
+    assessor = User(
+        email="transition-assessor@test.com",
+        name="Transition Assessor",
+        role=UserRole.AREA_ASSESSOR,
+        governance_area_id=area.id,
+        hashed_password="hashed",
+        is_active=True,
+    )
+    blgu = User(
+        email="transition-blgu@test.com",
+        name="Transition BLGU",
+        role=UserRole.BLGU_USER,
+        hashed_password="hashed",
+        is_active=True,
+    )
+    db_session.add_all([*indicators, assessor, blgu])
+    db_session.commit()
+
+    assessment = Assessment(
+        blgu_user_id=blgu.id, status=AssessmentStatus.SUBMITTED_FOR_REVIEW
+    )
+    assessment.responses = [
+        AssessmentResponse(indicator_id=indicator.id) for indicator in indicators
+    ]
+    db_session.add(assessment)
+    db_session.commit()
+    db_session.query(Assessment).update({"updated_at": STALE})
+    db_session.commit()
+
+    with patch(
+        "app.workers.finalize_pipeline.enqueue_finalize_pipeline", return_value={}
+    ):
+        yield {"assessment_id": assessment.id, "assessor": assessor}
+
+
+def count_statements(db_session: Session, call):
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    db_session.expunge_all()
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", record_statement)
+    try:
+        result = call()
+    finally:
+        event.remove(bind, "before_cursor_execute", record_statement)
+    return result, statements
+
+
+def test_rework_updates_all_responses_in_one_statement(db_session, submitted):
+    assessment_id = submitted["assessment_id"]
+    result, statements = count_statements(
+        db_session,
+        lambda: assessor_service.send_assessment_for_rework(
+            db_session, assessment_id, submitted["assessor"]
+        ),
+    )
+
+    assert result["new_status"] == AssessmentStatus.NEEDS_REWORK.value
+    # Guarded assessment UPDATE, one UPDATE for every response, then the
+    # notification outbox INSERT
+    assert len(statements) == 3
+
+    assessment = db_session.get(Assessment, assessment_id)
+    assert assessment.rework_count == 1
+    assert assessment.updated_at > STALE
+    assert all(r.requires_rework for r in assessment.responses)
+
+    with pytest.raises(ValueError, match="already been sent"):
+        assessor_service.send_assessment_for_rework(
+            db_session, assessment_id, submitted["assessor"]
+        )
+
+
+def test_finalize_counts_unreviewed_in_sql(db_session, submitted):
+    assessment_id = submitted["assessment_id"]
+    with pytest.raises(ValueError, match=f"{RESPONSES} responses"):
+        assessor_service.finalize_assessment(
+            db_session, assessment_id, submitted["assessor"]
+        )
+
+    db_session.query(AssessmentResponse).update(
+        {"validation_status": ValidationStatus.PASS}
+    )
+    db_session.commit()
+
+    result, statements = count_statements(
+        db_session,
+        lambda: assessor_service.finalize_assessment(
+            db_session, assessment_id, submitted["assessor"]
+        ),
+    )
+
+    assert result["new_status"] == AssessmentStatus.VALIDATED.value
+    # Status and unreviewed count, the guarded assessment UPDATE, then the
+    # UPDATE recording that the pipeline reached the broker
+    assert len(statements) == 3
+
+    assessment = db_session.get(Assessment, assessment_id)
+    assert assessment.status == AssessmentStatus.VALIDATED
+    assert assessment.validated_at == assessment.updated_at
+    assert assessment.updated_at > STALE
@@ -0,0 +1,160 @@
+# 🧪 Tests for the area-scoped, batched assessor details loader
+
+import pytest
+from app.api import deps
+from app.db.enums import AreaType, AssessmentStatus, UserRole
+from app.db.models import (
+    MOV,
+    Assessment,
+    AssessmentResponse,
+    FeedbackComment,
+    GovernanceArea,
+    Indicator,
+    User,
+)
+from app.services.assessor_service import assessor_service
+from fastapi.testclient import TestClient
+from main import app
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+@pytest.fixture
+def details(db_session: Session):
+    """An assessment with three responses in area A, one in area B, MOVs and comments."""
+    area_a = GovernanceArea(id=2, name="Area A", area_type=AreaType.CORE)
+    area_b = GovernanceArea(id=3, name="Area B", area_type=AreaType.ESSENTIAL)
+    db_session.add_all([area_a, area_b])
+    db_session.commit()
+
+    indicators = [
+        Indicator(name=f"Ind {i}", form_schema={"type": "object"}, governance_area_id=a)
+        for i, a in enumerate((2, 2, 2, 3))
+    ]
+    assessors = [
+        User(
+            email=f"details-assessor-{i}@test.com",
+            name=f"Assessor {i}",
+            role=UserRole.AREA_ASSESSOR,
+            governance_area_id=area_a.id,
+            hashed_password="hashed",
+            is_active=True,
+        )
+        for i in range(2)
+    ]
+    blgu = User(
+        email="details-blgu@test.com",
+        name="Details BLGU",
+        role=UserRole.BLGU_USER,
+        hashed_password="hashed",
+        is_active=True,
+    )
+    db_session.add_all([*indicators, *assessors, blgu])
+    db_session.commit()
+
+    assessment = Assessment(
+        blgu_user_id=blgu.id, status=AssessmentStatus.SUBMITTED_FOR_REVIEW
+    )
+    for indicator in indicators:
+        response = AssessmentResponse(
+            indicator_id=indicator.id, response_data={"answer": "yes"}
+        )
+        response.movs = [
+            MOV(
+                filename=f"{indicator.name}-{n}.pdf",
+                original_filename="f.pdf",
+                file_size=1,
+                content_type="application/pdf",
+                storage_path=f"{indicator.id}/{n}.pdf",
+            )
+            for n in range(2)
+        ]
+        response.feedback_comments = [
+            FeedbackComment(comment="note", assessor_id=author.id)
+            for author in assessors
+        ]
+        assessment.responses.append(response)
+    db_session.add(assessment)
+    db_session.commit()
+
+    db_session.refresh(assessors[0])
+    db_session.expunge(assessors[0])
+
+    def _override_get_db():
+        yield db_session
+
+    app.dependency_overrides[deps.get_db] = _override_get_db
+    app.dependency_overrides[deps.get_current_area_assessor_user] = (
+        lambda: assessors[0]
+    )
+    yield {
+        "client": TestClient(app),
+        "assessor": assessors[0],
+        "assessment_id": assessment.id,
+    }
+    app.dependency_overrides.clear()
+
+
+def load_counting_statements(db_session: Session, details, **kwargs):
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    db_session.expunge_all()
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", record_statement)
+    try:
+        result = assessor_service.get_assessment_details_for_assessor(
+            db_session, details["assessment_id"], details["assessor"], **kwargs
+        )
+    finally:
+        event.remove(bind, "before_cursor_execute", record_statement)
+    return result, statements
+
+
+def test_details_are_area_scoped_and_batched(db_session, details):
+    result, statements = load_counting_statements(db_session, details)
+
+    responses = result["assessment"]["responses"]
+    assert len(responses) == 3
+    assert {r["indicator"]["governance_area"]["id"] for r in responses} == {2}
+    assert all(len(r["movs"]) == 2 for r in responses)
+    assert all(
+        {c["assessor"]["name"] for c in r["feedback_comments"]}
+        == {"Assessor 0", "Assessor 1"}
+        for r in responses
+    )
+    assert responses[0]["response_data"] == {"answer": "yes"}
+    assert responses[0]["indicator"]["form_schema"] == {"type": "object"}
+    # Assessment, responses, MOVs, comments with authors
+    assert len(statements) == 4
+
+
+def test_fields_skip_heavy_columns(db_session, details):
+    result, statements = load_counting_statements(
+        db_session, details, fields={"movs"}
+    )
+
+    response = result["assessment"]["responses"][0]
+    assert "response_data" not in response
+    assert "form_schema" not in response["indicator"]
+    assert "feedback_comments" not in response
+    assert len(response["movs"]) == 2
+    assert len(statements) == 3
+    assert not any(
+        "form_schema" in s or "response_data" in s for s in statements
+    )
+
+
+def test_endpoint_parses_fields(details):
+    client = details["client"]
+    path = f"/api/v1/assessor/assessments/{details['assessment_id']}"
+
+    listed = client.get(path, params={"fields": "movs,feedback_comments"})
+    assert listed.status_code == 200
+    assert "response_data" not in listed.json()["assessment"]["responses"][0]
+    # Each field selection is its own representation
+    assert listed.headers["ETag"] != client.get(path).headers["ETag"]
+
+    assert client.get(path, params={"fields": "secrets"}).status_code == 400
@@ -0,0 +1,211 @@
+# 🧪 Tests for the link-backed, keyset-paginated assessor queue
+
+from datetime import datetime, timedelta
+
+import pytest
+from app.api import deps
+from app.db.enums import AreaType, AssessmentStatus, UserRole
+from app.db.models import (
+    Assessment,
+    AssessmentGovernanceArea,
+    AssessmentResponse,
+    Barangay,
+    GovernanceArea,
+    Indicator,
+    User,
+)
+from app.schemas.assessment import AssessmentResponseCreate
+from app.services.assessment_service import assessment_service
+from app.services.assessor_service import assessor_service
+from fastapi.testclient import TestClient
+from main import app
+from sqlalchemy import delete
+from sqlalchemy.orm import Session
+
+
+def area_links(db_session: Session, assessment_id: int) -> set:
+    return {
+        link.governance_area_id
+        for link in db_session.query(AssessmentGovernanceArea).filter_by(
+            assessment_id=assessment_id
+        )
+    }
+
+
+@pytest.fixture
+def queue(db_session: Session):
+    """An assessor in area A and five submissions touching area A."""
+    area_a = GovernanceArea(id=2, name="Area A", area_type=AreaType.CORE)
+    area_b = GovernanceArea(id=3, name="Area B", area_type=AreaType.ESSENTIAL)
+    db_session.add_all([area_a, area_b])
+    db_session.commit()
+
+    ind_a = Indicator(name="Ind A", form_schema={}, governance_area_id=area_a.id)
+    ind_b = Indicator(name="Ind B", form_schema={}, governance_area_id=area_b.id)
+    barangay = Barangay(name="Queue Barangay")
+    db_session.add_all([ind_a, ind_b, barangay])
+    db_session.commit()
+
+    assessor = User(
+        email="queue-assessor@test.com",
+        name="Queue Assessor",
+        role=UserRole.AREA_ASSESSOR,
+        governance_area_id=area_a.id,
+        hashed_password="hashed",
+        is_active=True,
+    )
+    blgu = User(
+        email="queue-blgu@test.com",
+        name="Queue BLGU",
+        role=UserRole.BLGU_USER,
+        barangay_id=barangay.id,
+        hashed_password="hashed",
+        is_active=True,
+    )
+    db_session.add_all([assessor, blgu])
+    db_session.commit()
+
+    base = datetime(2026, 1, 1)
+    statuses = [
+        AssessmentStatus.SUBMITTED_FOR_REVIEW,
+        AssessmentStatus.NEEDS_REWORK,
+        AssessmentStatus.VALIDATED,
+        AssessmentStatus.SUBMITTED_FOR_REVIEW,
+        AssessmentStatus.SUBMITTED_FOR_REVIEW,
+        AssessmentStatus.NEEDS_REWORK,
+        AssessmentStatus.NEEDS_REWORK,
+    ]
+    assessments = []
+    for day, status in enumerate(statuses):
+        assessment = Assessment(
+            blgu_user_id=blgu.id,
+            status=status,
+            # Two submissions share a timestamp to exercise the id tiebreak;
+            # the last two were never submitted and sort after every date
+            submitted_at=base + timedelta(days=min(day, 3)) if day < 5 else None,
+        )
+        assessment.responses = [AssessmentResponse(indicator_id=ind_a.id)]
+        assessments.append(assessment)
+    db_session.add_all(assessments)
+    db_session.commit()
+    assessor_service.rebuild_queue_links(db_session, [a.id for a in assessments])
+
+    db_session.refresh(assessor)
+    db_session.expunge(assessor)
+
+    def _override_get_db():
+        yield db_session
+
+    app.dependency_overrides[deps.get_db] = _override_get_db
+    app.dependency_overrides[deps.get_current_area_assessor_user] = lambda: assessor
+    yield {
+        "client": TestClient(app),
+        "assessor": assessor,
+        "ids": [a.id for a in assessments],
+        "indicators": (ind_a, ind_b),
+    }
+    app.dependency_overrides.clear()
+
+
+def test_links_follow_response_writes(db_session, queue):
+    ind_a, ind_b = queue["indicators"]
+    assessment_id = queue["ids"][0]
+    assert area_links(db_session, assessment_id) == {ind_a.governance_area_id}
+
+    assessment_service.create_assessment_response(
+        db_session,
+        AssessmentResponseCreate(assessment_id=assessment_id, indicator_id=ind_b.id),
+    )
+    assert area_links(db_session, assessment_id) == {2, 3}
+
+
+def test_untracked_writes_need_a_rebuild(db_session, queue):
+    """Bulk statements and indicator moves leave the links stale until rebuilt"""
+    ind_a, ind_b = queue["indicators"]
+    assessment_id = queue["ids"][0]
+
+    db_session.execute(
+        delete(AssessmentResponse).where(
+            AssessmentResponse.assessment_id == assessment_id
+        )
+    )
+    ind_a.governance_area_id = ind_b.governance_area_id
+    db_session.commit()
+    assert area_links(db_session, assessment_id) == {2}
+
+    assessor_service.rebuild_queue_links(db_session)
+    assert area_links(db_session, assessment_id) == set()
+    # Moving the indicator moves every other assessment using it
+    assert all(area_links(db_session, i) == {3} for i in queue["ids"][1:])
+
+
+def test_queue_pages_by_submission_date(queue):
+    client = queue["client"]
+    ids = queue["ids"]
+    # Newest first; ids 3 and 4 share a timestamp, so the higher id leads.
+    # Unsubmitted ones come last in both orders.
+    expected = {
+        "desc": [ids[4], ids[3], ids[2], ids[1], ids[0], ids[6], ids[5]],
+        "asc": [ids[0], ids[1], ids[2], ids[3], ids[4], ids[5], ids[6]],
+    }
+
+    for order, expected_ids in expected.items():
+        for limit in (1, 2, 3):
+            seen, cursor = [], None
+            while True:
+                params = {"limit": limit, "order": order}
+                if cursor:
+                    params["cursor"] = cursor
+                response = client.get("/api/v1/assessor/queue", params=params)
+                assert response.status_code == 200
+                seen += [item["assessment_id"] for item in response.json()]
+                cursor = response.headers.get("X-Next-Cursor")
+                if cursor is None:
+                    break
+            assert seen == expected_ids, (order, limit)
+
+    first = client.get("/api/v1/assessor/queue").json()[0]
+    assert first["barangay_name"] == "Queue Barangay"
+
+
+def test_queue_without_limit_returns_everything(queue):
+    """Clients that never send a limit keep getting the whole queue."""
+    response = queue["client"].get("/api/v1/assessor/queue")
+
+    assert response.status_code == 200
+    assert len(response.json()) == len(queue["ids"])
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_queue_filters_by_status(queue):
+    client = queue["client"]
+    response = client.get(
+        "/api/v1/assessor/queue",
+        params={"status": ["Needs Rework", "Validated"]},
+    )
+    assert response.status_code == 200
+    assert {item["status"] for item in response.json()} == {
+        "Needs Rework",
+        "Validated",
+    }
+
+    assert (
+        client.get("/api/v1/assessor/queue", params={"status": "Draft"}).status_code
+        == 400
+    )
+    assert (
+        client.get("/api/v1/assessor/queue", params={"cursor": "garbage"}).status_code
+        == 400
+    )
+
+
+def test_rebuild_restores_links(db_session, queue):
+    db_session.query(AssessmentGovernanceArea).delete()
+    db_session.commit()
+    assert assessor_service.get_assessor_queue(db_session, queue["assessor"])[
+        "items"
+    ] == []
+
+    assessor_service.rebuild_queue_links(db_session)
+    page = assessor_service.get_assessor_queue(db_session, queue["assessor"])
+    assert len(page["items"]) == len(queue["ids"])
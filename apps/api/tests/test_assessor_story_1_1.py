@@ -4,6 +4,7 @@ from app.db.enums import AreaType, AssessmentStatus, UserRole
 from app.db.models.assessment import Assessment, AssessmentResponse
 from app.db.models.governance_area import GovernanceArea, Indicator
 from app.db.models.user import User
+from app.services.assessor_service import assessor_service
 from fastapi import HTTPException
 
 
@@ -49,6 +50,7 @@ def create_assessment_with_indicator(
     )
     db.add(ar)
     db.commit()
+    assessor_service.rebuild_queue_links(db, [a.id])
     return a
 
 
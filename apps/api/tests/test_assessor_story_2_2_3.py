@@ -13,6 +13,7 @@ from app.db.models.assessment import (
 from app.db.models.barangay import Barangay
 from app.db.models.governance_area import GovernanceArea, Indicator
 from app.db.models.user import User
+from app.services.assessor_service import assessor_service
 from fastapi.testclient import TestClient
 from main import app
 from sqlalchemy.orm import Session
@@ -73,6 +74,7 @@ def create_test_assessment_for_details(db_session: Session) -> Assessment:
     )
     db_session.add(response)
     db_session.commit()
+    assessor_service.rebuild_queue_links(db_session, [assessment.id])
     db_session.refresh(response)
 
     # Add a MOV to the response
@@ -294,6 +296,7 @@ def test_get_assessment_details_access_denied(client, db_session):
     )
     db_session.add(response)
     db_session.commit()
+    assessor_service.rebuild_queue_links(db_session, [assessment.id])
     db_session.refresh(response)
 
     # Create assessor user with different governance area
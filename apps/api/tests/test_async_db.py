@@ -0,0 +1,163 @@
+# 🧪 Tests for the async session layer and the latency benchmark tool
+
+import asyncio
+
+import pytest
+from app.api import deps
+from app.core.config import Settings
+from app.core.security import create_access_token
+from app.db.enums import UserRole
+from app.db.models import User
+from app.devtools.latency_benchmark import percentile, run_benchmark
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from httpx import ASGITransport
+from main import app
+from sqlalchemy.orm import Session
+
+
+def test_async_url_is_derived_from_database_url():
+    """The asyncpg URL reuses DATABASE_URL without the libpq sslmode option."""
+    derived = Settings(
+        DATABASE_URL="postgresql://user:secret@db:6543/postgres?sslmode=require"
+    ).ASYNC_DATABASE_URL
+    assert derived == "postgresql+asyncpg://user:secret@db:6543/postgres"
+
+    explicit = Settings(
+        DATABASE_URL="postgresql://db/app",
+        ASYNC_DATABASE_URL="sqlite+aiosqlite:///./app.db",
+    ).ASYNC_DATABASE_URL
+    assert explicit == "sqlite+aiosqlite:///./app.db"
+
+
+def test_benchmark_reports_percentiles():
+    """The benchmark runs requests concurrently and reports nearest-rank percentiles."""
+    assert percentile([0.1, 0.2, 0.3, 0.4], 50) == 0.2
+    assert percentile([0.1, 0.2, 0.3, 0.4], 99) == 0.4
+
+    bench_app = FastAPI()
+
+    @bench_app.get("/ping")
+    async def ping():
+        await asyncio.sleep(0.01)
+        return {"ok": True}
+
+    summary = asyncio.run(
+        run_benchmark(
+            "http://bench/ping",
+            requests=20,
+            concurrency=10,
+            transport=ASGITransport(app=bench_app),
+        )
+    )
+    assert summary["requests"] == 20
+    assert summary["errors"] == 0
+    assert 0 < summary["p50_ms"] <= summary["p99_ms"]
+
+
+def test_user_routes_use_async_session(db_session: Session):
+    """The admin user list and stats run on an AsyncSession."""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    for index, (role, active) in enumerate(
+        [
+            (UserRole.BLGU_USER, True),
+            (UserRole.BLGU_USER, False),
+            (UserRole.AREA_ASSESSOR, True),
+        ]
+    ):
+        db_session.add(
+            User(
+                email=f"async{index}@test.com",
+                name=f"Async User {index}",
+                role=role,
+                hashed_password="hashed",
+                is_active=active,
+                must_change_password=True,
+            )
+        )
+    db_session.commit()
+
+    async_engine = create_async_engine("sqlite+aiosqlite:///./test.db")
+    session_factory = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    async def _override_get_async_db():
+        async with session_factory() as session:
+            yield session
+
+    admin = User(id=0, name="Admin", role=UserRole.SUPERADMIN, is_active=True)
+    app.dependency_overrides[deps.get_async_db] = _override_get_async_db
+    app.dependency_overrides[deps.get_current_admin_user_async] = lambda: admin
+    try:
+        client = TestClient(app)
+        stats = client.get("/api/v1/users/stats/dashboard").json()
+        listing = client.get("/api/v1/users/", params={"size": 2}).json()
+    finally:
+        app.dependency_overrides.clear()
+        asyncio.run(async_engine.dispose())
+
+    assert stats["total_users"] == 3
+    assert stats["active_users"] == 2
+    assert stats["users_need_password_change"] == 2
+    assert stats["users_by_role"] == {"BLGU_USER": 2, "AREA_ASSESSOR": 1}
+    assert listing["total"] == 3
+    assert listing["total_pages"] == 2
+    assert [user["email"] for user in listing["users"]] == [
+        "async0@test.com",
+        "async1@test.com",
+    ]
+
+
+def test_async_routes_authenticate_on_the_async_session(db_session: Session):
+    """The admin check loads the user on the AsyncSession, not through get_db."""
+    pytest.importorskip("aiosqlite")
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    admin = User(
+        email="async-admin@test.com",
+        name="Async Admin",
+        role=UserRole.SUPERADMIN,
+        hashed_password="hashed",
+        is_active=True,
+    )
+    blgu = User(
+        email="async-blgu@test.com",
+        name="Async BLGU",
+        role=UserRole.BLGU_USER,
+        hashed_password="hashed",
+        is_active=True,
+    )
+    db_session.add_all([admin, blgu])
+    db_session.commit()
+
+    async_engine = create_async_engine("sqlite+aiosqlite:///./test.db")
+    session_factory = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    async def _override_get_async_db():
+        async with session_factory() as session:
+            yield session
+
+    def _no_sync_db():
+        raise AssertionError("sync session used by an async route")
+        yield
+
+    app.dependency_overrides[deps.get_async_db] = _override_get_async_db
+    app.dependency_overrides[deps.get_db] = _no_sync_db
+    try:
+        client = TestClient(app)
+
+        def stats_as(user: User):
+            token = create_access_token(subject=user.id, role=user.role)
+            return client.get(
+                "/api/v1/users/stats/dashboard",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+
+        # Miss, then cache hit
+        assert stats_as(admin).json()["total_users"] == 2
+        assert stats_as(admin).status_code == 200
+        assert stats_as(blgu).status_code == 403
+    finally:
+        app.dependency_overrides.clear()
+        asyncio.run(async_engine.dispose())
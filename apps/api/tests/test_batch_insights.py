@@ -0,0 +1,178 @@
+# 🧪 Tests for batch insight generation against the local Gemini stub
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from app.core.config import settings
+from app.db.enums import (
+    AreaType,
+    AssessmentStatus,
+    ComplianceStatus,
+    UserRole,
+    ValidationStatus,
+)
+from app.db.models import (
+    Assessment,
+    AssessmentResponse,
+    GovernanceArea,
+    Indicator,
+    InsightCacheEntry,
+    User,
+)
+from app.devtools.gemini_stub import GeminiStubServer, stub_insights
+from app.services.intelligence_service import intelligence_service
+from app.workers.intelligence_worker import _generate_insights_batch_logic
+from sqlalchemy.orm import Session
+
+
+@pytest.fixture
+def gemini_stub():
+    """Stub server with some latency so concurrent requests overlap."""
+    with GeminiStubServer(latency=0.2) as server:
+        with (
+            patch.object(settings, "GEMINI_API_KEY", "stub-key"),
+            patch.object(settings, "GEMINI_API_BASE_URL", server.url),
+            patch(
+                "app.services.intelligence_service.get_gemini_rate_limiter",
+                return_value=None,
+            ),
+        ):
+            yield server
+
+
+def fail_indicator(db_session: Session, assessment_id: int, name: str) -> None:
+    """Record a failed response for the named indicator (created on first use)."""
+    area = db_session.get(GovernanceArea, 2)
+    if area is None:
+        area = GovernanceArea(id=2, name="Disaster Preparedness", area_type=AreaType.CORE)
+        db_session.add(area)
+    indicator = db_session.query(Indicator).filter(Indicator.name == name).first()
+    if indicator is None:
+        indicator = Indicator(
+            name=name,
+            description=f"{name} description",
+            form_schema={"type": "object"},
+            governance_area=area,
+        )
+        db_session.add(indicator)
+    db_session.add(
+        AssessmentResponse(
+            assessment_id=assessment_id,
+            indicator=indicator,
+            response_data={},
+            validation_status=ValidationStatus.FAIL,
+        )
+    )
+    db_session.commit()
+
+
+def make_assessments(db_session: Session, count: int, **kwargs) -> list[int]:
+    ids = []
+    for i in range(count):
+        user = User(
+            email=f"batch{i}-{kwargs.get('status', 'v')}@test.com",
+            name=f"Batch BLGU {i}",
+            role=UserRole.BLGU_USER,
+            hashed_password="hashed",
+        )
+        db_session.add(user)
+        db_session.commit()
+        assessment = Assessment(
+            blgu_user_id=user.id,
+            status=kwargs.get("status", AssessmentStatus.VALIDATED),
+            final_compliance_status=ComplianceStatus.FAILED,
+            validated_at=datetime(2024, 1, 1),
+        )
+        db_session.add(assessment)
+        db_session.commit()
+        # Distinct failed indicators give distinct prompts
+        fail_indicator(
+            db_session,
+            assessment.id,
+            kwargs.get("indicator", f"Batch Indicator {kwargs.get('status', 'v')}-{i}"),
+        )
+        ids.append(assessment.id)
+    return ids
+
+
+def test_batch_generates_concurrently_and_commits(gemini_stub, db_session: Session):
+    """Calls overlap up to the concurrency bound and every result is stored."""
+    ids = make_assessments(db_session, 6)
+
+    started = datetime.now()
+    report = _generate_insights_batch_logic(ids, concurrency=3, db=db_session)
+    elapsed = (datetime.now() - started).total_seconds()
+
+    assert report["success"] is True
+    assert report["generated"] == 6
+    assert report["gemini_calls"] == 6
+    assert report["failed"] == {}
+    assert gemini_stub.max_in_flight == 3
+    # Six 0.2s calls, three at a time
+    assert elapsed < 6 * 0.2
+
+    prompts = intelligence_service.build_gemini_prompts(db_session, ids)
+    db_session.expire_all()
+    for assessment_id in ids:
+        stored = db_session.get(Assessment, assessment_id).ai_recommendations
+        assert stored == stub_insights(prompts[assessment_id])
+    assert db_session.query(InsightCacheEntry).count() == 6
+
+
+def test_batch_skips_and_reuses_cache(gemini_stub, db_session: Session):
+    """Ineligible assessments are skipped and cached prompts skip Gemini."""
+    ids = make_assessments(db_session, 2)
+    draft_ids = make_assessments(db_session, 1, status=AssessmentStatus.DRAFT)
+
+    intelligence_service.generate_insights_batch(db_session, ids[:1])
+    assert gemini_stub.request_count == 1
+
+    # Forget the stored insights: the shared cache still answers
+    db_session.query(Assessment).update({"ai_recommendations": None})
+    db_session.commit()
+
+    report = intelligence_service.generate_insights_batch(
+        db_session, ids + draft_ids + [99999]
+    )
+
+    assert gemini_stub.request_count == 2
+    assert report["cached"] == 1
+    assert report["generated"] == 1
+    assert report["skipped"] == {draft_ids[0]: "not validated", 99999: "not found"}
+
+
+def test_batch_shares_insights_across_barangays(gemini_stub, db_session: Session):
+    """Assessments failing the same indicators cost one Gemini call."""
+    ids = make_assessments(db_session, 3, indicator="Shared Indicator")
+    # Different years still share the cached insights
+    db_session.get(Assessment, ids[0]).validated_at = datetime(2025, 1, 1)
+    db_session.commit()
+
+    report = intelligence_service.generate_insights_batch(db_session, ids)
+
+    assert report["generated"] == 3
+    assert gemini_stub.request_count == 1
+    assert db_session.query(InsightCacheEntry).count() == 1
+
+
+def test_batch_reports_failed_calls(db_session: Session):
+    """Rejected calls are reported per assessment; the rest are stored."""
+    ids = make_assessments(db_session, 2)
+
+    with GeminiStubServer(fail_every=2) as server:
+        with (
+            patch.object(settings, "GEMINI_API_KEY", "stub-key"),
+            patch.object(settings, "GEMINI_API_BASE_URL", server.url),
+            patch(
+                "app.services.intelligence_service.get_gemini_rate_limiter",
+                return_value=None,
+            ),
+        ):
+            report = intelligence_service.generate_insights_batch(
+                db_session, ids, concurrency=1
+            )
+
+    assert report["generated"] == 1
+    assert len(report["failed"]) == 1
+    assert "rate limit" in next(iter(report["failed"].values()))
@@ -0,0 +1,167 @@
+# 🧪 Tests for validating many assessment responses in one transaction
+
+from datetime import datetime
+
+import pytest
+from app.api import deps
+from app.db.enums import AreaType, AssessmentStatus, UserRole, ValidationStatus
+from app.db.models import (
+    Assessment,
+    AssessmentResponse,
+    FeedbackComment,
+    GovernanceArea,
+    Indicator,
+    User,
+)
+from fastapi.testclient import TestClient
+from main import app
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+URL = "/api/v1/assessor/assessment-responses/validate-batch"
+
+
+@pytest.fixture
+def batch(db_session: Session):
+    """An area assessor and two submitted assessments with responses in two areas."""
+    area_a = GovernanceArea(id=2, name="Area A", area_type=AreaType.CORE)
+    area_b = GovernanceArea(id=3, name="Area B", area_type=AreaType.ESSENTIAL)
+    db_session.add_all([area_a, area_b])
+    db_session.commit()
+
+    ind_a1, ind_a2, ind_b = (
+        Indicator(name=name, form_schema={}, governance_area_id=area_id)
+        for name, area_id in (("A1", 2), ("A2", 2), ("B1", 3))
+    )
+    assessor = User(
+        email="batch-assessor@test.com",
+        name="Batch Assessor",
+        role=UserRole.AREA_ASSESSOR,
+        governance_area_id=area_a.id,
+        hashed_password="hashed",
+        is_active=True,
+    )
+    blgu = User(
+        email="batch-blgu@test.com",
+        name="Batch BLGU",
+        role=UserRole.BLGU_USER,
+        hashed_password="hashed",
+        is_active=True,
+    )
+    db_session.add_all([ind_a1, ind_a2, ind_b, assessor, blgu])
+    db_session.commit()
+
+    stale = datetime(2020, 1, 1)
+    assessment, other = (
+        Assessment(
+            blgu_user_id=blgu.id,
+            status=AssessmentStatus.SUBMITTED_FOR_REVIEW,
+            updated_at=stale,
+        )
+        for _ in range(2)
+    )
+    assessment.responses = [
+        AssessmentResponse(indicator_id=indicator.id)
+        for indicator in (ind_a1, ind_a2, ind_b)
+    ]
+    other.responses = [AssessmentResponse(indicator_id=ind_a1.id)]
+    db_session.add_all([assessment, other])
+    db_session.commit()
+    db_session.query(Assessment).update({"updated_at": stale})
+    db_session.commit()
+
+    db_session.refresh(assessor)
+    db_session.expunge(assessor)
+
+    def _override_get_db():
+        yield db_session
+
+    app.dependency_overrides[deps.get_db] = _override_get_db
+    app.dependency_overrides[deps.get_current_area_assessor_user] = lambda: assessor
+    yield {
+        "client": TestClient(app),
+        "assessment_id": assessment.id,
+        "responses": [r.id for r in assessment.responses],
+        "other_response": other.responses[0].id,
+        "stale": stale,
+    }
+    app.dependency_overrides.clear()
+
+
+def test_batch_is_written_with_bulk_statements(db_session, batch):
+    own_a1, own_a2, _ = batch["responses"]
+    payload = {
+        "items": [
+            {
+                "response_id": own_a1,
+                "validation_status": "Pass",
+                "public_comment": "Looks good",
+                "internal_note": "Checked the MOV",
+            },
+            {"response_id": own_a2, "validation_status": "Fail"},
+        ]
+    }
+
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", record_statement)
+    try:
+        response = batch["client"].post(URL, json=payload)
+    finally:
+        event.remove(bind, "before_cursor_execute", record_statement)
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["assessment_id"] == batch["assessment_id"]
+    assert body["validated_count"] == 2
+    assert body["comments_created"] == 2
+    # Ownership check, response UPDATE, comment INSERT, assessment version bump
+    assert len(statements) == 4
+
+    db_session.expire_all()
+    assert db_session.get(AssessmentResponse, own_a1).validation_status == (
+        ValidationStatus.PASS
+    )
+    assert db_session.get(AssessmentResponse, own_a2).validation_status == (
+        ValidationStatus.FAIL
+    )
+    comments = db_session.query(FeedbackComment).filter_by(response_id=own_a1).all()
+    assert {c.is_internal_note for c in comments} == {False, True}
+    assert db_session.get(Assessment, batch["assessment_id"]).updated_at > (
+        batch["stale"]
+    )
+
+
+@pytest.mark.parametrize(
+    "response_ids, status_code",
+    [
+        # Indicator in another governance area
+        (lambda b: [b["responses"][0], b["responses"][2]], 403),
+        # Responses from two assessments
+        (lambda b: [b["responses"][0], b["other_response"]], 400),
+        # Same response twice
+        (lambda b: [b["responses"][0], b["responses"][0]], 400),
+        # Unknown response
+        (lambda b: [b["responses"][0], 999999], 400),
+    ],
+)
+def test_invalid_batches_write_nothing(db_session, batch, response_ids, status_code):
+    items = [
+        {"response_id": response_id, "validation_status": "Pass", "public_comment": "x"}
+        for response_id in response_ids(batch)
+    ]
+    response = batch["client"].post(URL, json={"items": items})
+    assert response.status_code == status_code
+
+    db_session.expire_all()
+    assert db_session.query(FeedbackComment).count() == 0
+    assert (
+        db_session.query(AssessmentResponse)
+        .filter(AssessmentResponse.validation_status.isnot(None))
+        .count()
+        == 0
+    )
@@ -0,0 +1,156 @@
+# 🧪 Tests for the request-scoped BLGU context and single-query ownership checks
+
+from unittest.mock import patch
+
+import pytest
+from app.api import deps
+from app.api.v1.assessments import get_current_blgu_user
+from app.db.enums import AreaType, AssessmentStatus, UserRole
+from app.db.models import (
+    MOV,
+    Assessment,
+    AssessmentResponse,
+    GovernanceArea,
+    Indicator,
+    User,
+)
+from fastapi.testclient import TestClient
+from main import app
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+@pytest.fixture
+def context(db_session: Session):
+    """Two BLGU users, each with an assessment, a response and a MOV."""
+    area = GovernanceArea(id=2, name="Disaster Preparedness", area_type=AreaType.CORE)
+    db_session.add(area)
+    db_session.commit()
+
+    indicator = Indicator(
+        name="Context Indicator",
+        form_schema={"type": "object"},
+        governance_area_id=area.id,
+    )
+    blgu, other = (
+        User(
+            email=f"context-{name}@test.com",
+            name=name,
+            role=UserRole.BLGU_USER,
+            hashed_password="hashed",
+            is_active=True,
+        )
+        for name in ("blgu", "other")
+    )
+    db_session.add_all([indicator, blgu, other])
+    db_session.commit()
+
+    ids = {}
+    for owner in (blgu, other):
+        assessment = Assessment(blgu_user_id=owner.id, status=AssessmentStatus.DRAFT)
+        db_session.add(assessment)
+        db_session.commit()
+        response = AssessmentResponse(
+            assessment_id=assessment.id,
+            indicator_id=indicator.id,
+            response_data={"answer": "no"},
+        )
+        db_session.add(response)
+        db_session.commit()
+        mov = MOV(
+            filename="f.pdf",
+            original_filename="f.pdf",
+            file_size=1,
+            content_type="application/pdf",
+            storage_path=f"{owner.id}/f.pdf",
+            response_id=response.id,
+        )
+        db_session.add(mov)
+        db_session.commit()
+        ids[owner.name] = {
+            "assessment": assessment.id,
+            "response": response.id,
+            "mov": mov.id,
+        }
+
+    # Like a cached principal: the user is resolved without touching the session
+    db_session.refresh(blgu)
+    db_session.expunge(blgu)
+
+    def _override_get_db():
+        yield db_session
+
+    app.dependency_overrides[deps.get_db] = _override_get_db
+    app.dependency_overrides[get_current_blgu_user] = lambda: blgu
+    with patch("app.services.assessment_service.settings.READ_PATH_SAFEGUARDS", False):
+        yield {"client": TestClient(app), "own": ids["blgu"], "foreign": ids["other"]}
+    app.dependency_overrides.clear()
+
+
+def call_counting_statements(db_session: Session, call):
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", record_statement)
+    try:
+        response = call()
+    finally:
+        event.remove(bind, "before_cursor_execute", record_statement)
+    return response, statements
+
+
+@pytest.mark.parametrize(
+    "method, path",
+    [
+        ("get", "/api/v1/assessments/responses/{response}"),
+        ("delete", "/api/v1/assessments/movs/{mov}"),
+    ],
+)
+def test_foreign_resources_are_rejected_with_one_query(
+    db_session, context, method, path
+):
+    url = path.format(**context["foreign"])
+    response, statements = call_counting_statements(
+        db_session, lambda: getattr(context["client"], method)(url)
+    )
+    assert response.status_code == 403
+    assert len(statements) == 1
+
+
+def test_missing_response_is_404(db_session, context):
+    response, statements = call_counting_statements(
+        db_session,
+        lambda: context["client"].get("/api/v1/assessments/responses/999999"),
+    )
+    assert response.status_code == 404
+    assert len(statements) == 1
+
+
+def test_update_checks_status_from_ownership_query(db_session, context):
+    """The status check uses the joined ownership row, not a second lookup"""
+    db_session.query(Assessment).filter(
+        Assessment.id == context["own"]["assessment"]
+    ).update({"status": AssessmentStatus.SUBMITTED_FOR_REVIEW})
+    db_session.commit()
+
+    response, statements = call_counting_statements(
+        db_session,
+        lambda: context["client"].put(
+            f"/api/v1/assessments/responses/{context['own']['response']}",
+            json={"response_data": {"answer": "yes"}},
+        ),
+    )
+    assert response.status_code == 400
+    assert len(statements) == 1
+
+
+def test_own_mov_is_deleted(db_session, context):
+    response = context["client"].delete(
+        f"/api/v1/assessments/movs/{context['own']['mov']}"
+    )
+    assert response.status_code == 200
+    assert db_session.get(MOV, context["own"]["mov"]) is None
+    assert db_session.get(MOV, context["foreign"]["mov"]) is not None
@@ -0,0 +1,100 @@
+# 🧪 Tests for the bounded threadpool running blocking service calls
+
+import asyncio
+import contextvars
+import threading
+import time
+
+from app.core.executor import BlockingExecutor
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+
+
+def test_bounded_concurrency_and_saturation_gauges():
+    """Calls beyond max_workers queue up, and the gauges show it"""
+    executor = BlockingExecutor(max_workers=2)
+    release = threading.Event()
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def blocking_call(value: int) -> int:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        release.wait(5)
+        with lock:
+            in_flight -= 1
+        return value * 2
+
+    async def scenario():
+        tasks = [asyncio.create_task(executor.run(blocking_call, i)) for i in range(5)]
+        # Let both workers pick up a call while the rest wait for a thread
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if executor.stats()["active_workers"] == 2:
+                break
+        saturated = executor.stats()
+        time.sleep(0.05)
+        release.set()
+        return saturated, await asyncio.gather(*tasks)
+
+    try:
+        saturated, results = asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+    assert results == [0, 2, 4, 6, 8]
+    assert peak == 2
+    assert saturated["max_workers"] == 2
+    assert saturated["active_workers"] == 2
+    assert saturated["queue_depth"] == 3
+
+    drained = executor.stats()
+    assert drained["active_workers"] == 0
+    assert drained["queue_depth"] == 0
+    assert drained["completed"] == 5
+    # Queued calls waited at least as long as the workers were held
+    assert drained["max_wait_ms"] >= 50
+    assert drained["avg_wait_ms"] > 0
+
+
+def test_run_propagates_context_and_exceptions():
+    """Context variables reach the worker thread and errors reach the caller"""
+    executor = BlockingExecutor(max_workers=1)
+
+    def read_context() -> str:
+        return request_id.get()
+
+    def fail() -> None:
+        raise ValueError("boom")
+
+    async def scenario():
+        request_id.set("req-1")
+        value = await executor.run(read_context)
+        try:
+            await executor.run(fail)
+        except ValueError as e:
+            return value, str(e)
+        return value, None
+
+    try:
+        value, error = asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+    assert value == "req-1"
+    assert error == "boom"
+    stats = executor.stats()
+    assert stats["completed"] == 2
+    assert stats["active_workers"] == 0
+
+
+def test_executor_status_endpoint(client):
+    """The system router exposes the shared executor's gauges"""
+    response = client.get("/api/v1/system/executor-status")
+    assert response.status_code == 200
+    gauges = response.json()["blocking_executor"]
+    assert gauges["max_workers"] >= 1
+    assert {"active_workers", "queue_depth", "avg_wait_ms"} <= gauges.keys()
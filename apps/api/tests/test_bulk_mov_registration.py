@@ -0,0 +1,165 @@
+# 🧪 Tests for registering many MOVs in one request
+
+from unittest.mock import patch
+
+import pytest
+from app.api import deps
+from app.api.v1.assessments import get_current_blgu_user
+from app.db.enums import AreaType, AssessmentStatus, UserRole
+from app.db.models import (
+    MOV,
+    Assessment,
+    AssessmentResponse,
+    GovernanceArea,
+    Indicator,
+    User,
+)
+from fastapi.testclient import TestClient
+from main import app
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+YES_NEEDS_MOV_SCHEMA = {
+    "type": "object",
+    "properties": {"answer": {"type": "string", "enum": ["yes", "no", "na"]}},
+    "required": ["answer"],
+}
+
+
+def mov_payload(response_id: int, name: str) -> dict:
+    return {
+        "filename": name,
+        "original_filename": name,
+        "file_size": 1024,
+        "content_type": "application/pdf",
+        "storage_path": f"uploads/{name}",
+        "response_id": response_id,
+    }
+
+
+@pytest.fixture
+def bulk_context(db_session: Session):
+    """BLGU user with two YES responses lacking MOVs, plus another user's response."""
+    area = GovernanceArea(id=2, name="Disaster Preparedness", area_type=AreaType.CORE)
+    db_session.add(area)
+    db_session.commit()
+
+    indicators = [
+        Indicator(
+            name=f"Bulk MOV Indicator {i}",
+            form_schema=YES_NEEDS_MOV_SCHEMA,
+            governance_area_id=area.id,
+        )
+        for i in range(2)
+    ]
+    blgu, other = (
+        User(
+            email=f"bulk-mov-{name}@test.com",
+            name=name,
+            role=UserRole.BLGU_USER,
+            hashed_password="hashed",
+            is_active=True,
+        )
+        for name in ("blgu", "other")
+    )
+    db_session.add_all([*indicators, blgu, other])
+    db_session.commit()
+
+    assessment = Assessment(blgu_user_id=blgu.id, status=AssessmentStatus.DRAFT)
+    other_assessment = Assessment(blgu_user_id=other.id, status=AssessmentStatus.DRAFT)
+    db_session.add_all([assessment, other_assessment])
+    db_session.commit()
+
+    responses = [
+        AssessmentResponse(
+            assessment_id=assessment.id,
+            indicator_id=indicator.id,
+            response_data={"answer": "yes"},
+            is_completed=False,
+        )
+        for indicator in indicators
+    ]
+    foreign = AssessmentResponse(
+        assessment_id=other_assessment.id,
+        indicator_id=indicators[0].id,
+        response_data={"answer": "yes"},
+        is_completed=False,
+    )
+    db_session.add_all([*responses, foreign])
+    db_session.commit()
+
+    def _override_get_db():
+        yield db_session
+
+    app.dependency_overrides[deps.get_db] = _override_get_db
+    app.dependency_overrides[get_current_blgu_user] = lambda: blgu
+    with patch("app.services.assessment_service.settings.READ_PATH_SAFEGUARDS", False):
+        yield {
+            "client": TestClient(app),
+            "assessment_id": assessment.id,
+            "response_ids": [r.id for r in responses],
+            "foreign_id": foreign.id,
+        }
+    app.dependency_overrides.clear()
+
+
+def test_bulk_registration_uses_one_insert_and_commit(db_session, bulk_context):
+    """Many MOVs across responses: one INSERT, one commit, completion recomputed"""
+    first, second = bulk_context["response_ids"]
+    payload = {
+        "movs": [
+            mov_payload(first, "a.pdf"),
+            mov_payload(first, "b.pdf"),
+            mov_payload(second, "c.pdf"),
+        ]
+    }
+
+    statements = []
+    bind = db_session.get_bind()
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.lstrip().split()[0].upper())
+
+    event.listen(bind, "before_cursor_execute", record_statement)
+    try:
+        response = bulk_context["client"].post(
+            "/api/v1/assessments/movs/bulk", json=payload
+        )
+    finally:
+        event.remove(bind, "before_cursor_execute", record_statement)
+
+    assert response.status_code == 201, response.text
+    body = response.json()
+    assert [m["filename"] for m in body] == ["a.pdf", "b.pdf", "c.pdf"]
+    assert all(m["status"] == "Uploaded" for m in body)
+    # SQLite can't order a batched RETURNING by an autoincrement id, so it
+    # sends one row per INSERT; PostgreSQL batches them into one statement
+    assert statements.count("INSERT") == (3 if bind.dialect.name == "sqlite" else 1)
+    # The returned MOVs are serialized without a refresh SELECT after the commit
+    assert "SELECT" not in statements[statements.index("UPDATE") :]
+
+    db_session.expire_all()
+    completed = {
+        r.id: r.is_completed
+        for r in db_session.query(AssessmentResponse).filter(
+            AssessmentResponse.id.in_([first, second])
+        )
+    }
+    assert completed == {first: True, second: True}
+    assert db_session.query(MOV).count() == 3
+
+
+def test_bulk_registration_rejects_foreign_responses(db_session, bulk_context):
+    """A response of another assessment rejects the whole request"""
+    payload = {
+        "movs": [
+            mov_payload(bulk_context["response_ids"][0], "a.pdf"),
+            mov_payload(bulk_context["foreign_id"], "x.pdf"),
+        ]
+    }
+    response = bulk_context["client"].post(
+        "/api/v1/assessments/movs/bulk", json=payload
+    )
+
+    assert response.status_code == 403
+    assert db_session.query(MOV).count() == 0
@@ -0,0 +1,135 @@
+# 🧪 Tests for the bulk SGLGB reclassification job
+
+import pytest
+from app.db.enums import (
+    AreaType,
+    AssessmentStatus,
+    ComplianceStatus,
+    UserRole,
+    ValidationStatus,
+)
+from app.db.models import Assessment, AssessmentResponse, GovernanceArea, Indicator, User
+from app.services.intelligence_service import ALL_AREAS, CORE_AREAS
+from app.workers.sglgb_classifier import _reclassify_logic
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+@pytest.fixture
+def cycle(db_session: Session):
+    """All six areas with one indicator each, and three assessments."""
+    areas = [
+        GovernanceArea(
+            id=index,
+            name=name,
+            area_type=AreaType.CORE if name in CORE_AREAS else AreaType.ESSENTIAL,
+        )
+        for index, name in enumerate(ALL_AREAS, start=1)
+    ]
+    db_session.add_all(areas)
+    db_session.commit()
+
+    indicators = {
+        area.name: Indicator(
+            name=f"{area.name} indicator",
+            form_schema={"type": "object"},
+            governance_area_id=area.id,
+        )
+        for area in areas
+    }
+    db_session.add_all(indicators.values())
+    db_session.commit()
+
+    assessments = []
+    for i in range(3):
+        user = User(
+            email=f"reclassify{i}@test.com",
+            name=f"Reclassify BLGU {i}",
+            role=UserRole.BLGU_USER,
+            hashed_password="hashed",
+        )
+        db_session.add(user)
+        db_session.commit()
+        # Stored results are stale: everything marked as failed
+        assessment = Assessment(
+            blgu_user_id=user.id,
+            status=AssessmentStatus.VALIDATED if i < 2 else AssessmentStatus.DRAFT,
+            final_compliance_status=ComplianceStatus.FAILED,
+            area_results={name: "Failed" for name in ALL_AREAS},
+        )
+        db_session.add(assessment)
+        db_session.commit()
+        assessments.append(assessment)
+
+    # Assessments 0 and 2 pass every area; assessment 1 passes none
+    for assessment in (assessments[0], assessments[2]):
+        for indicator in indicators.values():
+            db_session.add(
+                AssessmentResponse(
+                    assessment_id=assessment.id,
+                    indicator_id=indicator.id,
+                    response_data={},
+                    validation_status=ValidationStatus.PASS,
+                )
+            )
+    db_session.commit()
+
+    return [assessment.id for assessment in assessments]
+
+
+def test_dry_run_reports_diff_without_writing(cycle, db_session: Session):
+    """A dry run lists the changed assessment and leaves the row untouched."""
+    report = _reclassify_logic(dry_run=True, db=db_session)
+
+    assert report["success"] is True
+    assert report["assessments_scanned"] == 2
+    assert report["changed"] == 1
+    assert report["unchanged"] == 1
+    change = report["changes"][0]
+    assert change["assessment_id"] == cycle[0]
+    assert change["old_status"] == "Failed"
+    assert change["new_status"] == "Passed"
+    assert change["changed_areas"]["Disaster Preparedness"] == ["Failed", "Passed"]
+
+    db_session.expire_all()
+    stored = db_session.get(Assessment, cycle[0])
+    assert stored.final_compliance_status == ComplianceStatus.FAILED
+
+
+def test_reclassification_writes_changes_in_bulk(cycle, db_session: Session):
+    """Only changed assessments are updated, with one UPDATE statement."""
+    statements: list[str] = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", record_statement)
+    try:
+        report = _reclassify_logic(db=db_session)
+    finally:
+        event.remove(bind, "before_cursor_execute", record_statement)
+
+    assert report["changed"] == 1
+    assert sum(s.lstrip().upper().startswith("UPDATE") for s in statements) == 1
+
+    db_session.expire_all()
+    passed = db_session.get(Assessment, cycle[0])
+    assert passed.final_compliance_status == ComplianceStatus.PASSED
+    assert passed.area_results == {name: "Passed" for name in ALL_AREAS}
+    # The draft is outside the default VALIDATED filter
+    draft = db_session.get(Assessment, cycle[2])
+    assert draft.final_compliance_status == ComplianceStatus.FAILED
+
+    # A second run is a no-op
+    assert _reclassify_logic(db=db_session)["changed"] == 0
+
+
+def test_reclassification_filters_by_ids_and_status(cycle, db_session: Session):
+    """Explicit IDs and status=None reach assessments in any status."""
+    report = _reclassify_logic(
+        status=None, assessment_ids=[cycle[1], cycle[2]], db=db_session
+    )
+
+    assert report["assessments_scanned"] == 2
+    assert [change["assessment_id"] for change in report["changes"]] == [cycle[2]]
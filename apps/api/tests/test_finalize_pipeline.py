@@ -0,0 +1,277 @@
+# 🧪 Tests for the asynchronous finalize pipeline and its status endpoint
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from app.api import deps
+from app.db.enums import (
+    AreaType,
+    AssessmentStatus,
+    ComplianceStatus,
+    UserRole,
+    ValidationStatus,
+)
+from app.db.models import (
+    Assessment,
+    AssessmentResponse,
+    GovernanceArea,
+    Indicator,
+    User,
+)
+from app.services.assessor_service import assessor_service
+from app.workers import finalize_pipeline
+from app.workers.notifications import send_validation_complete_notification
+from app.workers.sglgb_classifier import _classify_assessment_logic
+from fastapi.testclient import TestClient
+from main import app
+from sqlalchemy.orm import Session
+
+
+@pytest.fixture
+def reviewed(db_session: Session):
+    """A submitted assessment whose responses have all been reviewed."""
+    area = GovernanceArea(id=2, name="Area A", area_type=AreaType.CORE)
+    db_session.add(area)
+    db_session.commit()
+
+    indicator = Indicator(name="Ind", form_schema={}, governance_area_id=area.id)
+    assessor = User(
+        email="pipeline-assessor@test.com",
+        name="Pipeline Assessor",
+        role=UserRole.AREA_ASSESSOR,
+        governance_area_id=area.id,
+        hashed_password="hashed",
+        is_active=True,
+    )
+    blgu = User(
+        email="pipeline-blgu@test.com",
+        name="Pipeline BLGU",
+        role=UserRole.BLGU_USER,
+        hashed_password="hashed",
+        is_active=True,
+    )
+    db_session.add_all([indicator, assessor, blgu])
+    db_session.commit()
+
+    assessment = Assessment(
+        blgu_user_id=blgu.id, status=AssessmentStatus.SUBMITTED_FOR_REVIEW
+    )
+    assessment.responses = [
+        AssessmentResponse(
+            indicator_id=indicator.id, validation_status=ValidationStatus.PASS
+        )
+    ]
+    db_session.add(assessment)
+    db_session.commit()
+
+    db_session.refresh(assessor)
+    db_session.expunge(assessor)
+
+    def _override_get_db():
+        yield db_session
+
+    app.dependency_overrides[deps.get_db] = _override_get_db
+    app.dependency_overrides[deps.get_current_area_assessor_user] = lambda: assessor
+    app.dependency_overrides[deps.get_current_area_assessor_user_http] = (
+        lambda: assessor
+    )
+    yield {"client": TestClient(app), "assessment_id": assessment.id}
+    app.dependency_overrides.clear()
+
+
+def test_finalize_queues_chain_without_classifying(db_session, reviewed):
+    assessment_id = reviewed["assessment_id"]
+    with patch.object(finalize_pipeline, "chain") as chain, patch(
+        "app.services.intelligence_service.intelligence_service.classify_assessment",
+        side_effect=AssertionError("classification ran in the request"),
+    ):
+        response = reviewed["client"].post(
+            f"/api/v1/assessor/assessments/{assessment_id}/finalize"
+        )
+
+    assert response.status_code == 200, response.text
+    body = response.json()
+    # Deprecated keys stay for existing clients
+    assert body["classification_result"] is None
+    assert body["notification_result"] is None
+    pipeline = body["pipeline"]
+    assert pipeline["queued"] is True
+    assert pipeline["steps"] == {
+        "classify": f"finalize-{assessment_id}-classify",
+        "notify": f"finalize-{assessment_id}-notify",
+    }
+
+    signatures = chain.call_args.args
+    assert [s.task for s in signatures] == [
+        "app.workers.sglgb_classifier.classify_assessment_task",
+        "notifications.send_validation_complete_notification",
+    ]
+    assert [s.options["task_id"] for s in signatures] == list(
+        pipeline["steps"].values()
+    )
+    chain.return_value.apply_async.assert_called_once()
+    db_session.expire_all()
+    assert db_session.get(Assessment, assessment_id).finalize_dispatched_at is not None
+
+
+def test_status_reports_the_steps_queued_at_finalize(db_session, reviewed):
+    """Enabling insights later doesn't add a step the pipeline never had."""
+    assessment_id = reviewed["assessment_id"]
+    with patch.object(finalize_pipeline, "chain"):
+        response = reviewed["client"].post(
+            f"/api/v1/assessor/assessments/{assessment_id}/finalize"
+        )
+    assert response.status_code == 200, response.text
+
+    done = MagicMock(state="SUCCESS")
+    with patch.object(
+        finalize_pipeline.settings, "FINALIZE_GENERATE_INSIGHTS", True
+    ), patch.object(finalize_pipeline, "AsyncResult", return_value=done):
+        body = reviewed["client"].get(
+            f"/api/v1/assessor/assessments/{assessment_id}/finalize-status"
+        ).json()
+
+    assert [step["name"] for step in body["pipeline"]["steps"]] == [
+        "classify",
+        "notify",
+    ]
+    assert body["pipeline"]["state"] == "completed"
+
+
+def test_pipeline_left_behind_by_broker_outage_is_dispatched_later(
+    db_session, reviewed
+):
+    """A finalize that could not reach the broker is queued by the beat task."""
+    assessment_id = reviewed["assessment_id"]
+    client = reviewed["client"]
+    with patch.object(finalize_pipeline, "chain") as chain:
+        chain.return_value.apply_async.side_effect = ConnectionError("broker down")
+        response = client.post(f"/api/v1/assessor/assessments/{assessment_id}/finalize")
+
+    assert response.status_code == 200, response.text
+    assert response.json()["pipeline"]["queued"] is False
+    status_url = f"/api/v1/assessor/assessments/{assessment_id}/finalize-status"
+    body = client.get(status_url).json()
+    assert body["pipeline"]["state"] == "not_queued"
+    assert {step["state"] for step in body["pipeline"]["steps"]} == {"NOT_QUEUED"}
+
+    # Still within the grace period of the request that finalized it
+    with patch.object(finalize_pipeline, "chain") as chain:
+        report = finalize_pipeline._dispatch_finalize_pipelines_logic(db=db_session)
+    assert report["dispatched"] == []
+    chain.assert_not_called()
+
+    later = datetime.utcnow() + timedelta(
+        seconds=finalize_pipeline.settings.FINALIZE_DISPATCH_GRACE_SECONDS + 1
+    )
+    with patch.object(finalize_pipeline, "chain") as chain, patch.object(
+        finalize_pipeline, "datetime"
+    ) as mock_datetime:
+        mock_datetime.utcnow.return_value = later
+        report = finalize_pipeline._dispatch_finalize_pipelines_logic(db=db_session)
+    assert report == {"success": True, "dispatched": [assessment_id], "error": None}
+    assert [s.options["task_id"] for s in chain.call_args.args] == [
+        f"finalize-{assessment_id}-classify",
+        f"finalize-{assessment_id}-notify",
+    ]
+
+    with patch.object(
+        finalize_pipeline, "AsyncResult", return_value=MagicMock(state="PENDING")
+    ):
+        assert client.get(status_url).json()["pipeline"]["state"] == "queued"
+
+    # Dispatched pipelines are not queued twice
+    with patch.object(finalize_pipeline, "chain") as chain, patch.object(
+        finalize_pipeline, "datetime"
+    ) as mock_datetime:
+        mock_datetime.utcnow.return_value = later
+        report = finalize_pipeline._dispatch_finalize_pipelines_logic(db=db_session)
+    assert report["dispatched"] == []
+
+
+def test_finalized_assessment_cannot_be_sent_for_rework(db_session, reviewed):
+    """Re-finalizing would reuse the step task IDs, so rework is refused."""
+    assessment_id = reviewed["assessment_id"]
+    db_session.query(Assessment).filter(Assessment.id == assessment_id).update(
+        {"status": AssessmentStatus.VALIDATED}
+    )
+    db_session.commit()
+
+    with pytest.raises(ValueError, match="finalized"):
+        assessor_service.send_assessment_for_rework(db_session, assessment_id, None)
+
+    db_session.expire_all()
+    assessment = db_session.get(Assessment, assessment_id)
+    assert assessment.status == AssessmentStatus.VALIDATED
+    assert assessment.rework_count == 0
+
+
+def test_notify_step_fails_instead_of_succeeding():
+    """A notification that could not be queued fails the chain step."""
+    with patch(
+        "app.workers.notifications._enqueue_notification_logic",
+        return_value={"success": False, "error": "Assessment not found"},
+    ):
+        result = send_validation_complete_notification.apply(args=[1])
+
+    assert result.state == "FAILURE"
+    assert "not found" in str(result.result)
+
+
+def test_insights_step_is_optional():
+    with patch.object(finalize_pipeline.settings, "FINALIZE_GENERATE_INSIGHTS", True):
+        assert finalize_pipeline.pipeline_steps() == ["classify", "notify", "insights"]
+
+
+@pytest.mark.parametrize(
+    "states, overall",
+    [
+        (["PENDING", "PENDING"], "queued"),
+        (["SUCCESS", "STARTED"], "running"),
+        (["SUCCESS", "SUCCESS"], "completed"),
+        (["FAILURE", "PENDING"], "failed"),
+    ],
+)
+def test_status_endpoint_reports_steps(db_session, reviewed, states, overall):
+    assessment_id = reviewed["assessment_id"]
+    db_session.query(Assessment).filter(Assessment.id == assessment_id).update(
+        {
+            "status": AssessmentStatus.VALIDATED,
+            "final_compliance_status": ComplianceStatus.PASSED,
+            "finalize_dispatched_at": datetime.utcnow(),
+        }
+    )
+    db_session.commit()
+
+    results = {
+        f"finalize-{assessment_id}-{step}": MagicMock(
+            id=f"finalize-{assessment_id}-{step}", state=state, result="boom"
+        )
+        for step, state in zip(["classify", "notify"], states)
+    }
+    with patch.object(
+        finalize_pipeline, "AsyncResult", side_effect=lambda task_id, app: results[task_id]
+    ):
+        response = reviewed["client"].get(
+            f"/api/v1/assessor/assessments/{assessment_id}/finalize-status"
+        )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["final_compliance_status"] == ComplianceStatus.PASSED.value
+    assert body["pipeline"]["state"] == overall
+    assert [step["state"] for step in body["pipeline"]["steps"]] == states
+
+
+def test_status_requires_finalized_assessment(reviewed):
+    response = reviewed["client"].get(
+        f"/api/v1/assessor/assessments/{reviewed['assessment_id']}/finalize-status"
+    )
+    assert response.status_code == 400
+
+
+def test_classify_logic_reports_missing_assessment(db_session):
+    result = _classify_assessment_logic(999999, db=db_session)
+    assert result["success"] is False
+    assert "not found" in result["error"]
@@ -0,0 +1,161 @@
+# 🧪 Tests for the per-governance-area BLGU assessment endpoints
+
+from unittest.mock import patch
+
+import pytest
+from app.api import deps
+from app.api.v1.assessments import get_current_blgu_user
+from app.db.enums import AreaType, UserRole
+from app.db.models import (
+    MOV,
+    Assessment,
+    AssessmentResponse,
+    GovernanceArea,
+    Indicator,
+    User,
+)
+from app.services.assessment_service import assessment_service
+from fastapi.testclient import TestClient
+from main import app
+from sqlalchemy.orm import Session
+
+
+@pytest.fixture
+def area_context(db_session: Session):
+    """Two governance areas, each with a parent/child indicator pair and responses."""
+    areas = [
+        GovernanceArea(id=2, name="Disaster Preparedness", area_type=AreaType.CORE),
+        GovernanceArea(
+            id=3, name="Safety, Peace and Order", area_type=AreaType.CORE
+        ),
+    ]
+    db_session.add_all(areas)
+    db_session.commit()
+
+    indicators = {}
+    for area in areas:
+        parent = Indicator(
+            name=f"Parent {area.id}",
+            form_schema={"type": "object"},
+            governance_area_id=area.id,
+        )
+        db_session.add(parent)
+        db_session.commit()
+        child = Indicator(
+            name=f"Child {area.id}",
+            form_schema={"type": "object"},
+            governance_area_id=area.id,
+            parent_id=parent.id,
+        )
+        db_session.add(child)
+        db_session.commit()
+        indicators[area.id] = (parent, child)
+
+    blgu = User(
+        email="area-subtree@test.com",
+        name="Area Subtree BLGU",
+        role=UserRole.BLGU_USER,
+        hashed_password="hashed",
+        is_active=True,
+    )
+    db_session.add(blgu)
+    db_session.commit()
+
+    assessment = Assessment(blgu_user_id=blgu.id)
+    db_session.add(assessment)
+    db_session.commit()
+
+    responses = {}
+    for area_id, (parent, child) in indicators.items():
+        response = AssessmentResponse(
+            assessment_id=assessment.id,
+            indicator_id=child.id,
+            response_data={"answer": "yes"},
+            is_completed=area_id == 2,
+            requires_rework=area_id == 3,
+        )
+        db_session.add(response)
+        db_session.commit()
+        db_session.add(
+            MOV(
+                filename=f"area{area_id}.pdf",
+                original_filename=f"area{area_id}.pdf",
+                file_size=10,
+                content_type="application/pdf",
+                storage_path=f"movs/area{area_id}.pdf",
+                response_id=response.id,
+            )
+        )
+        db_session.commit()
+        responses[area_id] = response
+
+    def _override_get_db():
+        yield db_session
+
+    app.dependency_overrides[deps.get_db] = _override_get_db
+    app.dependency_overrides[get_current_blgu_user] = lambda: blgu
+    with patch("app.services.assessment_service.settings.READ_PATH_SAFEGUARDS", False):
+        yield {
+            "client": TestClient(app),
+            "assessment": assessment,
+            "indicators": indicators,
+            "responses": responses,
+        }
+    app.dependency_overrides.clear()
+
+
+def test_area_index_returns_counts_without_schemas(area_context):
+    """The index lists every area with counts and no indicator payloads."""
+    result = area_context["client"].get("/api/v1/assessments/my-assessment/areas")
+
+    assert result.status_code == 200
+    assert result.headers["etag"]
+    data = result.json()
+    assert data["assessment"]["id"] == area_context["assessment"].id
+
+    by_id = {area["id"]: area for area in data["governance_areas"]}
+    assert by_id[2] == {
+        "id": 2,
+        "name": "Disaster Preparedness",
+        "area_type": "Core",
+        "total_indicators": 2,
+        "responses": 1,
+        "completed_indicators": 1,
+        "requires_rework_count": 0,
+    }
+    assert by_id[3]["completed_indicators"] == 0
+    assert by_id[3]["requires_rework_count"] == 1
+
+
+def test_area_subtree_only_contains_requested_area(area_context):
+    """Opening one area returns its subtree with its own responses only."""
+    result = area_context["client"].get("/api/v1/assessments/my-assessment/areas/2")
+
+    assert result.status_code == 200
+    area = result.json()["governance_area"]
+    parent_id, child_id = (ind.id for ind in area_context["indicators"][2])
+    assert area["id"] == 2
+    assert [ind["id"] for ind in area["indicators"]] == [parent_id]
+
+    child = area["indicators"][0]["children"][0]
+    assert child["id"] == child_id
+    assert child["response"]["id"] == area_context["responses"][2].id
+    assert [mov["filename"] for mov in child["movs"]] == ["area2.pdf"]
+
+
+def test_area_subtree_filters_responses_in_sql(area_context, db_session: Session):
+    """The response graph loader skips responses of other areas."""
+    graph = assessment_service.load_response_graph(
+        db_session, area_context["assessment"].id, governance_area_id=3
+    )
+
+    _, child = area_context["indicators"][3]
+    assert list(graph) == [child.id]
+    assert graph[child.id]["movs"][0]["filename"] == "area3.pdf"
+
+
+def test_unknown_area_returns_404(area_context):
+    """Requesting an area outside the catalogue is a 404."""
+    result = area_context["client"].get("/api/v1/assessments/my-assessment/areas/999")
+
+    assert result.status_code == 404
@@ -0,0 +1,142 @@
+# 🧪 Tests for the process-wide indicator tree cache
+
+from app.db.enums import AreaType, UserRole
+from app.db.models import AssessmentResponse, GovernanceArea, Indicator, User
+from app.services.assessment_service import assessment_service
+from app.services.indicator_tree_cache import indicator_tree_cache
+from sqlalchemy import update
+from sqlalchemy.orm import Session, sessionmaker
+
+
+def _seed_catalogue(db_session: Session) -> dict:
+    # Area 1 gets synthetic demo children, so use a different area id
+    area = GovernanceArea(id=2, name="Disaster Preparedness", area_type=AreaType.CORE)
+    db_session.add(area)
+    db_session.commit()
+
+    parent = Indicator(
+        name="Parent Indicator",
+        description="Parent",
+        form_schema={"type": "object"},
+        governance_area_id=area.id,
+    )
+    db_session.add(parent)
+    db_session.commit()
+
+    child = Indicator(
+        name="Child Indicator",
+        description="Child",
+        form_schema={"type": "object", "required": ["answer"]},
+        governance_area_id=area.id,
+        parent_id=parent.id,
+    )
+    db_session.add(child)
+    db_session.commit()
+
+    user = User(
+        email="tree-cache@test.com",
+        name="Tree Cache User",
+        role=UserRole.BLGU_USER,
+        hashed_password="hashed",
+        is_active=True,
+    )
+    db_session.add(user)
+    db_session.commit()
+
+    return {"area": area, "parent": parent, "child": child, "user": user}
+
+
+def test_tree_is_reused_until_catalogue_changes(db_session: Session):
+    """The same tree object is served until a catalogue write is committed."""
+    data = _seed_catalogue(db_session)
+
+    first = indicator_tree_cache.get_tree(db_session)
+    second = indicator_tree_cache.get_tree(db_session)
+    assert first is second
+
+    area = next(a for a in first.areas if a.id == data["area"].id)
+    assert [n.id for n in area.indicators] == [data["parent"].id]
+    assert [c.id for c in area.indicators[0].children] == [data["child"].id]
+
+    version = indicator_tree_cache.get_version(db_session)
+    data["child"].name = "Renamed Child"
+    db_session.commit()
+
+    assert indicator_tree_cache.get_version(db_session) == version + 1
+    rebuilt = indicator_tree_cache.get_tree(db_session)
+    assert rebuilt is not first
+    area = next(a for a in rebuilt.areas if a.id == data["area"].id)
+    assert area.indicators[0].children[0].name == "Renamed Child"
+
+
+def test_rolled_back_catalogue_write_keeps_version(db_session: Session):
+    """Uncommitted catalogue writes must not invalidate the cache."""
+    data = _seed_catalogue(db_session)
+    version = indicator_tree_cache.get_version(db_session)
+
+    data["parent"].name = "Never committed"
+    db_session.flush()
+    db_session.rollback()
+
+    assert indicator_tree_cache.get_version(db_session) == version
+
+
+def test_write_from_another_process_invalidates_tree(db_session: Session):
+    """The version is read from the database, not kept in process memory."""
+    data = _seed_catalogue(db_session)
+    first = indicator_tree_cache.get_tree(db_session)
+
+    # Another process reseeding the catalogue with a bulk UPDATE: the only
+    # trace it leaves for this process is the shared version row
+    other = sessionmaker(bind=db_session.get_bind())()
+    try:
+        other.execute(
+            update(Indicator)
+            .where(Indicator.id == data["child"].id)
+            .values(name="Reseeded Child")
+        )
+        other.commit()
+    finally:
+        other.close()
+
+    # A later request works on a fresh session
+    db_session.expire_all()
+    rebuilt = indicator_tree_cache.get_tree(db_session)
+    assert rebuilt.version == first.version + 1
+    area = next(a for a in rebuilt.areas if a.id == data["area"].id)
+    assert area.indicators[0].children[0].name == "Reseeded Child"
+
+
+def test_full_data_merges_responses_into_cached_skeleton(db_session: Session):
+    """Per-assessment responses are merged into nodes without mutating the cache."""
+    data = _seed_catalogue(db_session)
+    user = data["user"]
+
+    first = assessment_service.get_assessment_for_blgu_with_full_data(
+        db_session, user.id
+    )
+    assessment_id = first["assessment"]["id"]
+
+    response = AssessmentResponse(
+        assessment_id=assessment_id,
+        indicator_id=data["child"].id,
+        response_data={"answer": "no"},
+    )
+    db_session.add(response)
+    db_session.commit()
+
+    second = assessment_service.get_assessment_for_blgu_with_full_data(
+        db_session, user.id
+    )
+    area = next(a for a in second["governance_areas"] if a["id"] == data["area"].id)
+    parent_node = area["indicators"][0]
+    child_node = parent_node["children"][0]
+
+    assert parent_node["response"] is None
+    assert child_node["response"]["id"] == response.id
+    assert child_node["response"]["response_data"] == {"answer": "no"}
+
+    # The cached skeleton itself carries no per-assessment data
+    tree = indicator_tree_cache.get_tree(db_session)
+    cached_area = next(a for a in tree.areas if a.id == data["area"].id)
+    assert not hasattr(cached_area.indicators[0].children[0], "response")
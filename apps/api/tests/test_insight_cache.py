@@ -0,0 +1,123 @@
+# 🧪 Tests for the shared, prompt-hash keyed insight cache
+
+import json
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, Mock, patch
+
+from app.api import deps
+from app.api.v1.assessments import get_current_admin_user
+from app.core.config import settings
+from app.db.models import InsightCacheEntry
+from app.services.insight_cache_service import insight_cache_service, make_cache_key
+from app.services.intelligence_service import intelligence_service
+from fastapi.testclient import TestClient
+from main import app
+from sqlalchemy.orm import Session
+
+INSIGHTS = {
+    "summary": "Summary",
+    "recommendations": ["Recommendation"],
+    "capacity_development_needs": ["Need"],
+}
+
+
+def test_cache_key_ignores_whitespace_and_case_but_not_model():
+    """Cosmetic whitespace and case share an entry; a different model does not."""
+    key = make_cache_key("Failed:\n  1. Indicator  ", "gemini-2.5-flash")
+
+    assert key == make_cache_key("Failed: 1. Indicator", "gemini-2.5-flash")
+    assert key == make_cache_key("FAILED: 1. indicator", "gemini-2.5-flash")
+    assert key != make_cache_key("Failed: 1. Indicator", "gemini-2.5-pro")
+    assert key != make_cache_key("Failed: 2. Indicator", "gemini-2.5-flash")
+
+
+@patch("app.services.intelligence_service.genai.configure")
+@patch("app.services.intelligence_service.genai.GenerativeModel")
+def test_identical_prompt_calls_gemini_once(
+    mock_generative_model, mock_configure, db_session: Session, mock_assessment
+):
+    """A regenerated prompt is served from the cache and counted as a hit."""
+    mock_model = MagicMock()
+    mock_model.generate_content = MagicMock(
+        return_value=Mock(text=json.dumps(INSIGHTS))
+    )
+    mock_generative_model.return_value = mock_model
+
+    with patch.object(settings, "GEMINI_API_KEY", "test_api_key"):
+        first = intelligence_service.call_gemini_api(db_session, mock_assessment.id)
+        second = intelligence_service.call_gemini_api(db_session, mock_assessment.id)
+
+    assert first == second == INSIGHTS
+    mock_model.generate_content.assert_called_once()
+
+    stats = insight_cache_service.get_stats(db_session)
+    assert stats["entries"] == 1
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_expired_entries_miss_and_lru_is_evicted(db_session: Session):
+    """Expired entries are not served, and capacity evicts the oldest access."""
+    with patch.object(settings, "INSIGHT_CACHE_MAX_ENTRIES", 2):
+        insight_cache_service.put(db_session, "prompt a", "model", INSIGHTS)
+        insight_cache_service.put(db_session, "prompt b", "model", INSIGHTS)
+        # Touch "a" so "b" becomes the least recently used entry
+        db_session.query(InsightCacheEntry).filter(
+            InsightCacheEntry.cache_key == make_cache_key("prompt b", "model")
+        ).update({"last_accessed_at": datetime.utcnow() - timedelta(hours=1)})
+        db_session.commit()
+        assert insight_cache_service.get(db_session, "prompt a", "model") == INSIGHTS
+
+        insight_cache_service.put(db_session, "prompt c", "model", INSIGHTS)
+
+    assert insight_cache_service.get(db_session, "prompt b", "model") is None
+    assert insight_cache_service.get(db_session, "prompt c", "model") == INSIGHTS
+
+    db_session.query(InsightCacheEntry).update(
+        {"expires_at": datetime.utcnow() - timedelta(seconds=1)}
+    )
+    db_session.commit()
+    assert insight_cache_service.get(db_session, "prompt a", "model") is None
+
+    # Regenerating refreshes the expired entry in place
+    insight_cache_service.put(db_session, "prompt a", "model", INSIGHTS)
+    stats = insight_cache_service.get_stats(db_session)
+    assert stats["entries"] == 1
+    assert stats["misses"] == 2
+
+
+def test_lookups_count_misses_without_committing_caller(db_session: Session):
+    """Misses are counted at lookup time and the caller's transaction is left open."""
+    db_session.query(InsightCacheEntry).count()
+    transaction = db_session.get_transaction()
+
+    assert insight_cache_service.get(db_session, "never stored", "model") is None
+    assert insight_cache_service.get_many(db_session, {1: "a", 2: "b"}, "model") == {}
+
+    assert db_session.get_transaction() is transaction
+    db_session.rollback()
+    stats = insight_cache_service.get_stats(db_session)
+    assert stats["entries"] == 0
+    assert stats["misses"] == 3
+    assert stats["hit_ratio"] == 0.0
+
+
+def test_cache_stats_endpoint(db_session: Session, mock_blgu_user):
+    """Admins can read the cache hit ratio."""
+    assert insight_cache_service.get(db_session, "prompt", "model") is None
+    insight_cache_service.put(db_session, "prompt", "model", INSIGHTS)
+    insight_cache_service.get(db_session, "prompt", "model")
+
+    def _override_get_db():
+        yield db_session
+
+    app.dependency_overrides[deps.get_db] = _override_get_db
+    app.dependency_overrides[get_current_admin_user] = lambda: mock_blgu_user
+    try:
+        result = TestClient(app).get("/api/v1/assessments/insights/cache-stats")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert result.status_code == 200
+    assert result.json()["hit_ratio"] == 0.5
@@ -0,0 +1,172 @@
+# 🧪 Tests for the orjson response classes
+
+import json
+from datetime import datetime
+
+import pytest
+
+from app.api import deps
+from app.api.v1.assessments import get_current_admin_user
+from app.core.responses import JSONArrayStreamingResponse, ORJSONResponse, dumps
+from app.db.enums import AssessmentStatus, ComplianceStatus, UserRole
+from app.db.models import Assessment, User
+from app.db.models.barangay import Barangay
+from app.schemas.assessment import ProgressSummary
+from fastapi import FastAPI
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from main import app
+from sqlalchemy.orm import Session
+
+
+def test_dumps_encodes_native_types():
+    """Datetimes, enums, int keys and pydantic models need no pre-formatting."""
+    stamp = datetime(2025, 1, 2, 3, 4, 5, 678901)
+    payload = {
+        1: "int key",
+        "at": stamp,
+        "status": AssessmentStatus.VALIDATED,
+        "model": ProgressSummary(current=1, total=2, percentage=50.0),
+    }
+
+    decoded = json.loads(dumps(payload))
+
+    assert decoded["1"] == "int key"
+    assert decoded["at"] == stamp.isoformat()
+    assert decoded["status"] == AssessmentStatus.VALIDATED.value
+    assert decoded["model"] == {"current": 1, "total": 2, "percentage": 50.0}
+
+
+def test_streamed_array_is_valid_json_across_chunks():
+    """Chunk boundaries never break the array, including the empty case."""
+    streaming_app = FastAPI()
+
+    @streaming_app.get("/items/{count}")
+    def items(count: int):
+        return JSONArrayStreamingResponse(
+            ({"n": n} for n in range(count)), chunk_size=2
+        )
+
+    client = TestClient(streaming_app)
+    for count in (0, 1, 2, 5):
+        result = client.get(f"/items/{count}")
+        assert result.headers["content-type"] == "application/json"
+        assert result.json() == [{"n": n} for n in range(count)]
+
+
+def test_app_uses_orjson_by_default():
+    """The API serializes responses with the orjson response class."""
+    routes = [route for route in app.routes if isinstance(route, APIRoute)]
+    assert routes
+    assert all(route.response_class is ORJSONResponse for route in routes)
+
+
+def test_validated_assessment_list_is_streamed(db_session: Session):
+    """The MLGOO list streams every assessment with native datetimes encoded."""
+    barangay = Barangay(name="Streamed Barangay")
+    db_session.add(barangay)
+    db_session.commit()
+
+    validated_at = datetime(2025, 3, 1, 8, 30)
+    for i in range(3):
+        user = User(
+            email=f"stream{i}@test.com",
+            name=f"Streamed BLGU {i}",
+            role=UserRole.BLGU_USER,
+            hashed_password="hashed",
+            barangay_id=barangay.id if i else None,
+        )
+        db_session.add(user)
+        db_session.commit()
+        db_session.add(
+            Assessment(
+                blgu_user_id=user.id,
+                status=AssessmentStatus.VALIDATED,
+                final_compliance_status=ComplianceStatus.PASSED,
+                validated_at=validated_at,
+            )
+        )
+    db_session.commit()
+
+    admin = User(
+        email="stream-admin@test.com",
+        name="Stream Admin",
+        role=UserRole.MLGOO_DILG,
+        hashed_password="hashed",
+    )
+
+    def _override_get_db():
+        yield db_session
+
+    app.dependency_overrides[deps.get_db] = _override_get_db
+    app.dependency_overrides[get_current_admin_user] = lambda: admin
+    try:
+        result = TestClient(app).get("/api/v1/assessments/list")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert result.status_code == 200
+    data = result.json()
+    assert len(data) == 3
+    assert {item["barangay_name"] for item in data} == {
+        "Streamed Barangay",
+        "Unknown",
+    }
+    assert all(item["final_compliance_status"] == "Passed" for item in data)
+    assert all(item["validated_at"] == validated_at.isoformat() for item in data)
+
+
+def test_stream_errors_before_and_after_the_response_starts():
+    """A failing first chunk answers 500; a later failure aborts the body."""
+    streaming_app = FastAPI()
+
+    def failing(after: int):
+        for n in range(after):
+            yield {"n": n}
+        raise RuntimeError("cursor lost")
+
+    @streaming_app.get("/items/{after}")
+    def items(after: int):
+        return JSONArrayStreamingResponse.prefetched(failing(after), chunk_size=2)
+
+    client = TestClient(streaming_app, raise_server_exceptions=False)
+    assert client.get("/items/0").status_code == 500
+    assert client.get("/items/1").status_code == 500
+
+    with pytest.raises(RuntimeError, match="cursor lost"):
+        TestClient(streaming_app).get("/items/3")
+
+
+def test_validated_assessment_list_query_error_is_a_500(
+    db_session: Session, monkeypatch
+):
+    """A database error fetching the list answers 500, not a truncated 200."""
+    from app.services.assessment_service import assessment_service
+    from sqlalchemy.exc import OperationalError
+
+    def failing_iter(db, status=None):
+        raise OperationalError("SELECT", {}, Exception("connection lost"))
+        yield  # pragma: no cover
+
+    monkeypatch.setattr(
+        assessment_service, "iter_validated_assessments", failing_iter
+    )
+    admin = User(
+        email="stream-admin@test.com",
+        name="Stream Admin",
+        role=UserRole.MLGOO_DILG,
+        hashed_password="hashed",
+    )
+
+    def _override_get_db():
+        yield db_session
+
+    app.dependency_overrides[deps.get_db] = _override_get_db
+    app.dependency_overrides[get_current_admin_user] = lambda: admin
+    try:
+        result = TestClient(app).get("/api/v1/assessments/list")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert result.status_code == 500
+    assert "connection lost" in result.json()["detail"]
@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import patch
 from sqlalchemy.orm import Session
-from app.db.models import Assessment, AssessmentResponse, Indicator, MOV, User, GovernanceArea
+from app.db.models import Assessment, AssessmentResponse, Indicator, MOV, User, GovernanceArea, StorageDeletion
 from app.db.enums import UserRole, AssessmentStatus, AreaType
 from app.services.assessment_service import AssessmentService
 
@@ -59,34 +59,26 @@ def test_mov_deletion_updates_completion(db_session, setup_assessment_with_mov):
     assert response.is_completed is True
     assert db_session.query(MOV).filter_by(id=mov.id).first() is not None
 
-    # Patch supabase_admin to fake successful file deletion
-    with patch("app.db.base.supabase_admin") as mock_admin:
-        bucket = mock_admin.storage.from_.return_value
-        bucket.remove.return_value = {}
-        ok = svc.delete_mov(db_session, mov.id)
-        assert ok
+    assert svc.delete_mov(db_session, mov.id)
     # DB MOV is deleted
     assert db_session.query(MOV).filter_by(id=mov.id).first() is None
     # Reload response (should be incomplete)
     refreshed = db_session.query(AssessmentResponse).get(response.id)
     assert refreshed.is_completed is False
 
-def test_atomic_deletion_aborts_on_file_failure(db_session, setup_assessment_with_mov):
+def test_deletion_queues_file_without_calling_storage(db_session, setup_assessment_with_mov):
     svc = AssessmentService()
     context = setup_assessment_with_mov
     mov = context["mov"]
-    response = context["response"]
-    # Patch supabase_admin to simulate deletion error
-    with patch("app.db.base.supabase_admin") as mock_admin:
-        bucket = mock_admin.storage.from_.return_value
-        bucket.remove.side_effect = Exception("Supabase failure")
-        import sqlalchemy.exc
-        # Transaction abort should not delete MOV or modify response
-        with pytest.raises(Exception):
-            svc.delete_mov(db_session, mov.id)
-        assert db_session.query(MOV).filter_by(id=mov.id).first() is not None
-        refreshed = db_session.query(AssessmentResponse).get(response.id)
-        assert refreshed.is_completed is True
+    # The request never reaches storage; the file is left in the outbox
+    with patch(
+        "app.services.storage_outbox_service.get_storage_backend",
+        side_effect=AssertionError("storage called from the request"),
+    ):
+        assert svc.delete_mov(db_session, mov.id)
+    assert db_session.query(MOV).filter_by(id=mov.id).first() is None
+    queued = db_session.query(StorageDeletion).filter_by(storage_path="testbucket/file.pdf").all()
+    assert [(q.bucket, q.attempts) for q in queued] == [("movs", 0)]
 
 def test_delete_no_effect_for_nonexistent_mov(db_session):
     svc = AssessmentService()
@@ -0,0 +1,227 @@
+# 🧪 Tests for the notification outbox, digest flushing and pooled SMTP delivery
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from app.core.mailer import FakeMailer, SMTPMailer
+from app.db.enums import AssessmentStatus, ComplianceStatus, UserRole
+from app.db.models import Assessment, Barangay, NotificationEvent, User
+from app.services.assessor_service import assessor_service
+from app.services.notification_service import (
+    REWORK,
+    VALIDATION_COMPLETE,
+    notification_service,
+    retry_delay,
+)
+from app.workers.notifications import (
+    _enqueue_notification_logic,
+    _flush_notifications_logic,
+)
+from sqlalchemy.orm import Session, sessionmaker
+
+
+@pytest.fixture
+def blgu_assessments(db_session: Session):
+    """Two BLGU users with two assessments each."""
+    barangays = [Barangay(name="Outbox North"), Barangay(name="Outbox South")]
+    db_session.add_all(barangays)
+    db_session.commit()
+
+    users = [
+        User(
+            email=f"outbox-blgu-{i}@test.com",
+            name=f"Outbox BLGU {i}",
+            role=UserRole.BLGU_USER,
+            barangay_id=barangay.id,
+            hashed_password="hashed",
+            is_active=True,
+        )
+        for i, barangay in enumerate(barangays)
+    ]
+    db_session.add_all(users)
+    db_session.commit()
+
+    assessments = [
+        Assessment(blgu_user_id=user.id, status=AssessmentStatus.SUBMITTED_FOR_REVIEW)
+        for user in users
+        for _ in range(2)
+    ]
+    db_session.add_all(assessments)
+    db_session.commit()
+    return [assessment.id for assessment in assessments]
+
+
+def test_flush_sends_one_digest_per_recipient(db_session, blgu_assessments):
+    """All pending events of a recipient are rendered into one email"""
+    first, second, third, _ = blgu_assessments
+    db_session.query(Assessment).filter(Assessment.id == second).update(
+        {"final_compliance_status": ComplianceStatus.PASSED}
+    )
+    notification_service.enqueue(db_session, first, REWORK)
+    notification_service.enqueue(db_session, second, VALIDATION_COMPLETE)
+    notification_service.enqueue(db_session, third, REWORK)
+    db_session.commit()
+
+    mailer = FakeMailer()
+    result = _flush_notifications_logic(db=db_session, mailer=mailer)
+
+    assert result["success"] is True
+    assert result["events_sent"] == 3
+    assert result["digests_sent"] == 2
+    assert len(mailer.messages) == 2
+
+    digests = {message["To"]: message for message in mailer.messages}
+    digest = digests["Outbox BLGU 0 <outbox-blgu-0@test.com>"]
+    assert digest["Subject"] == "VANTAGE: 2 updates on your assessments"
+    body = digest.get_content()
+    assert "Outbox North needs rework" in body
+    assert "Final SGLGB result: Passed." in body
+
+    single = digests["Outbox BLGU 1 <outbox-blgu-1@test.com>"]
+    assert single["Subject"] == "VANTAGE: Assessment for Outbox South needs rework"
+    assert db_session.query(NotificationEvent).count() == 0
+
+
+def test_failed_digest_backs_off_and_retries(db_session, blgu_assessments):
+    """A failed send keeps the recipient's events queued with backoff"""
+    notification_service.enqueue(db_session, blgu_assessments[0], REWORK)
+    notification_service.enqueue(db_session, blgu_assessments[1], REWORK)
+    db_session.commit()
+
+    mailer = FakeMailer()
+    mailer.fail_next = 1
+    first = notification_service.flush(db_session, mailer=mailer)
+    assert first["events_sent"] == 0
+    assert first["failed"] == 2
+
+    db_session.expire_all()
+    rows = db_session.query(NotificationEvent).all()
+    assert {row.attempts for row in rows} == {1}
+    assert all(row.last_error == "Fake mailer failure" for row in rows)
+    assert all(row.next_attempt_at > datetime.utcnow() for row in rows)
+
+    # Not due yet: nothing is sent
+    assert notification_service.flush(db_session, mailer=mailer)["batches"] == 0
+    assert notification_service.get_stats(db_session)["pending"] == 2
+
+    later = datetime.utcnow() + retry_delay(1) + timedelta(seconds=1)
+    with patch("app.services.notification_service.datetime") as mock_datetime:
+        mock_datetime.utcnow.return_value = later
+        retried = notification_service.flush(db_session, mailer=mailer)
+    assert retried["events_sent"] == 2
+    assert len(mailer.messages) == 1
+    assert db_session.query(NotificationEvent).count() == 0
+
+
+def test_batches_claim_whole_recipients(db_session, blgu_assessments):
+    """A recipient's events are never split across batches"""
+    for assessment_id in blgu_assessments:
+        notification_service.enqueue(db_session, assessment_id, REWORK)
+    db_session.commit()
+
+    mailer = FakeMailer()
+    result = notification_service.flush(db_session, mailer=mailer, batch_size=1)
+
+    assert result["batches"] == 2
+    assert result["digests_sent"] == 2
+    assert result["events_sent"] == 4
+    assert sorted(message["To"] for message in mailer.messages) == [
+        "Outbox BLGU 0 <outbox-blgu-0@test.com>",
+        "Outbox BLGU 1 <outbox-blgu-1@test.com>",
+    ]
+    assert all(
+        message["Subject"] == "VANTAGE: 2 updates on your assessments"
+        for message in mailer.messages
+    )
+
+
+def test_claim_is_committed_before_sending(db_session, blgu_assessments):
+    """No transaction (and no row lock) is open while the mail server is called"""
+    notification_service.enqueue(db_session, blgu_assessments[0], REWORK)
+    db_session.commit()
+    other_session = sessionmaker(bind=db_session.get_bind())
+
+    observed = []
+
+    class ObservingMailer(FakeMailer):
+        def send(self, message):
+            with other_session() as other:
+                event = other.query(NotificationEvent).one()
+                observed.append((db_session.in_transaction(), event.next_attempt_at))
+            super().send(message)
+
+    before = datetime.utcnow()
+    result = notification_service.flush(db_session, mailer=ObservingMailer())
+
+    assert result["events_sent"] == 1
+    [(in_transaction, next_attempt_at)] = observed
+    assert in_transaction is False
+    # Other workers see the claim and skip the event until it expires
+    assert next_attempt_at > before + timedelta(minutes=1)
+    assert db_session.query(NotificationEvent).count() == 0
+
+
+def test_rework_queues_notification_in_its_transaction(db_session, blgu_assessments):
+    """Sending for rework writes the outbox row instead of calling the broker"""
+    assessment_id = blgu_assessments[0]
+    with patch(
+        "app.workers.notifications.send_rework_notification.delay",
+        side_effect=AssertionError("broker called from the request"),
+    ):
+        result = assessor_service.send_assessment_for_rework(
+            db_session, assessment_id, None
+        )
+
+    assert result["notification_result"]["success"] is True
+    event = db_session.query(NotificationEvent).one()
+    assert (event.kind, event.assessment_id) == (REWORK, assessment_id)
+    assert event.recipient_email == "outbox-blgu-0@test.com"
+
+
+def test_enqueue_reports_missing_assessment(db_session):
+    result = _enqueue_notification_logic(999999, VALIDATION_COMPLETE, db=db_session)
+    assert result["success"] is False
+    assert db_session.query(NotificationEvent).count() == 0
+
+
+def test_digests_reuse_one_smtp_connection(db_session):
+    """Every digest of a flush goes over the same pooled SMTP connection"""
+    pytest.importorskip("aiosmtpd")
+    from app.devtools.smtp_sink import SMTPSink
+
+    users = [
+        User(
+            email=f"smtp-blgu-{i}@test.com",
+            name=f"SMTP BLGU {i}",
+            role=UserRole.BLGU_USER,
+            hashed_password="hashed",
+            is_active=True,
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(users)
+    db_session.commit()
+    assessments = [Assessment(blgu_user_id=user.id) for user in users]
+    db_session.add_all(assessments)
+    db_session.commit()
+    for assessment in assessments:
+        notification_service.enqueue(db_session, assessment.id, REWORK)
+    db_session.commit()
+
+    with SMTPSink() as sink:
+        mailer = SMTPMailer(
+            sink.host, sink.port, "VANTAGE <noreply@test.com>", use_tls=False
+        )
+        try:
+            result = notification_service.flush(db_session, mailer=mailer)
+        finally:
+            mailer.close()
+
+        assert result["digests_sent"] == 5
+        assert len(sink.messages) == 5
+        assert sink.connection_count == 1
+        assert mailer.connections_opened == 1
+        assert {message["To"].addresses[0].addr_spec for message in sink.messages} == {
+            user.email for user in users
+        }
@@ -0,0 +1,106 @@
+# 🧪 Tests for off-loop bcrypt hashing and rehash-on-login
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from app.api import deps
+from app.core import security
+from app.db.enums import UserRole
+from app.db.models import User
+from app.devtools.login_benchmark import run_login_benchmark
+from fastapi.testclient import TestClient
+from httpx import ASGITransport
+from main import app
+from passlib.context import CryptContext  # type: ignore
+from sqlalchemy.orm import Session, sessionmaker
+
+# Low costs keep the tests fast; only the difference between them matters
+OLD_CONTEXT = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=4)
+NEW_CONTEXT = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=5)
+
+
+@pytest.fixture
+def login_context(db_session: Session):
+    """Active user whose password hash uses an outdated cost factor."""
+    user = User(
+        email="hash-user@test.com",
+        name="Hash User",
+        role=UserRole.BLGU_USER,
+        hashed_password=OLD_CONTEXT.hash("secret-password"),
+        must_change_password=False,
+        is_active=True,
+    )
+    db_session.add(user)
+    db_session.commit()
+
+    def _override_get_db():
+        yield db_session
+
+    app.dependency_overrides[deps.get_db] = _override_get_db
+    with patch.object(security, "pwd_context", NEW_CONTEXT), patch.object(
+        security.settings, "PASSWORD_HASH_WORKERS", 0
+    ):
+        yield user
+    app.dependency_overrides.clear()
+
+
+def test_login_rehashes_when_cost_changes(db_session, login_context):
+    """A successful login replaces a hash made with other rounds, once"""
+    client = TestClient(app)
+    credentials = {"email": "hash-user@test.com", "password": "secret-password"}
+
+    response = client.post("/api/v1/auth/login", json=credentials)
+    assert response.status_code == 200, response.text
+
+    db_session.refresh(login_context)
+    upgraded = login_context.hashed_password
+    assert upgraded.startswith("$2b$05$")
+
+    assert client.post("/api/v1/auth/login", json=credentials).status_code == 200
+    db_session.refresh(login_context)
+    assert login_context.hashed_password == upgraded
+
+    wrong = {**credentials, "password": "wrong"}
+    assert client.post("/api/v1/auth/login", json=wrong).status_code == 401
+
+
+def test_login_benchmark_reports_throughput(db_session, login_context):
+    # Concurrent logins query on executor threads: one session per request
+    session_factory = sessionmaker(bind=db_session.get_bind())
+
+    def _session_per_request():
+        with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[deps.get_db] = _session_per_request
+    summary = asyncio.run(
+        run_login_benchmark(
+            "http://bench",
+            "hash-user@test.com",
+            "secret-password",
+            requests=4,
+            concurrency=2,
+            transport=ASGITransport(app=app),
+        )
+    )
+    assert summary["requests"] == 4
+    assert summary["errors"] == 0
+    assert summary["requests_per_second"] > 0
+
+
+def test_verification_runs_in_process_pool():
+    """Hashing and verification work across the process boundary"""
+    hashed = OLD_CONTEXT.hash("pool-password")
+    with patch.object(security.settings, "PASSWORD_HASH_WORKERS", 1):
+        try:
+            assert security.get_password_hash_pool() is not None
+            ok, _ = asyncio.run(
+                security.verify_and_update_password_async("pool-password", hashed)
+            )
+            bad = asyncio.run(security.verify_password_async("nope", hashed))
+        finally:
+            security.shutdown_password_hash_pool()
+
+    assert ok is True
+    assert bad is False
@@ -0,0 +1,219 @@
+# 🧪 Tests for the authenticated principal cache behind get_current_user
+
+import threading
+from unittest.mock import patch
+
+import pytest
+from app.api import deps
+from app.core.principal_cache import (
+    InMemoryPrincipalBackend,
+    RedisPrincipalBackend,
+    build_principal_cache,
+    get_principal_cache,
+)
+from app.db.enums import UserRole
+from app.db.models import User
+from app.services.user_service import user_service
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session
+
+
+def credentials(user_id: int) -> HTTPAuthorizationCredentials:
+    return HTTPAuthorizationCredentials(scheme="Bearer", credentials=str(user_id))
+
+
+def count_user_selects(db: Session):
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM users" in statement:
+            statements.append(statement)
+
+    event.listen(db.get_bind(), "before_cursor_execute", record_statement)
+    return statements, lambda: event.remove(
+        db.get_bind(), "before_cursor_execute", record_statement
+    )
+
+
+@pytest.fixture
+def blgu_user(db_session: Session) -> User:
+    user = User(
+        email="principal@test.com",
+        name="Principal",
+        role=UserRole.BLGU_USER,
+        hashed_password="hashed",
+        must_change_password=True,
+        is_active=True,
+    )
+    db_session.add(user)
+    db_session.commit()
+    with patch("app.api.deps.verify_token", lambda token: {"sub": int(token)}):
+        yield user
+
+
+@pytest.mark.asyncio
+async def test_cached_principal_skips_users_query(db_session, blgu_user):
+    """Only the first request for a user reads the users table"""
+    user_id = blgu_user.id
+    db_session.expunge_all()
+
+    statements, stop = count_user_selects(db_session)
+    try:
+        first = await deps.get_current_user(credentials(user_id), db_session)
+        db_session.expunge_all()
+        second = await deps.get_current_user(credentials(user_id), db_session)
+        principal_selects = len(statements)
+        # Columns outside the principal load on demand
+        hashed_password = second.hashed_password
+    finally:
+        stop()
+
+    assert principal_selects == 1
+    assert len(statements) == 2
+    assert first.id == second.id == user_id
+    assert second.role == UserRole.BLGU_USER
+    assert second.email == "principal@test.com"
+    assert hashed_password == "hashed"
+
+
+@pytest.mark.asyncio
+async def test_changes_to_cached_user_are_persisted(db_session, blgu_user):
+    """A user rebuilt from the cache is session-attached, so commits write it"""
+    user_id = blgu_user.id
+    await deps.get_current_user(credentials(user_id), db_session)
+    db_session.expunge_all()
+
+    user = await deps.get_current_user(credentials(user_id), db_session)
+    user.must_change_password = False
+    db_session.commit()
+
+    db_session.expunge_all()
+    assert db_session.get(User, user_id).must_change_password is False
+
+
+@pytest.mark.asyncio
+async def test_deactivation_invalidates_cached_principal(db_session, blgu_user):
+    """deactivate_user drops the cached principal, so the next request sees it"""
+    user_id = blgu_user.id
+    user = await deps.get_current_user(credentials(user_id), db_session)
+    assert (await deps.get_current_active_user(user)).id == user_id
+
+    user_service.deactivate_user(db_session, user_id)
+    db_session.expunge_all()
+
+    user = await deps.get_current_user(credentials(user_id), db_session)
+    with pytest.raises(HTTPException) as exc:
+        await deps.get_current_active_user(user)
+    assert exc.value.status_code == 400
+
+
+
+@pytest.mark.asyncio
+async def test_any_committed_user_write_invalidates_principal(db_session, blgu_user):
+    """Writes outside user_service (seeding, scripts) also drop the principal"""
+    user_id = blgu_user.id
+    cache = get_principal_cache()
+    await deps.get_current_user(credentials(user_id), db_session)
+    assert cache.get(user_id) is not None
+
+    # A rolled back write leaves the principal in place
+    db_session.get(User, user_id).role = UserRole.MLGOO_DILG
+    db_session.flush()
+    db_session.rollback()
+    assert cache.get(user_id) is not None
+
+    db_session.get(User, user_id).role = UserRole.MLGOO_DILG
+    db_session.commit()
+    assert cache.get(user_id) is None
+
+    user = await deps.get_current_user(credentials(user_id), db_session)
+    assert user.role == UserRole.MLGOO_DILG
+
+    # Bulk statements don't say which users they touched, so the cache is cleared
+    db_session.execute(update(User).where(User.id == user_id).values(is_active=False))
+    db_session.commit()
+    assert cache.get(user_id) is None
+
+
+def test_backend_defaults_to_redis_when_redis_url_is_set():
+    """Without an explicit backend, a configured Redis shares the cache"""
+    with (
+        patch("app.core.principal_cache.settings.PRINCIPAL_CACHE_BACKEND", None),
+        patch(
+            "app.core.principal_cache.settings.REDIS_URL", "redis://redis:6379/0"
+        ),
+        patch("redis.Redis.from_url") as from_url,
+    ):
+        cache = build_principal_cache()
+
+    assert isinstance(cache.backend, RedisPrincipalBackend)
+    assert from_url.call_args.args == ("redis://redis:6379/0",)
+
+    with (
+        patch("app.core.principal_cache.settings.PRINCIPAL_CACHE_BACKEND", None),
+        patch("app.core.principal_cache.settings.REDIS_URL", None),
+    ):
+        assert isinstance(build_principal_cache().backend, InMemoryPrincipalBackend)
+
+
+def test_in_memory_backend_expires_and_evicts_lru():
+    now = [0.0]
+    backend = InMemoryPrincipalBackend(max_entries=2, clock=lambda: now[0])
+
+    backend.set("1", {"id": 1}, ttl_seconds=10)
+    backend.set("2", {"id": 2}, ttl_seconds=10)
+    assert backend.get("1") == {"id": 1}  # 1 is now most recently used
+    backend.set("3", {"id": 3}, ttl_seconds=10)
+
+    assert backend.get("2") is None
+    assert backend.get("1") == {"id": 1}
+
+    now[0] = 11.0
+    assert backend.get("1") is None
+    assert backend.get("3") is None
+
+
+@pytest.mark.asyncio
+async def test_user_lookups_run_on_the_blocking_executor(db_session, blgu_user):
+    """Auth dependencies and login query the sync session off the event loop"""
+    from app.core import principal_cache
+    from fastapi.testclient import TestClient
+    from main import app
+
+    threads = []
+
+    def recording(func):
+        def wrapper(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    with patch(
+        "app.api.deps.load_principal_user",
+        recording(principal_cache.load_principal_user),
+    ):
+        await deps.get_current_user(credentials(blgu_user.id), db_session)
+
+    def _override_get_db():
+        yield db_session
+
+    app.dependency_overrides[deps.get_db] = _override_get_db
+    try:
+        with patch.object(
+            user_service,
+            "get_user_by_email",
+            recording(user_service.get_user_by_email),
+        ):
+            response = TestClient(app).post(
+                "/api/v1/auth/login",
+                json={"email": "missing@test.com", "password": "wrong"},
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 401
+    assert len(threads) == 2
+    assert all(name.startswith("blocking") for name in threads)
@@ -0,0 +1,167 @@
+# 🧪 Tests for the token-bucket rate limiter used for Gemini calls
+
+import json
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from app.core.config import settings
+from app.core.rate_limiter import (
+    InMemoryBucketBackend,
+    RateLimiter,
+    RateLimitTimeout,
+    RedisBucketBackend,
+    estimate_tokens,
+)
+from app.db.models import InsightCacheEntry
+from app.services.intelligence_service import GENERATION_CONFIG, intelligence_service
+
+
+class FakeClock:
+    """Monotonic clock advanced by the limiter's sleep calls."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_limiter(clock: FakeClock, rpm: int, tpm: int, **kwargs) -> RateLimiter:
+    return RateLimiter(
+        InMemoryBucketBackend(clock),
+        name="test",
+        requests_per_minute=rpm,
+        tokens_per_minute=tpm,
+        sleep=clock.sleep,
+        **kwargs,
+    )
+
+
+def test_estimate_reserves_the_generation_output_cap():
+    """The reservation matches the max_output_tokens the calls are made with"""
+    assert estimate_tokens("x" * 400) == 100 + GENERATION_CONFIG["max_output_tokens"]
+    assert estimate_tokens("x" * 400, output_tokens=0) == 100
+
+
+def test_requests_per_minute_waits_for_refill():
+    """A burst uses the bucket, then each request waits for one refill."""
+    clock = FakeClock()
+    limiter = make_limiter(clock, rpm=60, tpm=0)
+
+    for _ in range(60):
+        assert limiter.acquire() == 0
+    assert limiter.acquire() == pytest.approx(1.0)
+    assert clock.sleeps == [pytest.approx(1.0)]
+
+
+def test_tokens_per_minute_limits_large_prompts():
+    """Token-heavy requests wait on TPM even when RPM has room."""
+    clock = FakeClock()
+    limiter = make_limiter(clock, rpm=100, tpm=1000)
+
+    limiter.acquire(tokens=800)
+    waited = limiter.acquire(tokens=500)
+
+    # 300 tokens missing at 1000/60 tokens per second
+    assert waited == pytest.approx(18.0)
+
+
+def test_denied_request_takes_no_tokens():
+    """Both buckets are charged together or not at all."""
+    clock = FakeClock()
+    backend = InMemoryBucketBackend(clock)
+    limiter = RateLimiter(
+        backend, "test", requests_per_minute=2, tokens_per_minute=100, sleep=clock.sleep
+    )
+
+    limiter.acquire(tokens=100)
+    assert backend.try_acquire([(limiter.tokens_bucket, 50)]) > 0
+    # The RPM bucket still has its second request
+    assert backend.try_acquire([(limiter.requests_bucket, 1)]) == 0
+
+
+def test_gives_up_after_max_wait():
+    """Waits longer than max_wait_seconds raise instead of blocking forever."""
+    clock = FakeClock()
+    limiter = make_limiter(clock, rpm=1, tpm=0, max_wait_seconds=10)
+
+    limiter.acquire()
+    with pytest.raises(RateLimitTimeout):
+        limiter.acquire()
+
+
+def test_unavailable_backend_fails_open():
+    """A broken limiter store does not block Gemini calls."""
+    backend = MagicMock()
+    backend.try_acquire.side_effect = ConnectionError("redis down")
+    limiter = RateLimiter(backend, "test", requests_per_minute=1, tokens_per_minute=0)
+
+    assert limiter.acquire() == 0
+
+
+def test_redis_backend_shares_buckets():
+    """Two limiters on the same Redis share one bucket."""
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.FakeRedis()
+    first = RateLimiter(RedisBucketBackend(client), "shared", 2, 0, max_wait_seconds=0)
+    second = RateLimiter(RedisBucketBackend(client), "shared", 2, 0, max_wait_seconds=0)
+
+    first.acquire()
+    second.acquire()
+    with pytest.raises(RateLimitTimeout):
+        first.acquire()
+
+
+@patch("app.services.intelligence_service.genai.configure")
+@patch("app.services.intelligence_service.genai.GenerativeModel")
+def test_call_gemini_api_waits_for_capacity(
+    mock_generative_model, mock_configure, db_session, mock_assessment
+):
+    """Gemini is only called after the limiter grants capacity."""
+    mock_model = MagicMock()
+    mock_model.generate_content = MagicMock(
+        return_value=Mock(
+            text=json.dumps(
+                {
+                    "summary": "Summary",
+                    "recommendations": [],
+                    "capacity_development_needs": [],
+                }
+            )
+        )
+    )
+    mock_generative_model.return_value = mock_model
+    limiter = MagicMock()
+
+    with (
+        patch.object(settings, "GEMINI_API_KEY", "test_api_key"),
+        patch(
+            "app.services.intelligence_service.get_gemini_rate_limiter",
+            return_value=limiter,
+        ),
+    ):
+        intelligence_service.call_gemini_api(db_session, mock_assessment.id)
+
+    limiter.acquire.assert_called_once()
+    assert limiter.acquire.call_args.args[0] > 0
+    mock_model.generate_content.assert_called_once()
+
+    limiter.acquire.side_effect = RateLimitTimeout("no capacity")
+    # Clear the shared insight cache so the second call needs Gemini again
+    db_session.query(InsightCacheEntry).delete()
+    db_session.commit()
+    with (
+        patch.object(settings, "GEMINI_API_KEY", "test_api_key"),
+        patch(
+            "app.services.intelligence_service.get_gemini_rate_limiter",
+            return_value=limiter,
+        ),
+        pytest.raises(Exception, match="rate limit"),
+    ):
+        intelligence_service.call_gemini_api(db_session, mock_assessment.id)
+    mock_model.generate_content.assert_called_once()
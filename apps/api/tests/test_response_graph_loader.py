@@ -0,0 +1,152 @@
+# 🧪 Tests for the flat response/MOV/feedback loaders
+
+from app.db.enums import AreaType, UserRole
+from app.db.models import (
+    MOV,
+    Assessment,
+    AssessmentResponse,
+    FeedbackComment,
+    GovernanceArea,
+    Indicator,
+    User,
+)
+from app.services.assessment_service import assessment_service
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+def _seed_assessment(db_session: Session) -> dict:
+    area = GovernanceArea(id=2, name="Disaster Preparedness", area_type=AreaType.CORE)
+    db_session.add(area)
+    db_session.commit()
+
+    indicators = [
+        Indicator(
+            name=f"Loader Indicator {i}",
+            form_schema={"type": "object"},
+            governance_area_id=area.id,
+        )
+        for i in range(2)
+    ]
+    db_session.add_all(indicators)
+
+    blgu = User(
+        email="loader-blgu@test.com",
+        name="Loader BLGU",
+        role=UserRole.BLGU_USER,
+        hashed_password="hashed",
+        is_active=True,
+    )
+    assessor = User(
+        email="loader-assessor@test.com",
+        name="Loader Assessor",
+        role=UserRole.AREA_ASSESSOR,
+        hashed_password="hashed",
+        is_active=True,
+    )
+    db_session.add_all([blgu, assessor])
+    db_session.commit()
+
+    assessment = Assessment(blgu_user_id=blgu.id)
+    db_session.add(assessment)
+    db_session.commit()
+
+    with_files = AssessmentResponse(
+        assessment_id=assessment.id,
+        indicator_id=indicators[0].id,
+        response_data={"answer": "yes"},
+        is_completed=True,
+    )
+    empty = AssessmentResponse(
+        assessment_id=assessment.id,
+        indicator_id=indicators[1].id,
+        response_data={},
+        requires_rework=True,
+    )
+    db_session.add_all([with_files, empty])
+    db_session.commit()
+
+    # 3 MOVs x 2 comments would have produced 6 joined rows for one response
+    db_session.add_all(
+        [
+            MOV(
+                filename=f"file{i}.pdf",
+                original_filename=f"file{i}.pdf",
+                file_size=100 + i,
+                content_type="application/pdf",
+                storage_path=f"movs/file{i}.pdf",
+                response_id=with_files.id,
+            )
+            for i in range(3)
+        ]
+        + [
+            FeedbackComment(
+                comment=f"Comment {i}",
+                response_id=with_files.id,
+                assessor_id=assessor.id,
+            )
+            for i in range(2)
+        ]
+    )
+    db_session.commit()
+
+    return {
+        "assessment_id": assessment.id,
+        "indicators": [ind.id for ind in indicators],
+        "with_files_id": with_files.id,
+    }
+
+
+def test_response_graph_groups_children_without_duplicates(db_session: Session):
+    """Each MOV and comment appears exactly once, in three flat SELECTs."""
+    data = _seed_assessment(db_session)
+
+    statements: list[str] = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", record_statement)
+    try:
+        graph = assessment_service.load_response_graph(
+            db_session, data["assessment_id"]
+        )
+    finally:
+        event.remove(bind, "before_cursor_execute", record_statement)
+
+    assert len(statements) == 3
+
+    first, second = (graph[ind_id] for ind_id in data["indicators"])
+    assert first["response"]["id"] == data["with_files_id"]
+    assert first["response"]["response_data"] == {"answer": "yes"}
+    assert [m["filename"] for m in first["movs"]] == [
+        "file0.pdf",
+        "file1.pdf",
+        "file2.pdf",
+    ]
+    assert first["movs"][0]["status"] == "Uploaded"
+    assert [c["comment"] for c in first["feedback_comments"]] == [
+        "Comment 0",
+        "Comment 1",
+    ]
+    assert second["movs"] == [] and second["feedback_comments"] == []
+
+
+def test_response_summaries_count_children_per_response(db_session: Session):
+    """Summaries return one row per response with child counts."""
+    data = _seed_assessment(db_session)
+
+    rows = assessment_service.load_response_summaries(
+        db_session, data["assessment_id"]
+    )
+    by_indicator = {row.indicator_id: row for row in rows}
+
+    assert len(rows) == 2
+    first, second = (by_indicator[ind_id] for ind_id in data["indicators"])
+    assert (first.mov_count, first.comment_count, first.is_completed) == (3, 2, True)
+    assert (second.mov_count, second.comment_count, second.requires_rework) == (
+        0,
+        0,
+        True,
+    )
@@ -0,0 +1,102 @@
+# 🧪 Tests for the storage deletion outbox and its worker
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from sqlalchemy.orm import sessionmaker
+
+from app.core.storage import FakeStorageBackend
+from app.db.models import StorageDeletion
+from app.services.storage_outbox_service import retry_delay, storage_outbox_service
+from app.workers.storage_outbox import _drain_storage_outbox_logic
+
+
+def queue_files(db, bucket, paths, backend):
+    for path in paths:
+        backend.put(bucket, path)
+    storage_outbox_service.enqueue(db, bucket, paths)
+    db.commit()
+
+
+def test_drain_removes_many_paths_per_call(db_session):
+    """Queued files are removed in batches and their outbox rows deleted"""
+    backend = FakeStorageBackend()
+    queue_files(db_session, "movs", [f"a/{i}.pdf" for i in range(5)], backend)
+    queue_files(db_session, "other", ["b/1.pdf"], backend)
+
+    result = _drain_storage_outbox_logic(batch_size=4, db=db_session, backend=backend)
+
+    assert result["success"] is True
+    assert result["removed"] == 6
+    assert result["failed"] == 0
+    assert result["batches"] == 2
+    # One call per bucket per batch, not one per file
+    assert len(backend.calls) == 3
+    assert all(len(paths) <= 4 for _, paths in backend.calls)
+    assert not any(backend.exists("movs", f"a/{i}.pdf") for i in range(5))
+    assert db_session.query(StorageDeletion).count() == 0
+
+
+def test_failed_removals_back_off_and_retry(db_session):
+    """A failing storage call leaves the rows queued with exponential backoff"""
+    backend = FakeStorageBackend()
+    backend.fail_next = 1
+    queue_files(db_session, "movs", ["a/1.pdf", "a/2.pdf"], backend)
+
+    first = storage_outbox_service.drain(db_session, backend=backend)
+    assert first["removed"] == 0
+    assert first["failed"] == 2
+
+    db_session.expire_all()
+    rows = db_session.query(StorageDeletion).all()
+    assert {row.attempts for row in rows} == {1}
+    assert all(row.last_error == "Fake storage failure" for row in rows)
+    assert all(row.next_attempt_at > datetime.utcnow() for row in rows)
+
+    # Not due yet: nothing is retried
+    assert storage_outbox_service.drain(db_session, backend=backend)["batches"] == 0
+    assert storage_outbox_service.get_stats(db_session)["pending"] == 2
+
+    # Once due, the retry succeeds
+    later = datetime.utcnow() + retry_delay(1) + timedelta(seconds=1)
+    with patch("app.services.storage_outbox_service.datetime") as mock_datetime:
+        mock_datetime.utcnow.return_value = later
+        retried = storage_outbox_service.drain(db_session, backend=backend)
+    assert retried["removed"] == 2
+    assert db_session.query(StorageDeletion).count() == 0
+    assert not backend.exists("movs", "a/1.pdf")
+
+
+def test_claim_is_committed_before_removing(db_session):
+    """No transaction (and no row lock) is open while storage is called"""
+    other_session = sessionmaker(bind=db_session.get_bind())
+    observed = []
+
+    class ObservingBackend(FakeStorageBackend):
+        def remove(self, bucket, paths):
+            with other_session() as other:
+                entry = other.query(StorageDeletion).one()
+                observed.append((db_session.in_transaction(), entry.next_attempt_at))
+            super().remove(bucket, paths)
+
+    backend = ObservingBackend()
+    queue_files(db_session, "movs", ["a/1.pdf"], backend)
+
+    before = datetime.utcnow()
+    result = storage_outbox_service.drain(db_session, backend=backend)
+
+    assert result["removed"] == 1
+    [(in_transaction, next_attempt_at)] = observed
+    assert in_transaction is False
+    # Other workers see the claim and skip the entry until it expires
+    assert next_attempt_at > before + timedelta(minutes=1)
+    assert db_session.query(StorageDeletion).count() == 0
+
+
+def test_retry_delay_is_exponential_and_capped():
+    with patch("app.services.storage_outbox_service.settings") as mock_settings:
+        mock_settings.STORAGE_OUTBOX_RETRY_BASE_SECONDS = 30
+        mock_settings.STORAGE_OUTBOX_RETRY_MAX_SECONDS = 100
+        assert retry_delay(1) == timedelta(seconds=30)
+        assert retry_delay(2) == timedelta(seconds=60)
+        assert retry_delay(5) == timedelta(seconds=100)